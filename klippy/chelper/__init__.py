@@ -78,6 +78,11 @@ defs_itersolve = """
     void itersolve_set_position(struct stepper_kinematics *sk
         , double x, double y, double z);
     double itersolve_get_commanded_pos(struct stepper_kinematics *sk);
+    struct itersolve_pool *itersolve_pool_alloc(int num_threads);
+    void itersolve_pool_free(struct itersolve_pool *pool);
+    int32_t itersolve_pool_generate_steps(struct itersolve_pool *pool
+        , struct stepper_kinematics **sks, int count, double flush_time
+        , double *times);
 """
 
 defs_trapq = """
@@ -173,6 +178,14 @@ defs_serialqueue = """
         double sent_time, receive_time;
         uint64_t notify_id;
     };
+    struct serialqueue_link_stats {
+        uint32_t latency_counts[16];
+        double latency_sum, latency_max;
+        uint32_t blocks_sent, block_bytes;
+    };
+    struct command_queue_stats {
+        uint32_t bytes_queued, bytes_sent;
+    };
 
     struct serialqueue *serialqueue_alloc(int serial_fd, char serial_fd_type
         , int client_id);
@@ -183,8 +196,13 @@ defs_serialqueue = """
     void serialqueue_send(struct serialqueue *sq, struct command_queue *cq
         , uint8_t *msg, int len, uint64_t min_clock, uint64_t req_clock
         , uint64_t notify_id);
+    void serialqueue_send_group(struct serialqueue *sq
+        , struct command_queue **cqs, uint8_t *msgs, int *lens
+        , uint64_t *min_clocks, uint64_t *req_clocks, int count);
     void serialqueue_pull(struct serialqueue *sq
         , struct pull_queue_message *pqm);
+    int serialqueue_pull_batch(struct serialqueue *sq
+        , struct pull_queue_message *q, int max);
     void serialqueue_set_wire_frequency(struct serialqueue *sq
         , double frequency);
     void serialqueue_set_receive_window(struct serialqueue *sq
@@ -192,6 +210,10 @@ defs_serialqueue = """
     void serialqueue_set_clock_est(struct serialqueue *sq, double est_freq
         , double conv_time, uint64_t conv_clock, uint64_t last_clock);
     void serialqueue_get_stats(struct serialqueue *sq, char *buf, int len);
+    void serialqueue_get_link_stats(struct serialqueue *sq
+        , struct serialqueue_link_stats *ls);
+    void serialqueue_get_queue_stats(struct serialqueue *sq
+        , struct command_queue *cq, struct command_queue_stats *qs);
     int serialqueue_extract_old(struct serialqueue *sq, int sentq
         , struct pull_queue_message *q, int max);
 """
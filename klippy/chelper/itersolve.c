@@ -5,11 +5,13 @@
 // This file may be distributed under the terms of the GNU GPLv3 license.
 
 #include <math.h> // fabs
+#include <pthread.h> // pthread_mutex_lock
 #include <stddef.h> // offsetof
+#include <stdlib.h> // malloc
 #include <string.h> // memset
 #include "compiler.h" // __visible
 #include "itersolve.h" // itersolve_generate_steps
-#include "pyhelper.h" // errorf
+#include "pyhelper.h" // errorf, get_monotonic
 #include "stepcompress.h" // queue_append_start
 #include "trapq.h" // struct move
 
@@ -279,3 +281,146 @@ itersolve_get_commanded_pos(struct stepper_kinematics *sk)
 {
     return sk->commanded_pos;
 }
+
+
+/****************************************************************
+ * Parallel step generation
+ ****************************************************************/
+
+// A pool of worker threads that generate steps for several steppers
+// at once.  Each stepper_kinematics is a separate work item; they
+// only share read access to their trapq during generation.
+struct itersolve_pool {
+    pthread_mutex_t lock; // protects variables below
+    pthread_cond_t work_cond, done_cond;
+    int num_threads, exiting, generation;
+    pthread_t *threads;
+    struct stepper_kinematics **sks;
+    double *times;
+    int count, next, pending;
+    double flush_time;
+    int32_t ret;
+};
+
+// Claim and process work items until none remain (lock must be held)
+static void
+pool_do_work(struct itersolve_pool *pool)
+{
+    while (pool->next < pool->count) {
+        int idx = pool->next++;
+        struct stepper_kinematics *sk = pool->sks[idx];
+        double *times = pool->times, flush_time = pool->flush_time;
+        pthread_mutex_unlock(&pool->lock);
+        double start_time = times ? get_monotonic() : 0.;
+        int32_t ret = itersolve_generate_steps(sk, flush_time);
+        if (times)
+            times[idx] = get_monotonic() - start_time;
+        pthread_mutex_lock(&pool->lock);
+        if (ret && !pool->ret)
+            pool->ret = ret;
+        pool->pending--;
+        if (!pool->pending)
+            pthread_cond_broadcast(&pool->done_cond);
+    }
+}
+
+// Main loop of each worker thread
+static void *
+pool_thread(void *data)
+{
+    struct itersolve_pool *pool = data;
+    pthread_mutex_lock(&pool->lock);
+    int generation = pool->generation;
+    for (;;) {
+        while (!pool->exiting && pool->generation == generation)
+            pthread_cond_wait(&pool->work_cond, &pool->lock);
+        if (pool->exiting)
+            break;
+        generation = pool->generation;
+        pool_do_work(pool);
+    }
+    pthread_mutex_unlock(&pool->lock);
+    return NULL;
+}
+
+// Create a pool with the given number of helper threads
+struct itersolve_pool * __visible
+itersolve_pool_alloc(int num_threads)
+{
+    struct itersolve_pool *pool = malloc(sizeof(*pool));
+    memset(pool, 0, sizeof(*pool));
+    pthread_mutex_init(&pool->lock, NULL);
+    pthread_cond_init(&pool->work_cond, NULL);
+    pthread_cond_init(&pool->done_cond, NULL);
+    pool->threads = malloc(sizeof(pool->threads[0]) * num_threads);
+    int i;
+    for (i=0; i<num_threads; i++) {
+        int ret = pthread_create(&pool->threads[i], NULL, pool_thread, pool);
+        if (ret) {
+            errorf("itersolve_pool_alloc unable to create thread %d", ret);
+            break;
+        }
+    }
+    pool->num_threads = i;
+    return pool;
+}
+
+// Stop all helper threads and free the pool
+void __visible
+itersolve_pool_free(struct itersolve_pool *pool)
+{
+    if (!pool)
+        return;
+    pthread_mutex_lock(&pool->lock);
+    pool->exiting = 1;
+    pthread_cond_broadcast(&pool->work_cond);
+    pthread_mutex_unlock(&pool->lock);
+    int i;
+    for (i=0; i<pool->num_threads; i++)
+        pthread_join(pool->threads[i], NULL);
+    pthread_cond_destroy(&pool->done_cond);
+    pthread_cond_destroy(&pool->work_cond);
+    pthread_mutex_destroy(&pool->lock);
+    free(pool->threads);
+    free(pool);
+}
+
+// Generate steps for all the given steppers and wait for completion.
+// If 'times' is not NULL, the time spent on each stepper is stored in it.
+int32_t __visible
+itersolve_pool_generate_steps(struct itersolve_pool *pool
+                              , struct stepper_kinematics **sks, int count
+                              , double flush_time, double *times)
+{
+    if (!pool->num_threads || count <= 1) {
+        int i;
+        for (i=0; i<count; i++) {
+            double start_time = times ? get_monotonic() : 0.;
+            int32_t ret = itersolve_generate_steps(sks[i], flush_time);
+            if (times)
+                times[i] = get_monotonic() - start_time;
+            if (ret)
+                return ret;
+        }
+        return 0;
+    }
+    pthread_mutex_lock(&pool->lock);
+    pool->sks = sks;
+    pool->times = times;
+    pool->count = pool->pending = count;
+    pool->next = 0;
+    pool->flush_time = flush_time;
+    pool->ret = 0;
+    pool->generation++;
+    pthread_cond_broadcast(&pool->work_cond);
+    // The calling thread also processes work items
+    pool_do_work(pool);
+    while (pool->pending)
+        pthread_cond_wait(&pool->done_cond, &pool->lock);
+    int32_t ret = pool->ret;
+    pool->sks = NULL;
+    pool->times = NULL;
+    pool->count = 0;
+    pthread_mutex_unlock(&pool->lock);
+    return ret;
+}
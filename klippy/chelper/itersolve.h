@@ -37,5 +37,11 @@ double itersolve_calc_position_from_coord(struct stepper_kinematics *sk
 void itersolve_set_position(struct stepper_kinematics *sk
                             , double x, double y, double z);
 double itersolve_get_commanded_pos(struct stepper_kinematics *sk);
+struct itersolve_pool *itersolve_pool_alloc(int num_threads);
+void itersolve_pool_free(struct itersolve_pool *pool);
+int32_t itersolve_pool_generate_steps(struct itersolve_pool *pool
+                                      , struct stepper_kinematics **sks
+                                      , int count, double flush_time
+                                      , double *times);
 
 #endif // itersolve.h
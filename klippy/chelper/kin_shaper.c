@@ -88,11 +88,78 @@ get_axis_position_across_moves(struct move *m, int axis, double time)
     return get_axis_position(m, axis, time);
 }
 
+// Time range (relative to the start of a move) where an axis does not
+// move during the whole shaper window
+struct stationary_range {
+    struct move *m;
+    double print_time, pos, min_time, max_time;
+    int checked_prev, checked_next;
+};
+
+static void
+update_stationary_range(struct stationary_range *sr, struct trapq *tq
+                        , struct move *m, int axis, double move_time
+                        , struct shaper_pulses *sp)
+{
+    int idx = axis - 'x';
+    double pre_t = -sp->pulses[0].t;
+    double post_t = sp->pulses[sp->num_pulses-1].t;
+    if (sr->m != m || sr->print_time != m->print_time
+        || sr->pos != m->start_pos.axis[idx]) {
+        // Start with the part of the move itself
+        sr->m = m;
+        sr->print_time = m->print_time;
+        sr->pos = m->start_pos.axis[idx];
+        sr->min_time = pre_t;
+        sr->max_time = m->move_t - post_t;
+        sr->checked_prev = sr->checked_next = 0;
+    }
+    // Extend the range with the stationary moves before and after this
+    // move (only when the shaper window reaches them, and never past the
+    // trapq sentinels as later moves may still be appended)
+    if (move_time < sr->min_time && !sr->checked_prev) {
+        struct move *head = list_first_entry(&tq->moves, struct move, node);
+        struct move *pm = m;
+        double stationary_t = 0.;
+        while (stationary_t < pre_t) {
+            pm = list_prev_entry(pm, node);
+            if (pm == head || pm->axes_r.axis[idx]
+                || pm->start_pos.axis[idx] != sr->pos)
+                break;
+            stationary_t += pm->move_t;
+        }
+        sr->min_time = pre_t - stationary_t;
+        sr->checked_prev = 1;
+    }
+    if (move_time > sr->max_time && !sr->checked_next) {
+        struct move *tail = list_last_entry(&tq->moves, struct move, node);
+        struct move *pm = m;
+        double stationary_t = 0.;
+        while (stationary_t < post_t) {
+            pm = list_next_entry(pm, node);
+            if (pm == tail || pm->axes_r.axis[idx]
+                || pm->start_pos.axis[idx] != sr->pos)
+                break;
+            stationary_t += pm->move_t;
+        }
+        sr->max_time = m->move_t + stationary_t - post_t;
+        sr->checked_next = 1;
+    }
+}
+
 // Calculate the position from the convolution of the shaper with input signal
 static inline double
 calc_position(struct move *m, int axis, double move_time
-              , struct shaper_pulses *sp)
+              , struct shaper_pulses *sp, struct stationary_range *sr
+              , struct trapq *tq)
 {
+    // Skip the convolution while the axis does not move (eg, during
+    // z-hops, extrude only moves, and moves along the other axis)
+    if (!m->axes_r.axis[axis - 'x']) {
+        update_stationary_range(sr, tq, m, axis, move_time, sp);
+        if (move_time >= sr->min_time && move_time <= sr->max_time)
+            return sr->pos;
+    }
     double res = 0.;
     int num_pulses = sp->num_pulses, i;
     for (i = 0; i < num_pulses; ++i) {
@@ -114,6 +181,7 @@ struct input_shaper {
     struct stepper_kinematics *orig_sk;
     struct move m;
     struct shaper_pulses sx, sy;
+    struct stationary_range rx, ry;
 };
 
 // Optimized calc_position when only x axis is needed
@@ -124,7 +192,8 @@ shaper_x_calc_position(struct stepper_kinematics *sk, struct move *m
     struct input_shaper *is = container_of(sk, struct input_shaper, sk);
     if (!is->sx.num_pulses)
         return is->orig_sk->calc_position_cb(is->orig_sk, m, move_time);
-    is->m.start_pos.x = calc_position(m, 'x', move_time, &is->sx);
+    is->m.start_pos.x = calc_position(m, 'x', move_time, &is->sx
+                                      , &is->rx, sk->tq);
     return is->orig_sk->calc_position_cb(is->orig_sk, &is->m, DUMMY_T);
 }
 
@@ -136,7 +205,8 @@ shaper_y_calc_position(struct stepper_kinematics *sk, struct move *m
     struct input_shaper *is = container_of(sk, struct input_shaper, sk);
     if (!is->sy.num_pulses)
         return is->orig_sk->calc_position_cb(is->orig_sk, m, move_time);
-    is->m.start_pos.y = calc_position(m, 'y', move_time, &is->sy);
+    is->m.start_pos.y = calc_position(m, 'y', move_time, &is->sy
+                                      , &is->ry, sk->tq);
     return is->orig_sk->calc_position_cb(is->orig_sk, &is->m, DUMMY_T);
 }
 
@@ -150,9 +220,11 @@ shaper_xy_calc_position(struct stepper_kinematics *sk, struct move *m
         return is->orig_sk->calc_position_cb(is->orig_sk, m, move_time);
     is->m.start_pos = move_get_coord(m, move_time);
     if (is->sx.num_pulses)
-        is->m.start_pos.x = calc_position(m, 'x', move_time, &is->sx);
+        is->m.start_pos.x = calc_position(m, 'x', move_time, &is->sx
+                                          , &is->rx, sk->tq);
     if (is->sy.num_pulses)
-        is->m.start_pos.y = calc_position(m, 'y', move_time, &is->sy);
+        is->m.start_pos.y = calc_position(m, 'y', move_time, &is->sy
+                                          , &is->ry, sk->tq);
     return is->orig_sk->calc_position_cb(is->orig_sk, &is->m, DUMMY_T);
 }
 
@@ -216,6 +288,8 @@ input_shaper_set_shaper_params(struct stepper_kinematics *sk, char axis
         return -1;
     struct input_shaper *is = container_of(sk, struct input_shaper, sk);
     struct shaper_pulses *sp = axis == 'x' ? &is->sx : &is->sy;
+    struct stationary_range *sr = axis == 'x' ? &is->rx : &is->ry;
+    sr->m = NULL;
     int status = 0;
     // Ignore input shaper update if the axis is not active
     if (is->orig_sk->active_flags & (axis == 'x' ? AF_X : AF_Y)) {
@@ -32,6 +32,8 @@
 struct command_queue {
     struct list_head upcoming_queue, ready_queue;
     struct list_node node;
+    // Stats
+    uint32_t bytes_queued, bytes_sent;
 };
 
 struct serialqueue {
@@ -72,6 +74,7 @@ struct serialqueue {
     struct list_head old_sent, old_receive;
     // Stats
     uint32_t bytes_write, bytes_read, bytes_retransmit, bytes_invalid;
+    struct serialqueue_link_stats link_stats;
 };
 
 #define SQPF_SERIAL 0
@@ -93,6 +96,8 @@ struct serialqueue {
 #define MIN_BACKGROUND_DELTA 0.005
 #define IDLE_QUERY_TIME 1.0
 
+#define LINK_LATENCY_BASE 0.000100
+
 #define DEBUG_QUEUE_SENT 100
 #define DEBUG_QUEUE_RECEIVE 100
 
@@ -154,6 +159,23 @@ calculate_bittime(struct serialqueue *sq, uint32_t bytes)
     }
 }
 
+// Note the time from transmission to acknowledgment of a message block
+static void
+note_ack_latency(struct serialqueue *sq, double latency)
+{
+    struct serialqueue_link_stats *ls = &sq->link_stats;
+    int bucket = 0;
+    double t = latency / LINK_LATENCY_BASE;
+    while (t >= 1. && bucket < LINK_LATENCY_BUCKETS - 1) {
+        t *= .5;
+        bucket++;
+    }
+    ls->latency_counts[bucket]++;
+    ls->latency_sum += latency;
+    if (latency > ls->latency_max)
+        ls->latency_max = latency;
+}
+
 // Update internal state when the receive sequence increases
 static void
 update_receive_seq(struct serialqueue *sq, double eventtime, uint64_t rseq)
@@ -170,6 +192,7 @@ update_receive_seq(struct serialqueue *sq, double eventtime, uint64_t rseq)
             break;
         }
         sq->need_ack_bytes -= sent->len;
+        note_ack_latency(sq, eventtime - sent->sent_time);
         list_del(&sent->node);
         debug_queue_add(&sq->old_sent, sent);
         sent_seq++;
@@ -471,6 +494,7 @@ build_and_send_command(struct serialqueue *sq, uint8_t *buf, int pending
         memcpy(&buf[len], qm->msg, qm->len);
         len += qm->len;
         sq->ready_bytes -= qm->len;
+        cq->bytes_sent += qm->len;
         if (qm->notify_id) {
             // Message requires notification - add to notify list
             qm->req_clock = sq->send_seq;
@@ -503,6 +527,8 @@ build_and_send_command(struct serialqueue *sq, uint8_t *buf, int pending
         sq->rtt_sample_seq = sq->send_seq;
     sq->send_seq++;
     sq->need_ack_bytes += len;
+    sq->link_stats.blocks_sent++;
+    sq->link_stats.block_bytes += len;
     list_add_tail(&out->node, &sq->sent_queue);
     return len;
 }
@@ -774,6 +800,35 @@ serialqueue_rm_fastreader(struct serialqueue *sq, struct fastreader *fr)
     pthread_mutex_unlock(&sq->fast_reader_dispatch_lock);
 }
 
+// Make sure min_clock is set for a message
+static void
+check_min_clock(struct queue_message *qm)
+{
+    if (qm->min_clock + (1LL<<31) < qm->req_clock
+        && qm->req_clock != BACKGROUND_PRIORITY_CLOCK)
+        qm->min_clock = qm->req_clock - (1LL<<31);
+}
+
+// Add a list of messages to a command_queue (caller must hold lock).
+// Returns non-zero if the background thread needs to be woken.
+static int
+queue_messages(struct serialqueue *sq, struct command_queue *cq
+               , struct list_head *msgs, int len)
+{
+    struct queue_message *qm = list_first_entry(
+        msgs, struct queue_message, node);
+    if (list_empty(&cq->ready_queue) && list_empty(&cq->upcoming_queue))
+        list_add_tail(&cq->node, &sq->pending_queues);
+    list_join_tail(msgs, &cq->upcoming_queue);
+    sq->upcoming_bytes += len;
+    cq->bytes_queued += len;
+    if (qm->min_clock < sq->need_kick_clock) {
+        sq->need_kick_clock = 0;
+        return 1;
+    }
+    return 0;
+}
+
 // Add a batch of messages to the given command_queue
 void
 serialqueue_send_batch(struct serialqueue *sq, struct command_queue *cq
@@ -783,26 +838,15 @@ serialqueue_send_batch(struct serialqueue *sq, struct command_queue *cq
     int len = 0;
     struct queue_message *qm;
     list_for_each_entry(qm, msgs, node) {
-        if (qm->min_clock + (1LL<<31) < qm->req_clock
-            && qm->req_clock != BACKGROUND_PRIORITY_CLOCK)
-            qm->min_clock = qm->req_clock - (1LL<<31);
+        check_min_clock(qm);
         len += qm->len;
     }
     if (! len)
         return;
-    qm = list_first_entry(msgs, struct queue_message, node);
 
     // Add list to cq->upcoming_queue
     pthread_mutex_lock(&sq->lock);
-    if (list_empty(&cq->ready_queue) && list_empty(&cq->upcoming_queue))
-        list_add_tail(&cq->node, &sq->pending_queues);
-    list_join_tail(msgs, &cq->upcoming_queue);
-    sq->upcoming_bytes += len;
-    int mustwake = 0;
-    if (qm->min_clock < sq->need_kick_clock) {
-        sq->need_kick_clock = 0;
-        mustwake = 1;
-    }
+    int mustwake = queue_messages(sq, cq, msgs, len);
     pthread_mutex_unlock(&sq->lock);
 
     // Wake the background thread if necessary
@@ -810,6 +854,39 @@ serialqueue_send_batch(struct serialqueue *sq, struct command_queue *cq
         kick_bg_thread(sq);
 }
 
+// Schedule the transmission of a group of messages that may be on
+// different command queues.  The messages are added atomically so
+// that they may be transmitted in the same message block.  The
+// message contents are concatenated in 'msgs'.
+void __visible
+serialqueue_send_group(struct serialqueue *sq, struct command_queue **cqs
+                       , uint8_t *msgs, int *lens, uint64_t *min_clocks
+                       , uint64_t *req_clocks, int count)
+{
+    if (count <= 0)
+        return;
+    struct list_head lists[count];
+    int i;
+    for (i=0; i<count; i++) {
+        struct queue_message *qm = message_fill(msgs, lens[i]);
+        msgs += lens[i];
+        qm->min_clock = min_clocks[i];
+        qm->req_clock = req_clocks[i];
+        check_min_clock(qm);
+        list_init(&lists[i]);
+        list_add_tail(&qm->node, &lists[i]);
+    }
+
+    pthread_mutex_lock(&sq->lock);
+    int mustwake = 0;
+    for (i=0; i<count; i++)
+        mustwake |= queue_messages(sq, cqs[i], &lists[i], lens[i]);
+    pthread_mutex_unlock(&sq->lock);
+
+    if (mustwake)
+        kick_bg_thread(sq);
+}
+
 // Helper to send a single message
 void
 serialqueue_send_one(struct serialqueue *sq, struct command_queue *cq
@@ -835,23 +912,25 @@ serialqueue_send(struct serialqueue *sq, struct command_queue *cq, uint8_t *msg
     serialqueue_send_one(sq, cq, qm);
 }
 
-// Return a message read from the serial port (or wait for one if none
-// available)
-void __visible
-serialqueue_pull(struct serialqueue *sq, struct pull_queue_message *pqm)
+// Wait for a message to be available (returns non-zero on exit)
+static int
+wait_receive(struct serialqueue *sq)
 {
-    pthread_mutex_lock(&sq->lock);
-    // Wait for message to be available
     while (list_empty(&sq->receive_queue)) {
         if (pollreactor_is_exit(sq->pr))
-            goto exit;
+            return -1;
         sq->receive_waiting = 1;
         int ret = pthread_cond_wait(&sq->cond, &sq->lock);
         if (ret)
             report_errno("pthread_cond_wait", ret);
     }
+    return 0;
+}
 
-    // Remove message from queue
+// Remove the first message from the receive queue and copy it to pqm
+static void
+pop_receive(struct serialqueue *sq, struct pull_queue_message *pqm)
+{
     struct queue_message *qm = list_first_entry(
         &sq->receive_queue, struct queue_message, node);
     list_del(&qm->node);
@@ -866,13 +945,36 @@ serialqueue_pull(struct serialqueue *sq, struct pull_queue_message *pqm)
         debug_queue_add(&sq->old_receive, qm);
     else
         message_free(qm);
+}
 
+// Return a message read from the serial port (or wait for one if none
+// available)
+void __visible
+serialqueue_pull(struct serialqueue *sq, struct pull_queue_message *pqm)
+{
+    pthread_mutex_lock(&sq->lock);
+    if (wait_receive(sq))
+        pqm->len = -1;
+    else
+        pop_receive(sq, pqm);
     pthread_mutex_unlock(&sq->lock);
-    return;
+}
 
-exit:
-    pqm->len = -1;
+// Return up to 'max' messages read from the serial port (or wait for
+// one if none available).  Returns the number of messages or -1 on exit.
+int __visible
+serialqueue_pull_batch(struct serialqueue *sq, struct pull_queue_message *q
+                       , int max)
+{
+    pthread_mutex_lock(&sq->lock);
+    int count = -1;
+    if (!wait_receive(sq)) {
+        count = 0;
+        while (count < max && !list_empty(&sq->receive_queue))
+            pop_receive(sq, &q[count++]);
+    }
     pthread_mutex_unlock(&sq->lock);
+    return count;
 }
 
 void __visible
@@ -942,6 +1044,28 @@ serialqueue_get_stats(struct serialqueue *sq, char *buf, int len)
              , stats.ready_bytes, stats.upcoming_bytes);
 }
 
+// Return the link health counters (the maximum latency is reset)
+void __visible
+serialqueue_get_link_stats(struct serialqueue *sq
+                           , struct serialqueue_link_stats *ls)
+{
+    pthread_mutex_lock(&sq->lock);
+    memcpy(ls, &sq->link_stats, sizeof(*ls));
+    sq->link_stats.latency_max = 0.;
+    pthread_mutex_unlock(&sq->lock);
+}
+
+// Return the traffic counters of a command queue
+void __visible
+serialqueue_get_queue_stats(struct serialqueue *sq, struct command_queue *cq
+                            , struct command_queue_stats *qs)
+{
+    pthread_mutex_lock(&sq->lock);
+    qs->bytes_queued = cq->bytes_queued;
+    qs->bytes_sent = cq->bytes_sent;
+    pthread_mutex_unlock(&sq->lock);
+}
+
 // Extract old messages stored in the debug queues
 int __visible
 serialqueue_extract_old(struct serialqueue *sq, int sentq
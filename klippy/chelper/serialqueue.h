@@ -25,6 +25,18 @@ struct pull_queue_message {
     uint64_t notify_id;
 };
 
+#define LINK_LATENCY_BUCKETS 16
+
+struct serialqueue_link_stats {
+    uint32_t latency_counts[LINK_LATENCY_BUCKETS];
+    double latency_sum, latency_max;
+    uint32_t blocks_sent, block_bytes;
+};
+
+struct command_queue_stats {
+    uint32_t bytes_queued, bytes_sent;
+};
+
 struct serialqueue;
 struct serialqueue *serialqueue_alloc(int serial_fd, char serial_fd_type
                                       , int client_id);
@@ -41,7 +53,12 @@ void serialqueue_send_one(struct serialqueue *sq, struct command_queue *cq
 void serialqueue_send(struct serialqueue *sq, struct command_queue *cq
                       , uint8_t *msg, int len, uint64_t min_clock
                       , uint64_t req_clock, uint64_t notify_id);
+void serialqueue_send_group(struct serialqueue *sq, struct command_queue **cqs
+                            , uint8_t *msgs, int *lens, uint64_t *min_clocks
+                            , uint64_t *req_clocks, int count);
 void serialqueue_pull(struct serialqueue *sq, struct pull_queue_message *pqm);
+int serialqueue_pull_batch(struct serialqueue *sq
+                           , struct pull_queue_message *q, int max);
 void serialqueue_set_wire_frequency(struct serialqueue *sq, double frequency);
 void serialqueue_set_receive_window(struct serialqueue *sq, int receive_window);
 void serialqueue_set_clock_est(struct serialqueue *sq, double est_freq
@@ -50,6 +67,11 @@ void serialqueue_set_clock_est(struct serialqueue *sq, double est_freq
 void serialqueue_get_clock_est(struct serialqueue *sq
                                , struct clock_estimate *ce);
 void serialqueue_get_stats(struct serialqueue *sq, char *buf, int len);
+void serialqueue_get_link_stats(struct serialqueue *sq
+                                , struct serialqueue_link_stats *ls);
+void serialqueue_get_queue_stats(struct serialqueue *sq
+                                 , struct command_queue *cq
+                                 , struct command_queue_stats *qs);
 int serialqueue_extract_old(struct serialqueue *sq, int sentq
                             , struct pull_queue_message *q, int max);
 
@@ -8,6 +8,12 @@ import logging, math
 RTT_AGE = .000010 / (60. * 60.)
 DECAY = 1. / 30.
 TRANSMIT_EXTRA = .001
+DRIFT_DECAY = 1. / 120.
+DRIFT_MIN_SPAN = 10.
+QUERY_INTERVAL = .9839
+MIN_QUERY_INTERVAL = .5 * QUERY_INTERVAL
+MAX_QUERY_INTERVAL = 2. * QUERY_INTERVAL
+LOW_JITTER = .000020
 
 class ClockSync:
     def __init__(self, reactor):
@@ -23,10 +29,17 @@ class ClockSync:
         self.min_half_rtt = 999999999.9
         self.min_rtt_time = 0.
         # Linear regression of mcu clock and system sent_time
-        self.time_avg = self.time_variance = 0.
+        self.time_avg = self.time_variance = self.time_skew = 0.
         self.clock_avg = self.clock_covariance = 0.
         self.prediction_variance = 0.
         self.last_prediction_time = 0.
+        self.regress_freq = 0.
+        # Linear regression of frequency drift over time
+        self.drift_time_avg = self.drift_time_variance = 0.
+        self.freq_avg = self.freq_variance = self.freq_covariance = 0.
+        self.drift = self.drift_stddev = 0.
+        # Adaptive get_clock query rate
+        self.query_interval = QUERY_INTERVAL
     def connect(self, serial):
         self.serial = serial
         self.mcu_freq = serial.msgparser.get_constant_float('CLOCK_FREQ')
@@ -36,6 +49,8 @@ class ClockSync:
         self.clock_avg = self.last_clock
         self.time_avg = params['#sent_time']
         self.clock_est = (self.time_avg, self.clock_avg, self.mcu_freq)
+        self.regress_freq = self.freq_avg = self.mcu_freq
+        self.drift_time_avg = self.time_avg
         self.prediction_variance = (.001 * self.mcu_freq)**2
         # Enable periodic get_clock timer
         for i in range(8):
@@ -44,7 +59,7 @@ class ClockSync:
             params = serial.send_with_response('get_clock', 'clock')
             self._handle_clock(params)
         self.get_clock_cmd = serial.get_msgparser().create_command('get_clock')
-        self.cmd_queue = serial.alloc_command_queue()
+        self.cmd_queue = serial.alloc_command_queue("clocksync")
         serial.register_response(self._handle_clock, 'clock')
         self.reactor.update_timer(self.get_clock_timer, self.reactor.NOW)
     def connect_file(self, serial, pace=False):
@@ -59,9 +74,56 @@ class ClockSync:
     def _get_clock_event(self, eventtime):
         self.serial.raw_send(self.get_clock_cmd, 0, 0, self.cmd_queue)
         self.queries_pending += 1
+        # Query less often when samples are consistently accurate, and
+        # more often while the frequency drift is poorly known.  (Extra
+        # samples do not help with noisy samples as the regression
+        # decays per sample.)
+        interval = self.query_interval
+        jitter = math.sqrt(self.prediction_variance) / self.mcu_freq
+        drift_err = .5 * self.drift_stddev * interval**2 / self.mcu_freq
+        if drift_err > LOW_JITTER:
+            interval = max(MIN_QUERY_INTERVAL, .8 * interval)
+        elif jitter < LOW_JITTER:
+            interval = min(MAX_QUERY_INTERVAL, 1.05 * interval)
+        elif interval < QUERY_INTERVAL:
+            interval = min(QUERY_INTERVAL, 1.05 * interval)
+        else:
+            interval = max(QUERY_INTERVAL, .95 * interval)
+        self.query_interval = interval
         # Use an unusual time for the next event so clock messages
         # don't resonate with other periodic events.
-        return eventtime + .9839
+        return eventtime + self.query_interval
+    def _predict_sample_clock(self, sent_time):
+        # Clock predicted by the regression (corrected for drift)
+        drift = self.drift
+        diff_time = sent_time - self.time_avg
+        return (self.clock_avg + self.regress_freq * diff_time
+                + .5 * drift * (diff_time**2 - self.time_variance))
+    def _update_drift(self, new_freq):
+        # Track the rate of change of the regression frequency.  The
+        # regression frequency best reflects the clock at time_avg.
+        diff_time = self.time_avg - self.drift_time_avg
+        self.drift_time_avg += DRIFT_DECAY * diff_time
+        self.drift_time_variance = (1. - DRIFT_DECAY) * (
+            self.drift_time_variance + diff_time**2 * DRIFT_DECAY)
+        diff_freq = new_freq - self.freq_avg
+        self.freq_avg += DRIFT_DECAY * diff_freq
+        self.freq_variance = (1. - DRIFT_DECAY) * (
+            self.freq_variance + diff_freq**2 * DRIFT_DECAY)
+        self.freq_covariance = (1. - DRIFT_DECAY) * (
+            self.freq_covariance + diff_time * diff_freq * DRIFT_DECAY)
+        if self.drift_time_variance < DRIFT_MIN_SPAN**2:
+            self.drift = self.drift_stddev = 0.
+            return
+        # Only apply drift that is significant compared to its error
+        slope = self.freq_covariance / self.drift_time_variance
+        resid_variance = max(0., self.freq_variance
+                             - slope * self.freq_covariance)
+        self.drift_stddev = math.sqrt(resid_variance * DRIFT_DECAY
+                                      / self.drift_time_variance)
+        self.drift = 0.
+        if abs(slope) > 2. * self.drift_stddev:
+            self.drift = slope
     def _handle_clock(self, params):
         self.queries_pending = 0
         # Extend clock to 64bit
@@ -81,8 +143,7 @@ class ClockSync:
             logging.debug("new minimum rtt %.3f: hrtt=%.6f freq=%d",
                           sent_time, half_rtt, self.clock_est[2])
         # Filter out samples that are extreme outliers
-        exp_clock = ((sent_time - self.time_avg) * self.clock_est[2]
-                     + self.clock_avg)
+        exp_clock = self._predict_sample_clock(sent_time)
         clock_diff2 = (clock - exp_clock)**2
         if (clock_diff2 > 25. * self.prediction_variance
             and clock_diff2 > (.000500 * self.mcu_freq)**2):
@@ -97,6 +158,7 @@ class ClockSync:
                          sent_time, self.clock_est[2], clock - exp_clock,
                          math.sqrt(self.prediction_variance))
             self.prediction_variance = (.001 * self.mcu_freq)**2
+            self.query_interval = MIN_QUERY_INTERVAL
         else:
             self.last_prediction_time = sent_time
             self.prediction_variance = (
@@ -104,6 +166,9 @@ class ClockSync:
         # Add clock and sent_time to linear regression
         diff_sent_time = sent_time - self.time_avg
         self.time_avg += DECAY * diff_sent_time
+        self.time_skew = (1. - DECAY) * (
+            self.time_skew - 3. * DECAY * diff_sent_time * self.time_variance
+            + DECAY * diff_sent_time**3 * ((1. - DECAY)**2 - DECAY**2))
         self.time_variance = (1. - DECAY) * (
             self.time_variance + diff_sent_time**2 * DECAY)
         diff_clock = clock - self.clock_avg
@@ -112,11 +177,18 @@ class ClockSync:
             self.clock_covariance + diff_sent_time * diff_clock * DECAY)
         # Update prediction from linear regression
         new_freq = self.clock_covariance / self.time_variance
+        self._update_drift(new_freq)
+        # With a drifting clock the regression slope (which favors recent
+        # samples) differs from the frequency at time_avg
+        self.regress_freq = new_freq - (.5 * self.drift * self.time_skew
+                                        / self.time_variance)
+        # Estimate clock and frequency at the time of this sample
+        est_clock = self._predict_sample_clock(sent_time)
+        est_freq = self.regress_freq + self.drift * (sent_time - self.time_avg)
         pred_stddev = math.sqrt(self.prediction_variance)
-        self.serial.set_clock_est(new_freq, self.time_avg + TRANSMIT_EXTRA,
-                                  int(self.clock_avg - 3. * pred_stddev), clock)
-        self.clock_est = (self.time_avg + self.min_half_rtt,
-                          self.clock_avg, new_freq)
+        self.serial.set_clock_est(est_freq, sent_time + TRANSMIT_EXTRA,
+                                  int(est_clock - 3. * pred_stddev), clock)
+        self.clock_est = (sent_time + self.min_half_rtt, est_clock, est_freq)
         #logging.debug("regr %.3f: freq=%.3f d=%d(%.3f)",
         #              sent_time, new_freq, clock - exp_clock, pred_stddev)
     # clock frequency conversions
@@ -133,6 +205,18 @@ class ClockSync:
         return float(reqclock - clock)/freq + sample_time
     def estimated_print_time(self, eventtime):
         return self.clock_to_print_time(self.get_clock(eventtime))
+    def predict_clock(self, eventtime):
+        # Like get_clock(), but includes the estimated frequency drift
+        # (useful when predicting further into the future)
+        sample_time, clock, freq = self.clock_est
+        diff_time = eventtime - sample_time
+        return int(clock + diff_time * (freq + .5 * self.drift * diff_time))
+    def get_sync_error(self, eventtime):
+        # Estimated error (3 standard deviations) of get_clock() in seconds
+        diff_time = eventtime - self.clock_est[0]
+        drift_variance = (.5 * self.drift_stddev * diff_time**2)**2
+        return (3. * math.sqrt(self.prediction_variance + drift_variance)
+                / self.mcu_freq)
     # misc commands
     def clock32_to_clock64(self, clock32):
         last_clock = self.last_clock
@@ -140,21 +224,24 @@ class ClockSync:
         clock_diff -= (clock_diff & 0x80000000) << 1
         return last_clock + clock_diff
     def is_active(self):
-        return self.queries_pending <= 4
+        return self.queries_pending * self.query_interval <= 4. * QUERY_INTERVAL
     def dump_debug(self):
         sample_time, clock, freq = self.clock_est
         return ("clocksync state: mcu_freq=%d last_clock=%d"
                 " clock_est=(%.3f %d %.3f) min_half_rtt=%.6f min_rtt_time=%.3f"
                 " time_avg=%.3f(%.3f) clock_avg=%.3f(%.3f)"
-                " pred_variance=%.3f" % (
+                " pred_variance=%.3f drift=%.6f(%.6f) query_interval=%.3f" % (
                     self.mcu_freq, self.last_clock, sample_time, clock, freq,
                     self.min_half_rtt, self.min_rtt_time,
                     self.time_avg, self.time_variance,
                     self.clock_avg, self.clock_covariance,
-                    self.prediction_variance))
+                    self.prediction_variance, self.drift, self.drift_stddev,
+                    self.query_interval))
     def stats(self, eventtime):
         sample_time, clock, freq = self.clock_est
-        return "freq=%d" % (freq,)
+        return "freq=%d drift=%.3f sync_err=%.6f query_interval=%.3f" % (
+            freq, self.drift, self.get_sync_error(eventtime),
+            self.query_interval)
     def calibrate_clock(self, print_time, eventtime):
         return (0., self.mcu_freq)
 
@@ -189,13 +276,19 @@ class SecondarySync(ClockSync):
         adjusted_offset, adjusted_freq = self.clock_adj
         return "%s clock_adj=(%.3f %.3f)" % (
             ClockSync.dump_debug(self), adjusted_offset, adjusted_freq)
+    def get_sync_error(self, eventtime):
+        # Error relative to the main mcu clock (in seconds)
+        local_err = ClockSync.get_sync_error(self, eventtime)
+        main_err = self.main_sync.get_sync_error(eventtime)
+        return math.sqrt(local_err**2 + main_err**2)
     def stats(self, eventtime):
         adjusted_offset, adjusted_freq = self.clock_adj
         return "%s adj=%d" % (ClockSync.stats(self, eventtime), adjusted_freq)
     def calibrate_clock(self, print_time, eventtime):
         # Calculate: est_print_time = main_sync.estimatated_print_time()
-        ser_time, ser_clock, ser_freq = self.main_sync.clock_est
-        main_mcu_freq = self.main_sync.mcu_freq
+        main_sync = self.main_sync
+        ser_time, ser_clock, ser_freq = main_sync.clock_est
+        main_mcu_freq = main_sync.mcu_freq
         est_main_clock = (eventtime - ser_time) * ser_freq + ser_clock
         est_print_time = est_main_clock / main_mcu_freq
         # Determine sync1_print_time and sync2_print_time
@@ -205,9 +298,12 @@ class SecondarySync(ClockSync):
         # Calc sync2_sys_time (inverse of main_sync.estimatated_print_time)
         sync2_main_clock = sync2_print_time * main_mcu_freq
         sync2_sys_time = ser_time + (sync2_main_clock - ser_clock) / ser_freq
+        # Correct for the expected frequency drift of both clocks
+        main_diff_time = sync2_sys_time - ser_time
+        sync2_sys_time -= .5 * main_sync.drift * main_diff_time**2 / ser_freq
         # Adjust freq so estimated print_time will match at sync2_print_time
         sync1_clock = self.print_time_to_clock(sync1_print_time)
-        sync2_clock = self.get_clock(sync2_sys_time)
+        sync2_clock = self.predict_clock(sync2_sys_time)
         adjusted_freq = ((sync2_clock - sync1_clock)
                          / (sync2_print_time - sync1_print_time))
         adjusted_offset = sync1_print_time - sync1_clock / adjusted_freq
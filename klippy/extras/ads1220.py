@@ -135,6 +135,13 @@ class ADS1220:
             count += 1
         del samples[count:]
 
+    def _convert_sample_arrays(self, ptimes, samples):
+        np = self.ffreader.numpy
+        adc_factor = 1. / (1 << 23)
+        vals = samples['f0']
+        return list(zip(np.round(ptimes, 6).tolist(), vals.tolist(),
+                        np.round(vals * adc_factor, 9).tolist()))
+
     # Start, stop, and process message batches
     def _start_measurements(self):
         self.last_error_count = 0
@@ -158,8 +165,12 @@ class ADS1220:
         logging.info("ADS1220 finished '%s' measurements", self.name)
 
     def _process_batch(self, eventtime):
-        samples = self.ffreader.pull_samples()
-        self._convert_samples(samples)
+        if self.ffreader.numpy is not None:
+            ptimes, samples = self.ffreader.pull_sample_arrays()
+            samples = self._convert_sample_arrays(ptimes, samples)
+        else:
+            samples = self.ffreader.pull_samples()
+            self._convert_samples(samples)
         return {'data': samples, 'errors': self.last_error_count,
                 'overflows': self.ffreader.get_last_overflows()}
 
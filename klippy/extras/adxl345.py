@@ -3,8 +3,8 @@
 # Copyright (C) 2020-2023  Kevin O'Connor <kevin@koconnor.net>
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
-import logging, time, collections, multiprocessing, os
-from . import bus, bulk_sensor
+import logging, time, collections, array, struct, sys, itertools
+from . import bus, bulk_sensor, calc_worker
 
 # ADXL345 registers
 REG_DEVID = 0x00
@@ -39,20 +39,48 @@ class AccelQueryHelper:
         self.request_start_time = self.request_end_time = print_time
         self.msgs = []
         self.samples = []
+        self.sample_consumers = []
+        self.keep_samples = True
+        self.streamed_count = 0
+        self.stream_end_time = None
+    def add_sample_consumer(self, consumer, keep_samples=False):
+        # Pass the measured samples to consumer.add_samples() as they
+        # arrive (optionally without storing them in memory)
+        if not self.sample_consumers:
+            self.keep_samples = False
+        self.sample_consumers.append(consumer)
+        self.keep_samples = self.keep_samples or keep_samples
     def finish_measurements(self):
         toolhead = self.printer.lookup_object('toolhead')
         self.request_end_time = toolhead.get_last_move_time()
+        self.stream_end_time = self.request_end_time
         toolhead.wait_moves()
         self.is_finished = True
+    def _stream_samples(self, data):
+        start_time, end_time = self.request_start_time, self.stream_end_time
+        if data[0][0] < start_time:
+            data = [s for s in data if s[0] >= start_time]
+        if end_time is not None and data and data[-1][0] > end_time:
+            data = [s for s in data if s[0] <= end_time]
+        if data:
+            self.streamed_count += len(data)
+            for consumer in self.sample_consumers:
+                consumer.add_samples(data)
     def handle_batch(self, msg):
         if self.is_finished:
             return False
+        if self.sample_consumers:
+            self._stream_samples(msg['data'])
+            if not self.keep_samples or len(self.msgs) >= 10000:
+                return True
         if len(self.msgs) >= 10000:
             # Avoid filling up memory with too many samples
             return False
         self.msgs.append(msg)
         return True
     def has_valid_samples(self):
+        if self.sample_consumers:
+            return self.streamed_count > 0
         for msg in self.msgs:
             data = msg['data']
             first_sample_time = data[0][0]
@@ -85,23 +113,69 @@ class AccelQueryHelper:
                 count += 1
         del samples[count:]
         return self.samples
+    def _get_sample_values(self):
+        # Return the requested samples as a flat array of doubles
+        # (without creating an Accel_Measurement for each sample)
+        if not self.msgs:
+            return array.array('d', itertools.chain.from_iterable(
+                self.samples))
+        reactor = self.printer.get_reactor()
+        start_time, end_time = self.request_start_time, self.request_end_time
+        values = array.array('d')
+        for i, msg in enumerate(self.msgs):
+            if i and not i % 500:
+                # Let other tasks run while converting a long capture
+                reactor.pause(reactor.NOW)
+            data = msg['data']
+            if data[0][0] < start_time or data[-1][0] > end_time:
+                data = [s for s in data if start_time <= s[0] <= end_time]
+            values.extend(itertools.chain.from_iterable(data))
+        return values
     def write_to_file(self, filename):
-        def write_impl():
+        values = self._get_sample_values()
+        if filename.endswith('.npy'):
             try:
-                # Try to re-nice writing process
-                os.nice(20)
-            except:
-                pass
-            f = open(filename, "w")
-            f.write("#time,accel_x,accel_y,accel_z\n")
-            samples = self.samples or self.get_samples()
-            for t, accel_x, accel_y, accel_z in samples:
-                f.write("%.6f,%.6f,%.6f,%.6f\n" % (
-                    t, accel_x, accel_y, accel_z))
-            f.close()
-        write_proc = multiprocessing.Process(target=write_impl)
-        write_proc.daemon = True
-        write_proc.start()
+                write_npy_file(filename, values, Accel_Measurement._fields)
+            except (IOError, OSError) as e:
+                raise self.printer.command_error(
+                    "Unable to write '%s': %s" % (filename, str(e)))
+            return
+        # Format and write the samples in the calculation worker process
+        shared = calc_worker.SharedArray(values, (len(values) // 4, 4))
+        worker = calc_worker.lookup_calc_worker(self.printer)
+        try:
+            worker.submit(write_samples_file, (filename, shared))
+        except:
+            shared.close()
+            raise
+
+RAW_DATA_FORMATS = ['npy', 'csv']
+
+# Write a table of doubles in the numpy ".npy" format (as a structured
+# array with the given field names) without requiring numpy
+def write_npy_file(filename, values, fields):
+    order = '<' if sys.byteorder == 'little' else '>'
+    descr = ", ".join(["('%s', '%sf8')" % (f, order) for f in fields])
+    header = "{'descr': [%s], 'fortran_order': False, 'shape': (%d,), }" % (
+        descr, len(values) // len(fields))
+    # Pad the header so that the data starts at a 64 byte boundary
+    header += ' ' * (-(len(header) + 11) % 64) + '\n'
+    f = open(filename, "wb")
+    try:
+        f.write(b'\x93NUMPY\x01\x00' + struct.pack('<H', len(header))
+                + header.encode())
+        values.tofile(f)
+    finally:
+        f.close()
+
+# Invoked in the calculation worker process
+def write_samples_file(filename, shared_samples):
+    values = shared_samples.load()
+    f = open(filename, "w")
+    f.write("#time,accel_x,accel_y,accel_z\n")
+    for i in range(0, len(values), 4):
+        f.write("%.6f,%.6f,%.6f,%.6f\n" % tuple(values[i:i+4]))
+    f.close()
 
 # Helper class for G-Code commands
 class AccelCommandHelper:
@@ -142,14 +216,18 @@ class AccelCommandHelper:
         name = gcmd.get("NAME", time.strftime("%Y%m%d_%H%M%S"))
         if not name.replace('-', '').replace('_', '').isalnum():
             raise gcmd.error("Invalid NAME parameter")
+        raw_format = gcmd.get("FORMAT", "npy").lower()
+        if raw_format not in RAW_DATA_FORMATS:
+            raise gcmd.error("Invalid FORMAT parameter")
         bg_client = self.bg_client
         self.bg_client = None
         bg_client.finish_measurements()
         # Write data to file
         if self.base_name == self.name:
-            filename = "/tmp/%s-%s.csv" % (self.base_name, name)
+            filename = "/tmp/%s-%s.%s" % (self.base_name, name, raw_format)
         else:
-            filename = "/tmp/%s-%s-%s.csv" % (self.base_name, self.name, name)
+            filename = "/tmp/%s-%s-%s.%s" % (self.base_name, self.name, name,
+                                             raw_format)
         bg_client.write_to_file(filename)
         gcmd.respond_info("Writing raw accelerometer data to %s file"
                           % (filename,))
@@ -259,6 +337,22 @@ class ADXL345:
             samples[count] = (round(ptime, 6), x, y, z)
             count += 1
         del samples[count:]
+    def _convert_sample_arrays(self, ptimes, samples):
+        np = self.ffreader.numpy
+        (x_pos, x_scale), (y_pos, y_scale), (z_pos, z_scale) = self.axes_map
+        xlow, ylow, zlow, xzhigh, yzhigh = [
+            samples[f].astype(np.int32) for f in samples.dtype.names]
+        valid = (yzhigh & 0x80) == 0
+        self.last_error_count += len(valid) - int(np.count_nonzero(valid))
+        rx = (xlow | ((xzhigh & 0x1f) << 8)) - ((xzhigh & 0x10) << 9)
+        ry = (ylow | ((yzhigh & 0x1f) << 8)) - ((yzhigh & 0x10) << 9)
+        rz = ((zlow | ((xzhigh & 0xe0) << 3) | ((yzhigh & 0xe0) << 6))
+              - ((yzhigh & 0x40) << 7))
+        raw_xyz = (rx, ry, rz)
+        out = np.column_stack((ptimes, raw_xyz[x_pos] * x_scale,
+                               raw_xyz[y_pos] * y_scale,
+                               raw_xyz[z_pos] * z_scale))
+        return np.round(out[valid], 6)
     # Start, stop, and process message batches
     def _start_measurements(self):
         # In case of miswiring, testing ADXL345 device ID prevents treating
@@ -291,9 +385,13 @@ class ADXL345:
         self.ffreader.note_end()
         logging.info("ADXL345 finished '%s' measurements", self.name)
     def _process_batch(self, eventtime):
-        samples = self.ffreader.pull_samples()
-        self._convert_samples(samples)
-        if not samples:
+        if self.ffreader.numpy is not None:
+            ptimes, samples = self.ffreader.pull_sample_arrays()
+            samples = self._convert_sample_arrays(ptimes, samples)
+        else:
+            samples = self.ffreader.pull_samples()
+            self._convert_samples(samples)
+        if not len(samples):
             return {}
         return {'data': samples, 'errors': self.last_error_count,
                 'overflows': self.ffreader.get_last_overflows()}
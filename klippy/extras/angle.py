@@ -20,6 +20,10 @@ class AngleCalibration:
         self.printer = config.get_printer()
         self.name = config.get_name()
         self.stepper_name = config.get('stepper', None)
+        # Current calibration data (a numpy lookup table of angle
+        # corrections indexed by the low 16 bits of an angle)
+        self.calibration = None
+        self.calibration_reversed = False
         if self.stepper_name is None:
             # No calibration
             return
@@ -30,11 +34,8 @@ class AngleCalibration:
         sconfig = config.getsection(self.stepper_name)
         sconfig.getint('microsteps', note_valid=False)
         self.tmc_module = self.mcu_stepper = None
-        # Current calibration data
         self.mcu_pos_offset = None
         self.angle_phase_offset = 0.
-        self.calibration_reversed = False
-        self.calibration = []
         cal = config.get('calibrate', None)
         if cal is not None:
             data = [d.strip() for d in cal.split(',')]
@@ -71,28 +72,16 @@ class AngleCalibration:
             phase_diff -= phases
         # Store final offset
         self.mcu_pos_offset = mcu_pos - (angle_mpos - phase_diff)
-    def apply_calibration(self, samples):
+    def apply_calibration(self, ptimes, angles):
+        # Calibrate a numpy array of angles (in place)
         calibration = self.calibration
-        if not calibration:
+        if calibration is None:
             return None
-        calibration_reversed = self.calibration_reversed
-        interp_bits = ANGLE_BITS - CALIBRATION_BITS
-        interp_mask = (1 << interp_bits) - 1
-        interp_round = 1 << (interp_bits - 1)
-        for i, (samp_time, angle) in enumerate(samples):
-            bucket = (angle & 0xffff) >> interp_bits
-            cal1 = calibration[bucket]
-            cal2 = calibration[bucket + 1]
-            adj = (angle & interp_mask) * (cal2 - cal1)
-            adj = cal1 + ((adj + interp_round) >> interp_bits)
-            angle_diff = (adj - angle) & 0xffff
-            angle_diff -= (angle_diff & 0x8000) << 1
-            new_angle = angle + angle_diff
-            if calibration_reversed:
-                new_angle = -new_angle
-            samples[i] = (samp_time, new_angle)
+        angles += calibration[angles & 0xffff]
+        if self.calibration_reversed:
+            angles *= -1
         if self.mcu_pos_offset is None:
-            self.calc_mcu_pos_offset(samples[0])
+            self.calc_mcu_pos_offset((float(ptimes[0]), int(angles[0])))
             if self.mcu_pos_offset is None:
                 return None
         return self.mcu_stepper.mcu_to_commanded_position(self.mcu_pos_offset)
@@ -127,7 +116,19 @@ class AngleCalibration:
                 ans[step] -= ang_diff_per * angle_max
         sol = numpy.linalg.lstsq(eqs, ans, rcond=None)[0]
         isol = [int(s + .5) for s in sol]
-        self.calibration = isol + [isol[0] + angle_max]
+        cal = numpy.array(isol + [isol[0] + angle_max], dtype=numpy.int64)
+        # Precompute the interpolated correction of every angle
+        interp_bits = ANGLE_BITS - CALIBRATION_BITS
+        interp_mask = (1 << interp_bits) - 1
+        interp_round = 1 << (interp_bits - 1)
+        raw_angles = numpy.arange(angle_max, dtype=numpy.int64)
+        cal1 = cal[raw_angles >> interp_bits]
+        cal2 = cal[(raw_angles >> interp_bits) + 1]
+        adj = (raw_angles & interp_mask) * (cal2 - cal1)
+        adj = cal1 + ((adj + interp_round) >> interp_bits)
+        angle_diff = (adj - raw_angles) & 0xffff
+        angle_diff -= (angle_diff & 0x8000) << 1
+        self.calibration = angle_diff
     def lookup_tmc(self):
         for driver in TRINAMIC_DRIVERS:
             driver_name = "%s %s" % (driver, self.stepper_name)
@@ -227,7 +228,7 @@ class AngleCalibration:
     def cmd_ANGLE_CALIBRATE(self, gcmd):
         # Perform calibration movement and capture
         old_calibration = self.calibration
-        self.calibration = []
+        self.calibration = None
         try:
             fcal, rcal = self.do_calibration_moves()
         finally:
@@ -613,6 +614,13 @@ class Angle:
         self.sample_period = config.getfloat('sample_period', SAMPLE_PERIOD,
                                              above=0.)
         self.calibration = AngleCalibration(config)
+        # Numpy is optional - it is only needed by _extract_sample_arrays()
+        self.numpy = None
+        try:
+            import numpy
+            self.numpy = numpy
+        except ImportError:
+            pass
         # Measurement conversion
         self.start_clock = self.time_shift = self.sample_ticks = 0
         self.last_sequence = self.last_angle = 0
@@ -715,6 +723,63 @@ class Angle:
         self.last_angle = last_angle
         del samples[count:]
         return samples, error_count
+    def _extract_sample_arrays(self, raw_samples):
+        np = self.numpy
+        # Gather the sample bytes and the mcu clock of each message
+        sample_ticks = self.sample_ticks
+        last_sequence = self.last_sequence
+        msg_mclocks = []
+        msg_counts = []
+        data = bytearray()
+        for params in raw_samples:
+            seq_diff = (params['sequence'] - last_sequence) & 0xffff
+            last_sequence += seq_diff
+            samp_count = last_sequence * SAMPLES_PER_BLOCK
+            msg_mclocks.append(self.start_clock + samp_count*sample_ticks)
+            count = len(params['data']) // BYTES_PER_SAMPLE
+            msg_counts.append(count)
+            data += params['data'][:count * BYTES_PER_SAMPLE]
+        self.last_sequence = last_sequence
+        raw = np.frombuffer(bytes(data), dtype=np.uint8)
+        raw = raw.reshape(-1, BYTES_PER_SAMPLE).astype(np.int64)
+        # Expand the per message clocks to per sample clocks
+        msg_counts = np.array(msg_counts, dtype=np.int64)
+        msg_offsets = np.cumsum(msg_counts) - msg_counts
+        msg_mclocks = np.array(msg_mclocks, dtype=np.int64)
+        mclocks = (np.repeat(msg_mclocks - msg_offsets*sample_ticks, msg_counts)
+                   + np.arange(len(raw), dtype=np.int64) * sample_ticks)
+        # Discard errors
+        valid = raw[:, 0] != TCODE_ERROR
+        error_count = len(raw) - int(np.count_nonzero(valid))
+        raw = raw[valid]
+        mclocks = mclocks[valid]
+        tcodes = raw[:, 0]
+        # Unwrap the 16bit angles
+        angle_diffs = np.diff(raw[:, 1] | (raw[:, 2] << 8),
+                              prepend=self.last_angle) & 0xffff
+        angle_diffs -= (angle_diffs & 0x8000) << 1
+        angles = self.last_angle + np.cumsum(angle_diffs)
+        if len(angles):
+            self.last_angle = int(angles[-1])
+        # Calculate sample times
+        if self.sensor_helper.is_tcode_absolute:
+            # tcode is tle5012b frame counter
+            tparams = self.sensor_helper.get_tcode_params()
+            last_chip_mcu_clock, last_chip_clock, chip_freq = tparams
+            mdiff = mclocks - last_chip_mcu_clock
+            chip_mclocks = last_chip_clock + np.trunc(
+                mdiff * chip_freq + .5).astype(np.int64)
+            cdiffs = ((tcodes << 10) - chip_mclocks) & 0xffff
+            cdiffs -= (cdiffs & 0x8000) << 1
+            sclocks = mclocks + (cdiffs - 0x800) * (1. / chip_freq)
+            static_delay = 0.
+        else:
+            # tcode is mcu clock offset shifted by time_shift
+            sclocks = mclocks + (tcodes << self.time_shift)
+            static_delay = self.sensor_helper.get_static_delay()
+        # The mcu clock to print time conversion also works on arrays
+        ptimes = self.mcu.clock_to_print_time(sclocks)
+        return np.round(ptimes - static_delay, 6), angles, error_count
     # Start, stop, and process message batches
     def _is_measuring(self):
         return self.start_clock != 0
@@ -743,10 +808,18 @@ class Angle:
         raw_samples = self.bulk_queue.pull_queue()
         if not raw_samples:
             return {}
-        samples, error_count = self._extract_samples(raw_samples)
-        if not samples:
+        if self.numpy is None:
+            # Angle calibration requires numpy, so there is nothing to apply
+            samples, error_count = self._extract_samples(raw_samples)
+            if not samples:
+                return {}
+            return {'data': samples, 'errors': error_count,
+                    'position_offset': None}
+        ptimes, angles, error_count = self._extract_sample_arrays(raw_samples)
+        if not len(angles):
             return {}
-        offset = self.calibration.apply_calibration(samples)
+        offset = self.calibration.apply_calibration(ptimes, angles)
+        samples = list(zip(ptimes.tolist(), angles.tolist()))
         return {'data': samples, 'errors': error_count,
                 'position_offset': offset}
 
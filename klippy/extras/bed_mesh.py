@@ -457,23 +457,15 @@ class BedMeshCalibrate:
             gcmd.respond_info("Exclude objects not enabled. Using full mesh...")
             return False
         objects = exclude_objects.get_status().get("objects", [])
-        if not objects:
+        bounds = exclude_objects.get_objects_bounds()
+        if not objects or bounds is None:
             return False
         margin = gcmd.get_float('ADAPTIVE_MARGIN', self.adaptive_margin)
-
-        # List all exclude_object points by axis and iterate over
-        # all polygon points, and pick the min and max or each axis
-        list_of_xs = []
-        list_of_ys = []
         gcmd.respond_info("Found %s objects" % (len(objects)))
-        for obj in objects:
-            for point in obj["polygon"]:
-                list_of_xs.append(point[0])
-                list_of_ys.append(point[1])
-
-        # Define bounds of adaptive mesh area
-        mesh_min = [min(list_of_xs), min(list_of_ys)]
-        mesh_max = [max(list_of_xs), max(list_of_ys)]
+
+        # Define bounds of adaptive mesh area from the precomputed
+        # bounding box of all exclude_object polygons
+        mesh_min, mesh_max = bounds
         adjusted_mesh_min = [x - margin for x in mesh_min]
         adjusted_mesh_max = [x + margin for x in mesh_max]
 
@@ -3,7 +3,7 @@
 # Copyright (C) 2020-2023  Kevin O'Connor <kevin@koconnor.net>
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
-import logging, threading, struct
+import logging, threading, struct, os, mmap, tempfile
 
 # This "bulk sensor" module facilitates the processing of sensor chip
 # measurements that do not require the host to respond with low
@@ -35,7 +35,15 @@ class BatchBulkHelper:
         self.batch_interval = batch_interval
         self.batch_timer = None
         self.client_cbs = []
+        self.array_client_cbs = []
         self.webhooks_start_resp = {}
+        self.shm_clients = []
+        printer.register_event_handler("klippy:disconnect",
+                                       self._handle_disconnect)
+    def _handle_disconnect(self):
+        for shm_client in self.shm_clients:
+            shm_client.close()
+        del self.shm_clients[:]
     # Periodic batch processing
     def _start(self):
         if self.is_started:
@@ -47,6 +55,7 @@ class BatchBulkHelper:
             logging.exception("BatchBulkHelper start callback error")
             self.is_started = False
             del self.client_cbs[:]
+            del self.array_client_cbs[:]
             raise
         reactor = self.printer.get_reactor()
         systime = reactor.monotonic()
@@ -54,6 +63,7 @@ class BatchBulkHelper:
         self.batch_timer = reactor.register_timer(self._proc_batch, waketime)
     def _stop(self):
         del self.client_cbs[:]
+        del self.array_client_cbs[:]
         self.printer.get_reactor().unregister_timer(self.batch_timer)
         self.batch_timer = None
         if not self.is_started:
@@ -63,6 +73,7 @@ class BatchBulkHelper:
         except self.printer.command_error as e:
             logging.exception("BatchBulkHelper stop callback error")
             del self.client_cbs[:]
+            del self.array_client_cbs[:]
         self.is_started = False
         if self.client_cbs:
             # New client started while in process of stopping
@@ -76,24 +87,59 @@ class BatchBulkHelper:
             return self.printer.get_reactor().NEVER
         if not msg:
             return eventtime + self.batch_interval
+        # Sensors may provide their data as a numpy array - only clients
+        # registered with accepts_arrays receive it without conversion
+        list_msg = msg
+        data = msg.get('data')
+        if hasattr(data, 'tolist'):
+            list_msg = None
         for client_cb in list(self.client_cbs):
-            res = client_cb(msg)
+            if client_cb in self.array_client_cbs:
+                res = client_cb(msg)
+            else:
+                if list_msg is None:
+                    list_msg = dict(msg)
+                    list_msg['data'] = data.tolist()
+                res = client_cb(list_msg)
             if not res:
                 # This client no longer needs updates - unregister it
                 self.client_cbs.remove(client_cb)
+                if client_cb in self.array_client_cbs:
+                    self.array_client_cbs.remove(client_cb)
                 if not self.client_cbs:
                     self._stop()
                     return self.printer.get_reactor().NEVER
         return eventtime + self.batch_interval
     # Client registration
-    def add_client(self, client_cb):
+    def add_client(self, client_cb, accepts_arrays=False):
         self.client_cbs.append(client_cb)
+        if accepts_arrays:
+            self.array_client_cbs.append(client_cb)
         self._start()
     # Webhooks registration
     def _add_api_client(self, web_request):
-        whbatch = BatchWebhooksClient(web_request)
-        self.add_client(whbatch.handle_batch)
-        web_request.send(self.webhooks_start_resp)
+        transport = web_request.get_str('transport', 'json')
+        if transport == 'json':
+            whbatch = BatchWebhooksClient(web_request)
+            self.add_client(whbatch.handle_batch)
+            web_request.send(self.webhooks_start_resp)
+            return
+        if transport != 'shm':
+            raise web_request.error("Unknown transport '%s'" % (transport,))
+        # Remove shared memory clients that have already disconnected
+        for shm_client in list(self.shm_clients):
+            if shm_client.is_closed():
+                self.shm_clients.remove(shm_client)
+        shmbatch = BatchSharedMemoryClient(web_request)
+        self.shm_clients.append(shmbatch)
+        try:
+            self.add_client(shmbatch.handle_batch, accepts_arrays=True)
+        except:
+            shmbatch.close()
+            raise
+        resp = dict(self.webhooks_start_resp)
+        resp.update(shmbatch.get_info())
+        web_request.send(resp)
     def add_mux_endpoint(self, path, key, value, webhooks_start_resp):
         self.webhooks_start_resp = webhooks_start_resp
         wh = self.printer.lookup_object('webhooks')
@@ -112,6 +158,108 @@ class BatchWebhooksClient:
         self.cconn.send(tmp)
         return True
 
+SHM_MAGIC = b"KLBULK01"
+SHM_HEADER = struct.Struct("<8sQQ")
+SHM_HEADER_SIZE = 64
+SHM_DEFAULT_SIZE = 4 * 1024 * 1024
+SHM_MIN_SIZE = 64 * 1024
+SHM_MAX_SIZE = 256 * 1024 * 1024
+SHM_DIR = "/dev/shm"
+
+# A webhooks wrapper that places the "data" rows of each batch in a
+# shared memory ring buffer (as packed little-endian doubles) and only
+# sends a small JSON notification over the socket.  The ring starts
+# with a header containing a magic string, the size of the data area,
+# and the total number of bytes ever written to the ring.
+class BatchSharedMemoryClient:
+    def __init__(self, web_request):
+        self.cconn = web_request.get_client_connection()
+        self.template = web_request.get_dict('response_template', {})
+        size = web_request.get_int('shm_size', SHM_DEFAULT_SIZE)
+        if size < SHM_MIN_SIZE or size > SHM_MAX_SIZE:
+            raise web_request.error("Invalid shm_size %d" % (size,))
+        self.capacity = size
+        self.write_pos = 0
+        tmpdir = SHM_DIR if os.path.isdir(SHM_DIR) else None
+        fd, self.path = tempfile.mkstemp(prefix="klippy_bulk_", dir=tmpdir)
+        try:
+            os.ftruncate(fd, SHM_HEADER_SIZE + size)
+            self.mm = mmap.mmap(fd, SHM_HEADER_SIZE + size)
+        except:
+            os.close(fd)
+            os.unlink(self.path)
+            raise
+        os.close(fd)
+        self._write_header()
+    def get_info(self):
+        return {'shm_path': self.path, 'shm_size': self.capacity}
+    def is_closed(self):
+        return self.mm is None
+    def close(self):
+        if self.mm is None:
+            return
+        self.mm.close()
+        self.mm = None
+        try:
+            os.unlink(self.path)
+        except OSError:
+            logging.exception("Unable to remove %s", self.path)
+    def _write_header(self):
+        self.mm[:SHM_HEADER.size] = SHM_HEADER.pack(
+            SHM_MAGIC, self.capacity, self.write_pos)
+    def _pack_data(self, data):
+        if hasattr(data, 'tobytes'):
+            # Numpy array - store it directly as little endian doubles
+            if len(data.shape) != 2:
+                return None, 0
+            return data.astype('<f8').tobytes(), data.shape[1]
+        try:
+            columns = len(data[0])
+            values = [v for row in data for v in row]
+            if len(values) != columns * len(data):
+                return None, 0
+            return struct.pack("<%dd" % (len(values),), *values), columns
+        except (TypeError, struct.error):
+            return None, 0
+    def _write(self, buf):
+        pos = self.write_pos % self.capacity
+        first = min(len(buf), self.capacity - pos)
+        start = SHM_HEADER_SIZE + pos
+        self.mm[start:start+first] = buf[:first]
+        if first < len(buf):
+            rest = len(buf) - first
+            self.mm[SHM_HEADER_SIZE:SHM_HEADER_SIZE+rest] = buf[first:]
+        self.write_pos += len(buf)
+        self._write_header()
+    def handle_batch(self, msg):
+        if self.mm is None:
+            return False
+        if self.cconn.is_closed():
+            self.close()
+            return False
+        tmp = dict(self.template)
+        data = msg.get('data')
+        packed = columns = None
+        if data is not None and len(data):
+            packed, columns = self._pack_data(data)
+        if packed is None or len(packed) > self.capacity:
+            # Data can't be stored in the ring - send it inline instead
+            if hasattr(data, 'tolist'):
+                msg = dict(msg)
+                msg['data'] = data.tolist()
+            tmp['params'] = msg
+            self.cconn.send(tmp)
+            return True
+        start = self.write_pos
+        self._write(packed)
+        params = dict(msg)
+        del params['data']
+        params['shm'] = {'start': start, 'size': len(packed),
+                         'rows': len(data), 'columns': columns}
+        tmp['params'] = params
+        self.cconn.send(tmp)
+        return True
+
 # Helper class to store incoming messages in a queue
 class BulkDataQueue:
     def __init__(self, mcu, msg_name="sensor_bulk_data", oid=None):
@@ -119,10 +267,10 @@ class BulkDataQueue:
         self.lock = threading.Lock()
         self.raw_samples = []
         # Register callback with mcu
-        mcu.register_response(self._handle_data, msg_name, oid)
-    def _handle_data(self, params):
+        mcu.register_batch_response(self._handle_data, msg_name, oid)
+    def _handle_data(self, batch):
         with self.lock:
-            self.raw_samples.append(params)
+            self.raw_samples.extend(batch)
     def pull_queue(self):
         with self.lock:
             raw_samples = self.raw_samples
@@ -131,6 +279,39 @@ class BulkDataQueue:
     def clear_queue(self):
         self.pull_queue()
 
+# Helper class to store the payload of incoming messages in a single
+# contiguous buffer (along with the sequence and size of each message).
+# Any partial sample at the end of a message is discarded.
+class BulkDataBuffer:
+    def __init__(self, mcu, msg_name="sensor_bulk_data", oid=None,
+                 bytes_per_sample=1):
+        self.bytes_per_sample = bytes_per_sample
+        # Measurement storage (accessed from background thread)
+        self.lock = threading.Lock()
+        self.blocks = []
+        self.data = bytearray()
+        # Register callback with mcu
+        mcu.register_batch_response(self._handle_data, msg_name, oid)
+    def _handle_data(self, batch):
+        bytes_per_sample = self.bytes_per_sample
+        with self.lock:
+            for params in batch:
+                data = params['data']
+                length = len(data) - len(data) % bytes_per_sample
+                if length != len(data):
+                    data = data[:length]
+                self.blocks.append((params['sequence'], length))
+                self.data += data
+    def pull_queue(self):
+        with self.lock:
+            blocks = self.blocks
+            data = self.data
+            self.blocks = []
+            self.data = bytearray()
+        return blocks, data
+    def clear_queue(self):
+        self.pull_queue()
+
 
 ######################################################################
 # Clock synchronization
@@ -197,9 +378,36 @@ class ClockSyncRegression:
         base_time = clock_to_print_time(base_mcu)
         inv_freq = clock_to_print_time(base_mcu + inv_cfreq) - base_time
         return base_time, base_chip, inv_freq
+    def get_print_times(self, chip_clocks):
+        # Convert a numpy array of chip clocks to an array of print times
+        base_time, base_chip, inv_freq = self.get_time_translation()
+        return base_time + (chip_clocks - base_chip) * inv_freq
 
 MAX_BULK_MSG_SIZE = 51
 
+NUMPY_TYPES = {
+    'b': 'i1', 'B': 'u1', 'h': 'i2', 'H': 'u2', 'i': 'i4', 'I': 'u4',
+    'l': 'i4', 'L': 'u4', 'q': 'i8', 'Q': 'u8', 'f': 'f4', 'd': 'f8',
+}
+
+# Find a numpy structured dtype matching a struct module format string
+def lookup_numpy_dtype(numpy, unpack_fmt):
+    byteorder = '='
+    fmt = unpack_fmt
+    if fmt and fmt[0] in '<>!=@':
+        byteorder = {'!': '>', '@': '='}.get(fmt[0], fmt[0])
+        fmt = fmt[1:]
+    fields = []
+    for c in fmt:
+        ntype = NUMPY_TYPES.get(c)
+        if ntype is None:
+            return None
+        fields.append(('f%d' % (len(fields),), byteorder + ntype))
+    dtype = numpy.dtype(fields)
+    if dtype.itemsize != struct.calcsize(unpack_fmt):
+        return None
+    return dtype
+
 # Read sensor_bulk_data and calculate timestamps for devices that take
 # samples at a fixed frequency (and produce fixed data size samples).
 class FixedFreqReader:
@@ -207,8 +415,18 @@ class FixedFreqReader:
         self.mcu = mcu
         self.clock_sync = ClockSyncRegression(mcu, chip_clock_smooth)
         unpack = struct.Struct(unpack_fmt)
-        self.unpack_from = unpack.unpack_from
+        self.iter_unpack = unpack.iter_unpack
         self.bytes_per_sample = unpack.size
+        # Numpy is optional - it is only needed by pull_sample_arrays()
+        self.numpy = self.np_dtype = None
+        try:
+            import numpy
+        except ImportError:
+            pass
+        else:
+            self.np_dtype = lookup_numpy_dtype(numpy, unpack_fmt)
+            if self.np_dtype is not None:
+                self.numpy = numpy
         self.samples_per_block = MAX_BULK_MSG_SIZE // self.bytes_per_sample
         self.last_sequence = self.max_query_duration = 0
         self.last_overflows = 0
@@ -221,7 +439,8 @@ class FixedFreqReader:
             " next_sequence=%hu buffered=%u possible_overflows=%hu",
             oid=oid, cq=cq)
         # Read sensor_bulk_data messages and store in a queue
-        self.bulk_queue = BulkDataQueue(self.mcu, oid=oid)
+        self.bulk_queue = BulkDataBuffer(
+            self.mcu, oid=oid, bytes_per_sample=self.bytes_per_sample)
     def get_last_overflows(self):
         return self.last_overflows
     def _clear_duration_filter(self):
@@ -264,34 +483,53 @@ class FixedFreqReader:
             self.clock_sync.reset(avg_mcu_clock, chip_clock)
         else:
             self.clock_sync.update(avg_mcu_clock, chip_clock)
-    # Convert sensor_bulk_data responses into list of samples
-    def pull_samples(self):
+    # Pull the raw sample data along with the chip clock of the first
+    # sample and the number of samples in each message
+    def _pull_data(self):
         # Query MCU for sample timing and update clock synchronization
         self._update_clock()
-        # Pull sensor_bulk_data messages from local queue
-        raw_samples = self.bulk_queue.pull_queue()
-        if not raw_samples:
-            return []
-        # Load variables to optimize inner loop below
+        # Pull sensor_bulk_data payloads from local queue
+        blocks, data = self.bulk_queue.pull_queue()
+        # Sequence tracking only needs to be done once per message
         last_sequence = self.last_sequence
-        time_base, chip_base, inv_freq = self.clock_sync.get_time_translation()
-        unpack_from = self.unpack_from
         bytes_per_sample = self.bytes_per_sample
         samples_per_block = self.samples_per_block
-        # Process every message in raw_samples
-        count = seq = 0
-        samples = [None] * (len(raw_samples) * samples_per_block)
-        for params in raw_samples:
-            seq_diff = (params['sequence'] - last_sequence) & 0xffff
+        msg_chip_clocks = []
+        msg_counts = []
+        for sequence, length in blocks:
+            seq_diff = (sequence - last_sequence) & 0xffff
             seq_diff -= (seq_diff & 0x8000) << 1
-            seq = last_sequence + seq_diff
-            msg_cdiff = seq * samples_per_block - chip_base
-            data = params['data']
-            for i in range(len(data) // bytes_per_sample):
-                ptime = time_base + (msg_cdiff + i) * inv_freq
-                udata = unpack_from(data, i * bytes_per_sample)
-                samples[count] = (ptime,) + udata
-                count += 1
-        self.clock_sync.set_last_chip_clock(seq * samples_per_block + i)
-        del samples[count:]
-        return samples
+            msg_chip_clocks.append((last_sequence + seq_diff)
+                                   * samples_per_block)
+            msg_counts.append(length // bytes_per_sample)
+        return msg_chip_clocks, msg_counts, data
+    # Convert sensor_bulk_data responses into list of samples
+    def pull_samples(self):
+        msg_chip_clocks, msg_counts, data = self._pull_data()
+        if not data:
+            return []
+        chip_clocks = []
+        for msg_chip_clock, count in zip(msg_chip_clocks, msg_counts):
+            chip_clocks.extend(range(msg_chip_clock, msg_chip_clock + count))
+        time_base, chip_base, inv_freq = self.clock_sync.get_time_translation()
+        self.clock_sync.set_last_chip_clock(chip_clocks[-1])
+        return [(time_base + (chip_clock - chip_base) * inv_freq,) + udata
+                for chip_clock, udata in zip(chip_clocks,
+                                             self.iter_unpack(data))]
+    # Convert sensor_bulk_data responses into numpy arrays - returns an
+    # array of sample times and a structured array of the sample fields
+    # (named f0, f1, ...)
+    def pull_sample_arrays(self):
+        np = self.numpy
+        msg_chip_clocks, msg_counts, data = self._pull_data()
+        if not data:
+            return np.zeros(0), np.zeros(0, dtype=self.np_dtype)
+        # Expand the per message chip clocks to per sample chip clocks
+        msg_chip_clocks = np.array(msg_chip_clocks, dtype=np.int64)
+        msg_counts = np.array(msg_counts, dtype=np.int64)
+        msg_offsets = np.cumsum(msg_counts) - msg_counts
+        chip_clocks = (np.repeat(msg_chip_clocks - msg_offsets, msg_counts)
+                       + np.arange(len(data) // self.bytes_per_sample))
+        ptimes = self.clock_sync.get_print_times(chip_clocks)
+        self.clock_sync.set_last_chip_clock(int(chip_clocks[-1]))
+        return ptimes, np.frombuffer(bytes(data), dtype=self.np_dtype)
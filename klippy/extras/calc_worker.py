@@ -0,0 +1,154 @@
+# Persistent background process for expensive calculations
+#
+# Copyright (C) 2026  CreatBot
+#
+# This file may be distributed under the terms of the GNU GPLv3 license.
+import logging, os, array, tempfile, multiprocessing, traceback
+
+SHARED_DIR = "/dev/shm"
+
+# Pass an array of doubles to the worker process through a file in
+# shared memory instead of pickling it over the pipe.  The receiving
+# side removes the file once it has been loaded.
+class SharedArray:
+    def __init__(self, values, shape):
+        tmpdir = SHARED_DIR if os.path.isdir(SHARED_DIR) else None
+        fd, self.path = tempfile.mkstemp(prefix="klippy_calc_", dir=tmpdir)
+        f = os.fdopen(fd, 'wb')
+        try:
+            values.tofile(f)
+        except:
+            f.close()
+            self.close()
+            raise
+        f.close()
+        self.shape = tuple(shape)
+    def close(self):
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+    def load(self):
+        # Load the values into an array.array('d')
+        values = array.array('d')
+        f = open(self.path, 'rb')
+        try:
+            count = 1
+            for dim in self.shape:
+                count *= dim
+            values.fromfile(f, count)
+        finally:
+            f.close()
+            self.close()
+        return values
+    def load_numpy(self, np):
+        if not all(self.shape):
+            self.close()
+            return np.zeros(self.shape)
+        values = np.memmap(self.path, dtype=np.float64, mode='r',
+                           shape=self.shape)
+        self.close()
+        return values
+
+def _worker_main(conn):
+    import queuelogger
+    queuelogger.clear_bg_logging()
+    while 1:
+        try:
+            req = conn.recv()
+        except EOFError:
+            break
+        if req is None:
+            break
+        func, args = req
+        try:
+            res = (False, func(*args))
+        except:
+            res = (True, traceback.format_exc())
+        try:
+            conn.send(res)
+        except:
+            # Result could not be sent (eg, it can not be pickled)
+            conn.send((True, traceback.format_exc()))
+    conn.close()
+
+# Calculation worker process.  The process is started on first use and
+# then runs all submitted jobs (one at a time, in order) until klippy
+# disconnects.  Jobs must be picklable module level functions.
+class CalcWorker:
+    def __init__(self, printer):
+        self.printer = printer
+        self.proc = self.conn = None
+        self.pending_jobs = 0
+        self.mutex = printer.get_reactor().mutex()
+        printer.register_event_handler("klippy:disconnect",
+                                       self._handle_disconnect)
+    def _handle_disconnect(self):
+        if self.proc is None:
+            return
+        try:
+            self.conn.send(None)
+        except (IOError, OSError):
+            pass
+        self.proc.join(1.)
+        if self.proc.is_alive():
+            self.proc.terminate()
+        self.conn.close()
+        self.proc = self.conn = None
+    def _start(self):
+        if self.proc is not None:
+            if self.proc.is_alive():
+                return
+            logging.info("Calculation worker exited - restarting")
+            self.conn.close()
+        parent_conn, child_conn = multiprocessing.Pipe()
+        self.proc = multiprocessing.Process(target=_worker_main,
+                                            args=(child_conn,))
+        self.proc.daemon = True
+        self.proc.start()
+        child_conn.close()
+        self.conn = parent_conn
+        self.pending_jobs = 0
+    def _receive(self, wait_msg=None):
+        reactor = self.printer.get_reactor()
+        eventtime = last_report_time = reactor.monotonic()
+        while not self.conn.poll():
+            if not self.proc.is_alive():
+                self.proc = None
+                self.conn.close()
+                raise self.printer.command_error(
+                    "Calculation worker process exited unexpectedly")
+            if wait_msg is not None and eventtime > last_report_time + 5.:
+                last_report_time = eventtime
+                gcode = self.printer.lookup_object("gcode")
+                gcode.respond_info(wait_msg, log=False)
+            eventtime = reactor.pause(eventtime + .1)
+        return self.conn.recv()
+    def _check_background_result(self, res):
+        self.pending_jobs -= 1
+        is_err, msg = res
+        if is_err:
+            logging.error("Error in background calculation: %s", msg)
+    def submit(self, func, args):
+        # Run a job without waiting for its result
+        self._start()
+        while (not self.mutex.test() and self.pending_jobs
+               and self.conn.poll()):
+            self._check_background_result(self.conn.recv())
+        self.conn.send((func, args))
+        self.pending_jobs += 1
+    def run(self, func, args, wait_msg=None):
+        # Run a job and wait for it to complete; returns (is_err, result)
+        with self.mutex:
+            self._start()
+            while self.pending_jobs:
+                self._check_background_result(self._receive(wait_msg))
+            self.conn.send((func, args))
+            return self._receive(wait_msg)
+
+def lookup_calc_worker(printer):
+    worker = printer.lookup_object('calc_worker', None)
+    if worker is None:
+        worker = CalcWorker(printer)
+        printer.add_object('calc_worker', worker)
+    return worker
@@ -73,10 +73,34 @@ class ExcludeObject:
             self.gcode_move.reset_last_position()
 
     def _reset_state(self):
-        self.objects = []
-        self.excluded_objects = []
+        # Object definitions and bounding boxes keyed by object name
+        self.objects = {}
+        self.object_bounds = {}
+        self.excluded_objects = set()
         self.current_object = None
+        self.current_excluded = False
         self.in_excluded_region = False
+        self._update_objects_status()
+
+    def _update_objects_status(self):
+        # Build the reported object lists only when they change so that
+        # get_status() can return them without any per-query work
+        self.objects_status = [self.objects[name]
+                               for name in sorted(self.objects)]
+        self.excluded_status = sorted(self.excluded_objects)
+        self._update_current_object()
+
+    def _update_current_object(self):
+        self.current_excluded = self.current_object in self.excluded_objects
+        self.status = {
+            "objects": self.objects_status,
+            "excluded_objects": self.excluded_status,
+            "current_object": self.current_object
+        }
+
+    def _set_current_object(self, name):
+        self.current_object = name
+        self._update_current_object()
 
     def _reset_file(self):
         self._reset_state()
@@ -166,16 +190,18 @@ class ExcludeObject:
 
     def _test_in_excluded_region(self):
         # Inside cancelled object
-        return self.current_object in self.excluded_objects \
-            and self.initial_extrusion_moves == 0
+        return self.current_excluded and self.initial_extrusion_moves == 0
 
     def get_status(self, eventtime=None):
-        status = {
-            "objects": self.objects,
-            "excluded_objects": self.excluded_objects,
-            "current_object": self.current_object
-        }
-        return status
+        return self.status
+
+    def get_objects_bounds(self):
+        # Return the (min, max) xy corners enclosing all object polygons
+        if not self.object_bounds:
+            return None
+        bounds = list(self.object_bounds.values())
+        return ([min([b[0] for b in bounds]), min([b[1] for b in bounds])],
+                [max([b[2] for b in bounds]), max([b[3] for b in bounds])])
 
     def move(self, newpos, speed, taskline=0):
         move_in_excluded_region = self._test_in_excluded_region()
@@ -196,9 +222,9 @@ class ExcludeObject:
                                     " as labeled"
     def cmd_EXCLUDE_OBJECT_START(self, gcmd):
         name = gcmd.get('NAME').upper()
-        if not any(obj["name"] == name for obj in self.objects):
+        if name not in self.objects:
             self._add_object_definition({"name": name})
-        self.current_object = name
+        self._set_current_object(name)
         self.was_excluded_at_start = self._test_in_excluded_region()
 
     cmd_EXCLUDE_OBJECT_END_help = "Marks the end the current object"
@@ -213,7 +239,7 @@ class ExcludeObject:
                               " current object NAME=%s" %
                               (name.upper(), self.current_object))
 
-        self.current_object = None
+        self._set_current_object(None)
 
     cmd_EXCLUDE_OBJECT_help = "Cancel moves inside a specified objects"
     def cmd_EXCLUDE_OBJECT(self, gcmd):
@@ -226,7 +252,8 @@ class ExcludeObject:
                 self._unexclude_object(name)
 
             else:
-                self.excluded_objects = []
+                self.excluded_objects = set()
+                self._update_objects_status()
 
         elif name:
             if name.upper() not in self.excluded_objects:
@@ -271,31 +298,44 @@ class ExcludeObject:
             self._list_objects(gcmd)
 
     def _add_object_definition(self, definition):
-        self.objects = sorted(self.objects + [definition],
-                              key=lambda o: o["name"])
+        name = definition["name"]
+        self.objects[name] = definition
+        self.object_bounds.pop(name, None)
+        polygon = definition.get("polygon")
+        if polygon:
+            try:
+                xs = [float(p[0]) for p in polygon]
+                ys = [float(p[1]) for p in polygon]
+            except (TypeError, ValueError, IndexError):
+                logging.info("exclude_object: Ignoring invalid polygon for"
+                             " object %s", name)
+            else:
+                self.object_bounds[name] = (min(xs), min(ys),
+                                            max(xs), max(ys))
+        self._update_objects_status()
 
     def _exclude_object(self, name):
         self._register_transform()
         self.gcode.respond_info('Excluding object {}'.format(name.upper()))
         if name not in self.excluded_objects:
-            self.excluded_objects = sorted(self.excluded_objects + [name])
+            self.excluded_objects.add(name)
+            self._update_objects_status()
 
     def _unexclude_object(self, name):
         self.gcode.respond_info('Unexcluding object {}'.format(name.upper()))
         if name in self.excluded_objects:
-            excluded_objects = list(self.excluded_objects)
-            excluded_objects.remove(name)
-            self.excluded_objects = sorted(excluded_objects)
+            self.excluded_objects.discard(name)
+            self._update_objects_status()
 
     def _list_objects(self, gcmd):
         if gcmd.get('JSON', None) is not None:
-            object_list = json.dumps(self.objects)
+            object_list = json.dumps(self.objects_status)
         else:
-            object_list = " ".join(obj['name'] for obj in self.objects)
+            object_list = " ".join(obj['name'] for obj in self.objects_status)
         gcmd.respond_info('Known objects: {}'.format(object_list))
 
     def _list_excluded_objects(self, gcmd):
-        object_list = " ".join(self.excluded_objects)
+        object_list = " ".join(self.excluded_status)
         gcmd.respond_info('Excluded objects: {}'.format(object_list))
 
 def load_config(config):
@@ -8,7 +8,7 @@
 # This file may be distributed under the terms of the GNU GPLv3 license.
 import math
 
-# Coordinates created by this are converted into G1 commands.
+# Coordinates created by this are queued as a batch of linear moves.
 #
 # supports XY, XZ & YZ planes with remaining axis as helical
 
@@ -24,11 +24,18 @@ Z_AXIS = 2
 E_AXIS = 3
 
 
+# Segments shorter than the distance traveled in this time (at the
+# velocity the arc can actually be followed) do not improve accuracy
+# enough to justify the extra planning work
+MIN_SEGMENT_TIME = 0.001
+
 class ArcSupport:
 
     def __init__(self, config):
         self.printer = config.get_printer()
         self.mm_per_arc_segment = config.getfloat('resolution', 1., above=0.0)
+        self.max_chord_error = config.getfloat('max_chord_error', None,
+                                               above=0.)
 
         self.gcode_move = self.printer.load_object(config, 'gcode_move')
         self.gcode = self.printer.lookup_object('gcode')
@@ -89,20 +96,61 @@ class ArcSupport:
         if not (asPlanar[0] or asPlanar[1]):
             raise gcmd.error("G2/G3 requires IJ, IK or JK parameters")
 
+        asE = gcmd.get_float("E", None)
+        asF = gcmd.get_float("F", None, above=0.)
+
+        # Requested velocity (in mm/s) for choosing the segment length
+        gcode_speed = asF
+        if gcode_speed is None:
+            gcode_speed = gcodestatus['speed']
+        speed = gcode_speed * gcodestatus['speed_factor'] / 60.
+
         # Build linear coordinates to move
-        self.planArc(currentPos, asTarget, asPlanar, clockwise,
-                     gcmd, absolut_extrude, *axes)
+        coords = self.planArc(currentPos, asTarget, asPlanar, clockwise,
+                              speed, *axes)
+
+        # Distribute extrusion evenly over the segments
+        e_per_move = 0.
+        if asE is not None:
+            e_base = 0.
+            if absolut_extrude:
+                e_base = currentPos[3]
+            e_per_move = (asE - e_base) / len(coords)
+        for c in coords:
+            c.append(e_per_move)
+
+        # Queue all segments in a single batch
+        self.gcode_move.move_path(coords, asF, gcmd.get_taskline())
+
+    def _get_segment_length(self, radius, speed):
+        if self.max_chord_error is None:
+            return self.mm_per_arc_segment
+        max_chord_error = self.max_chord_error
+        if radius <= .5 * max_chord_error:
+            # Any chord of the arc is within tolerance
+            return 2. * radius + self.mm_per_arc_segment
+        # Longest chord that deviates from the arc by max_chord_error
+        seg_len = 2. * math.sqrt(max_chord_error
+                                 * (2. * radius - max_chord_error))
+        # Avoid segments the toolhead would traverse in less than
+        # MIN_SEGMENT_TIME at the centripetal limited velocity
+        toolhead = self.printer.lookup_object('toolhead')
+        max_velocity, max_accel = toolhead.get_max_velocity()
+        arc_velocity = min(speed, max_velocity,
+                           math.sqrt(max_accel * radius))
+        return max(seg_len, arc_velocity * MIN_SEGMENT_TIME)
 
     # function planArc() originates from marlin plan_arc()
     # https://github.com/MarlinFirmware/Marlin
     #
     # The arc is approximated by generating many small linear segments.
-    # The length of each segment is configured in MM_PER_ARC_SEGMENT
-    # Arcs smaller then this value, will be a Line only
+    # The length of each segment is configured in MM_PER_ARC_SEGMENT, or
+    # derived from the configured max_chord_error, the arc radius and
+    # the requested velocity.  Arcs smaller then this value, will be a
+    # Line only
     #
     # alpha and beta axes are the current plane, helical axis is linear travel
-    def planArc(self, currentPos, targetPos, offset, clockwise,
-                gcmd, absolut_extrude,
+    def planArc(self, currentPos, targetPos, offset, clockwise, speed,
                 alpha_axis, beta_axis, helical_axis):
         # todo: sometimes produces full circles
 
@@ -137,47 +185,25 @@ class ArcSupport:
             mm_of_travel = math.hypot(flat_mm, linear_travel)
         else:
             mm_of_travel = math.fabs(flat_mm)
-        segments = max(1., math.floor(mm_of_travel / self.mm_per_arc_segment))
+        seg_len = self._get_segment_length(radius, speed)
+        segments = int(max(1., math.floor(mm_of_travel / seg_len)))
 
         # Generate coordinates
         theta_per_segment = angular_travel / segments
         linear_per_segment = linear_travel / segments
-
-        asE = gcmd.get_float("E", None)
-        asF = gcmd.get_float("F", None)
-
-        e_per_move = e_base = 0.
-        if asE is not None:
-            if absolut_extrude:
-                e_base = currentPos[3]
-            e_per_move = (asE - e_base) / segments
-
-        for i in range(1, int(segments) + 1):
-            dist_Helical = i * linear_per_segment
+        helical_start = currentPos[helical_axis]
+        coords = []
+        for i in range(1, segments):
             c_theta = i * theta_per_segment
             cos_Ti = math.cos(c_theta)
             sin_Ti = math.sin(c_theta)
-            r_P = -offset[0] * cos_Ti + offset[1] * sin_Ti
-            r_Q = -offset[0] * sin_Ti - offset[1] * cos_Ti
-
-            c = [None, None, None]
-            c[alpha_axis] = center_P + r_P
-            c[beta_axis] = center_Q + r_Q
-            c[helical_axis] = currentPos[helical_axis] + dist_Helical
-
-
-            if i == segments:
-                c = targetPos
-            # Convert coords into G1 commands
-            g1_params = {'X': c[0], 'Y': c[1], 'Z': c[2]}
-            if e_per_move:
-                g1_params['E'] = e_base + e_per_move
-                if absolut_extrude:
-                    e_base += e_per_move
-            if asF is not None:
-                g1_params['F'] = asF
-            g1_gcmd = self.gcode.create_gcode_command("G1", "G1", g1_params)
-            self.gcode_move.cmd_G1(g1_gcmd)
+            c = [0., 0., 0.]
+            c[alpha_axis] = center_P - offset[0] * cos_Ti + offset[1] * sin_Ti
+            c[beta_axis] = center_Q - offset[0] * sin_Ti - offset[1] * cos_Ti
+            c[helical_axis] = helical_start + i * linear_per_segment
+            coords.append(c)
+        coords.append(list(targetPos))
+        return coords
 
 def load_config(config):
     return ArcSupport(config)
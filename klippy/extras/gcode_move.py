@@ -142,6 +142,24 @@ class GCodeMove:
             raise gcmd.error("Unable to parse move '%s'"
                              % (gcmd.get_commandline(),))
         self.move_with_transform(self.last_position, self.speed, line)
+    def move_path(self, path, gcode_speed=None, taskline=0):
+        # Queue a batch of moves (eg, from G2/G3 arc planning) without
+        # creating and parsing a G1 command for each one.  Each path
+        # entry is an absolute (x, y, z) g-code position followed by a
+        # relative extrude distance (in g-code units).
+        if gcode_speed is not None:
+            self.speed = gcode_speed * self.speed_factor
+        speed = self.speed
+        base_x, base_y, base_z = self.base_position[:3]
+        extrude_factor = self.extrude_factor
+        last_position = self.last_position
+        move_with_transform = self.move_with_transform
+        for x, y, z, e in path:
+            last_position[0] = x + base_x
+            last_position[1] = y + base_y
+            last_position[2] = z + base_z
+            last_position[3] += e * extrude_factor
+            move_with_transform(last_position, speed, taskline)
     # G-Code coordinate manipulation
     def cmd_G20(self, gcmd):
         # Set units to inches
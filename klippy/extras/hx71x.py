@@ -95,6 +95,19 @@ class HX71xBase:
             count += 1
         del samples[count:]
 
+    def _convert_sample_arrays(self, ptimes, samples):
+        np = self.ffreader.numpy
+        adc_factor = 1. / (1 << 23)
+        vals = samples['f0']
+        errors = np.flatnonzero((vals == SAMPLE_ERROR_DESYNC)
+                                | (vals == SAMPLE_ERROR_LONG_READ))
+        if len(errors):
+            self.last_error_count += 1
+            # additional errors are duplicates
+            ptimes, vals = ptimes[:errors[0]], vals[:errors[0]]
+        return list(zip(np.round(ptimes, 6).tolist(), vals.tolist(),
+                        np.round(vals * adc_factor, 9).tolist()))
+
     # Start, stop, and process message batches
     def _start_measurements(self):
         self.consecutive_fails = 0
@@ -120,8 +133,12 @@ class HX71xBase:
     def _process_batch(self, eventtime):
         prev_overflows = self.ffreader.get_last_overflows()
         prev_error_count = self.last_error_count
-        samples = self.ffreader.pull_samples()
-        self._convert_samples(samples)
+        if self.ffreader.numpy is not None:
+            ptimes, samples = self.ffreader.pull_sample_arrays()
+            samples = self._convert_sample_arrays(ptimes, samples)
+        else:
+            samples = self.ffreader.pull_samples()
+            self._convert_samples(samples)
         overflows = self.ffreader.get_last_overflows() - prev_overflows
         errors = self.last_error_count - prev_error_count
         if errors > 0:
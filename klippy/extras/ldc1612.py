@@ -163,6 +163,16 @@ class LDC1612:
                 self.last_error_count += 1
             samples[count] = (round(ptime, 6), round(freq_conv * mv, 3), 999.9)
             count += 1
+    def _convert_sample_arrays(self, ptimes, samples):
+        np = self.ffreader.numpy
+        freq_conv = float(self.frequency) / (1<<28)
+        val = samples['f0']
+        mv = val & 0x0fffffff
+        self.last_error_count += int(np.count_nonzero(mv != val))
+        out = np.column_stack((np.round(ptimes, 6),
+                               np.round(freq_conv * mv, 3),
+                               np.full(len(val), 999.9)))
+        return out.tolist()
     # Start, stop, and process message batches
     def _start_measurements(self):
         # In case of miswiring, testing LDC1612 device ID prevents treating
@@ -198,8 +208,12 @@ class LDC1612:
         self.ffreader.note_end()
         logging.info("LDC1612 finished '%s' measurements", self.name)
     def _process_batch(self, eventtime):
-        samples = self.ffreader.pull_samples()
-        self._convert_samples(samples)
+        if self.ffreader.numpy is not None:
+            ptimes, samples = self.ffreader.pull_sample_arrays()
+            samples = self._convert_sample_arrays(ptimes, samples)
+        else:
+            samples = self.ffreader.pull_samples()
+            self._convert_samples(samples)
         if not samples:
             return {}
         if self.calibration is not None:
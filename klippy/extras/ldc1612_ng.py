@@ -538,6 +538,8 @@ class LDC1612_ng:
         # logging.info("LDC1612 finished '%s' measurements", self._name)
 
     def _process_batch(self, eventtime):
+        if self._ffreader.numpy is not None:
+            return self._process_batch_arrays()
         samples = self._ffreader.pull_samples()
         count = 0
         err_count = 0
@@ -561,3 +563,21 @@ class LDC1612_ng:
             "errors": err_count,
             "overflows": self._ffreader.get_last_overflows(),
         }
+
+    def _process_batch_arrays(self):
+        np = self._ffreader.numpy
+        ptimes, samples = self._ffreader.pull_sample_arrays()
+        vals = samples["f0"]
+        errors = vals > 0x0FFFFFFF  # high nibble indicates an error
+        if self._verbose:
+            err_vals = vals[errors]
+            err_kinds = err_vals >> 28
+            changed = err_kinds != np.concatenate(([0], err_kinds[:-1]))
+            for val in err_vals[changed].tolist():
+                logging.info(f"LDC1612 error: {hex(val)}")
+        valid = ~errors
+        return {
+            "data": list(zip(ptimes[valid].tolist(), vals[valid].tolist())),
+            "errors": int(np.count_nonzero(errors)),
+            "overflows": self._ffreader.get_last_overflows(),
+        }
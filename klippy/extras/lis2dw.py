@@ -132,6 +132,14 @@ class LIS2DW:
             z = round(raw_xyz[z_pos] * z_scale, 6)
             samples[count] = (round(ptime, 6), x, y, z)
             count += 1
+    def _convert_sample_arrays(self, ptimes, samples):
+        np = self.ffreader.numpy
+        (x_pos, x_scale), (y_pos, y_scale), (z_pos, z_scale) = self.axes_map
+        raw_xyz = [samples[f] for f in samples.dtype.names]
+        out = np.column_stack((ptimes, raw_xyz[x_pos] * x_scale,
+                               raw_xyz[y_pos] * y_scale,
+                               raw_xyz[z_pos] * z_scale))
+        return np.round(out, 6).tolist()
     # Start, stop, and process message batches
     def _start_measurements(self):
         # In case of miswiring, testing LIS2DW device ID prevents treating
@@ -192,8 +200,12 @@ class LIS2DW:
         logging.info("LIS2DW finished '%s' measurements", self.name)
         self.set_reg(REG_LIS2DW_FIFO_CTRL, 0x00)
     def _process_batch(self, eventtime):
-        samples = self.ffreader.pull_samples()
-        self._convert_samples(samples)
+        if self.ffreader.numpy is not None:
+            ptimes, samples = self.ffreader.pull_sample_arrays()
+            samples = self._convert_sample_arrays(ptimes, samples)
+        else:
+            samples = self.ffreader.pull_samples()
+            self._convert_samples(samples)
         if not samples:
             return {}
         return {'data': samples, 'errors': self.last_error_count,
@@ -4,7 +4,7 @@
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
 import logging, math, os, time
-from . import shaper_calibrate
+from . import adxl345, shaper_calibrate
 
 class TestAxis:
     def __init__(self, axis=None, vib_dir=None):
@@ -124,70 +124,99 @@ class ResonanceTestExecutor:
     def __init__(self, config):
         self.printer = config.get_printer()
         self.gcode = self.printer.lookup_object('gcode')
+    def _plan_trajectory(self, test_seq, axis, start_pos, decel):
+        # Convert the test sequence into a list of constant acceleration
+        # trapq segments (along with the test frequency of each segment)
+        X, Y, Z, E = start_pos
+        dir_x, dir_y = axis.get_point(1.)
+        moves = []
+        freqs = []
+        pos = min_pos = max_pos = max_v = 0.
+        def add_segment(t_seg, start_v, end_v, freq):
+            if t_seg <= 0.:
+                return pos
+            r = 1. if start_v + end_v >= 0. else -1.
+            abs_start_v, abs_end_v = abs(start_v), abs(end_v)
+            accel = abs(abs_end_v - abs_start_v) / t_seg
+            if abs_end_v > abs_start_v:
+                times = (t_seg, 0., 0.)
+                cruise_v = abs_end_v
+            elif abs_end_v < abs_start_v:
+                times = (0., 0., t_seg)
+                cruise_v = abs_start_v
+            else:
+                times = (0., t_seg, 0.)
+                cruise_v = abs_start_v
+                accel = 0.
+            moves.append(times + (X + pos * dir_x, Y + pos * dir_y, Z,
+                                  r * dir_x, r * dir_y, 0.,
+                                  abs_start_v, cruise_v, accel))
+            freqs.append(freq)
+            return pos + .5 * (start_v + end_v) * t_seg
+        last_v = last_t = 0.
+        for next_t, accel, freq in test_seq:
+            t_seg = next_t - last_t
+            v = last_v + accel * t_seg
+            if abs(v) < 0.000001:
+                v = 0.
+            if v * last_v < 0:
+                # The move first goes to a complete stop, then changes direction
+                t_stop = -last_v / accel
+                pos = add_segment(t_stop, last_v, 0., freq)
+                min_pos, max_pos = min(min_pos, pos), max(max_pos, pos)
+                pos = add_segment(t_seg - t_stop, 0., v, freq)
+            else:
+                pos = add_segment(t_seg, last_v, v, freq)
+            min_pos, max_pos = min(min_pos, pos), max(max_pos, pos)
+            max_v = max(max_v, abs(v))
+            last_t = next_t
+            last_v = v
+        if last_v:
+            pos = add_segment(abs(last_v) / decel, last_v, 0., freqs[-1])
+            min_pos, max_pos = min(min_pos, pos), max(max_pos, pos)
+        limits = [[X + p * dir_x, Y + p * dir_y, Z, E]
+                  for p in (min_pos, max_pos)]
+        end_pos = [X + pos * dir_x, Y + pos * dir_y, Z, E]
+        max_accel = max([0.] + [m[11] for m in moves])
+        return moves, freqs, end_pos, limits, max_v, max_accel
     def run_test(self, test_seq, axis, gcmd):
         reactor = self.printer.get_reactor()
         toolhead = self.printer.lookup_object('toolhead')
-        X, Y, Z, E = toolhead.get_position()
-        # Override maximum acceleration and acceleration to
-        # deceleration based on the maximum test frequency
         systime = reactor.monotonic()
         toolhead_info = toolhead.get_status(systime)
-        old_max_accel = toolhead_info['max_accel']
-        old_minimum_cruise_ratio = toolhead_info['minimum_cruise_ratio']
-        max_accel = max([abs(a) for _, a, _ in test_seq])
-        self.gcode.run_script_from_command(
-            "SET_VELOCITY_LIMIT ACCEL=%.3f MINIMUM_CRUISE_RATIO=0"
-            % (max_accel,))
+        # Precompute the complete test trajectory
+        moves, freqs, end_pos, limits, max_v, max_accel = (
+                self._plan_trajectory(test_seq, axis, toolhead.get_position(),
+                                      toolhead_info['max_accel']))
+        if max_v > toolhead_info['max_velocity']:
+            raise gcmd.error("Resonance test velocity %.3f exceeds"
+                             " max_velocity %.3f" % (
+                                 max_v, toolhead_info['max_velocity']))
+        # Apply the kinematic speed and accel limits at the sweep extremes
+        limit_v2, limit_accel = toolhead.check_trajectory(limits, max_v,
+                                                          max_accel)
+        if limit_v2 < max_v**2 or limit_accel < max_accel:
+            raise gcmd.error("Resonance test velocity %.3f and accel %.3f"
+                             " exceed the kinematic limits (%.3f, %.3f) at"
+                             " this position" % (
+                                 max_v, max_accel, math.sqrt(limit_v2),
+                                 limit_accel))
         input_shaper = self.printer.lookup_object('input_shaper', None)
         if input_shaper is not None and not gcmd.get_int('INPUT_SHAPING', 0):
             input_shaper.disable_shaping()
             gcmd.respond_info("Disabled [input_shaper] for resonance testing")
         else:
             input_shaper = None
-        last_v = last_t = last_accel = last_freq = 0.
-        for next_t, accel, freq in test_seq:
-            t_seg = next_t - last_t
-            toolhead.cmd_M204(self.gcode.create_gcode_command(
-                "M204", "M204", {"S": abs(accel)}))
-            v = last_v + accel * t_seg
-            abs_v = abs(v)
-            if abs_v < 0.000001:
-                v = abs_v = 0.
-            abs_last_v = abs(last_v)
-            v2 = v * v
-            last_v2 = last_v * last_v
-            half_inv_accel = .5 / accel
-            d = (v2 - last_v2) * half_inv_accel
-            dX, dY = axis.get_point(d)
-            nX = X + dX
-            nY = Y + dY
-            toolhead.limit_next_junction_speed(abs_last_v)
-            if v * last_v < 0:
-                # The move first goes to a complete stop, then changes direction
-                d_decel = -last_v2 * half_inv_accel
-                decel_X, decel_Y = axis.get_point(d_decel)
-                toolhead.move([X + decel_X, Y + decel_Y, Z, E], abs_last_v)
-                toolhead.move([nX, nY, Z, E], abs_v)
-            else:
-                toolhead.move([nX, nY, Z, E], max(abs_v, abs_last_v))
-            if math.floor(freq) > math.floor(last_freq):
-                gcmd.respond_info("Testing frequency %.0f Hz" % (freq,))
-                reactor.pause(reactor.monotonic() + 0.01)
-            X, Y = nX, nY
-            last_t = next_t
-            last_v = v
-            last_accel = accel
-            last_freq = freq
-        if last_v:
-            d_decel = -.5 * last_v2 / old_max_accel
-            decel_X, decel_Y = axis.get_point(d_decel)
-            toolhead.cmd_M204(self.gcode.create_gcode_command(
-                "M204", "M204", {"S": old_max_accel}))
-            toolhead.move([X + decel_X, Y + decel_Y, Z, E], abs(last_v))
-        # Restore the original acceleration values
-        self.gcode.run_script_from_command(
-            "SET_VELOCITY_LIMIT ACCEL=%.3f MINIMUM_CRUISE_RATIO=%.3f"
-            % (old_max_accel, old_minimum_cruise_ratio))
+        def report_progress():
+            last_freq = 0.
+            for move, freq in zip(moves, freqs):
+                if math.floor(freq) > math.floor(last_freq):
+                    gcmd.respond_info("Testing frequency %.0f Hz" % (freq,))
+                    reactor.pause(reactor.monotonic() + 0.01)
+                last_freq = freq
+                yield move
+        # Queue the segments directly, bypassing the lookahead
+        toolhead.queue_trajectory(report_progress(), end_pos)
         # Restore input shaper if it was disabled for resonance testing
         if input_shaper is not None:
             input_shaper.enable_shaping()
@@ -229,9 +258,12 @@ class ResonanceTester:
                 for chip_axis, chip_name in self.accel_chip_names]
 
     def _run_test(self, gcmd, axes, helper, raw_name_suffix=None,
-                  accel_chips=None, test_point=None):
+                  accel_chips=None, test_point=None, raw_format='npy',
+                  cross_spectra=None):
         toolhead = self.printer.lookup_object('toolhead')
         calibration_data = {axis: None for axis in axes}
+        if cross_spectra is not None:
+            cross_spectra.update({axis: None for axis in axes})
 
         self.generator.prepare_test(gcmd)
 
@@ -258,6 +290,17 @@ class ResonanceTester:
                     for chip in accel_chips:
                         aclient = chip.start_internal_client()
                         raw_values.append((axis, aclient, chip.name))
+                if helper is not None:
+                    # Calculate the frequency response during the test
+                    for chip_axis, aclient, chip_name in raw_values:
+                        helper.stream_accelerometer_data(
+                                aclient, raw_name_suffix is not None)
+                cross_accumulator = None
+                if cross_spectra is not None and len(raw_values) > 1:
+                    # Align the chips for the cross spectral analysis
+                    cross_accumulator = helper.stream_cross_spectra(
+                            [aclient for _, aclient, _ in raw_values],
+                            [chip_name for _, _, chip_name in raw_values])
 
                 # Generate moves
                 test_seq = self.generator.gen_test()
@@ -268,7 +311,8 @@ class ResonanceTester:
                         raw_name = self.get_filename(
                                 'raw_data', raw_name_suffix, axis,
                                 point if len(test_points) > 1 else None,
-                                chip_name if accel_chips is not None else None,)
+                                chip_name if accel_chips is not None else None,
+                                ext=raw_format)
                         aclient.write_to_file(raw_name)
                         gcmd.respond_info(
                                 "Writing raw accelerometer data to "
@@ -285,6 +329,12 @@ class ResonanceTester:
                         calibration_data[axis] = new_data
                     else:
                         calibration_data[axis].add_data(new_data)
+                if cross_accumulator is not None:
+                    new_data = helper.process_cross_spectra(cross_accumulator)
+                    if cross_spectra[axis] is None:
+                        cross_spectra[axis] = new_data
+                    else:
+                        cross_spectra[axis].add_data(new_data)
         return calibration_data
     def _parse_chips(self, accel_chips):
         parsed_chips = []
@@ -315,34 +365,58 @@ class ResonanceTester:
 
         outputs = gcmd.get("OUTPUT", "resonances").lower().split(',')
         for output in outputs:
-            if output not in ['resonances', 'raw_data']:
-                raise gcmd.error("Unsupported output '%s', only 'resonances'"
-                                 " and 'raw_data' are supported" % (output,))
+            if output not in ['resonances', 'raw_data', 'cross_spectra']:
+                raise gcmd.error("Unsupported output '%s', only 'resonances',"
+                                 " 'raw_data' and 'cross_spectra' are"
+                                 " supported" % (output,))
         if not outputs:
-            raise gcmd.error("No output specified, at least one of 'resonances'"
-                             " or 'raw_data' must be set in OUTPUT parameter")
+            raise gcmd.error("No output specified, at least one of"
+                             " 'resonances', 'raw_data' or 'cross_spectra'"
+                             " must be set in OUTPUT parameter")
         name_suffix = gcmd.get("NAME", time.strftime("%Y%m%d_%H%M%S"))
         if not self.is_valid_name_suffix(name_suffix):
             raise gcmd.error("Invalid NAME parameter")
+        raw_format = gcmd.get("FORMAT", "npy").lower()
+        if raw_format not in adxl345.RAW_DATA_FORMATS:
+            raise gcmd.error("Invalid FORMAT parameter")
         csv_output = 'resonances' in outputs
         raw_output = 'raw_data' in outputs
+        cross_output = 'cross_spectra' in outputs
+        if cross_output:
+            if accel_chips is not None:
+                num_chips = len(accel_chips)
+            else:
+                num_chips = len([chip for chip_axis, chip in self.accel_chips
+                                 if axis.matches(chip_axis)])
+            if num_chips < 2:
+                raise gcmd.error("OUTPUT=cross_spectra requires at least two"
+                                 " accelerometer chips")
 
         # Setup calculation of resonances
-        if csv_output:
+        if csv_output or cross_output:
             helper = shaper_calibrate.ShaperCalibrate(self.printer)
         else:
             helper = None
+        cross_spectra = {} if cross_output else None
 
         data = self._run_test(
                 gcmd, [axis], helper,
                 raw_name_suffix=name_suffix if raw_output else None,
-                accel_chips=accel_chips, test_point=test_point)[axis]
+                accel_chips=accel_chips, test_point=test_point,
+                raw_format=raw_format, cross_spectra=cross_spectra)[axis]
         if csv_output:
             csv_name = self.save_calibration_data(
                     'resonances', name_suffix, helper, axis, data,
                     point=test_point, max_freq=self._get_max_calibration_freq())
             gcmd.respond_info(
                     "Resonances data written to %s file" % (csv_name,))
+        if cross_output:
+            output = self.get_filename('cross_spectra', name_suffix, axis,
+                                       test_point)
+            helper.save_cross_spectra(output, cross_spectra[axis],
+                                      self._get_max_calibration_freq())
+            gcmd.respond_info(
+                    "Cross spectra written to %s file" % (output,))
     cmd_SHAPER_CALIBRATE_help = (
         "Simular to TEST_RESONANCES but suggest input shaper config")
     def cmd_SHAPER_CALIBRATE(self, gcmd):
@@ -408,12 +482,14 @@ class ResonanceTester:
         "Measures noise of all enabled accelerometer chips")
     def cmd_MEASURE_AXES_NOISE(self, gcmd):
         meas_time = gcmd.get_float("MEAS_TIME", 2.)
+        helper = shaper_calibrate.ShaperCalibrate(self.printer)
         raw_values = [(chip_axis, chip.start_internal_client())
                       for chip_axis, chip in self.accel_chips]
+        for chip_axis, aclient in raw_values:
+            helper.stream_accelerometer_data(aclient)
         self.printer.lookup_object('toolhead').dwell(meas_time)
         for chip_axis, aclient in raw_values:
             aclient.finish_measurements()
-        helper = shaper_calibrate.ShaperCalibrate(self.printer)
         for chip_axis, aclient in raw_values:
             if not aclient.has_valid_samples():
                 raise gcmd.error(
@@ -431,7 +507,7 @@ class ResonanceTester:
         return name_suffix.replace('-', '').replace('_', '').isalnum()
 
     def get_filename(self, base, name_suffix, axis=None,
-                     point=None, chip_name=None):
+                     point=None, chip_name=None, ext="csv"):
         name = base
         if axis:
             name += '_' + axis.get_name()
@@ -440,7 +516,7 @@ class ResonanceTester:
         if point:
             name += "_%.3f_%.3f_%.3f" % (point[0], point[1], point[2])
         name += '_' + name_suffix
-        return os.path.join("/tmp", name + ".csv")
+        return os.path.join("/tmp", name + "." + ext)
 
     def save_calibration_data(self, base_name, name_suffix, shaper_calibrate,
                               axis, calibration_data,
@@ -3,13 +3,16 @@
 # Copyright (C) 2020-2024  Dmitry Butyugin <dmbutyugin@google.com>
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
-import collections, importlib, logging, math, multiprocessing, traceback
+import collections, importlib, logging, math
 shaper_defs = importlib.import_module('.shaper_defs', 'extras')
+calc_worker = importlib.import_module('.calc_worker', 'extras')
 
 MIN_FREQ = 5.
 MAX_FREQ = 200.
 WINDOW_T_SEC = 0.5
 MAX_SHAPER_FREQ = 150.
+# Maximum number of elements in intermediate arrays of fit_shaper()
+FIT_CHUNK_SIZE = 1 << 20
 
 TEST_DAMPING_RATIOS=[0.075, 0.1, 0.15]
 
@@ -43,6 +46,14 @@ class CalibrationData:
         self.data_sets = joined_data_sets
     def set_numpy(self, numpy):
         self.numpy = numpy
+    def __getstate__(self):
+        # Modules can not be pickled (eg, when sent to the calc worker)
+        state = dict(self.__dict__)
+        state.pop('numpy', None)
+        return state
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.numpy = importlib.import_module('numpy')
     def normalize_to_frequencies(self):
         for psd in self._psd_list:
             # Avoid division by zero errors
@@ -55,6 +66,243 @@ class CalibrationData:
         return self._psd_map[axis]
 
 
+# Calculate the FFT of all (half overlapping) windows that fit into the
+# samples x (one column per channel) - the streaming form of _psd().
+# Returns the FFT results and the number of samples no longer needed.
+def _welch_fft(np, x, window):
+    nfft = len(window)
+    step = nfft - nfft // 2
+    if x.shape[0] < nfft:
+        return None, 0
+    n_windows = (x.shape[0] - nfft // 2) // step
+    # Split into overlapping windows of size nfft
+    x = np.ascontiguousarray(x)
+    windows = np.lib.stride_tricks.as_strided(
+            x, shape=(n_windows, nfft, x.shape[1]),
+            strides=(step * x.strides[0], x.strides[0], x.strides[1]),
+            writeable=False)
+    # First detrend, then apply windowing function
+    windows = window[None, :, None] * (
+            windows - windows.mean(axis=1)[:, None, :])
+    return np.fft.rfft(windows, n=nfft, axis=1), n_windows * step
+
+class PSDAccumulator:
+    # Calculate the power spectral density of accelerometer samples as
+    # they arrive (Welch's algorithm over a stream of sample batches)
+    def __init__(self, numpy):
+        self.numpy = numpy
+        self.pending = []
+        self.nfft = self.window = None
+        self.psd_sum = None
+        self.windows = 0
+        self.sample_count = 0
+        self.first_time = self.last_time = None
+    def add_samples(self, samples):
+        data = self.numpy.asarray(samples, dtype=float)
+        if len(data.shape) != 2 or not data.shape[0]:
+            return
+        if self.first_time is None:
+            self.first_time = data[0, 0]
+        self.last_time = data[-1, 0]
+        self.sample_count += data.shape[0]
+        self.pending.append(data[:, 1:4])
+        if self.nfft is None:
+            # Wait for enough samples to estimate the sampling frequency
+            if self.last_time - self.first_time < 2. * WINDOW_T_SEC:
+                return
+            self._setup_window()
+        self._process_pending()
+    def _setup_window(self):
+        np = self.numpy
+        T = self.last_time - self.first_time
+        if T <= 0.:
+            return
+        fs = (self.sample_count - 1) / T
+        # Round up to the nearest power of 2 for faster FFT
+        self.nfft = 1 << int(fs * WINDOW_T_SEC - 1).bit_length()
+        self.window = np.kaiser(self.nfft, 6.)
+        self.psd_sum = np.zeros((self.nfft // 2 + 1, 3))
+    def _process_pending(self):
+        np = self.numpy
+        if len(self.pending) > 1:
+            self.pending = [np.concatenate(self.pending)]
+        result, consumed = _welch_fft(np, self.pending[0], self.window)
+        if result is None:
+            return
+        self.psd_sum += (result.real**2 + result.imag**2).sum(axis=0)
+        self.windows += result.shape[0]
+        # Keep the samples needed by the following windows
+        self.pending = [self.pending[0][consumed:]]
+    def get_calibration_data(self):
+        np = self.numpy
+        if self.nfft is None and self.sample_count:
+            self._setup_window()
+            if self.nfft is not None:
+                self._process_pending()
+        if not self.windows:
+            return None
+        fs = self.sample_count / (self.last_time - self.first_time)
+        # Compensation for windowing loss
+        scale = 1.0 / (self.window**2).sum()
+        psd = self.psd_sum * (scale / (fs * self.windows))
+        # For one-sided FFT output the response must be doubled, except
+        # the last point for unpaired Nyquist frequency (assuming even nfft)
+        # and the 'DC' term (0 Hz)
+        psd[1:-1, :] *= 2.
+        freqs = np.fft.rfftfreq(self.nfft, 1. / fs)
+        px, py, pz = psd[:, 0], psd[:, 1], psd[:, 2]
+        return CalibrationData(freqs, px+py+pz, px, py, pz)
+
+class CrossSpectrumData:
+    def __init__(self, freq_bins, csd, names):
+        # csd[f, i, j] is the cross spectral density of channels i and j,
+        # where channel 3*n+k is the axis k of the accelerometer names[n]
+        self.freq_bins = freq_bins
+        self.csd = csd
+        self.names = names
+        self.data_sets = 1
+    def _channel(self, name, axis):
+        return 3 * self.names.index(name) + 'xyz'.index(axis)
+    def get_csd(self, name_a, name_b, axis_a='x', axis_b=None):
+        return self.csd[:, self._channel(name_a, axis_a),
+                        self._channel(name_b, axis_b or axis_a)]
+    def get_coherence(self, name_a, name_b, axis_a='x', axis_b=None):
+        axis_b = axis_b or axis_a
+        csd = self.get_csd(name_a, name_b, axis_a, axis_b)
+        psd_a = self.get_csd(name_a, name_a, axis_a).real
+        psd_b = self.get_csd(name_b, name_b, axis_b).real
+        return (csd.real**2 + csd.imag**2) / (psd_a * psd_b + 1e-30)
+    def add_data(self, other):
+        np = self.numpy
+        joined_data_sets = self.data_sets + other.data_sets
+        # `other` data may be defined at different frequency bins,
+        # interpolating to fix that.
+        other_csd = other.csd.reshape(other.csd.shape[0], -1)
+        other_normalized = np.empty(
+                (len(self.freq_bins), other_csd.shape[1]), dtype=complex)
+        for i in range(other_csd.shape[1]):
+            other_normalized[:, i] = (
+                    np.interp(self.freq_bins, other.freq_bins,
+                              other_csd[:, i].real)
+                    + 1j * np.interp(self.freq_bins, other.freq_bins,
+                                     other_csd[:, i].imag))
+        self.csd *= self.data_sets
+        self.csd += other.data_sets * other_normalized.reshape(self.csd.shape)
+        self.csd *= 1. / joined_data_sets
+        self.data_sets = joined_data_sets
+    def set_numpy(self, numpy):
+        self.numpy = numpy
+
+# Resample the sample streams of several accelerometers onto a shared
+# time grid and calculate their cross spectral densities as the samples
+# arrive.  The sample times of all chips are already translated to the
+# print time (via the ClockSyncRegression of each chip).
+class CrossSpectrumAccumulator:
+    def __init__(self, numpy, names):
+        self.numpy = numpy
+        self.names = names
+        self.streams = [[] for n in names]
+        self.first_times = [None] * len(names)
+        self.last_times = [None] * len(names)
+        self.sample_counts = [0] * len(names)
+        self.grid_start = self.grid_freq = None
+        self.grid_index = 0
+        self.pending = []
+        self.nfft = self.window = None
+        self.csd_sum = None
+        self.windows = 0
+    def get_consumer(self, index):
+        return CrossSpectrumConsumer(self, index)
+    def add_samples(self, index, samples):
+        data = self.numpy.asarray(samples, dtype=float)
+        if len(data.shape) != 2 or not data.shape[0]:
+            return
+        if self.first_times[index] is None:
+            self.first_times[index] = data[0, 0]
+        self.last_times[index] = data[-1, 0]
+        self.sample_counts[index] += data.shape[0]
+        self.streams[index].append(data[:, :4])
+        if self.grid_freq is None:
+            # Wait for enough samples from all chips to estimate the
+            # sampling frequencies
+            for first_time, last_time in zip(self.first_times,
+                                             self.last_times):
+                if (first_time is None
+                        or last_time - first_time < 2. * WINDOW_T_SEC):
+                    return
+            self._setup_grid()
+        self._resample()
+    def _setup_grid(self):
+        # Resample to the lowest sampling frequency of all chips
+        np = self.numpy
+        self.grid_freq = min([
+            (count - 1) / (last_time - first_time)
+            for count, first_time, last_time in zip(
+                self.sample_counts, self.first_times, self.last_times)])
+        self.grid_start = max(self.first_times)
+        # Round up to the nearest power of 2 for faster FFT
+        self.nfft = 1 << int(self.grid_freq * WINDOW_T_SEC - 1).bit_length()
+        self.window = np.kaiser(self.nfft, 6.)
+        channels = 3 * len(self.names)
+        self.csd_sum = np.zeros((self.nfft // 2 + 1, channels, channels),
+                                dtype=complex)
+    def _resample(self):
+        np = self.numpy
+        end_time = min(self.last_times)
+        count = int((end_time - self.grid_start) * self.grid_freq
+                    - self.grid_index) + 1
+        if count <= 0:
+            return
+        indexes = self.grid_index + np.arange(count)
+        times = self.grid_start + indexes / self.grid_freq
+        next_time = self.grid_start + (indexes[-1] + 1) / self.grid_freq
+        self.grid_index += count
+        columns = []
+        for i, stream in enumerate(self.streams):
+            data = np.concatenate(stream) if len(stream) > 1 else stream[0]
+            for axis in range(1, 4):
+                columns.append(np.interp(times, data[:, 0], data[:, axis]))
+            # Keep the samples needed to interpolate the following times
+            keep = max(np.searchsorted(data[:, 0], next_time) - 1, 0)
+            self.streams[i] = [data[keep:]]
+        self.pending.append(np.column_stack(columns))
+        self._process_pending()
+    def _process_pending(self):
+        np = self.numpy
+        if len(self.pending) > 1:
+            self.pending = [np.concatenate(self.pending)]
+        result, consumed = _welch_fft(np, self.pending[0], self.window)
+        if result is None:
+            return
+        self.csd_sum += np.einsum('wfi,wfj->fij', result.conj(), result)
+        self.windows += result.shape[0]
+        # Keep the samples needed by the following windows
+        self.pending = [self.pending[0][consumed:]]
+    def get_cross_spectra(self):
+        np = self.numpy
+        if self.grid_freq is None and all(self.sample_counts):
+            if all([l > f for f, l in zip(self.first_times,
+                                          self.last_times)]):
+                self._setup_grid()
+                self._resample()
+        if not self.windows:
+            return None
+        fs = self.grid_freq
+        # Compensation for windowing loss
+        scale = 1.0 / (self.window**2).sum()
+        csd = self.csd_sum * (scale / (fs * self.windows))
+        # One-sided spectrum (see _psd())
+        csd[1:-1] *= 2.
+        freqs = np.fft.rfftfreq(self.nfft, 1. / fs)
+        return CrossSpectrumData(freqs, csd, list(self.names))
+
+class CrossSpectrumConsumer:
+    def __init__(self, accumulator, index):
+        self.accumulator = accumulator
+        self.index = index
+    def add_samples(self, samples):
+        self.accumulator.add_samples(self.index, samples)
+
 CalibrationResult = collections.namedtuple(
         'CalibrationResult',
         ('name', 'freq', 'vals', 'vibrs', 'smoothing', 'score', 'max_accel'))
@@ -74,37 +322,12 @@ class ShaperCalibrate:
     def background_process_exec(self, method, args):
         if self.printer is None:
             return method(*args)
-        import queuelogger
-        parent_conn, child_conn = multiprocessing.Pipe()
-        def wrapper():
-            queuelogger.clear_bg_logging()
-            try:
-                res = method(*args)
-            except:
-                child_conn.send((True, traceback.format_exc()))
-                child_conn.close()
-                return
-            child_conn.send((False, res))
-            child_conn.close()
-        # Start a process to perform the calculation
-        calc_proc = multiprocessing.Process(target=wrapper)
-        calc_proc.daemon = True
-        calc_proc.start()
-        # Wait for the process to finish
-        reactor = self.printer.get_reactor()
-        gcode = self.printer.lookup_object("gcode")
-        eventtime = last_report_time = reactor.monotonic()
-        while calc_proc.is_alive():
-            if eventtime > last_report_time + 5.:
-                last_report_time = eventtime
-                gcode.respond_info("Wait for calculations..", log=False)
-            eventtime = reactor.pause(eventtime + .1)
-        # Return results
-        is_err, res = parent_conn.recv()
+        # Run the calculation in the (persistent) calculation worker
+        worker = calc_worker.lookup_calc_worker(self.printer)
+        is_err, res = worker.run(_run_calc_method, (method.__name__, args),
+                                 "Wait for calculations..")
         if is_err:
             raise self.error("Error in remote calculation: %s" % (res,))
-        calc_proc.join()
-        parent_conn.close()
         return res
 
     def _split_into_windows(self, x, window_size, overlap):
@@ -153,6 +376,8 @@ class ShaperCalibrate:
             return None
         if isinstance(raw_values, np.ndarray):
             data = raw_values
+        elif isinstance(raw_values, calc_worker.SharedArray):
+            data = raw_values.load_numpy(np)
         else:
             samples = raw_values.get_samples()
             if not samples:
@@ -174,9 +399,49 @@ class ShaperCalibrate:
         fz, pz = self._psd(data[:,3], SAMPLING_FREQ, M)
         return CalibrationData(fx, px+py+pz, px, py, pz)
 
+    def _share_samples(self, raw_values):
+        # Avoid pickling the samples when sending them to the worker
+        np = self.numpy
+        if self.printer is None or raw_values is None:
+            return raw_values
+        if not isinstance(raw_values, np.ndarray):
+            samples = raw_values.get_samples()
+            if not samples:
+                return None
+            raw_values = np.array(samples, dtype=np.float64)
+        return calc_worker.SharedArray(raw_values, raw_values.shape)
+
+    def stream_accelerometer_data(self, aclient, keep_samples=False):
+        aclient.add_sample_consumer(PSDAccumulator(self.numpy), keep_samples)
+
+    def stream_cross_spectra(self, aclients, names):
+        accumulator = CrossSpectrumAccumulator(self.numpy, names)
+        for i, aclient in enumerate(aclients):
+            aclient.add_sample_consumer(accumulator.get_consumer(i))
+        return accumulator
+
+    def process_cross_spectra(self, accumulator):
+        cross_spectra = accumulator.get_cross_spectra()
+        if cross_spectra is None:
+            raise self.error("Not enough accelerometer data to calculate"
+                             " the cross spectra")
+        cross_spectra.set_numpy(self.numpy)
+        return cross_spectra
+
     def process_accelerometer_data(self, data):
-        calibration_data = self.background_process_exec(
-                self.calc_freq_response, (data,))
+        consumers = [c for c in getattr(data, 'sample_consumers', [])
+                     if isinstance(c, PSDAccumulator)]
+        if consumers:
+            # Frequency response was calculated during the measurements
+            calibration_data = consumers[0].get_calibration_data()
+        else:
+            shared_data = self._share_samples(data)
+            try:
+                calibration_data = self.background_process_exec(
+                        self.calc_freq_response, (shared_data,))
+            finally:
+                if isinstance(shared_data, calc_worker.SharedArray):
+                    shared_data.close()
         if calibration_data is None:
             raise self.error(
                     "Internal error processing accelerometer data %s" % (data,))
@@ -184,18 +449,22 @@ class ShaperCalibrate:
         return calibration_data
 
     def _estimate_shaper(self, shaper, test_damping_ratio, test_freqs):
+        # The shaper impulses may be given as 2D arrays in order to
+        # evaluate a set of shapers (one per row) at once
         np = self.numpy
 
-        A, T = np.array(shaper[0]), np.array(shaper[1])
-        inv_D = 1. / A.sum()
+        A, T = np.asarray(shaper[0]), np.asarray(shaper[1])
+        inv_D = 1. / A.sum(axis=-1)
 
         omega = 2. * math.pi * test_freqs
         damping = test_damping_ratio * omega
         omega_d = omega * math.sqrt(1. - test_damping_ratio**2)
-        W = A * np.exp(np.outer(-damping, (T[-1] - T)))
-        S = W * np.sin(np.outer(omega_d, T))
-        C = W * np.cos(np.outer(omega_d, T))
-        return np.sqrt(S.sum(axis=1)**2 + C.sum(axis=1)**2) * inv_D
+        W = A[..., None, :] * np.exp(
+                -damping[:, None] * (T[..., -1:] - T)[..., None, :])
+        S = W * np.sin(omega_d[:, None] * T[..., None, :])
+        C = W * np.cos(omega_d[:, None] * T[..., None, :])
+        return (np.sqrt(S.sum(axis=-1)**2 + C.sum(axis=-1)**2)
+                * inv_D[..., None])
 
     def _estimate_remaining_vibrations(self, shaper, test_damping_ratio,
                                        freq_bins, psd):
@@ -205,7 +474,7 @@ class ShaperCalibrate:
         # threshold can be igonred
         vibr_threshold = psd.max() / shaper_defs.SHAPER_VIBRATION_REDUCTION
         remaining_vibrations = self.numpy.maximum(
-                vals * psd - vibr_threshold, 0).sum()
+                vals * psd - vibr_threshold, 0).sum(axis=-1)
         all_vibrations = self.numpy.maximum(psd - vibr_threshold, 0).sum()
         return (remaining_vibrations / all_vibrations, vals)
 
@@ -229,6 +498,20 @@ class ShaperCalibrate:
         offset_180 *= inv_D
         return max(offset_90, offset_180)
 
+    def _get_shapers_smoothing(self, A, T, accel=5000, scv=5.):
+        # Vectorized _get_shaper_smoothing() for shapers given as rows
+        # of the A and T arrays
+        np = self.numpy
+        half_accel = accel * .5
+
+        inv_D = 1. / A.sum(axis=-1)
+        ts = (A * T).sum(axis=-1) * inv_D
+        dT = T - ts[:, None]
+        offset_90 = np.where(dT >= 0., A * (scv + half_accel * dT) * dT,
+                             0.).sum(axis=-1) * (inv_D * math.sqrt(2.))
+        offset_180 = (A * half_accel * dT**2).sum(axis=-1) * inv_D
+        return np.maximum(offset_90, offset_180)
+
     def fit_shaper(self, shaper_cfg, calibration_data, shaper_freqs,
                    damping_ratio, scv, max_smoothing, test_damping_ratios,
                    max_freq):
@@ -254,44 +537,68 @@ class ShaperCalibrate:
         psd = calibration_data.psd_sum[freq_bins <= max_freq]
         freq_bins = freq_bins[freq_bins <= max_freq]
 
-        best_res = None
-        results = []
-        for test_freq in test_freqs[::-1]:
-            shaper_vibrations = 0.
-            shaper_vals = np.zeros(shape=freq_bins.shape)
-            shaper = shaper_cfg.init_func(test_freq, damping_ratio)
-            shaper_smoothing = self._get_shaper_smoothing(shaper, scv=scv)
-            if max_smoothing and shaper_smoothing > max_smoothing and best_res:
-                return best_res
-            # Exact damping ratio of the printer is unknown, pessimizing
-            # remaining vibrations over possible damping values
+        # Evaluate the shaper at all test frequencies at once, starting
+        # from the highest frequency (the least smoothing)
+        test_freqs = test_freqs[::-1]
+        shapers = [shaper_cfg.init_func(test_freq, damping_ratio)
+                   for test_freq in test_freqs]
+        A = np.array([shaper[0] for shaper in shapers])
+        T = np.array([shaper[1] for shaper in shapers])
+        smoothing = self._get_shapers_smoothing(A, T, scv=scv)
+        if max_smoothing:
+            too_smooth = np.nonzero(smoothing[1:] > max_smoothing)[0]
+            if len(too_smooth):
+                # Frequencies below that are not worth testing
+                count = too_smooth[0] + 1
+                test_freqs, A, T = test_freqs[:count], A[:count], T[:count]
+                smoothing = smoothing[:count]
+        else:
+            too_smooth = []
+        # Exact damping ratio of the printer is unknown, pessimizing
+        # remaining vibrations over possible damping values. Shapers are
+        # processed in chunks to bound the memory usage.
+        vibrations = np.zeros(test_freqs.shape)
+        chunk = max(1, FIT_CHUNK_SIZE // (len(freq_bins) * A.shape[1]))
+        for i in range(0, len(test_freqs), chunk):
             for dr in test_damping_ratios:
-                vibrations, vals = self._estimate_remaining_vibrations(
-                        shaper, dr, freq_bins, psd)
-                shaper_vals = np.maximum(shaper_vals, vals)
-                if vibrations > shaper_vibrations:
-                    shaper_vibrations = vibrations
-            max_accel = self.find_shaper_max_accel(shaper, scv)
-            # The score trying to minimize vibrations, but also accounting
-            # the growth of smoothing. The formula itself does not have any
-            # special meaning, it simply shows good results on real user data
-            shaper_score = shaper_smoothing * (shaper_vibrations**1.5 +
-                                               shaper_vibrations * .2 + .01)
-            results.append(
-                    CalibrationResult(
-                        name=shaper_cfg.name, freq=test_freq, vals=shaper_vals,
-                        vibrs=shaper_vibrations, smoothing=shaper_smoothing,
-                        score=shaper_score, max_accel=max_accel))
-            if best_res is None or best_res.vibrs > results[-1].vibrs:
-                # The current frequency is better for the shaper.
-                best_res = results[-1]
-        # Try to find an 'optimal' shapper configuration: the one that is not
-        # much worse than the 'best' one, but gives much less smoothing
-        selected = best_res
-        for res in results[::-1]:
-            if res.vibrs < best_res.vibrs * 1.1 and res.score < selected.score:
-                selected = res
-        return selected
+                vibrs, vals = self._estimate_remaining_vibrations(
+                        (A[i:i+chunk], T[i:i+chunk]), dr, freq_bins, psd)
+                vibrations[i:i+chunk] = np.maximum(
+                        vibrations[i:i+chunk], vibrs)
+        # The score trying to minimize vibrations, but also accounting
+        # the growth of smoothing. The formula itself does not have any
+        # special meaning, it simply shows good results on real user data
+        scores = smoothing * (vibrations**1.5 + vibrations * .2 + .01)
+        best = np.argmin(vibrations)
+        selected = best
+        if not len(too_smooth):
+            # Try to find an 'optimal' shapper configuration: the one that
+            # is not much worse than the 'best' one, but gives much less
+            # smoothing
+            candidates = vibrations[::-1] < vibrations[best] * 1.1
+            if candidates.any():
+                rev_scores = np.where(candidates, scores[::-1], np.inf)
+                res = len(test_freqs) - 1 - np.argmin(rev_scores)
+                if scores[res] < scores[best]:
+                    selected = res
+        return self._get_calibration_result(
+                shaper_cfg.name, shapers[selected], test_freqs[selected],
+                vibrations[selected], smoothing[selected], scores[selected],
+                test_damping_ratios, freq_bins, psd, scv)
+
+    def _get_calibration_result(self, name, shaper, freq, vibrations,
+                                smoothing, score, test_damping_ratios,
+                                freq_bins, psd, scv):
+        np = self.numpy
+        shaper_vals = np.zeros(shape=freq_bins.shape)
+        for dr in test_damping_ratios:
+            vibrs, vals = self._estimate_remaining_vibrations(
+                    shaper, dr, freq_bins, psd)
+            shaper_vals = np.maximum(shaper_vals, vals)
+        max_accel = self.find_shaper_max_accel(shaper, scv)
+        return CalibrationResult(
+                name=name, freq=freq, vals=shaper_vals, vibrs=vibrations,
+                smoothing=smoothing, score=score, max_accel=max_accel)
 
     def _bisect(self, func):
         left = right = 1.
@@ -396,3 +703,42 @@ class ShaperCalibrate:
                     csvfile.write("\n")
         except IOError as e:
             raise self.error("Error writing to file '%s': %s", output, str(e))
+
+    def save_cross_spectra(self, output, cross_spectra, max_freq=None):
+        np = self.numpy
+        names = [n.replace(" ", "_") for n in cross_spectra.names]
+        pairs = [(i, j) for i in range(len(names))
+                 for j in range(i + 1, len(names))]
+        try:
+            max_freq = max_freq or MAX_FREQ
+            with open(output, "w") as csvfile:
+                columns = ["freq"]
+                values = []
+                for i, j in pairs:
+                    for axis in 'xyz':
+                        suffix = "%s_%s_%s" % (names[i], names[j], axis)
+                        columns += ["csd_" + suffix, "coherence_" + suffix,
+                                    "phase_" + suffix]
+                        a, b = cross_spectra.names[i], cross_spectra.names[j]
+                        csd = cross_spectra.get_csd(a, b, axis)
+                        values += [np.abs(csd),
+                                   cross_spectra.get_coherence(a, b, axis),
+                                   np.degrees(np.angle(csd))]
+                csvfile.write(",".join(columns) + "\n")
+                freq_bins = cross_spectra.freq_bins
+                for k in range(freq_bins.shape[0]):
+                    if freq_bins[k] >= max_freq:
+                        break
+                    csvfile.write("%.1f" % (freq_bins[k],))
+                    for i in range(0, len(values), 3):
+                        csvfile.write(",%.3e,%.3f,%.1f" % (
+                            values[i][k], values[i+1][k], values[i+2][k]))
+                    csvfile.write("\n")
+        except IOError as e:
+            raise self.error("Error writing to file '%s': %s"
+                             % (output, str(e)))
+
+# Invoked in the calculation worker process
+def _run_calc_method(method_name, args):
+    helper = ShaperCalibrate(printer=None)
+    return getattr(helper, method_name)(*args)
@@ -0,0 +1,205 @@
+# Background monitoring of printer resonances during prints
+#
+# Copyright (C) 2026  CreatBot
+#
+# This file may be distributed under the terms of the GNU GPLv3 license.
+import importlib, logging
+from . import shaper_calibrate
+
+# Delay between checks for an active print
+RETRY_TIME = 10.
+# Width (in Hz) of the frequency bins of the reported PSD
+PSD_BIN_WIDTH = 5.
+# Minimum ratio of the resonance peak to the median of the PSD for the
+# peak to be considered a resonance (and not noise, eg while heating)
+MIN_PEAK_RATIO = 5.
+
+class VibrationMonitor:
+    def __init__(self, config):
+        self.printer = config.get_printer()
+        self.reactor = self.printer.get_reactor()
+        try:
+            self.numpy = importlib.import_module('numpy')
+        except ImportError:
+            raise config.error(
+                    "Failed to import `numpy` module, make sure it was "
+                    "installed via `~/klippy-env/bin/pip install` (refer to "
+                    "docs/Measuring_Resonances.md for more details).")
+        self.accel_chip_name = config.get('accel_chip').strip()
+        self.interval = config.getfloat('interval', 600., minval=10.)
+        self.sample_time = config.getfloat('sample_time', 10., minval=1.,
+                                           maxval=self.interval)
+        self.min_freq = config.getfloat('min_freq', shaper_calibrate.MIN_FREQ,
+                                        minval=1.)
+        self.max_freq = config.getfloat('max_freq', shaper_calibrate.MAX_FREQ,
+                                        above=self.min_freq)
+        self.tolerance = config.getfloat('tolerance', 0.15, above=0.)
+        self.enabled = config.getboolean('enabled', True)
+        self.accel_chip = self.input_shaper = self.idle_timeout = None
+        self.helper = None
+        self.timer = None
+        # Measurement state
+        self.accumulator = None
+        self.measure_end_time = 0.
+        self.measurements = 0
+        self.alert = False
+        self.axes_status = {}
+        self.psd_status = {}
+        self.printer.register_event_handler("klippy:connect",
+                                            self._handle_connect)
+        self.printer.register_event_handler("klippy:ready",
+                                            self._handle_ready)
+        # Register commands
+        gcode = self.printer.lookup_object('gcode')
+        gcode.register_command("SET_VIBRATION_MONITOR",
+                               self.cmd_SET_VIBRATION_MONITOR,
+                               desc=self.cmd_SET_VIBRATION_MONITOR_help)
+        gcode.register_command("QUERY_VIBRATION_MONITOR",
+                               self.cmd_QUERY_VIBRATION_MONITOR,
+                               desc=self.cmd_QUERY_VIBRATION_MONITOR_help)
+    def _handle_connect(self):
+        self.accel_chip = self.printer.lookup_object(self.accel_chip_name)
+        self.input_shaper = self.printer.lookup_object('input_shaper', None)
+        self.idle_timeout = self.printer.lookup_object('idle_timeout')
+        self.helper = shaper_calibrate.ShaperCalibrate(self.printer)
+    def _handle_ready(self):
+        self.timer = self.reactor.register_timer(
+                self._check_timer, self.reactor.monotonic() + self.interval)
+    def _is_printing(self, eventtime):
+        status = self.idle_timeout.get_status(eventtime)
+        return status['state'] == 'Printing'
+    # Periodic measurements
+    def _check_timer(self, eventtime):
+        if not self.enabled or self.accumulator is not None:
+            return self.reactor.NEVER
+        if not self._is_printing(eventtime):
+            return eventtime + RETRY_TIME
+        self.accumulator = shaper_calibrate.PSDAccumulator(self.numpy)
+        self.measure_end_time = eventtime + self.sample_time
+        try:
+            self.accel_chip.batch_bulk.add_client(self._handle_batch)
+        except self.printer.command_error as e:
+            logging.warning("vibration_monitor: unable to start '%s': %s",
+                            self.accel_chip_name, str(e))
+            self.accumulator = None
+            return eventtime + self.interval
+        return self.reactor.NEVER
+    def _handle_batch(self, msg):
+        if self.accumulator is None:
+            return False
+        eventtime = self.reactor.monotonic()
+        if not self._is_printing(eventtime):
+            # The print has ended - discard the partial measurement
+            self._schedule_next(None)
+            return False
+        self.accumulator.add_samples(msg['data'])
+        if eventtime < self.measure_end_time:
+            return True
+        self.reactor.register_callback(
+                lambda e, acc=self.accumulator: self._schedule_next(acc))
+        return False
+    def _schedule_next(self, accumulator):
+        self.accumulator = None
+        waketime = self.reactor.monotonic() + RETRY_TIME
+        if accumulator is not None:
+            calibration_data = accumulator.get_calibration_data()
+            if calibration_data is not None:
+                self._analyze(calibration_data)
+            waketime = self.reactor.monotonic() + self.interval
+        if self.enabled:
+            self.reactor.update_timer(self.timer, waketime)
+    # Analysis of the measured power spectral density
+    def _get_shaper_params(self, axis):
+        if self.input_shaper is None:
+            return None
+        for shaper in self.input_shaper.get_shapers():
+            if shaper.axis == axis:
+                return shaper.params
+        return None
+    def _analyze(self, calibration_data):
+        np = self.numpy
+        calibration_data.set_numpy(np)
+        freq_bins = calibration_data.freq_bins
+        in_range = (freq_bins >= self.min_freq) & (freq_bins <= self.max_freq)
+        freq_bins = freq_bins[in_range]
+        if not len(freq_bins):
+            return
+        self.measurements += 1
+        # Peaks are searched in the measured acceleration PSD, while the
+        # remaining vibrations are estimated as in the shaper calibration
+        psds = {axis: calibration_data.get_psd(axis)[in_range]
+                for axis in 'xy'}
+        calibration_data.normalize_to_frequencies()
+        bin_index = ((freq_bins - self.min_freq) // PSD_BIN_WIDTH).astype(int)
+        bin_counts = np.bincount(bin_index)
+        self.psd_status = {'freqs': (self.min_freq + PSD_BIN_WIDTH * (
+            np.arange(len(bin_counts)) + .5)).tolist()}
+        alert_msgs = []
+        for axis in 'xy':
+            psd = psds[axis]
+            self.psd_status[axis] = (np.bincount(bin_index, weights=psd)
+                                     / np.maximum(bin_counts, 1)).tolist()
+            peak = psd.argmax()
+            if psd[peak] < MIN_PEAK_RATIO * np.median(psd):
+                # No clear resonance (eg, the toolhead was not moving)
+                continue
+            status = {'peak_freq': float(freq_bins[peak]),
+                      'shaper_freq': 0., 'drift': 0., 'vibrations': 0.,
+                      'alert': False}
+            params = self._get_shaper_params(axis)
+            if params is not None and params.shaper_freq:
+                _, A, T = params.get_shaper()
+                vibrations, _ = self.helper._estimate_remaining_vibrations(
+                        (A, T), params.damping_ratio, freq_bins,
+                        calibration_data.get_psd(axis)[in_range])
+                drift = status['peak_freq'] / params.shaper_freq - 1.
+                status.update({'shaper_freq': params.shaper_freq,
+                               'drift': drift,
+                               'vibrations': float(vibrations) * 100.,
+                               'alert': abs(drift) > self.tolerance})
+                if status['alert']:
+                    alert_msgs.append(
+                            "%s resonance at %.1f Hz (shaper_freq_%s: %.1f Hz)"
+                            % (axis.upper(), status['peak_freq'], axis,
+                               params.shaper_freq))
+            self.axes_status[axis] = status
+        self.alert = any(s['alert'] for s in self.axes_status.values())
+        logging.info("vibration_monitor: %s", self._get_summary())
+        if alert_msgs:
+            gcode = self.printer.lookup_object('gcode')
+            gcode.respond_info("Vibration monitor: %s drifted from the"
+                               " configured input shaper frequency"
+                               % (', '.join(alert_msgs),))
+    def _get_summary(self):
+        if not self.axes_status:
+            return "no resonances measured yet"
+        return ' '.join(["%s: peak_freq=%.1f drift=%.1f%% vibrations=%.1f%%"
+                         % (axis, s['peak_freq'], s['drift'] * 100.,
+                            s['vibrations'])
+                         for axis, s in sorted(self.axes_status.items())])
+    def get_status(self, eventtime):
+        return {'enabled': self.enabled,
+                'measuring': self.accumulator is not None,
+                'measurements': self.measurements,
+                'alert': self.alert,
+                'axes': self.axes_status,
+                'psd': self.psd_status}
+    cmd_SET_VIBRATION_MONITOR_help = "Enable or disable the vibration monitor"
+    def cmd_SET_VIBRATION_MONITOR(self, gcmd):
+        self.enabled = gcmd.get_int('ENABLE', int(self.enabled),
+                                   minval=0, maxval=1)
+        if gcmd.get_int('RESET', 0, minval=0, maxval=1):
+            self.alert = False
+            self.axes_status = {}
+            self.psd_status = {}
+        if self.enabled and self.accumulator is None:
+            self.reactor.update_timer(
+                    self.timer, self.reactor.monotonic() + self.interval)
+    cmd_QUERY_VIBRATION_MONITOR_help = "Report the last measured resonances"
+    def cmd_QUERY_VIBRATION_MONITOR(self, gcmd):
+        gcmd.respond_info("Vibration monitor (%s, %d measurements): %s" % (
+            "enabled" if self.enabled else "disabled", self.measurements,
+            self._get_summary()))
+
+def load_config(config):
+    return VibrationMonitor(config)
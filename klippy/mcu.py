@@ -3,7 +3,7 @@
 # Copyright (C) 2016-2024  Kevin O'Connor <kevin@koconnor.net>
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
-import sys, os, zlib, logging, math
+import sys, os, zlib, logging, math, threading
 import serialhdl, msgproto, pins, chelper, clocksync
 
 class error(Exception):
@@ -91,6 +91,10 @@ class CommandWrapper:
     def send(self, data=(), minclock=0, reqclock=0):
         cmd = self._cmd.encode(data)
         self._serial.raw_send(cmd, minclock, reqclock, self._cmd_queue)
+    def encode(self, data=()):
+        return self._cmd.encode(data)
+    def get_command_queue(self):
+        return self._cmd_queue
     def send_wait_ack(self, data=(), minclock=0, reqclock=0):
         cmd = self._cmd.encode(data)
         self._serial.raw_send_wait_ack(cmd, minclock, reqclock, self._cmd_queue)
@@ -391,8 +395,9 @@ class MCU_digital_out:
             "queue_digital_out oid=%c clock=%u on_ticks=%u", cq=cmd_queue)
     def set_digital(self, print_time, value):
         clock = self._mcu.print_time_to_clock(print_time)
-        self._set_cmd.send([self._oid, clock, (not not value) ^ self._invert],
-                           minclock=self._last_clock, reqclock=clock)
+        value = (not not value) ^ self._invert
+        self._mcu.send_output(self._set_cmd, [self._oid, clock, value],
+                              minclock=self._last_clock, reqclock=clock)
         self._last_clock = clock
 
 class MCU_pwm:
@@ -478,8 +483,8 @@ class MCU_pwm:
             value = 1. - value
         v = int(max(0., min(1., value)) * self._pwm_max + 0.5)
         clock = self._mcu.print_time_to_clock(print_time)
-        self._set_cmd.send([self._oid, clock, v],
-                           minclock=self._last_clock, reqclock=clock)
+        self._mcu.send_output(self._set_cmd, [self._oid, clock, v],
+                              minclock=self._last_clock, reqclock=clock)
         self._last_clock = clock
 
 class MCU_adc:
@@ -545,6 +550,8 @@ class MCU_adc:
 # Main MCU class
 ######################################################################
 
+MAX_OUTPUT_GROUP = 32
+
 class MCU:
     error = error
     def __init__(self, config, clocksync):
@@ -572,6 +579,11 @@ class MCU:
             if not (self._serialport.startswith("/dev/rpmsg_")
                     or self._serialport.startswith("/tmp/klipper_host_")):
                 self._baud = config.getint('baud', 250000, minval=2400)
+        cache_dir = config.get('dictionary_cache_dir', None)
+        if cache_dir is not None:
+            cache_dir = os.path.expanduser(cache_dir)
+            self._serial.set_dictionary_cache(os.path.join(
+                cache_dir, "%s.dict" % (self._name.replace(' ', '_'),)))
         # Restarts
         restart_methods = [None, 'arduino', 'cheetah', 'command', 'rpi_usb']
         self._restart_method = 'command'
@@ -597,6 +609,9 @@ class MCU:
         self._max_stepper_error = config.getfloat('max_stepper_error', 0.000025,
                                                   minval=0.)
         self._reserved_move_slots = 0
+        self._batch_outputs = config.getboolean('batch_output_updates', False)
+        self._pending_outputs = []
+        self._pending_lock = threading.Lock()
         self._stepqueues = []
         self._steppersync = None
         self._flush_callbacks = []
@@ -606,13 +621,13 @@ class MCU:
         self._mcu_tick_avg = 0.
         self._mcu_tick_stddev = 0.
         self._mcu_tick_awake = 0.
+        wh = printer.lookup_object('webhooks')
+        wh.register_mux_endpoint("mcu/link_stats", "mcu", self._name,
+                                 self._handle_link_stats)
         # Register handlers
         printer.load_object(config, "error_mcu")
         printer.register_event_handler("klippy:firmware_restart",
                                        self._firmware_restart)
-        printer.register_event_handler("klippy:mcu_identify",
-                                       self._mcu_identify)
-        printer.register_event_handler("klippy:connect", self._connect)
         printer.register_event_handler("klippy:shutdown", self._shutdown)
         printer.register_event_handler("klippy:disconnect", self._disconnect)
         printer.register_event_handler("klippy:ready", self._ready)
@@ -774,7 +789,7 @@ class MCU:
         logging.info(move_msg)
         log_info = self._log_info() + "\n" + move_msg
         self._printer.set_rollover_info(self._name, log_info, log=False)
-    def _mcu_identify(self):
+    def _connect_serial(self):
         if self.is_fileoutput():
             self._connect_file()
         else:
@@ -795,9 +810,16 @@ class MCU:
                     self._serial.connect_uart(self._serialport, self._baud, rts)
                 else:
                     self._serial.connect_pipe(self._serialport)
-                self._clocksync.connect(self._serial)
             except serialhdl.error as e:
                 raise error(str(e))
+    def _connect_clocksync(self):
+        if self.is_fileoutput():
+            return
+        try:
+            self._clocksync.connect(self._serial)
+        except serialhdl.error as e:
+            raise error(str(e))
+    def _mcu_identify(self):
         logging.info(self._log_info())
         ppins = self._printer.lookup_object('pins')
         pin_resolver = ppins.get_pin_resolver(self._name)
@@ -877,8 +899,42 @@ class MCU:
         return self._name
     def register_response(self, cb, msg, oid=None):
         self._serial.register_response(cb, msg, oid)
-    def alloc_command_queue(self):
-        return self._serial.alloc_command_queue()
+    def register_batch_response(self, cb, msg, oid=None):
+        self._serial.register_batch_response(cb, msg, oid)
+    # Output pin update batching
+    def send_output(self, cmd, data, minclock=0, reqclock=0):
+        if not self._batch_outputs:
+            cmd.send(data, minclock=minclock, reqclock=reqclock)
+            return
+        # Updates may also arrive from the serial background thread (eg,
+        # heater updates from analog_in_state responses)
+        with self._pending_lock:
+            is_first = not self._pending_outputs
+            self._pending_outputs.append((cmd, data, minclock, reqclock))
+        if not is_first:
+            return
+        if threading.current_thread() is threading.main_thread():
+            self._reactor.register_callback(self._flush_outputs)
+        else:
+            self._reactor.register_async_callback(self._flush_outputs)
+    def _flush_outputs(self, eventtime):
+        with self._pending_lock:
+            pending = self._pending_outputs
+            self._pending_outputs = []
+        if not pending:
+            return
+        # Only the last update of a pin (oid) for a given clock is needed
+        last_update = {}
+        for i, (cmd, data, minclock, reqclock) in enumerate(pending):
+            last_update[(cmd, data[0], data[1])] = i
+        cmds = [(cmd.encode(data), minclock, reqclock,
+                 cmd.get_command_queue())
+                for i, (cmd, data, minclock, reqclock) in enumerate(pending)
+                if last_update[(cmd, data[0], data[1])] == i]
+        for i in range(0, len(cmds), MAX_OUTPUT_GROUP):
+            self._serial.raw_send_group(cmds[i:i+MAX_OUTPUT_GROUP])
+    def alloc_command_queue(self, name=None):
+        return self._serial.alloc_command_queue(name)
     def lookup_command(self, msgformat, cq=None):
         return CommandWrapper(self._serial, msgformat, cq)
     def lookup_query_command(self, msgformat, respformat, oid=None,
@@ -906,6 +962,8 @@ class MCU:
         return self._clocksync.clock32_to_clock64(clock32)
     # Restarts
     def _disconnect(self):
+        if self._pending_outputs and self._serial.get_serialqueue() is not None:
+            self._flush_outputs(None)
         self._serial.disconnect()
         self._steppersync = None
     def _shutdown(self, force=False):
@@ -967,6 +1025,8 @@ class MCU:
     def register_flush_callback(self, callback):
         self._flush_callbacks.append(callback)
     def flush_moves(self, print_time, clear_history_time):
+        if self._pending_outputs:
+            self._flush_outputs(None)
         if self._steppersync is None:
             return
         clock = self.print_time_to_clock(print_time)
@@ -1011,16 +1071,66 @@ class MCU:
         parts = [s.split('=', 1) for s in stats.split()]
         last_stats = {k:(float(v) if '.' in v else int(v)) for k, v in parts}
         self._get_status_info['last_stats'] = last_stats
+        self._get_status_info['link_stats'] = self._serial.link_stats(
+            eventtime)
         return False, '%s: %s' % (self._name, stats)
+    def _handle_link_stats(self, web_request):
+        web_request.send(dict(self._get_status_info.get('link_stats', {})))
+
+######################################################################
+# MCU connection
+######################################################################
+
+# Connect to all micro-controllers, overlapping the slow steps
+class MCUConnectGroup:
+    def __init__(self, printer, mcus):
+        self._printer = printer
+        self._reactor = printer.get_reactor()
+        self._mcus = mcus
+        printer.register_event_handler("klippy:mcu_identify",
+                                       self._mcu_identify)
+        printer.register_event_handler("klippy:connect", self._connect)
+    def _run_parallel(self, callbacks):
+        if len(callbacks) <= 1:
+            for cb in callbacks:
+                cb()
+            return
+        def wrap(cb):
+            def invoke(eventtime):
+                try:
+                    cb()
+                except Exception as e:
+                    return e
+                return None
+            return invoke
+        completions = [self._reactor.register_callback(wrap(cb))
+                       for cb in callbacks]
+        # Report the first error (in config order) once all have finished
+        errors = [c.wait() for c in completions]
+        for e in errors:
+            if e is not None:
+                raise e
+    def _mcu_identify(self):
+        mcus = self._mcus
+        self._run_parallel([m._connect_serial for m in mcus])
+        # Secondary clocks are synchronized against the main mcu clock
+        mcus[0]._connect_clocksync()
+        self._run_parallel([m._connect_clocksync for m in mcus[1:]])
+        for m in mcus:
+            m._mcu_identify()
+    def _connect(self):
+        self._run_parallel([m._connect for m in self._mcus])
 
 def add_printer_objects(config):
     printer = config.get_printer()
     reactor = printer.get_reactor()
     mainsync = clocksync.ClockSync(reactor)
-    printer.add_object('mcu', MCU(config.getsection('mcu'), mainsync))
+    mcus = [MCU(config.getsection('mcu'), mainsync)]
+    printer.add_object('mcu', mcus[0])
     for s in config.get_prefix_sections('mcu '):
-        printer.add_object(s.section, MCU(
-            s, clocksync.SecondarySync(reactor, mainsync)))
+        mcus.append(MCU(s, clocksync.SecondarySync(reactor, mainsync)))
+        printer.add_object(s.section, mcus[-1])
+    MCUConnectGroup(printer, mcus)
 
 def get_printer_mcu(printer, name):
     if name == 'mcu':
@@ -159,6 +159,53 @@ def convert_msg_format(msgformat):
         msgformat = msgformat.replace(c, '%s')
     return msgformat
 
+# Decode the remainder of a VLQ integer (first byte already read)
+def _parse_vlq_tail(c, s, pos):
+    v = c & 0x7f
+    if (c & 0x60) == 0x60:
+        v |= -0x20
+    while c & 0x80:
+        c = s[pos]
+        pos += 1
+        v = (v<<7) | (c & 0x7f)
+    return v, pos
+
+# Build a specialized parse function for a message's parameter list.
+# Integers that fit in a single byte (the common case) are decoded
+# inline and the result dict is created in a single step.
+def compile_parser(msgid_len, param_names):
+    code = ["def parse(s, pos):", "    pos += %d" % (msgid_len,)]
+    env = {'_parse_vlq_tail': _parse_vlq_tail}
+    for i, (name, t) in enumerate(param_names):
+        var = "p%d" % (i,)
+        pt = t
+        if isinstance(t, Enumeration):
+            pt = t.pt
+        if pt.is_dynamic_string:
+            code += ["    l = s[pos]",
+                     "    %s = bytes(bytearray(s[pos+1:pos+l+1]))" % (var,),
+                     "    pos += l + 1"]
+        else:
+            code += ["    %s = s[pos]" % (var,),
+                     "    pos += 1",
+                     "    if %s >= 0x60:" % (var,),
+                     "        %s, pos = _parse_vlq_tail(%s, s, pos)" % (
+                         var, var)]
+            if not pt.signed:
+                code.append("        %s = int(%s & 0xffffffff)" % (var, var))
+        if pt is not t:
+            enum_var = "enums%d" % (i,)
+            env[enum_var] = t.reverse_enums
+            code += ["    tv = %s.get(%s)" % (enum_var, var),
+                     "    if tv is None:",
+                     "        tv = \"?%%d\" %% (%s,)" % (var,),
+                     "    %s = tv" % (var,)]
+    code.append("    return {%s}, pos" % (", ".join([
+        "%s: p%d" % (repr(name), i)
+        for i, (name, t) in enumerate(param_names)]),))
+    exec("\n".join(code), env)
+    return env['parse']
+
 class MessageFormat:
     def __init__(self, msgid_bytes, msgformat, enumerations={}):
         self.msgid_bytes = msgid_bytes
@@ -168,6 +215,7 @@ class MessageFormat:
         self.param_names = lookup_params(msgformat, enumerations)
         self.param_types = [t for name, t in self.param_names]
         self.name_to_type = dict(self.param_names)
+        self.parse = compile_parser(len(msgid_bytes), self.param_names)
     def encode(self, params):
         out = list(self.msgid_bytes)
         for i, t in enumerate(self.param_types):
@@ -178,7 +226,8 @@ class MessageFormat:
         for name, t in self.param_names:
             t.encode(out, params[name])
         return out
-    def parse(self, s, pos):
+    def generic_parse(self, s, pos):
+        # Reference implementation of the compiled parse() method
         pos += len(self.msgid_bytes)
         out = {}
         for name, t in self.param_names:
@@ -282,7 +331,10 @@ class MessageParser:
             return "%s %s" % (name, msg)
         return str(params)
     def parse(self, s):
-        msgid, param_pos = self.msgid_parser.parse(s, MESSAGE_HEADER_SIZE)
+        msgid = s[MESSAGE_HEADER_SIZE]
+        if msgid >= 0x60:
+            msgid, param_pos = _parse_vlq_tail(msgid, s,
+                                               MESSAGE_HEADER_SIZE + 1)
         mid = self.messages_by_id.get(msgid, self.unknown)
         params, pos = mid.parse(s, MESSAGE_HEADER_SIZE)
         if pos != len(s)-MESSAGE_TRAILER_SIZE:
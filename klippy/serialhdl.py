@@ -3,7 +3,7 @@
 # Copyright (C) 2016-2021  Kevin O'Connor <kevin@koconnor.net>
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
-import logging, threading, os
+import logging, threading, os, collections, zlib
 import serial
 
 import msgproto, chelper, util
@@ -11,6 +11,24 @@ import msgproto, chelper, util
 class error(Exception):
     pass
 
+PULL_BATCH_SIZE = 64
+
+LINK_LATENCY_BUCKETS = 16
+LINK_LATENCY_BASE = 0.000100
+LINK_STATS_WINDOW = 60
+
+# Parsed data dictionaries are reused across firmware restarts
+parsed_dictionaries = {}
+
+def lookup_msgparser(identify_data, warn_prefix=""):
+    cached = parsed_dictionaries.get(warn_prefix)
+    if cached is not None and cached[0] == identify_data:
+        return cached[1]
+    msgparser = msgproto.MessageParser(warn_prefix=warn_prefix)
+    msgparser.process_identify(identify_data)
+    parsed_dictionaries[warn_prefix] = (identify_data, msgparser)
+    return msgparser
+
 class SerialReader:
     def __init__(self, reactor, warn_prefix=""):
         self.reactor = reactor
@@ -18,49 +36,123 @@ class SerialReader:
         # Serial port
         self.serial_dev = None
         self.msgparser = msgproto.MessageParser(warn_prefix=warn_prefix)
+        self.dictionary_cache = None
         # C interface
         self.ffi_main, self.ffi_lib = chelper.get_ffi()
         self.serialqueue = None
-        self.default_cmd_queue = self.alloc_command_queue()
         self.stats_buf = self.ffi_main.new('char[4096]')
+        # Link health tracking
+        self.command_queues = []
+        self.link_stats_buf = self.ffi_main.new(
+            'struct serialqueue_link_stats *')
+        self.queue_stats_buf = self.ffi_main.new('struct command_queue_stats *')
+        self.last_link_counters = None
+        self.link_window = collections.deque(maxlen=LINK_STATS_WINDOW)
+        self.default_cmd_queue = self.alloc_command_queue("default")
         # Threading
         self.lock = threading.Lock()
         self.background_thread = None
         # Message handlers
         self.handlers = {}
+        self.batch_handlers = {}
         self.register_response(self._handle_unknown_init, '#unknown')
         self.register_response(self.handle_output, '#output')
         # Sent message notification tracking
         self.last_notify_id = 0
         self.pending_notifications = {}
     def _bg_thread(self):
-        response = self.ffi_main.new('struct pull_queue_message *')
+        responses = self.ffi_main.new('struct pull_queue_message[%d]'
+                                      % (PULL_BATCH_SIZE,))
         while 1:
-            self.ffi_lib.serialqueue_pull(self.serialqueue, response)
-            count = response.len
+            count = self.ffi_lib.serialqueue_pull_batch(
+                self.serialqueue, responses, PULL_BATCH_SIZE)
             if count < 0:
                 break
-            if response.notify_id:
-                params = {'#sent_time': response.sent_time,
-                          '#receive_time': response.receive_time}
-                completion = self.pending_notifications.pop(response.notify_id)
-                self.reactor.async_complete(completion, params)
-                continue
-            params = self.msgparser.parse(response.msg[0:count])
-            params['#sent_time'] = response.sent_time
-            params['#receive_time'] = response.receive_time
-            hdl = (params['#name'], params.get('oid'))
-            try:
-                with self.lock:
-                    hdl = self.handlers.get(hdl, self.handle_default)
-                    hdl(params)
-            except:
-                logging.exception("%sException in serial callback",
-                                  self.warn_prefix)
+            batches = {}
+            with self.lock:
+                for i in range(count):
+                    response = responses[i]
+                    if response.notify_id:
+                        params = {'#sent_time': response.sent_time,
+                                  '#receive_time': response.receive_time}
+                        completion = self.pending_notifications.pop(
+                            response.notify_id)
+                        self.reactor.async_complete(completion, params)
+                        continue
+                    params = self.msgparser.parse(
+                        response.msg[0:response.len])
+                    params['#sent_time'] = response.sent_time
+                    params['#receive_time'] = response.receive_time
+                    hdl = (params['#name'], params.get('oid'))
+                    if hdl in self.batch_handlers:
+                        batches.setdefault(hdl, []).append(params)
+                        continue
+                    try:
+                        hdl = self.handlers.get(hdl, self.handle_default)
+                        hdl(params)
+                    except:
+                        logging.exception("%sException in serial callback",
+                                          self.warn_prefix)
+                # Messages with a batch handler are delivered together
+                for hdl, batch in batches.items():
+                    try:
+                        self.batch_handlers[hdl](batch)
+                    except:
+                        logging.exception("%sException in serial callback",
+                                          self.warn_prefix)
     def _error(self, msg, *params):
         raise error(self.warn_prefix + (msg % params))
+    def set_dictionary_cache(self, filename):
+        self.dictionary_cache = filename
+    def _load_dictionary_cache(self):
+        if self.dictionary_cache is None:
+            return None
+        try:
+            f = open(self.dictionary_cache, 'rb')
+            identify_data = f.read()
+            f.close()
+            # Reject truncated or corrupted cache files
+            zlib.decompress(identify_data)
+        except (IOError, OSError, zlib.error):
+            return None
+        return identify_data
+    def _save_dictionary_cache(self, identify_data):
+        if self.dictionary_cache is None:
+            return
+        tmpname = self.dictionary_cache + ".tmp"
+        try:
+            f = open(tmpname, 'wb')
+            f.write(identify_data)
+            f.close()
+            os.rename(tmpname, self.dictionary_cache)
+        except (IOError, OSError) as e:
+            logging.warning("%sUnable to write dictionary cache %s: %s",
+                            self.warn_prefix, self.dictionary_cache, e)
+    def _check_cached_identify(self, identify_data):
+        # The final block of the compressed dictionary ends with a
+        # checksum of its contents - confirm the firmware reports the
+        # same final block and no data past it.
+        size = len(identify_data)
+        for offset in [max(0, size - 40), size]:
+            msg = "identify offset=%d count=%d" % (offset, 40)
+            params = self.send_with_response(msg, 'identify_response')
+            if (params['offset'] != offset
+                or params['data'] != identify_data[offset:]):
+                return False
+        return True
     def _get_identify_data(self, eventtime):
         # Query the "data dictionary" from the micro-controller
+        cached_data = self._load_dictionary_cache()
+        if cached_data is not None:
+            try:
+                if self._check_cached_identify(cached_data):
+                    logging.info("%sUsing cached data dictionary %s",
+                                 self.warn_prefix, self.dictionary_cache)
+                    return cached_data
+            except error as e:
+                logging.exception("%sWait for identify_response",
+                                  self.warn_prefix)
+                return None
         identify_data = b""
         while 1:
             msg = "identify offset=%d count=%d" % (len(identify_data), 40)
@@ -74,6 +166,7 @@ class SerialReader:
                 msgdata = params['data']
                 if not msgdata:
                     # Done
+                    self._save_dictionary_cache(identify_data)
                     return identify_data
                 identify_data += msgdata
     def _start_session(self, serial_dev, serial_fd_type=b'u', client_id=0):
@@ -91,8 +184,7 @@ class SerialReader:
             logging.info("%sTimeout on connect", self.warn_prefix)
             self.disconnect()
             return False
-        msgparser = msgproto.MessageParser(warn_prefix=self.warn_prefix)
-        msgparser.process_identify(identify_data)
+        msgparser = lookup_msgparser(identify_data, self.warn_prefix)
         self.msgparser = msgparser
         self.register_response(self.handle_unknown, '#unknown')
         # Setup baud adjust
@@ -223,6 +315,71 @@ class SerialReader:
         self.ffi_lib.serialqueue_get_stats(self.serialqueue,
                                            self.stats_buf, len(self.stats_buf))
         return str(self.ffi_main.string(self.stats_buf).decode())
+    def _read_link_counters(self):
+        ls = self.link_stats_buf
+        self.ffi_lib.serialqueue_get_link_stats(self.serialqueue, ls)
+        qs = self.queue_stats_buf
+        queues = {}
+        for name, cq in self.command_queues:
+            self.ffi_lib.serialqueue_get_queue_stats(self.serialqueue, cq, qs)
+            queues[name] = (qs.bytes_queued, qs.bytes_sent)
+        return (list(ls.latency_counts), ls.latency_sum, ls.latency_max,
+                ls.blocks_sent, ls.block_bytes, queues)
+    def link_stats(self, eventtime):
+        # Report link health over a rolling window of recent calls
+        if self.serialqueue is None:
+            return {}
+        counters = self._read_link_counters()
+        last = self.last_link_counters
+        self.last_link_counters = (eventtime, counters)
+        if last is None:
+            return {}
+        last_time, last_counters = last
+        counts, lat_sum, lat_max, blocks, block_bytes, queues = counters
+        lcounts, llat_sum, llat_max, lblocks, lblock_bytes, lqueues = (
+            last_counters)
+        queue_sent = {name: (sent - lqueues.get(name, (0, 0))[1]) & 0xffffffff
+                      for name, (queued, sent) in queues.items()}
+        self.link_window.append((
+            eventtime - last_time,
+            [(c - lc) & 0xffffffff for c, lc in zip(counts, lcounts)],
+            lat_sum - llat_sum, lat_max, (blocks - lblocks) & 0xffffffff,
+            (block_bytes - lblock_bytes) & 0xffffffff, queue_sent))
+        # Summarize window
+        window = self.link_window
+        duration = max(sum([w[0] for w in window]), 0.001)
+        hist = [sum(c) for c in zip(*[w[1] for w in window])]
+        total = sum(hist)
+        blocks = sum([w[4] for w in window])
+        res = {
+            'latency_histogram': hist,
+            'latency_avg': sum([w[2] for w in window]) / max(total, 1),
+            'latency_max': max([w[3] for w in window]),
+            'block_fill': (sum([w[5] for w in window])
+                           / float(max(blocks, 1) * msgproto.MESSAGE_MAX)),
+            'blocks_per_sec': blocks / duration,
+        }
+        for pct in [50, 95, 99]:
+            if not total:
+                # No messages were acknowledged in the window
+                res['latency_p%d' % (pct,)] = 0.
+                continue
+            # Upper bound of the histogram bucket containing the percentile
+            needed = total * pct / 100.
+            bucket = count = 0
+            while bucket < LINK_LATENCY_BUCKETS - 1:
+                count += hist[bucket]
+                if count >= needed:
+                    break
+                bucket += 1
+            res['latency_p%d' % (pct,)] = LINK_LATENCY_BASE * (1 << bucket)
+        qstats = {}
+        for name, (queued, sent) in queues.items():
+            qsent = sum([w[6].get(name, 0) for w in window])
+            qstats[name] = {'backlog_bytes': (queued - sent) & 0xffffffff,
+                            'bytes_per_sec': qsent / duration}
+        res['queues'] = qstats
+        return res
     def get_reactor(self):
         return self.reactor
     def get_msgparser(self):
@@ -238,10 +395,27 @@ class SerialReader:
                 del self.handlers[name, oid]
             else:
                 self.handlers[name, oid] = callback
+    def register_batch_response(self, callback, name, oid=None):
+        # The callback is passed a list of all matching messages that
+        # were received together
+        with self.lock:
+            if callback is None:
+                del self.batch_handlers[name, oid]
+            else:
+                self.batch_handlers[name, oid] = callback
     # Command sending
     def raw_send(self, cmd, minclock, reqclock, cmd_queue):
         self.ffi_lib.serialqueue_send(self.serialqueue, cmd_queue,
                                       cmd, len(cmd), minclock, reqclock, 0)
+    def raw_send_group(self, cmds):
+        # Queue several (cmd, minclock, reqclock, cmd_queue) messages at once
+        msgs = bytearray()
+        for cmd, minclock, reqclock, cmd_queue in cmds:
+            msgs.extend(cmd)
+        self.ffi_lib.serialqueue_send_group(
+            self.serialqueue, [c[3] for c in cmds], bytes(msgs),
+            [len(c[0]) for c in cmds], [c[1] for c in cmds],
+            [c[2] for c in cmds], len(cmds))
     def raw_send_wait_ack(self, cmd, minclock, reqclock, cmd_queue):
         self.last_notify_id += 1
         nid = self.last_notify_id
@@ -260,9 +434,13 @@ class SerialReader:
         cmd = self.msgparser.create_command(msg)
         src = SerialRetryCommand(self, response)
         return src.get_response([cmd], self.default_cmd_queue)
-    def alloc_command_queue(self):
-        return self.ffi_main.gc(self.ffi_lib.serialqueue_alloc_commandqueue(),
-                                self.ffi_lib.serialqueue_free_commandqueue)
+    def alloc_command_queue(self, name=None):
+        cq = self.ffi_main.gc(self.ffi_lib.serialqueue_alloc_commandqueue(),
+                              self.ffi_lib.serialqueue_free_commandqueue)
+        if name is None:
+            name = "queue%d" % (len(self.command_queues),)
+        self.command_queues.append((name, cq))
+        return cq
     # Dumping debug lists
     def dump_debug(self):
         out = []
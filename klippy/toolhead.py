@@ -4,7 +4,7 @@
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
 import math, logging, importlib
-import mcu, chelper, kinematics.extruder
+import mcu, chelper, stepper, kinematics.extruder
 
 # Common suffixes: _d is distance (in mm), _v is velocity (in
 #   mm/second), _v2 is velocity squared (mm^2/s^2), _t is time (in
@@ -130,6 +130,9 @@ class LookAheadQueue:
             return self.queue[-1]
         return None
     def flush(self, lazy=False):
+        profile = self.toolhead.motion_profile
+        if profile is not None:
+            start_time = profile.monotonic()
         self.junction_flush = LOOKAHEAD_FLUSH_TIME
         update_flush_count = lazy
         queue = self.queue
@@ -175,8 +178,12 @@ class LookAheadQueue:
                 delayed.append((move, start_v2, next_end_v2))
             next_end_v2 = start_v2
             next_smoothed_v2 = smoothed_v2
+        if profile is not None:
+            profile.note_time("lookahead", start_time)
         if update_flush_count or not flush_count:
             return
+        if profile is not None:
+            profile.note_flush(flush_count, lazy)
         # Generate step times for all moves ready to be flushed
         self.toolhead._process_moves(queue[:flush_count])
         # Remove processed moves from the queue
@@ -208,6 +215,93 @@ DRIP_TIME = 0.100
 class DripModeEndSignal(Exception):
     pass
 
+# Optional low-overhead profiling of the host motion pipeline.  Timing
+# histograms use power-of-two buckets (bucket N covers 2^(N-1) to 2^N
+# microseconds) and batch size histograms use the same scheme on the
+# number of moves in each flushed batch.
+PROFILE_BUCKETS = 20
+PROFILE_STAGES = ["lookahead", "process_moves", "step_generation",
+                  "mcu_flush"]
+
+def _profile_bucket(value):
+    return min(int(value).bit_length(), PROFILE_BUCKETS - 1)
+
+class MotionProfile:
+    def __init__(self, reactor):
+        self.monotonic = reactor.monotonic
+        self.move_count = self.last_move_count = 0
+        self.last_stats_time = 0.
+        self.lazy_flushes = self.forced_flushes = 0
+        self.flush_hist = [0] * PROFILE_BUCKETS
+        self.stage_times = {name: [0., 0, [0] * PROFILE_BUCKETS]
+                            for name in PROFILE_STAGES}
+        self.sg_names = {}
+        self.sg_times = {}
+        self.status = {}
+    def note_time(self, stage, start_time):
+        duration = self.monotonic() - start_time
+        st = self.stage_times[stage]
+        st[0] += duration
+        st[1] += 1
+        st[2][_profile_bucket(duration * 1000000.)] += 1
+    def note_flush(self, move_count, lazy):
+        if lazy:
+            self.lazy_flushes += 1
+        else:
+            self.forced_flushes += 1
+        self.flush_hist[_profile_bucket(move_count)] += 1
+    def _lookup_sg_name(self, sg):
+        name = self.sg_names.get(sg)
+        if name is None:
+            get_name = getattr(getattr(sg, '__self__', None), 'get_name', None)
+            if get_name is not None:
+                name = get_name()
+            else:
+                name = getattr(sg, '__name__', 'step_generator')
+            self.sg_names[sg] = name
+        return name
+    def note_sg_time(self, name, duration):
+        sg_times = self.sg_times
+        sg_times[name] = sg_times.get(name, 0.) + duration
+    def call_step_generators(self, step_generators, flush_time):
+        monotonic = self.monotonic
+        curtime = monotonic()
+        for sg in step_generators:
+            sg(flush_time)
+            endtime = monotonic()
+            self.note_sg_time(self._lookup_sg_name(sg), endtime - curtime)
+            curtime = endtime
+    def generate_steps(self, step_generators, flush_time):
+        start_time = self.monotonic()
+        self.call_step_generators(step_generators, flush_time)
+        self.note_time("step_generation", start_time)
+    def stats(self, eventtime):
+        moves = self.move_count - self.last_move_count
+        elapsed = eventtime - self.last_stats_time
+        moves_per_sec = 0.
+        if self.last_stats_time and elapsed > 0.:
+            moves_per_sec = moves / elapsed
+        self.last_move_count = self.move_count
+        self.last_stats_time = eventtime
+        stages = {name: {'time': st[0], 'count': st[1],
+                         'histogram': list(st[2])}
+                  for name, st in self.stage_times.items()}
+        self.status = {
+            'moves': self.move_count, 'moves_per_sec': moves_per_sec,
+            'lazy_flushes': self.lazy_flushes,
+            'forced_flushes': self.forced_flushes,
+            'flush_batch_histogram': list(self.flush_hist),
+            'stages': stages, 'step_generators': dict(self.sg_times)}
+        msg = " moves_per_sec=%.1f lazy_flushes=%d forced_flushes=%d" % (
+            moves_per_sec, self.lazy_flushes, self.forced_flushes)
+        msg += "".join([" %s_time=%.3f" % (name, self.stage_times[name][0])
+                        for name in PROFILE_STAGES])
+        msg += "".join([" sg_%s_time=%.3f" % (name, t)
+                        for name, t in sorted(self.sg_times.items())])
+        return msg
+    def get_status(self, eventtime):
+        return self.status
+
 # Main code to track events (and their timing) on the printer toolhead
 class ToolHead:
     def __init__(self, config):
@@ -250,6 +344,10 @@ class ToolHead:
         self.special_queuing_state = "NeedPrime"
         self.priming_timer = None
         self.drip_completion = None
+        # Optional motion pipeline profiling
+        self.motion_profile = None
+        if config.getboolean('motion_profiling', False):
+            self.motion_profile = MotionProfile(self.reactor)
         # Flush tracking
         self.flush_timer = self.reactor.register_timer(self._flush_handler)
         self.do_kick_flush_timer = True
@@ -264,6 +362,18 @@ class ToolHead:
         self.trapq_append = ffi_lib.trapq_append
         self.trapq_finalize_moves = ffi_lib.trapq_finalize_moves
         self.step_generators = []
+        # Optional multi-threaded step generation
+        self.step_gen_pool = None
+        self.step_gen_steppers = self.step_gen_others = None
+        self.step_gen_times = None
+        step_gen_threads = config.getint('step_generation_threads', 0,
+                                         minval=0)
+        if step_gen_threads:
+            self.step_gen_pool = ffi_main.gc(
+                ffi_lib.itersolve_pool_alloc(step_gen_threads),
+                ffi_lib.itersolve_pool_free)
+            self.itersolve_pool_generate_steps = (
+                ffi_lib.itersolve_pool_generate_steps)
         # Create kinematics class
         gcode = self.printer.lookup_object('gcode')
         self.Coord = gcode.Coord
@@ -301,8 +411,18 @@ class ToolHead:
         sg_flush_want = min(flush_time + STEPCOMPRESS_FLUSH_TIME,
                             self.print_time - self.kin_flush_delay)
         sg_flush_time = max(sg_flush_want, flush_time)
-        for sg in self.step_generators:
-            sg(sg_flush_time)
+        profile = self.motion_profile
+        if self.step_gen_pool is not None:
+            if profile is not None:
+                start_time = profile.monotonic()
+            self._parallel_generate_steps(sg_flush_time)
+            if profile is not None:
+                profile.note_time("step_generation", start_time)
+        elif profile is None:
+            for sg in self.step_generators:
+                sg(sg_flush_time)
+        else:
+            profile.generate_steps(self.step_generators, sg_flush_time)
         self.min_restart_time = max(self.min_restart_time, sg_flush_time)
         # Free trapq entries that are no longer needed
         clear_history_time = self.clear_history_time
@@ -312,9 +432,57 @@ class ToolHead:
         self.trapq_finalize_moves(self.trapq, free_time, clear_history_time)
         self.extruder.update_move_time(free_time, clear_history_time)
         # Flush stepcompress and mcu steppersync
+        if profile is not None:
+            start_time = profile.monotonic()
         for m in self.all_mcus:
             m.flush_moves(flush_time, clear_history_time)
+        if profile is not None:
+            profile.note_time("mcu_flush", start_time)
         self.last_flush_time = flush_time
+    def _setup_parallel_step_generation(self):
+        # Split registered step generators into steppers that can be
+        # handled by the worker pool and other generators
+        steppers = []
+        others = []
+        for sg in self.step_generators:
+            obj = getattr(sg, '__self__', None)
+            if getattr(sg, '__name__', None) != 'generate_steps':
+                others.append(sg)
+            elif isinstance(obj, stepper.PrinterRail):
+                steppers.extend(obj.get_steppers())
+            elif isinstance(obj, stepper.MCU_stepper):
+                steppers.append(obj)
+            else:
+                others.append(sg)
+        self.step_gen_steppers = steppers
+        self.step_gen_others = others
+        # Per stepper generation times are only collected when profiling
+        ffi_main, ffi_lib = chelper.get_ffi()
+        self.step_gen_times = ffi_main.NULL
+        if self.motion_profile is not None:
+            self.step_gen_times = ffi_main.new('double[]', len(steppers))
+    def _parallel_generate_steps(self, flush_time):
+        if self.step_gen_steppers is None:
+            self._setup_parallel_step_generation()
+        steppers = self.step_gen_steppers
+        for s in steppers:
+            s.check_active_callbacks(flush_time)
+        # Steps for all steppers are generated in parallel (without
+        # holding the GIL) and joined before the mcu queues are flushed
+        sks = [s.get_stepper_kinematics() for s in steppers]
+        times = self.step_gen_times
+        ret = self.itersolve_pool_generate_steps(self.step_gen_pool, sks,
+                                                 len(sks), flush_time, times)
+        if ret:
+            raise stepper.error("Internal error in stepcompress")
+        profile = self.motion_profile
+        if profile is None:
+            for sg in self.step_gen_others:
+                sg(flush_time)
+            return
+        for i, s in enumerate(steppers):
+            profile.note_sg_time(s.get_name(), times[i])
+        profile.call_step_generators(self.step_gen_others, flush_time)
     def _advance_move_time(self, next_print_time):
         pt_delay = self.kin_flush_delay + STEPCOMPRESS_FLUSH_TIME
         flush_time = max(self.last_flush_time, self.print_time - pt_delay)
@@ -344,6 +512,9 @@ class ToolHead:
                 self.need_check_pause = -1.
             self._calc_print_time()
         # Queue moves into trapezoid motion queue (trapq)
+        profile = self.motion_profile
+        if profile is not None:
+            start_time = profile.monotonic()
         next_move_time = self.print_time
         for move in moves:
             if move.is_kinematic_move:
@@ -359,6 +530,8 @@ class ToolHead:
                               + move.cruise_t + move.decel_t)
             for cb in move.timing_callbacks:
                 cb(next_move_time)
+        if profile is not None:
+            profile.note_time("process_moves", start_time)
         # Generate steps for moves
         if self.special_queuing_state:
             self._update_drip_move_time(next_move_time)
@@ -479,6 +652,8 @@ class ToolHead:
         if move.axes_d[3]:
             self.extruder.check_move(move)
         self.commanded_pos[:] = move.end_pos
+        if self.motion_profile is not None:
+            self.motion_profile.move_count += 1
         self.lookahead.add_move(move)
         if self.print_time > self.need_check_pause:
             self._check_pause()
@@ -489,6 +664,52 @@ class ToolHead:
                 curpos[i] = coord[i]
         self.move(curpos, speed)
         self.printer.send_event("toolhead:manual_move")
+    def check_trajectory(self, positions, max_v, max_accel):
+        # Verify that moves from the current position to the given
+        # positions are valid and return the (max_v2, max_accel) limits
+        # that the kinematics impose on them
+        max_v2 = max_v**2
+        for pos in positions:
+            move = Move(self, self.commanded_pos, pos, max_v, 0)
+            if not move.move_d:
+                continue
+            move.accel = max_accel
+            self.kin.check_move(move)
+            max_v2 = min(max_v2, move.max_cruise_v2)
+            max_accel = min(max_accel, move.accel)
+        return max_v2, max_accel
+    def queue_trajectory(self, moves, end_pos):
+        # Queue precomputed trapezoidal moves directly into the trapq,
+        # bypassing the lookahead queue.  Each move is a tuple of
+        # (accel_t, cruise_t, decel_t, start_x, start_y, start_z,
+        # axes_r_x, axes_r_y, axes_r_z, start_v, cruise_v, accel). The
+        # moves must start and end at rest and be continuous (see
+        # check_trajectory() for verifying their limits).
+        self.lookahead.flush()
+        if self.special_queuing_state:
+            if self.special_queuing_state != "Drip":
+                self.special_queuing_state = ""
+                self.need_check_pause = -1.
+            self._calc_print_time()
+        next_move_time = batch_end_time = self.print_time
+        for move in moves:
+            self.trapq_append(self.trapq, next_move_time, *(move + (0.,)))
+            next_move_time += move[0] + move[1] + move[2]
+            if next_move_time < batch_end_time:
+                continue
+            # Generate steps for the queued moves in batches
+            self.note_mcu_movequeue_activity(
+                next_move_time + self.kin_flush_delay, set_step_gen_time=True)
+            self._advance_move_time(next_move_time)
+            batch_end_time = next_move_time + MOVE_BATCH_TIME
+            if self.print_time > self.need_check_pause:
+                self._check_pause()
+        self.note_mcu_movequeue_activity(
+            next_move_time + self.kin_flush_delay, set_step_gen_time=True)
+        self._advance_move_time(next_move_time)
+        self.commanded_pos[:3] = end_pos[:3]
+        if self.print_time > self.need_check_pause:
+            self._check_pause()
     def dwell(self, delay):
         next_print_time = self.get_last_move_time() + max(0., delay)
         self._advance_move_time(next_print_time)
@@ -561,8 +782,11 @@ class ToolHead:
         is_active = buffer_time > -60. or not self.special_queuing_state
         if self.special_queuing_state == "Drip":
             buffer_time = 0.
-        return is_active, "print_time=%.3f buffer_time=%.3f print_stall=%d" % (
+        msg = "print_time=%.3f buffer_time=%.3f print_stall=%d" % (
             self.print_time, max(buffer_time, 0.), self.print_stall)
+        if self.motion_profile is not None:
+            msg += self.motion_profile.stats(eventtime)
+        return is_active, msg
     def check_busy(self, eventtime):
         est_print_time = self.mcu.estimated_print_time(eventtime)
         lookahead_empty = not self.lookahead.queue
@@ -580,6 +804,8 @@ class ToolHead:
                      'max_accel': self.max_accel,
                      'minimum_cruise_ratio': self.min_cruise_ratio,
                      'square_corner_velocity': self.square_corner_velocity})
+        if self.motion_profile is not None:
+            res['motion_profile'] = self.motion_profile.get_status(eventtime)
         return res
     def _handle_shutdown(self):
         self.can_pause = False
@@ -590,6 +816,7 @@ class ToolHead:
         return self.trapq
     def register_step_generator(self, handler):
         self.step_generators.append(handler)
+        self.step_gen_steppers = self.step_gen_others = None
     def note_step_generation_scan_time(self, delay, old_delay=0.):
         self.flush_step_generation()
         if old_delay:
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+# Host motion pipeline benchmark helper script
+#
+# Copyright (C) 2026  CreatBot
+#
+# This file may be distributed under the terms of the GNU GPLv3 license.
+import sys, os, optparse, logging, subprocess, time, json
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                             '..', 'klippy'))
+import msgproto
+
+TEMP_GCODE_FILE = "_bench_.gcode"
+TEMP_LOG_FILE = "_bench_.log"
+TEMP_OUTPUT_FILE = "_bench_output"
+
+MOVE_COMMANDS = ('G0', 'G1', 'G2', 'G3')
+METRICS = ['lines_per_sec', 'moves_per_sec', 'steps_per_sec']
+
+
+######################################################################
+# Output file decoding
+######################################################################
+
+# Count the messages and steps in a batch mode klippy output file
+def analyze_output(dict_fname, output_fname):
+    f = open(dict_fname, 'rb')
+    dictionary = f.read()
+    f.close()
+    mp = msgproto.MessageParser()
+    mp.process_identify(dictionary, decompress=False)
+    msg_count = step_count = 0
+    f = open(output_fname, 'rb')
+    data = bytearray(f.read())
+    f.close()
+    total_bytes = len(data)
+    while data:
+        l = mp.check_packet(data)
+        if l <= 0:
+            if l < 0:
+                logging.error("Invalid data in %s", output_fname)
+                data = data[-l:]
+                continue
+            break
+        pos = msgproto.MESSAGE_HEADER_SIZE
+        while pos < l - msgproto.MESSAGE_TRAILER_SIZE:
+            msgid, param_pos = mp.msgid_parser.parse(data, pos)
+            mid = mp.messages_by_id.get(msgid, mp.unknown)
+            params, pos = mid.parse(data, pos)
+            msg_count += 1
+            if mid.name == 'queue_step':
+                step_count += params['count']
+        data = data[l:]
+    return {'bytes': total_bytes, 'messages': msg_count, 'steps': step_count}
+
+
+######################################################################
+# Benchmark cases
+######################################################################
+
+class error(Exception):
+    pass
+
+class BenchCase:
+    def __init__(self, fname, dictdir, tempdir, repeat, loops,
+                 gcode_override):
+        self.fname = fname
+        self.dictdir = dictdir
+        self.tempdir = tempdir
+        self.repeat = repeat
+        self.loops = loops
+        self.gcode_override = gcode_override
+    def relpath(self, fname, rel='test'):
+        if rel == 'dict':
+            reldir = self.dictdir
+        elif rel == 'temp':
+            reldir = self.tempdir
+        else:
+            reldir = os.path.dirname(self.fname)
+        return os.path.join(reldir, fname)
+    def parse_bench(self):
+        # Parse benchmark file (same format as the regression tests,
+        # with inline commands run before the gcode file)
+        config_fname = gcode_fname = dict_fnames = None
+        prologue = []
+        f = open(self.fname, 'r')
+        for line in f:
+            cpos = line.find('#')
+            if cpos >= 0:
+                line = line[:cpos]
+            parts = line.strip().split()
+            if not parts:
+                continue
+            if parts[0] == "CONFIG":
+                config_fname = self.relpath(parts[1])
+            elif parts[0] == "DICTIONARY":
+                dict_fnames = [self.relpath(parts[1], 'dict')]
+                for mcu_dict in parts[2:]:
+                    mcu, fname = mcu_dict.split('=', 1)
+                    dict_fnames.append('%s=%s' % (
+                        mcu.strip(), self.relpath(fname.strip(), 'dict')))
+            elif parts[0] == "GCODE":
+                gcode_fname = self.relpath(parts[1])
+            else:
+                prologue.append(line.strip())
+        f.close()
+        if self.gcode_override is not None:
+            gcode_fname = self.gcode_override
+        if config_fname is None:
+            raise error("config file not specified")
+        if dict_fnames is None:
+            raise error("data dictionary file not specified")
+        if gcode_fname is None:
+            raise error("gcode file not specified")
+        return config_fname, dict_fnames, gcode_fname, prologue
+    def run_klippy(self, config_fname, dict_fnames, gcode_lines):
+        gcode_tmp = self.relpath(TEMP_GCODE_FILE, 'temp')
+        f = open(gcode_tmp, 'w')
+        f.write('\n'.join(gcode_lines + ['']))
+        f.close()
+        output_fname = self.relpath(TEMP_OUTPUT_FILE, 'temp')
+        log_fname = self.relpath(TEMP_LOG_FILE, 'temp')
+        args = [sys.executable, './klippy/klippy.py', config_fname,
+                '-i', gcode_tmp, '-o', output_fname, '-l', log_fname]
+        for df in dict_fnames:
+            args += ['-d', df]
+        start_time = time.time()
+        proc = subprocess.Popen(args)
+        pid, status, rusage = os.wait4(proc.pid, 0)
+        elapsed = time.time() - start_time
+        proc.returncode = status
+        if status:
+            f = open(log_fname, 'r')
+            sys.stdout.write(f.read())
+            f.close()
+            raise error("Error during benchmark")
+        res = {'elapsed': elapsed,
+               'cputime': rusage.ru_utime + rusage.ru_stime,
+               'peak_rss_kb': rusage.ru_maxrss}
+        main_dict = dict_fnames[0]
+        res.update(analyze_output(main_dict, output_fname))
+        for fname in os.listdir(self.tempdir or '.'):
+            if fname.startswith(TEMP_OUTPUT_FILE):
+                os.unlink(os.path.join(self.tempdir, fname))
+        os.unlink(gcode_tmp)
+        os.unlink(log_fname)
+        return res
+    def run(self):
+        config_fname, dict_fnames, gcode_fname, prologue = self.parse_bench()
+        f = open(gcode_fname, 'r')
+        gcode = [l.strip() for l in f] * self.loops
+        f.close()
+        lines = moves = 0
+        for line in gcode:
+            cmd = line.split(';', 1)[0].split()
+            if not cmd:
+                continue
+            lines += 1
+            if cmd[0].upper() in MOVE_COMMANDS:
+                moves += 1
+        sys.stderr.write("    Running %s (%s, %d lines)\n" % (
+            self.fname, os.path.basename(gcode_fname), lines))
+        # Measure startup and prologue costs so they can be subtracted
+        startup = best = None
+        for i in range(self.repeat):
+            res = self.run_klippy(config_fname, dict_fnames, prologue)
+            if startup is None or res['cputime'] < startup['cputime']:
+                startup = res
+            res = self.run_klippy(config_fname, dict_fnames,
+                                  prologue + gcode)
+            if best is None or res['cputime'] < best['cputime']:
+                best = res
+        cputime = max(best['cputime'] - startup['cputime'], 0.000001)
+        steps = best['steps'] - startup['steps']
+        return {
+            'gcode': os.path.basename(gcode_fname),
+            'lines': lines, 'moves': moves, 'steps': steps,
+            'bytes': best['bytes'] - startup['bytes'],
+            'cputime': cputime,
+            'elapsed': best['elapsed'] - startup['elapsed'],
+            'lines_per_sec': lines / cputime,
+            'moves_per_sec': moves / cputime,
+            'steps_per_sec': steps / cputime,
+            'peak_rss_kb': best['peak_rss_kb'],
+        }
+
+
+######################################################################
+# Reporting
+######################################################################
+
+def format_result(name, res, baseline):
+    out = ["%s: gcode=%s lines=%d moves=%d steps=%d bytes=%d"
+           " cputime=%.3f peak_rss=%dKiB" % (
+               name, res['gcode'], res['lines'], res['moves'],
+               res['steps'], res['bytes'], res['cputime'],
+               res['peak_rss_kb'])]
+    for metric in METRICS + ['peak_rss_kb']:
+        msg = "    %s=%.1f" % (metric, res[metric])
+        if baseline is not None and baseline.get(metric):
+            change = (res[metric] - baseline[metric]) / baseline[metric]
+            msg += " (baseline %.1f, %+.1f%%)" % (baseline[metric],
+                                                  100. * change)
+        out.append(msg)
+    return "\n".join(out)
+
+def check_regression(res, baseline, threshold):
+    failed = []
+    for metric in METRICS:
+        if baseline.get(metric) and res[metric] < (
+                baseline[metric] * (1. - threshold)):
+            failed.append(metric)
+    base_rss = baseline.get('peak_rss_kb')
+    if base_rss and res['peak_rss_kb'] > base_rss * (1. + threshold):
+        failed.append('peak_rss_kb')
+    return failed
+
+
+######################################################################
+# Startup
+######################################################################
+
+def main():
+    # Parse args
+    usage = "%prog [options] <benchmark cases>"
+    opts = optparse.OptionParser(usage)
+    opts.add_option("-d", "--dictdir", dest="dictdir", default=".",
+                    help="directory for dictionary files")
+    opts.add_option("-t", "--tempdir", dest="tempdir", default=".",
+                    help="directory for temporary files")
+    opts.add_option("-g", "--gcode", dest="gcode", default=None,
+                    help="replay this gcode file instead of the default")
+    opts.add_option("-r", "--repeat", dest="repeat", type="int", default=3,
+                    help="number of runs per case (best is reported)")
+    opts.add_option("-n", "--loops", dest="loops", type="int", default=10,
+                    help="number of times to replay the gcode in each run")
+    opts.add_option("-s", "--save", dest="save", default=None,
+                    help="store results as a baseline in this file")
+    opts.add_option("-b", "--baseline", dest="baseline", default=None,
+                    help="compare results against this baseline file")
+    opts.add_option("-T", "--threshold", dest="threshold", type="float",
+                    default=10., help="allowed regression in percent")
+    options, args = opts.parse_args()
+    if len(args) < 1:
+        opts.error("Incorrect number of arguments")
+    logging.basicConfig(level=logging.INFO)
+    baselines = {}
+    if options.baseline is not None:
+        f = open(options.baseline, 'r')
+        baselines = json.load(f)
+        f.close()
+
+    # Run each benchmark
+    results = {}
+    regressions = []
+    for fname in args:
+        bc = BenchCase(fname, options.dictdir, options.tempdir,
+                       max(1, options.repeat), max(1, options.loops),
+                       options.gcode)
+        try:
+            res = bc.run()
+        except error as e:
+            sys.stderr.write("\n\nBenchmark %s FAILED (%s)!\n\n" % (fname, e))
+            sys.exit(-1)
+        name = os.path.basename(fname)
+        results[name] = res
+        baseline = baselines.get(name)
+        sys.stdout.write(format_result(name, res, baseline) + "\n")
+        if baseline is not None:
+            failed = check_regression(res, baseline,
+                                      options.threshold / 100.)
+            if failed:
+                regressions.append("%s (%s)" % (name, ", ".join(failed)))
+
+    if options.save is not None:
+        f = open(options.save, 'w')
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write('\n')
+        f.close()
+    if regressions:
+        sys.stderr.write("\n\nPerformance regression in: %s\n\n" % (
+            "; ".join(regressions),))
+        sys.exit(-1)
+
+if __name__ == '__main__':
+    main()
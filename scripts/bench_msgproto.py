@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# Measure message decoding throughput over captured serial data
+#
+# Copyright (C) 2026  CreatBot
+#
+# This file may be distributed under the terms of the GNU GPLv3 license.
+import sys, os, optparse, time
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                             '..', 'klippy'))
+import msgproto
+
+# Split a raw capture (eg, a batch mode output file) into message blocks
+def read_blocks(mp, fname):
+    f = open(fname, 'rb')
+    data = bytearray(f.read())
+    f.close()
+    blocks = []
+    while data:
+        l = mp.check_packet(data)
+        if l <= 0:
+            if l < 0:
+                data = data[-l:]
+                continue
+            break
+        blocks.append(bytes(data[:l]))
+        data = data[l:]
+    return blocks
+
+# Split message blocks so that each message is in its own block
+def split_messages(mp, blocks):
+    header = b'\x00' * msgproto.MESSAGE_HEADER_SIZE
+    trailer = b'\x00' * msgproto.MESSAGE_TRAILER_SIZE
+    out = []
+    for block in blocks:
+        pos = msgproto.MESSAGE_HEADER_SIZE
+        while pos < len(block) - msgproto.MESSAGE_TRAILER_SIZE:
+            msgid, param_pos = mp.msgid_parser.parse(block, pos)
+            mid = mp.messages_by_id.get(msgid, mp.unknown)
+            params, next_pos = mid.parse(block, pos)
+            out.append(header + block[pos:next_pos] + trailer)
+            pos = next_pos
+    return out
+
+def generic_parse(mp, s):
+    msgid, param_pos = mp.msgid_parser.parse(s, msgproto.MESSAGE_HEADER_SIZE)
+    mid = mp.messages_by_id.get(msgid, mp.unknown)
+    parse = getattr(mid, 'generic_parse', mid.parse)
+    params, pos = parse(s, msgproto.MESSAGE_HEADER_SIZE)
+    params['#name'] = mid.name
+    return params
+
+def run_bench(parse, msgs, loops):
+    best = None
+    for i in range(loops):
+        start_time = time.process_time()
+        for msg in msgs:
+            parse(msg)
+        cputime = time.process_time() - start_time
+        if best is None or cputime < best:
+            best = cputime
+    return max(best, 0.000001)
+
+def main():
+    usage = "%prog [options] <dictionary> <capture files>"
+    opts = optparse.OptionParser(usage)
+    opts.add_option("-n", "--loops", dest="loops", type="int", default=5,
+                    help="number of timed passes (best is reported)")
+    options, args = opts.parse_args()
+    if len(args) < 2:
+        opts.error("Incorrect number of arguments")
+    f = open(args[0], 'rb')
+    dictionary = f.read()
+    f.close()
+    mp = msgproto.MessageParser()
+    mp.process_identify(dictionary, decompress=False)
+    blocks = []
+    for fname in args[1:]:
+        blocks += read_blocks(mp, fname)
+    msgs = split_messages(mp, blocks)
+    if not msgs:
+        opts.error("No messages found in capture files")
+    # Verify the compiled parsers against the reference implementation
+    for msg in msgs:
+        if mp.parse(msg) != generic_parse(mp, msg):
+            sys.stderr.write("Parser mismatch on %s\n" % (repr(msg),))
+            sys.exit(-1)
+    generic_time = run_bench((lambda s: generic_parse(mp, s)), msgs,
+                             options.loops)
+    compiled_time = run_bench(mp.parse, msgs, options.loops)
+    sys.stdout.write("messages=%d blocks=%d\n" % (len(msgs), len(blocks)))
+    for name, cputime in [("generic", generic_time),
+                          ("compiled", compiled_time)]:
+        sys.stdout.write("    %s: cputime=%.3f messages_per_sec=%.0f\n"
+                         % (name, cputime, len(msgs) / cputime))
+    sys.stdout.write("    speedup=%.2fx\n" % (generic_time / compiled_time,))
+
+if __name__ == '__main__':
+    main()
@@ -16,6 +16,12 @@ shaper_calibrate = importlib.import_module('.shaper_calibrate', 'extras')
 MAX_TITLE_LENGTH=65
 
 def parse_log(logname):
+    if logname.endswith('.npy'):
+        # Binary raw accelerometer data (a structured array of doubles)
+        data = np.load(logname, mmap_mode='r')
+        if data.dtype.names is None:
+            return data
+        return data.view(data.dtype[0]).reshape(-1, len(data.dtype.names))
     with open(logname) as f:
         for header in f:
             if not header.startswith('#'):
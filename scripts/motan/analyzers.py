@@ -358,17 +358,38 @@ class AnalyzerManager:
                 raise self.error("Unknown dataset '%s'" % (dataset,))
         return hdl.get_label()
     def generate_datasets(self):
-        # Generate raw data
-        list_hdls = [(self.datasets[name], hdl)
-                     for name, hdl in self.raw_datasets.items()]
         initial_start_time = self.lmanager.get_initial_start_time()
         start_time = t = self.lmanager.get_start_time()
         end_time = start_time + self.duration
+        req_times = []
         while t < end_time:
             t += self.segment_time
-            self.dataset_times.append(t - initial_start_time)
-            for dl, hdl in list_hdls:
-                dl.append(hdl.pull_data(t))
+            req_times.append(t)
+        self.dataset_times = [t - initial_start_time for t in req_times]
+        # Load datasets from a previous invocation
+        cache = self.lmanager.get_dataset_cache()
+        cache_keys = {}
+        if cache is not None:
+            for name in list(self.raw_datasets) + list(self.gen_datasets):
+                key = (name, start_time, self.segment_time, len(req_times))
+                data = cache.load(key)
+                if data is None:
+                    cache_keys[name] = key
+                    continue
+                self.datasets[name] = data
+                if name in self.raw_datasets:
+                    self.lmanager.drop_dataset(name)
+        # Generate raw data
+        list_hdls = [(self.datasets[name], hdl)
+                     for name, hdl in self.raw_datasets.items()
+                     if cache is None or name in cache_keys]
+        if list_hdls:
+            for t in req_times:
+                for dl, hdl in list_hdls:
+                    dl.append(hdl.pull_data(t))
         # Generate analyzer data
         for name, hdl in self.gen_datasets.items():
-            self.datasets[name] = hdl.generate_data()
+            if cache is None or name in cache_keys:
+                self.datasets[name] = hdl.generate_data()
+        for name, key in cache_keys.items():
+            cache.store(key, self.datasets[name])
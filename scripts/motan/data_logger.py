@@ -5,6 +5,7 @@
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
 import sys, os, optparse, socket, select, json, errno, time, zlib
+import logcolumns
 
 INDEX_UPDATE_TIME = 5.0
 ClientInfo = {'program': 'motan_data_logger', 'version': 'v0.1'}
@@ -62,6 +63,7 @@ class DataLogger:
         # Data log
         self.logger = LogWriter(log_prefix + ".json.gz")
         self.index = LogWriter(log_prefix + ".index.gz")
+        self.columns = logcolumns.ColumnWriter(log_prefix + ".cols")
         # Handlers
         self.query_handlers = {}
         self.async_handlers = {}
@@ -75,8 +77,10 @@ class DataLogger:
         sys.stderr.write(msg + "\n")
     def finish(self, msg):
         self.error(msg)
+        self.flush_index()
         self.logger.close()
         self.index.close()
+        self.columns.close()
         sys.exit(0)
     # Unix Domain Socket IO
     def send_query(self, msg_id, method, params, cb):
@@ -100,6 +104,7 @@ class DataLogger:
             self.logger.add_data(part)
             msg_q = msg.get("q")
             if msg_q is not None:
+                self.columns.add_msg(msg_q, msg.get("params", {}))
                 hdl = self.async_handlers.get(msg_q)
                 if hdl is not None:
                     hdl(msg, part)
@@ -171,6 +176,7 @@ class DataLogger:
         self.db.setdefault("subscriptions", {})[msg_id] = msg["result"]
     def flush_index(self):
         self.db['file_position'] = self.logger.flush()
+        self.db['columns'] = self.columns.flush()
         self.index.add_data(json.dumps(self.db, separators=(',', ':')).encode())
         self.db = {"status": {}}
     def handle_async_db(self, msg, raw_msg):
@@ -0,0 +1,187 @@
+# Chunked columnar storage of the messages logged by data_logger.py
+#
+# Copyright (C) 2026  CreatBot
+#
+# This file may be distributed under the terms of the GNU GPLv3 license.
+import sys, json, zlib, array, itertools
+
+FORMAT_NAME = "motan_columns"
+FORMAT_VERSION = 1
+
+# The messages of each subscription are stored in "blocks" of messages
+# with the same keys. Each message key is stored as a separately
+# compressed column (an array of integers or doubles if possible, json
+# otherwise). When the messages have a 'data' list of rows with a fixed
+# layout (eg, trapq, stepq, and sensor dumps) the rows are stored as one
+# column per row field (nested lists are flattened). A block
+# description is a dictionary like:
+#   {'count': <number of messages>,
+#    'columns': {<msg key>: <column>, ...},
+#    'rows': {'shape': [<None or nested list length>, ...],
+#             'counts': <column>, 'fields': [<column>, ...]}}
+# where each column is [<typecode>, <file position>, <compressed size>].
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def _to_array(values):
+    # Booleans (and other non-numbers) are stored as json
+    if not all([_is_number(v) for v in values]):
+        return None
+    for typecode in ('q', 'd'):
+        try:
+            return array.array(typecode, values)
+        except (TypeError, OverflowError):
+            pass
+    return None
+
+# Return the layout of the rows in a 'data' list (or None if the rows
+# can not be stored as columns)
+def _get_row_shape(data):
+    if not isinstance(data, list) or not data:
+        return None
+    row = data[0]
+    if not isinstance(row, list) or not row:
+        return None
+    shape = []
+    for field in row:
+        if _is_number(field):
+            shape.append(None)
+        elif (isinstance(field, list) and field
+              and all([_is_number(v) for v in field])):
+            shape.append(len(field))
+        else:
+            return None
+    return tuple(shape)
+
+
+######################################################################
+# Column writing
+######################################################################
+
+class ColumnWriter:
+    def __init__(self, filename):
+        self.file = open(filename, "wb")
+        header = {'format': FORMAT_NAME, 'version': FORMAT_VERSION,
+                  'byteorder': sys.byteorder}
+        self.file.write(json.dumps(header).encode() + b"\n")
+        self.file_pos = self.file.tell()
+        # Pending messages: {qid: [[keys, shape, [msg, ...]], ...]}
+        self.pending = {}
+    def add_msg(self, qid, msg):
+        keys = tuple(sorted(msg.keys()))
+        shape = _get_row_shape(msg.get('data'))
+        blocks = self.pending.setdefault(qid, [])
+        if blocks:
+            block = blocks[-1]
+            if block[0] == keys and (shape is None or block[1] is None
+                                     or block[1] == shape):
+                if block[1] is None and shape is not None:
+                    block[1] = shape
+                block[2].append(msg)
+                return
+        blocks.append([keys, shape, [msg]])
+    def _write_column(self, values):
+        arr = _to_array(values)
+        if arr is None:
+            typecode = 'json'
+            raw = json.dumps(values, separators=(',', ':')).encode()
+        else:
+            typecode = arr.typecode
+            raw = arr.tobytes()
+        d = zlib.compress(raw, 1)
+        self.file.write(d)
+        column = [typecode, self.file_pos, len(d)]
+        self.file_pos += len(d)
+        return column
+    def _write_rows(self, shape, msgs):
+        # Transpose the rows of all the messages into field columns
+        rows = list(itertools.chain.from_iterable([m['data'] for m in msgs]))
+        if set(map(len, rows)) != set([len(shape)]):
+            return None
+        fields = []
+        for field, size in zip(zip(*rows), shape):
+            if size is None:
+                fields.append(field)
+                continue
+            try:
+                if set(map(len, field)) != set([size]):
+                    return None
+            except TypeError:
+                return None
+            fields.extend(zip(*field))
+        return {'shape': list(shape),
+                'counts': self._write_column([len(m['data']) for m in msgs]),
+                'fields': [self._write_column(list(f)) for f in fields]}
+    def _write_block(self, keys, shape, msgs):
+        block = {'count': len(msgs)}
+        if shape is not None:
+            rows = self._write_rows(shape, msgs)
+            if rows is not None:
+                block['rows'] = rows
+                keys = [k for k in keys if k != 'data']
+        block['columns'] = {k: self._write_column([m[k] for m in msgs])
+                            for k in keys}
+        return block
+    def flush(self):
+        # Write all pending messages and return their block descriptions
+        columns = {qid: [self._write_block(*b) for b in blocks]
+                   for qid, blocks in self.pending.items()}
+        self.pending = {}
+        self.file.flush()
+        return columns
+    def close(self):
+        self.file.close()
+        self.file = None
+
+
+######################################################################
+# Column reading
+######################################################################
+
+class ColumnReader:
+    def __init__(self, filename):
+        self.file = open(filename, "rb")
+        header = json.loads(self.file.readline())
+        if (header.get('format') != FORMAT_NAME
+            or header.get('version') != FORMAT_VERSION):
+            raise ValueError("Unknown column log format in '%s'" % (filename,))
+        self.byteswap = header.get('byteorder') != sys.byteorder
+    def _read_column(self, column):
+        typecode, pos, size = column
+        self.file.seek(pos)
+        raw = zlib.decompress(self.file.read(size))
+        if typecode == 'json':
+            return json.loads(raw)
+        values = array.array(typecode)
+        values.frombytes(raw)
+        if self.byteswap:
+            values.byteswap()
+        return values
+    def read_block(self, block):
+        # Rebuild the list of messages stored in a block
+        keys = list(block['columns'].keys())
+        values = [self._read_column(block['columns'][k]) for k in keys]
+        if keys:
+            msgs = [dict(zip(keys, vals)) for vals in zip(*values)]
+        else:
+            msgs = [{} for i in range(block['count'])]
+        rows_info = block.get('rows')
+        if rows_info is None:
+            return msgs
+        flat = [self._read_column(c) for c in rows_info['fields']]
+        fields = []
+        pos = 0
+        for size in rows_info['shape']:
+            if size is None:
+                fields.append(flat[pos])
+                pos += 1
+            else:
+                fields.append(list(zip(*flat[pos:pos+size])))
+                pos += size
+        rows = list(zip(*fields))
+        pos = 0
+        for msg, count in zip(msgs, self._read_column(rows_info['counts'])):
+            msg['data'] = rows[pos:pos+count]
+            pos += count
+        return msgs
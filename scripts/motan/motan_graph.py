@@ -109,6 +109,8 @@ def main():
     opts.add_option("-g", "--graph", help="Graph to generate (python literal)")
     opts.add_option("-l", "--list-datasets", action="store_true",
                     help="List available datasets")
+    opts.add_option("--no-cache", action="store_false", dest="use_cache",
+                    default=True, help="Do not cache the generated datasets")
     options, args = opts.parse_args()
     if options.list_datasets:
         list_datasets()
@@ -117,7 +119,7 @@ def main():
     log_prefix = args[0]
 
     # Open data files
-    lmanager = readlog.LogManager(log_prefix)
+    lmanager = readlog.LogManager(log_prefix, options.use_cache)
     lmanager.setup_index()
     lmanager.seek_time(options.skip)
     amanager = analyzers.AnalyzerManager(lmanager, options.segment_time)
@@ -3,7 +3,8 @@
 # Copyright (C) 2021  Kevin O'Connor <kevin@koconnor.net>
 #
 # This file may be distributed under the terms of the GNU GPLv3 license.
-import json, zlib
+import os, json, zlib, array, hashlib, logging
+import logcolumns
 
 class error(Exception):
     pass
@@ -550,6 +551,12 @@ class JsonDispatcher:
     def add_handler(self, name, subscription_id):
         self.names[name] = q = []
         self.queues.setdefault(subscription_id, []).append(q)
+    def remove_handler(self, name):
+        q = self.names.pop(name, None)
+        for sid, queues in self.queues.items():
+            queues[:] = [mq for mq in queues if mq is not q]
+    def seek(self, file_position):
+        self.log_reader.seek(file_position)
     def pull_msg(self, req_time, name):
         q = self.names[name]
         while 1:
@@ -569,11 +576,101 @@ class JsonDispatcher:
             for mq in self.queues.get(qid, []):
                 mq.append(json_msg['params'])
 
+# Load messages from the columnar log (stored in chunks between index
+# updates) for the subscriptions that have handlers
+class ColumnDispatcher:
+    def __init__(self, log_prefix):
+        self.names = {}
+        self.queues = {}
+        self.last_read_time = 0.
+        self.index_reader = JsonLogReader(log_prefix + ".index.gz")
+        self.column_reader = logcolumns.ColumnReader(log_prefix + ".cols")
+        self.is_eof = False
+    def check_end_of_data(self):
+        return self.is_eof and not any(self.queues.values())
+    def add_handler(self, name, subscription_id):
+        self.names[name] = q = []
+        self.queues.setdefault(subscription_id, []).append(q)
+    def remove_handler(self, name):
+        q = self.names.pop(name, None)
+        for sid, queues in self.queues.items():
+            queues[:] = [mq for mq in queues if mq is not q]
+    def seek(self, file_position):
+        # Skip the chunks stored before the given json log position
+        while 1:
+            fmsg = self.index_reader.pull_msg()
+            if fmsg is None or fmsg['file_position'] >= file_position:
+                break
+    def pull_msg(self, req_time, name):
+        q = self.names[name]
+        while 1:
+            if q:
+                return q.pop(0)
+            if req_time + 1. < self.last_read_time:
+                return None
+            fmsg = self.index_reader.pull_msg()
+            if fmsg is None:
+                self.is_eof = True
+                return None
+            th = fmsg.get('status', {}).get('toolhead', {})
+            pt = th.get('estimated_print_time')
+            if pt is not None:
+                self.last_read_time = pt
+            for qid, blocks in fmsg.get('columns', {}).items():
+                queues = self.queues.get(qid)
+                if not queues:
+                    continue
+                for block in blocks:
+                    msgs = self.column_reader.read_block(block)
+                    for mq in queues:
+                        mq.extend(msgs)
+
 
 ######################################################################
 # Dataset and log tracking
 ######################################################################
 
+# Storage of generated datasets between invocations. Entries are only
+# valid for the same sampling of the same (unchanged) capture.
+class DatasetCache:
+    def __init__(self, log_prefix):
+        self.cache_dir = log_prefix + ".cache"
+        st = os.stat(log_prefix + ".index.gz")
+        self.log_id = (st.st_size, st.st_mtime)
+    def _get_filename(self, key):
+        h = hashlib.sha1(repr((self.log_id, key)).encode()).hexdigest()
+        return os.path.join(self.cache_dir, h)
+    def load(self, key):
+        try:
+            f = open(self._get_filename(key), 'rb')
+            try:
+                raw = f.read()
+            finally:
+                f.close()
+        except (IOError, OSError):
+            return None
+        values = array.array('d')
+        values.frombytes(raw)
+        return values.tolist()
+    def store(self, key, values):
+        try:
+            raw = array.array('d', values).tobytes()
+        except (TypeError, OverflowError):
+            # Not a numeric dataset
+            return
+        filename = self._get_filename(key)
+        try:
+            if not os.path.isdir(self.cache_dir):
+                os.mkdir(self.cache_dir)
+            f = open(filename + ".tmp", 'wb')
+            try:
+                f.write(raw)
+            finally:
+                f.close()
+            os.rename(filename + ".tmp", filename)
+        except (IOError, OSError):
+            logging.exception("Unable to write dataset cache")
+
 # Tracking of get_status messages
 class TrackStatus:
     def __init__(self, lmanager, name, start_status):
@@ -630,9 +727,15 @@ def list_datasets():
 # Main log access management
 class LogManager:
     error = error
-    def __init__(self, log_prefix):
+    def __init__(self, log_prefix, use_cache=True):
         self.index_reader = JsonLogReader(log_prefix + ".index.gz")
-        self.jdispatch = JsonDispatcher(log_prefix)
+        if os.path.exists(log_prefix + ".cols"):
+            self.jdispatch = ColumnDispatcher(log_prefix)
+        else:
+            self.jdispatch = JsonDispatcher(log_prefix)
+        self.dataset_cache = None
+        if use_cache:
+            self.dataset_cache = DatasetCache(log_prefix)
         self.initial_start_time = self.start_time = 0.
         self.datasets = {}
         self.initial_status = {}
@@ -661,7 +764,9 @@ class LogManager:
             fmsg = self.index_reader.pull_msg()
             if fmsg is None:
                 break
-            th = fmsg['status']['toolhead']
+            th = fmsg['status'].get('toolhead')
+            if th is None:
+                break
             ptime = max(th['estimated_print_time'], th.get('print_time', 0.))
             if ptime > seek_time:
                 break
@@ -669,7 +774,7 @@ class LogManager:
                 start_status.setdefault(k, {}).update(v)
             file_position = fmsg['file_position']
         if file_position:
-            self.jdispatch.log_reader.seek(file_position)
+            self.jdispatch.seek(file_position)
     def get_initial_start_time(self):
         return self.initial_start_time
     def get_start_time(self):
@@ -679,6 +784,8 @@ class LogManager:
             self.status_tracker = TrackStatus(self, "status", self.start_status)
             self.jdispatch.add_handler("status", "status")
         return self.status_tracker
+    def get_dataset_cache(self):
+        return self.dataset_cache
     def setup_dataset(self, name):
         if name in self.datasets:
             return self.datasets[name]
@@ -696,3 +803,6 @@ class LogManager:
             self.jdispatch.add_handler(name, subscription_id)
         self.datasets[name] = hdl = cls(self, name, name_parts)
         return hdl
+    def drop_dataset(self, name):
+        # Stop queuing log messages for a dataset that is not pulled
+        self.jdispatch.remove_handler(name)
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+# Report how the bandwidth of the micro-controller link is used
+#
+# Copyright (C) 2026  CreatBot
+#
+# This file may be distributed under the terms of the GNU GPLv3 license.
+import sys, os, re, ast, optparse
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                             '..', 'klippy'))
+import msgproto
+
+
+######################################################################
+# Traffic accounting
+######################################################################
+
+class TrafficStats:
+    def __init__(self, name, window, field_cmds):
+        self.name = name
+        self.window = window
+        self.field_cmds = field_cmds
+        self.blocks = self.block_bytes = self.messages = 0
+        self.first_time = self.last_time = None
+        self.commands = {}
+        self.oids = {}
+        self.fields = {}
+        self.windows = {}
+    def add_block(self, block_time, block_len, msgs):
+        # msgs is a list of (name, oid, size, [(field, size), ...])
+        self.blocks += 1
+        self.block_bytes += block_len
+        self.messages += len(msgs)
+        if self.first_time is None:
+            self.first_time = self.last_time = block_time
+        self.last_time = max(self.last_time, block_time)
+        widx = int((block_time - self.first_time) // self.window)
+        win = self.windows.get(widx)
+        if win is None:
+            win = self.windows[widx] = {'blocks': 0, 'bytes': 0, 'cmds': {}}
+        win['blocks'] += 1
+        win['bytes'] += block_len
+        for name, oid, size, fields in msgs:
+            cmd = self.commands.setdefault(name, [0, 0])
+            cmd[0] += 1
+            cmd[1] += size
+            win['cmds'][name] = win['cmds'].get(name, 0) + size
+            if oid is not None:
+                o = self.oids.setdefault(oid, [0, 0, set()])
+                o[0] += 1
+                o[1] += size
+                o[2].add(name)
+            if name in self.field_cmds:
+                cfields = self.fields.setdefault(name, {})
+                for fname, fsize in fields:
+                    cfields[fname] = cfields.get(fname, 0) + fsize
+    def get_duration(self):
+        if self.first_time is None:
+            return 0.
+        return max(self.last_time - self.first_time, self.window)
+    def get_peak_rate(self, name):
+        peak = max([w['cmds'].get(name, 0) for w in self.windows.values()])
+        return peak / self.window
+
+
+######################################################################
+# Report generation
+######################################################################
+
+def format_share(value, total):
+    return "%5.1f%%" % (100. * value / max(total, 1),)
+
+def format_report(stats, max_oids, show_windows):
+    total = stats.block_bytes
+    duration = stats.get_duration()
+    framing = stats.blocks * msgproto.MESSAGE_MIN
+    payload = total - framing
+    out = ["%s: blocks=%d bytes=%d messages=%d duration=%.3fs"
+           " bytes_per_sec=%.0f" % (stats.name, stats.blocks, total,
+                                    stats.messages, duration,
+                                    total / duration if duration else 0.),
+           "  block_fill=%.1f%% (avg payload %.1f of %d bytes)"
+           " framing=%d bytes (%s)" % (
+               100. * payload / max(1, stats.blocks
+                                    * msgproto.MESSAGE_PAYLOAD_MAX),
+               payload / max(1, stats.blocks), msgproto.MESSAGE_PAYLOAD_MAX,
+               framing, format_share(framing, total).strip())]
+    # Breakdown by command
+    out.append("  %-32s %8s %10s %6s %8s %12s" % (
+        "command", "count", "bytes", "share", "avg_size", "peak_bytes/s"))
+    cmds = sorted(stats.commands.items(), key=(lambda i: -i[1][1]))
+    for name, (count, size) in cmds:
+        out.append("  %-32s %8d %10d %6s %8.2f %12.0f" % (
+            name, count, size, format_share(size, total), size / count,
+            stats.get_peak_rate(name)))
+    # Per command field breakdown
+    for name in stats.field_cmds:
+        cfields = stats.fields.get(name)
+        if cfields is None:
+            continue
+        count, size = stats.commands[name]
+        out.append("  Fields of %s (%d messages):" % (name, count))
+        for fname, fsize in cfields.items():
+            out.append("    %-30s %10d %6s of command %6s of link"
+                       " avg_size=%.2f" % (
+                           fname, fsize, format_share(fsize, size),
+                           format_share(fsize, total), fsize / count))
+    # Breakdown by oid
+    oids = sorted(stats.oids.items(), key=(lambda i: -i[1][1]))
+    if oids:
+        out.append("  %-6s %8s %10s %6s %12s  %s" % (
+            "oid", "count", "bytes", "share", "bytes/s", "commands"))
+        for oid, (count, size, names) in oids[:max_oids]:
+            out.append("  %-6d %8d %10d %6s %12.0f  %s" % (
+                oid, count, size, format_share(size, total),
+                size / duration if duration else 0.,
+                ",".join(sorted(names))))
+        if len(oids) > max_oids:
+            out.append("  (%d more oids)" % (len(oids) - max_oids,))
+    # Breakdown by time window
+    if show_windows:
+        out.append("  %-10s %7s %8s %10s %6s  %s" % (
+            "time", "blocks", "bytes", "bytes/s", "fill", "top command"))
+        for widx in sorted(stats.windows):
+            win = stats.windows[widx]
+            wpayload = win['bytes'] - win['blocks'] * msgproto.MESSAGE_MIN
+            top = max(win['cmds'].items(), key=(lambda i: i[1]),
+                      default=("-", 0))
+            out.append("  %-10.3f %7d %8d %10.0f %5.1f%%  %s (%s)" % (
+                stats.first_time + widx * stats.window, win['blocks'],
+                win['bytes'], win['bytes'] / stats.window,
+                100. * wpayload / (win['blocks']
+                                   * msgproto.MESSAGE_PAYLOAD_MAX),
+                top[0], format_share(top[1], win['bytes']).strip()))
+    return "\n".join(out)
+
+
+######################################################################
+# Batch mode output files
+######################################################################
+
+# Track the most recent clock scheduled by the host
+class ClockTracker:
+    def __init__(self):
+        self.clock = 0
+        self.step_clocks = {}
+    def _extend(self, clock32):
+        diff = (clock32 - self.clock) & 0xffffffff
+        diff -= (diff & 0x80000000) << 1
+        return self.clock + diff
+    def update(self, name, params):
+        if name == 'queue_step':
+            oid = params['oid']
+            clock = self.step_clocks.get(oid, 0)
+            count = params['count']
+            clock += (count * params['interval']
+                      + params['add'] * count * (count - 1) // 2)
+            self.step_clocks[oid] = clock
+        elif 'clock' in params:
+            clock = self._extend(params['clock'])
+            if name == 'reset_step_clock':
+                self.step_clocks[params['oid']] = clock
+        else:
+            return
+        self.clock = max(self.clock, clock)
+
+def parse_output_file(mp, fname, stats):
+    freq = mp.get_constant_float('CLOCK_FREQ')
+    f = open(fname, 'rb')
+    data = bytearray(f.read())
+    f.close()
+    clocks = ClockTracker()
+    while data:
+        l = mp.check_packet(data)
+        if l <= 0:
+            if l < 0:
+                sys.stderr.write("Invalid data in %s\n" % (fname,))
+                data = data[-l:]
+                continue
+            break
+        msgs = []
+        pos = msgproto.MESSAGE_HEADER_SIZE
+        end_pos = l - msgproto.MESSAGE_TRAILER_SIZE
+        while pos < end_pos:
+            msgid, param_pos = mp.msgid_parser.parse(data, pos)
+            mid = mp.messages_by_id.get(msgid)
+            if mid is None or not hasattr(mid, 'param_names'):
+                msgs.append(("#unknown", None, end_pos - pos, []))
+                break
+            fields = [("#msgid", param_pos - pos)]
+            params = {}
+            ppos = param_pos
+            for name, t in mid.param_names:
+                params[name], next_pos = t.parse(data, ppos)
+                fields.append((name, next_pos - ppos))
+                ppos = next_pos
+            clocks.update(mid.name, params)
+            msgs.append((mid.name, params.get('oid'), ppos - pos, fields))
+            pos = ppos
+        stats.add_block(clocks.clock / freq, l, msgs)
+        data = data[l:]
+
+
+######################################################################
+# Serial queue dumps in klippy.log
+######################################################################
+
+dump_r = re.compile(r"^Dumping (?P<dir>send|receive) queue [0-9]+ messages$")
+sent_r = re.compile(r"^Sent [0-9]+ [0-9.]+ (?P<time>[0-9.]+) (?P<len>[0-9]+):"
+                    r" seq: [0-9a-f]+(?P<msgs>.*)$")
+receive_r = re.compile(r"^Receive: [0-9]+ (?P<time>[0-9.]+) [0-9.]+"
+                       r" (?P<len>[0-9]+): seq: [0-9a-f]+(?P<msgs>.*)$")
+msg_split_r = re.compile(r", (?=[#a-zA-Z_][a-zA-Z0-9_]*(?: [a-zA-Z0-9_]+=|$))")
+param_r = re.compile(r"([a-zA-Z0-9_]+)="
+                     r"(b'(?:[^'\\]|\\.)*'|b\"(?:[^\"\\]|\\.)*\""
+                     r"|'(?:[^'\\]|\\.)*'|\S+)")
+
+# Determine (or estimate) the encoded size of a message in a dump
+def get_encoded_fields(mp, name, values):
+    mid = None
+    if mp is not None:
+        mid = mp.messages_by_name.get(name)
+    types = {}
+    fields = [("#msgid", 1)]
+    if mid is not None and hasattr(mid, 'param_names'):
+        types = mid.name_to_type
+        fields = [("#msgid", len(mid.msgid_bytes))]
+    for pname, text in values:
+        t = types.get(pname)
+        out = []
+        try:
+            if text.startswith(("b'", 'b"', "'")):
+                out = [0] * (1 + len(ast.literal_eval(text)))
+            elif t is not None and not t.is_int and not t.is_dynamic_string:
+                t.encode(out, text)
+            else:
+                v = int(text, 0)
+                if v >= 0x80000000:
+                    v -= 0x100000000
+                msgproto.PT_int32().encode(out, v)
+        except (ValueError, SyntaxError, msgproto.error):
+            # Unknown enumeration value (or unparsable text)
+            out = [0]
+        fields.append((pname, len(out)))
+    return fields
+
+def parse_log_file(mp, fname, options):
+    want_dir = 'receive' if options.receive else 'send'
+    line_r = receive_r if options.receive else sent_r
+    all_stats = []
+    stats = None
+    f = open(fname, 'r')
+    for line_num, line in enumerate(f):
+        line = line.rstrip()
+        m = dump_r.match(line)
+        if m is not None:
+            stats = None
+            if m.group('dir') == want_dir:
+                stats = TrafficStats("%s dump at line %d" % (
+                    want_dir, line_num + 1), options.window, options.fields)
+                all_stats.append(stats)
+            continue
+        if stats is None:
+            continue
+        m = line_r.match(line)
+        if m is None:
+            stats = None
+            continue
+        msgs = []
+        for msg in msg_split_r.split(m.group('msgs'))[1:]:
+            parts = msg.split(' ', 1)
+            name = parts[0]
+            values = param_r.findall(parts[1]) if len(parts) > 1 else []
+            fields = get_encoded_fields(mp, name, values)
+            oid = None
+            for pname, text in values:
+                if pname == 'oid':
+                    oid = int(text)
+            msgs.append((name, oid, sum([s for fn, s in fields]), fields))
+        stats.add_block(float(m.group('time')), int(m.group('len')), msgs)
+    f.close()
+    return all_stats
+
+
+######################################################################
+# Startup
+######################################################################
+
+def main():
+    usage = "%prog [options] <dictionary> <output file or klippy.log>"
+    opts = optparse.OptionParser(usage)
+    opts.add_option("-l", "--log", action="store_true", dest="log",
+                    help="input is a klippy.log with serial queue dumps")
+    opts.add_option("-r", "--receive", action="store_true", dest="receive",
+                    help="report received (instead of sent) log messages")
+    opts.add_option("-w", "--window", dest="window", type="float",
+                    default=1., help="time window size in seconds")
+    opts.add_option("-t", "--timeline", action="store_true",
+                    dest="timeline", help="report each time window")
+    opts.add_option("-f", "--fields", dest="fields", default="queue_step",
+                    help="comma separated commands to report per field")
+    opts.add_option("-n", "--oids", dest="oids", type="int", default=20,
+                    help="number of oids to report")
+    options, args = opts.parse_args()
+    if options.log and len(args) == 1:
+        # The data dictionary is optional for log files
+        args.insert(0, None)
+    if len(args) != 2:
+        opts.error("Incorrect number of arguments")
+    if options.window <= 0.:
+        opts.error("Time window must be positive")
+    options.fields = [f.strip() for f in options.fields.split(',')
+                      if f.strip()]
+    mp = None
+    if args[0] is not None:
+        f = open(args[0], 'rb')
+        dictionary = f.read()
+        f.close()
+        mp = msgproto.MessageParser()
+        mp.process_identify(dictionary, decompress=False)
+    if options.log:
+        all_stats = parse_log_file(mp, args[1], options)
+        if mp is None:
+            sys.stdout.write("(no data dictionary - message sizes are"
+                             " estimated)\n")
+    else:
+        stats = TrafficStats(os.path.basename(args[1]), options.window,
+                             options.fields)
+        parse_output_file(mp, args[1], stats)
+        all_stats = [stats]
+    all_stats = [s for s in all_stats if s.blocks]
+    if not all_stats:
+        sys.stderr.write("No message blocks found\n")
+        sys.exit(-1)
+    for stats in all_stats:
+        sys.stdout.write(format_report(stats, options.oids, options.timeline)
+                         + "\n")
+
+if __name__ == '__main__':
+    main()
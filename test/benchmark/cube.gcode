@@ -0,0 +1,3520 @@
+; Benchmark print: 20mm cube and 16mm cylinder, 0.2mm layers
+; Representative of sliced output (perimeters, zigzag infill,
+; short segment curves, travel moves and retractions)
+M83
+G90
+G92 E0
+G1 Z0.2 F1200
+;LAYER:0
+G1 Z0.200 F1200
+G1 E-0.8 F2400
+G1 X80.000 Y90.000 F9000
+G1 E0.8 F2400
+G1 X100.000 Y90.000 E0.74835 F2400
+G1 X100.000 Y110.000 E0.74835
+G1 X80.000 Y110.000 E0.74835
+G1 X80.000 Y90.000 E0.74835
+G1 E-0.8 F2400
+G1 X80.450 Y90.450 F9000
+G1 E0.8 F2400
+G1 X99.550 Y90.450 E0.71468 F2400
+G1 X99.550 Y109.550 E0.71468
+G1 X80.450 Y109.550 E0.71468
+G1 X80.450 Y90.450 E0.71468
+G1 E-0.8 F2400
+G1 X80.900 Y90.900 F9000
+G1 E0.8 F2400
+G1 X99.100 Y90.900 E0.68100 F4800
+G1 X99.100 Y91.350 E0.01684
+G1 X80.900 Y91.350 E0.68100
+G1 X80.900 Y91.800 E0.01684
+G1 X99.100 Y91.800 E0.68100
+G1 X99.100 Y92.250 E0.01684
+G1 X80.900 Y92.250 E0.68100
+G1 X80.900 Y92.700 E0.01684
+G1 X99.100 Y92.700 E0.68100
+G1 X99.100 Y93.150 E0.01684
+G1 X80.900 Y93.150 E0.68100
+G1 X80.900 Y93.600 E0.01684
+G1 X99.100 Y93.600 E0.68100
+G1 X99.100 Y94.050 E0.01684
+G1 X80.900 Y94.050 E0.68100
+G1 X80.900 Y94.500 E0.01684
+G1 X99.100 Y94.500 E0.68100
+G1 X99.100 Y94.950 E0.01684
+G1 X80.900 Y94.950 E0.68100
+G1 X80.900 Y95.400 E0.01684
+G1 X99.100 Y95.400 E0.68100
+G1 X99.100 Y95.850 E0.01684
+G1 X80.900 Y95.850 E0.68100
+G1 X80.900 Y96.300 E0.01684
+G1 X99.100 Y96.300 E0.68100
+G1 X99.100 Y96.750 E0.01684
+G1 X80.900 Y96.750 E0.68100
+G1 X80.900 Y97.200 E0.01684
+G1 X99.100 Y97.200 E0.68100
+G1 X99.100 Y97.650 E0.01684
+G1 X80.900 Y97.650 E0.68100
+G1 X80.900 Y98.100 E0.01684
+G1 X99.100 Y98.100 E0.68100
+G1 X99.100 Y98.550 E0.01684
+G1 X80.900 Y98.550 E0.68100
+G1 X80.900 Y99.000 E0.01684
+G1 X99.100 Y99.000 E0.68100
+G1 X99.100 Y99.450 E0.01684
+G1 X80.900 Y99.450 E0.68100
+G1 X80.900 Y99.900 E0.01684
+G1 X99.100 Y99.900 E0.68100
+G1 X99.100 Y100.350 E0.01684
+G1 X80.900 Y100.350 E0.68100
+G1 X80.900 Y100.800 E0.01684
+G1 X99.100 Y100.800 E0.68100
+G1 X99.100 Y101.250 E0.01684
+G1 X80.900 Y101.250 E0.68100
+G1 X80.900 Y101.700 E0.01684
+G1 X99.100 Y101.700 E0.68100
+G1 X99.100 Y102.150 E0.01684
+G1 X80.900 Y102.150 E0.68100
+G1 X80.900 Y102.600 E0.01684
+G1 X99.100 Y102.600 E0.68100
+G1 X99.100 Y103.050 E0.01684
+G1 X80.900 Y103.050 E0.68100
+G1 X80.900 Y103.500 E0.01684
+G1 X99.100 Y103.500 E0.68100
+G1 X99.100 Y103.950 E0.01684
+G1 X80.900 Y103.950 E0.68100
+G1 X80.900 Y104.400 E0.01684
+G1 X99.100 Y104.400 E0.68100
+G1 X99.100 Y104.850 E0.01684
+G1 X80.900 Y104.850 E0.68100
+G1 X80.900 Y105.300 E0.01684
+G1 X99.100 Y105.300 E0.68100
+G1 X99.100 Y105.750 E0.01684
+G1 X80.900 Y105.750 E0.68100
+G1 X80.900 Y106.200 E0.01684
+G1 X99.100 Y106.200 E0.68100
+G1 X99.100 Y106.650 E0.01684
+G1 X80.900 Y106.650 E0.68100
+G1 X80.900 Y107.100 E0.01684
+G1 X99.100 Y107.100 E0.68100
+G1 X99.100 Y107.550 E0.01684
+G1 X80.900 Y107.550 E0.68100
+G1 X80.900 Y108.000 E0.01684
+G1 X99.100 Y108.000 E0.68100
+G1 X99.100 Y108.450 E0.01684
+G1 X80.900 Y108.450 E0.68100
+G1 X80.900 Y108.900 E0.01684
+G1 X99.100 Y108.900 E0.68100
+G1 E-0.8 F2400
+G1 X123.000 Y100.000 F9000
+G1 E0.8 F2400
+G1 X122.989 Y100.419 E0.01567 F2400
+G1 X122.956 Y100.836 E0.01567
+G1 X122.902 Y101.251 E0.01567
+G1 X122.825 Y101.663 E0.01567
+G1 X122.727 Y102.071 E0.01567
+G1 X122.608 Y102.472 E0.01567
+G1 X122.469 Y102.867 E0.01567
+G1 X122.308 Y103.254 E0.01567
+G1 X122.128 Y103.632 E0.01567
+G1 X121.928 Y104.000 E0.01567
+G1 X121.709 Y104.357 E0.01567
+G1 X121.472 Y104.702 E0.01567
+G1 X121.217 Y105.035 E0.01567
+G1 X120.945 Y105.353 E0.01567
+G1 X120.657 Y105.657 E0.01567
+G1 X120.353 Y105.945 E0.01567
+G1 X120.035 Y106.217 E0.01567
+G1 X119.702 Y106.472 E0.01567
+G1 X119.357 Y106.709 E0.01567
+G1 X119.000 Y106.928 E0.01567
+G1 X118.632 Y107.128 E0.01567
+G1 X118.254 Y107.308 E0.01567
+G1 X117.867 Y107.469 E0.01567
+G1 X117.472 Y107.608 E0.01567
+G1 X117.071 Y107.727 E0.01567
+G1 X116.663 Y107.825 E0.01567
+G1 X116.251 Y107.902 E0.01567
+G1 X115.836 Y107.956 E0.01567
+G1 X115.419 Y107.989 E0.01567
+G1 X115.000 Y108.000 E0.01567
+G1 X114.581 Y107.989 E0.01567
+G1 X114.164 Y107.956 E0.01567
+G1 X113.749 Y107.902 E0.01567
+G1 X113.337 Y107.825 E0.01567
+G1 X112.929 Y107.727 E0.01567
+G1 X112.528 Y107.608 E0.01567
+G1 X112.133 Y107.469 E0.01567
+G1 X111.746 Y107.308 E0.01567
+G1 X111.368 Y107.128 E0.01567
+G1 X111.000 Y106.928 E0.01567
+G1 X110.643 Y106.709 E0.01567
+G1 X110.298 Y106.472 E0.01567
+G1 X109.965 Y106.217 E0.01567
+G1 X109.647 Y105.945 E0.01567
+G1 X109.343 Y105.657 E0.01567
+G1 X109.055 Y105.353 E0.01567
+G1 X108.783 Y105.035 E0.01567
+G1 X108.528 Y104.702 E0.01567
+G1 X108.291 Y104.357 E0.01567
+G1 X108.072 Y104.000 E0.01567
+G1 X107.872 Y103.632 E0.01567
+G1 X107.692 Y103.254 E0.01567
+G1 X107.531 Y102.867 E0.01567
+G1 X107.392 Y102.472 E0.01567
+G1 X107.273 Y102.071 E0.01567
+G1 X107.175 Y101.663 E0.01567
+G1 X107.098 Y101.251 E0.01567
+G1 X107.044 Y100.836 E0.01567
+G1 X107.011 Y100.419 E0.01567
+G1 X107.000 Y100.000 E0.01567
+G1 X107.011 Y99.581 E0.01567
+G1 X107.044 Y99.164 E0.01567
+G1 X107.098 Y98.749 E0.01567
+G1 X107.175 Y98.337 E0.01567
+G1 X107.273 Y97.929 E0.01567
+G1 X107.392 Y97.528 E0.01567
+G1 X107.531 Y97.133 E0.01567
+G1 X107.692 Y96.746 E0.01567
+G1 X107.872 Y96.368 E0.01567
+G1 X108.072 Y96.000 E0.01567
+G1 X108.291 Y95.643 E0.01567
+G1 X108.528 Y95.298 E0.01567
+G1 X108.783 Y94.965 E0.01567
+G1 X109.055 Y94.647 E0.01567
+G1 X109.343 Y94.343 E0.01567
+G1 X109.647 Y94.055 E0.01567
+G1 X109.965 Y93.783 E0.01567
+G1 X110.298 Y93.528 E0.01567
+G1 X110.643 Y93.291 E0.01567
+G1 X111.000 Y93.072 E0.01567
+G1 X111.368 Y92.872 E0.01567
+G1 X111.746 Y92.692 E0.01567
+G1 X112.133 Y92.531 E0.01567
+G1 X112.528 Y92.392 E0.01567
+G1 X112.929 Y92.273 E0.01567
+G1 X113.337 Y92.175 E0.01567
+G1 X113.749 Y92.098 E0.01567
+G1 X114.164 Y92.044 E0.01567
+G1 X114.581 Y92.011 E0.01567
+G1 X115.000 Y92.000 E0.01567
+G1 X115.419 Y92.011 E0.01567
+G1 X115.836 Y92.044 E0.01567
+G1 X116.251 Y92.098 E0.01567
+G1 X116.663 Y92.175 E0.01567
+G1 X117.071 Y92.273 E0.01567
+G1 X117.472 Y92.392 E0.01567
+G1 X117.867 Y92.531 E0.01567
+G1 X118.254 Y92.692 E0.01567
+G1 X118.632 Y92.872 E0.01567
+G1 X119.000 Y93.072 E0.01567
+G1 X119.357 Y93.291 E0.01567
+G1 X119.702 Y93.528 E0.01567
+G1 X120.035 Y93.783 E0.01567
+G1 X120.353 Y94.055 E0.01567
+G1 X120.657 Y94.343 E0.01567
+G1 X120.945 Y94.647 E0.01567
+G1 X121.217 Y94.965 E0.01567
+G1 X121.472 Y95.298 E0.01567
+G1 X121.709 Y95.643 E0.01567
+G1 X121.928 Y96.000 E0.01567
+G1 X122.128 Y96.368 E0.01567
+G1 X122.308 Y96.746 E0.01567
+G1 X122.469 Y97.133 E0.01567
+G1 X122.608 Y97.528 E0.01567
+G1 X122.727 Y97.929 E0.01567
+G1 X122.825 Y98.337 E0.01567
+G1 X122.902 Y98.749 E0.01567
+G1 X122.956 Y99.164 E0.01567
+G1 X122.989 Y99.581 E0.01567
+G1 X123.000 Y100.000 E0.01567
+G1 E-0.8 F2400
+G1 X122.550 Y100.000 F9000
+G1 E0.8 F2400
+G1 X122.540 Y100.395 E0.01479 F2400
+G1 X122.509 Y100.789 E0.01479
+G1 X122.457 Y101.181 E0.01479
+G1 X122.385 Y101.570 E0.01479
+G1 X122.293 Y101.954 E0.01479
+G1 X122.180 Y102.333 E0.01479
+G1 X122.049 Y102.706 E0.01479
+G1 X121.897 Y103.071 E0.01479
+G1 X121.727 Y103.428 E0.01479
+G1 X121.538 Y103.775 E0.01479
+G1 X121.332 Y104.112 E0.01479
+G1 X121.108 Y104.438 E0.01479
+G1 X120.867 Y104.751 E0.01479
+G1 X120.611 Y105.052 E0.01479
+G1 X120.339 Y105.339 E0.01479
+G1 X120.052 Y105.611 E0.01479
+G1 X119.751 Y105.867 E0.01479
+G1 X119.438 Y106.108 E0.01479
+G1 X119.112 Y106.332 E0.01479
+G1 X118.775 Y106.538 E0.01479
+G1 X118.428 Y106.727 E0.01479
+G1 X118.071 Y106.897 E0.01479
+G1 X117.706 Y107.049 E0.01479
+G1 X117.333 Y107.180 E0.01479
+G1 X116.954 Y107.293 E0.01479
+G1 X116.570 Y107.385 E0.01479
+G1 X116.181 Y107.457 E0.01479
+G1 X115.789 Y107.509 E0.01479
+G1 X115.395 Y107.540 E0.01479
+G1 X115.000 Y107.550 E0.01479
+G1 X114.605 Y107.540 E0.01479
+G1 X114.211 Y107.509 E0.01479
+G1 X113.819 Y107.457 E0.01479
+G1 X113.430 Y107.385 E0.01479
+G1 X113.046 Y107.293 E0.01479
+G1 X112.667 Y107.180 E0.01479
+G1 X112.294 Y107.049 E0.01479
+G1 X111.929 Y106.897 E0.01479
+G1 X111.572 Y106.727 E0.01479
+G1 X111.225 Y106.538 E0.01479
+G1 X110.888 Y106.332 E0.01479
+G1 X110.562 Y106.108 E0.01479
+G1 X110.249 Y105.867 E0.01479
+G1 X109.948 Y105.611 E0.01479
+G1 X109.661 Y105.339 E0.01479
+G1 X109.389 Y105.052 E0.01479
+G1 X109.133 Y104.751 E0.01479
+G1 X108.892 Y104.438 E0.01479
+G1 X108.668 Y104.112 E0.01479
+G1 X108.462 Y103.775 E0.01479
+G1 X108.273 Y103.428 E0.01479
+G1 X108.103 Y103.071 E0.01479
+G1 X107.951 Y102.706 E0.01479
+G1 X107.820 Y102.333 E0.01479
+G1 X107.707 Y101.954 E0.01479
+G1 X107.615 Y101.570 E0.01479
+G1 X107.543 Y101.181 E0.01479
+G1 X107.491 Y100.789 E0.01479
+G1 X107.460 Y100.395 E0.01479
+G1 X107.450 Y100.000 E0.01479
+G1 X107.460 Y99.605 E0.01479
+G1 X107.491 Y99.211 E0.01479
+G1 X107.543 Y98.819 E0.01479
+G1 X107.615 Y98.430 E0.01479
+G1 X107.707 Y98.046 E0.01479
+G1 X107.820 Y97.667 E0.01479
+G1 X107.951 Y97.294 E0.01479
+G1 X108.103 Y96.929 E0.01479
+G1 X108.273 Y96.572 E0.01479
+G1 X108.462 Y96.225 E0.01479
+G1 X108.668 Y95.888 E0.01479
+G1 X108.892 Y95.562 E0.01479
+G1 X109.133 Y95.249 E0.01479
+G1 X109.389 Y94.948 E0.01479
+G1 X109.661 Y94.661 E0.01479
+G1 X109.948 Y94.389 E0.01479
+G1 X110.249 Y94.133 E0.01479
+G1 X110.562 Y93.892 E0.01479
+G1 X110.888 Y93.668 E0.01479
+G1 X111.225 Y93.462 E0.01479
+G1 X111.572 Y93.273 E0.01479
+G1 X111.929 Y93.103 E0.01479
+G1 X112.294 Y92.951 E0.01479
+G1 X112.667 Y92.820 E0.01479
+G1 X113.046 Y92.707 E0.01479
+G1 X113.430 Y92.615 E0.01479
+G1 X113.819 Y92.543 E0.01479
+G1 X114.211 Y92.491 E0.01479
+G1 X114.605 Y92.460 E0.01479
+G1 X115.000 Y92.450 E0.01479
+G1 X115.395 Y92.460 E0.01479
+G1 X115.789 Y92.491 E0.01479
+G1 X116.181 Y92.543 E0.01479
+G1 X116.570 Y92.615 E0.01479
+G1 X116.954 Y92.707 E0.01479
+G1 X117.333 Y92.820 E0.01479
+G1 X117.706 Y92.951 E0.01479
+G1 X118.071 Y93.103 E0.01479
+G1 X118.428 Y93.273 E0.01479
+G1 X118.775 Y93.462 E0.01479
+G1 X119.112 Y93.668 E0.01479
+G1 X119.438 Y93.892 E0.01479
+G1 X119.751 Y94.133 E0.01479
+G1 X120.052 Y94.389 E0.01479
+G1 X120.339 Y94.661 E0.01479
+G1 X120.611 Y94.948 E0.01479
+G1 X120.867 Y95.249 E0.01479
+G1 X121.108 Y95.562 E0.01479
+G1 X121.332 Y95.888 E0.01479
+G1 X121.538 Y96.225 E0.01479
+G1 X121.727 Y96.572 E0.01479
+G1 X121.897 Y96.929 E0.01479
+G1 X122.049 Y97.294 E0.01479
+G1 X122.180 Y97.667 E0.01479
+G1 X122.293 Y98.046 E0.01479
+G1 X122.385 Y98.430 E0.01479
+G1 X122.457 Y98.819 E0.01479
+G1 X122.509 Y99.211 E0.01479
+G1 X122.540 Y99.605 E0.01479
+G1 X122.550 Y100.000 E0.01479
+G1 E-0.8 F2400
+G1 X123.900 Y100.000 F9000
+G1 E0.8 F2400
+G3 X106.100 Y100.000 I-8.900 J0 E1.04620 F2400
+G3 X123.900 Y100.000 I8.900 J0 E1.04620
+;LAYER:1
+G1 Z0.400 F1200
+G1 E-0.8 F2400
+G1 X80.000 Y90.000 F9000
+G1 E0.8 F2400
+G1 X100.000 Y90.000 E0.74835 F2400
+G1 X100.000 Y110.000 E0.74835
+G1 X80.000 Y110.000 E0.74835
+G1 X80.000 Y90.000 E0.74835
+G1 E-0.8 F2400
+G1 X80.450 Y90.450 F9000
+G1 E0.8 F2400
+G1 X99.550 Y90.450 E0.71468 F2400
+G1 X99.550 Y109.550 E0.71468
+G1 X80.450 Y109.550 E0.71468
+G1 X80.450 Y90.450 E0.71468
+G1 E-0.8 F2400
+G1 X80.900 Y90.900 F9000
+G1 E0.8 F2400
+G1 X99.100 Y90.900 E0.68100 F4800
+G1 X99.100 Y91.350 E0.01684
+G1 X80.900 Y91.350 E0.68100
+G1 X80.900 Y91.800 E0.01684
+G1 X99.100 Y91.800 E0.68100
+G1 X99.100 Y92.250 E0.01684
+G1 X80.900 Y92.250 E0.68100
+G1 X80.900 Y92.700 E0.01684
+G1 X99.100 Y92.700 E0.68100
+G1 X99.100 Y93.150 E0.01684
+G1 X80.900 Y93.150 E0.68100
+G1 X80.900 Y93.600 E0.01684
+G1 X99.100 Y93.600 E0.68100
+G1 X99.100 Y94.050 E0.01684
+G1 X80.900 Y94.050 E0.68100
+G1 X80.900 Y94.500 E0.01684
+G1 X99.100 Y94.500 E0.68100
+G1 X99.100 Y94.950 E0.01684
+G1 X80.900 Y94.950 E0.68100
+G1 X80.900 Y95.400 E0.01684
+G1 X99.100 Y95.400 E0.68100
+G1 X99.100 Y95.850 E0.01684
+G1 X80.900 Y95.850 E0.68100
+G1 X80.900 Y96.300 E0.01684
+G1 X99.100 Y96.300 E0.68100
+G1 X99.100 Y96.750 E0.01684
+G1 X80.900 Y96.750 E0.68100
+G1 X80.900 Y97.200 E0.01684
+G1 X99.100 Y97.200 E0.68100
+G1 X99.100 Y97.650 E0.01684
+G1 X80.900 Y97.650 E0.68100
+G1 X80.900 Y98.100 E0.01684
+G1 X99.100 Y98.100 E0.68100
+G1 X99.100 Y98.550 E0.01684
+G1 X80.900 Y98.550 E0.68100
+G1 X80.900 Y99.000 E0.01684
+G1 X99.100 Y99.000 E0.68100
+G1 X99.100 Y99.450 E0.01684
+G1 X80.900 Y99.450 E0.68100
+G1 X80.900 Y99.900 E0.01684
+G1 X99.100 Y99.900 E0.68100
+G1 X99.100 Y100.350 E0.01684
+G1 X80.900 Y100.350 E0.68100
+G1 X80.900 Y100.800 E0.01684
+G1 X99.100 Y100.800 E0.68100
+G1 X99.100 Y101.250 E0.01684
+G1 X80.900 Y101.250 E0.68100
+G1 X80.900 Y101.700 E0.01684
+G1 X99.100 Y101.700 E0.68100
+G1 X99.100 Y102.150 E0.01684
+G1 X80.900 Y102.150 E0.68100
+G1 X80.900 Y102.600 E0.01684
+G1 X99.100 Y102.600 E0.68100
+G1 X99.100 Y103.050 E0.01684
+G1 X80.900 Y103.050 E0.68100
+G1 X80.900 Y103.500 E0.01684
+G1 X99.100 Y103.500 E0.68100
+G1 X99.100 Y103.950 E0.01684
+G1 X80.900 Y103.950 E0.68100
+G1 X80.900 Y104.400 E0.01684
+G1 X99.100 Y104.400 E0.68100
+G1 X99.100 Y104.850 E0.01684
+G1 X80.900 Y104.850 E0.68100
+G1 X80.900 Y105.300 E0.01684
+G1 X99.100 Y105.300 E0.68100
+G1 X99.100 Y105.750 E0.01684
+G1 X80.900 Y105.750 E0.68100
+G1 X80.900 Y106.200 E0.01684
+G1 X99.100 Y106.200 E0.68100
+G1 X99.100 Y106.650 E0.01684
+G1 X80.900 Y106.650 E0.68100
+G1 X80.900 Y107.100 E0.01684
+G1 X99.100 Y107.100 E0.68100
+G1 X99.100 Y107.550 E0.01684
+G1 X80.900 Y107.550 E0.68100
+G1 X80.900 Y108.000 E0.01684
+G1 X99.100 Y108.000 E0.68100
+G1 X99.100 Y108.450 E0.01684
+G1 X80.900 Y108.450 E0.68100
+G1 X80.900 Y108.900 E0.01684
+G1 X99.100 Y108.900 E0.68100
+G1 E-0.8 F2400
+G1 X123.000 Y100.000 F9000
+G1 E0.8 F2400
+G1 X122.989 Y100.419 E0.01567 F2400
+G1 X122.956 Y100.836 E0.01567
+G1 X122.902 Y101.251 E0.01567
+G1 X122.825 Y101.663 E0.01567
+G1 X122.727 Y102.071 E0.01567
+G1 X122.608 Y102.472 E0.01567
+G1 X122.469 Y102.867 E0.01567
+G1 X122.308 Y103.254 E0.01567
+G1 X122.128 Y103.632 E0.01567
+G1 X121.928 Y104.000 E0.01567
+G1 X121.709 Y104.357 E0.01567
+G1 X121.472 Y104.702 E0.01567
+G1 X121.217 Y105.035 E0.01567
+G1 X120.945 Y105.353 E0.01567
+G1 X120.657 Y105.657 E0.01567
+G1 X120.353 Y105.945 E0.01567
+G1 X120.035 Y106.217 E0.01567
+G1 X119.702 Y106.472 E0.01567
+G1 X119.357 Y106.709 E0.01567
+G1 X119.000 Y106.928 E0.01567
+G1 X118.632 Y107.128 E0.01567
+G1 X118.254 Y107.308 E0.01567
+G1 X117.867 Y107.469 E0.01567
+G1 X117.472 Y107.608 E0.01567
+G1 X117.071 Y107.727 E0.01567
+G1 X116.663 Y107.825 E0.01567
+G1 X116.251 Y107.902 E0.01567
+G1 X115.836 Y107.956 E0.01567
+G1 X115.419 Y107.989 E0.01567
+G1 X115.000 Y108.000 E0.01567
+G1 X114.581 Y107.989 E0.01567
+G1 X114.164 Y107.956 E0.01567
+G1 X113.749 Y107.902 E0.01567
+G1 X113.337 Y107.825 E0.01567
+G1 X112.929 Y107.727 E0.01567
+G1 X112.528 Y107.608 E0.01567
+G1 X112.133 Y107.469 E0.01567
+G1 X111.746 Y107.308 E0.01567
+G1 X111.368 Y107.128 E0.01567
+G1 X111.000 Y106.928 E0.01567
+G1 X110.643 Y106.709 E0.01567
+G1 X110.298 Y106.472 E0.01567
+G1 X109.965 Y106.217 E0.01567
+G1 X109.647 Y105.945 E0.01567
+G1 X109.343 Y105.657 E0.01567
+G1 X109.055 Y105.353 E0.01567
+G1 X108.783 Y105.035 E0.01567
+G1 X108.528 Y104.702 E0.01567
+G1 X108.291 Y104.357 E0.01567
+G1 X108.072 Y104.000 E0.01567
+G1 X107.872 Y103.632 E0.01567
+G1 X107.692 Y103.254 E0.01567
+G1 X107.531 Y102.867 E0.01567
+G1 X107.392 Y102.472 E0.01567
+G1 X107.273 Y102.071 E0.01567
+G1 X107.175 Y101.663 E0.01567
+G1 X107.098 Y101.251 E0.01567
+G1 X107.044 Y100.836 E0.01567
+G1 X107.011 Y100.419 E0.01567
+G1 X107.000 Y100.000 E0.01567
+G1 X107.011 Y99.581 E0.01567
+G1 X107.044 Y99.164 E0.01567
+G1 X107.098 Y98.749 E0.01567
+G1 X107.175 Y98.337 E0.01567
+G1 X107.273 Y97.929 E0.01567
+G1 X107.392 Y97.528 E0.01567
+G1 X107.531 Y97.133 E0.01567
+G1 X107.692 Y96.746 E0.01567
+G1 X107.872 Y96.368 E0.01567
+G1 X108.072 Y96.000 E0.01567
+G1 X108.291 Y95.643 E0.01567
+G1 X108.528 Y95.298 E0.01567
+G1 X108.783 Y94.965 E0.01567
+G1 X109.055 Y94.647 E0.01567
+G1 X109.343 Y94.343 E0.01567
+G1 X109.647 Y94.055 E0.01567
+G1 X109.965 Y93.783 E0.01567
+G1 X110.298 Y93.528 E0.01567
+G1 X110.643 Y93.291 E0.01567
+G1 X111.000 Y93.072 E0.01567
+G1 X111.368 Y92.872 E0.01567
+G1 X111.746 Y92.692 E0.01567
+G1 X112.133 Y92.531 E0.01567
+G1 X112.528 Y92.392 E0.01567
+G1 X112.929 Y92.273 E0.01567
+G1 X113.337 Y92.175 E0.01567
+G1 X113.749 Y92.098 E0.01567
+G1 X114.164 Y92.044 E0.01567
+G1 X114.581 Y92.011 E0.01567
+G1 X115.000 Y92.000 E0.01567
+G1 X115.419 Y92.011 E0.01567
+G1 X115.836 Y92.044 E0.01567
+G1 X116.251 Y92.098 E0.01567
+G1 X116.663 Y92.175 E0.01567
+G1 X117.071 Y92.273 E0.01567
+G1 X117.472 Y92.392 E0.01567
+G1 X117.867 Y92.531 E0.01567
+G1 X118.254 Y92.692 E0.01567
+G1 X118.632 Y92.872 E0.01567
+G1 X119.000 Y93.072 E0.01567
+G1 X119.357 Y93.291 E0.01567
+G1 X119.702 Y93.528 E0.01567
+G1 X120.035 Y93.783 E0.01567
+G1 X120.353 Y94.055 E0.01567
+G1 X120.657 Y94.343 E0.01567
+G1 X120.945 Y94.647 E0.01567
+G1 X121.217 Y94.965 E0.01567
+G1 X121.472 Y95.298 E0.01567
+G1 X121.709 Y95.643 E0.01567
+G1 X121.928 Y96.000 E0.01567
+G1 X122.128 Y96.368 E0.01567
+G1 X122.308 Y96.746 E0.01567
+G1 X122.469 Y97.133 E0.01567
+G1 X122.608 Y97.528 E0.01567
+G1 X122.727 Y97.929 E0.01567
+G1 X122.825 Y98.337 E0.01567
+G1 X122.902 Y98.749 E0.01567
+G1 X122.956 Y99.164 E0.01567
+G1 X122.989 Y99.581 E0.01567
+G1 X123.000 Y100.000 E0.01567
+G1 E-0.8 F2400
+G1 X122.550 Y100.000 F9000
+G1 E0.8 F2400
+G1 X122.540 Y100.395 E0.01479 F2400
+G1 X122.509 Y100.789 E0.01479
+G1 X122.457 Y101.181 E0.01479
+G1 X122.385 Y101.570 E0.01479
+G1 X122.293 Y101.954 E0.01479
+G1 X122.180 Y102.333 E0.01479
+G1 X122.049 Y102.706 E0.01479
+G1 X121.897 Y103.071 E0.01479
+G1 X121.727 Y103.428 E0.01479
+G1 X121.538 Y103.775 E0.01479
+G1 X121.332 Y104.112 E0.01479
+G1 X121.108 Y104.438 E0.01479
+G1 X120.867 Y104.751 E0.01479
+G1 X120.611 Y105.052 E0.01479
+G1 X120.339 Y105.339 E0.01479
+G1 X120.052 Y105.611 E0.01479
+G1 X119.751 Y105.867 E0.01479
+G1 X119.438 Y106.108 E0.01479
+G1 X119.112 Y106.332 E0.01479
+G1 X118.775 Y106.538 E0.01479
+G1 X118.428 Y106.727 E0.01479
+G1 X118.071 Y106.897 E0.01479
+G1 X117.706 Y107.049 E0.01479
+G1 X117.333 Y107.180 E0.01479
+G1 X116.954 Y107.293 E0.01479
+G1 X116.570 Y107.385 E0.01479
+G1 X116.181 Y107.457 E0.01479
+G1 X115.789 Y107.509 E0.01479
+G1 X115.395 Y107.540 E0.01479
+G1 X115.000 Y107.550 E0.01479
+G1 X114.605 Y107.540 E0.01479
+G1 X114.211 Y107.509 E0.01479
+G1 X113.819 Y107.457 E0.01479
+G1 X113.430 Y107.385 E0.01479
+G1 X113.046 Y107.293 E0.01479
+G1 X112.667 Y107.180 E0.01479
+G1 X112.294 Y107.049 E0.01479
+G1 X111.929 Y106.897 E0.01479
+G1 X111.572 Y106.727 E0.01479
+G1 X111.225 Y106.538 E0.01479
+G1 X110.888 Y106.332 E0.01479
+G1 X110.562 Y106.108 E0.01479
+G1 X110.249 Y105.867 E0.01479
+G1 X109.948 Y105.611 E0.01479
+G1 X109.661 Y105.339 E0.01479
+G1 X109.389 Y105.052 E0.01479
+G1 X109.133 Y104.751 E0.01479
+G1 X108.892 Y104.438 E0.01479
+G1 X108.668 Y104.112 E0.01479
+G1 X108.462 Y103.775 E0.01479
+G1 X108.273 Y103.428 E0.01479
+G1 X108.103 Y103.071 E0.01479
+G1 X107.951 Y102.706 E0.01479
+G1 X107.820 Y102.333 E0.01479
+G1 X107.707 Y101.954 E0.01479
+G1 X107.615 Y101.570 E0.01479
+G1 X107.543 Y101.181 E0.01479
+G1 X107.491 Y100.789 E0.01479
+G1 X107.460 Y100.395 E0.01479
+G1 X107.450 Y100.000 E0.01479
+G1 X107.460 Y99.605 E0.01479
+G1 X107.491 Y99.211 E0.01479
+G1 X107.543 Y98.819 E0.01479
+G1 X107.615 Y98.430 E0.01479
+G1 X107.707 Y98.046 E0.01479
+G1 X107.820 Y97.667 E0.01479
+G1 X107.951 Y97.294 E0.01479
+G1 X108.103 Y96.929 E0.01479
+G1 X108.273 Y96.572 E0.01479
+G1 X108.462 Y96.225 E0.01479
+G1 X108.668 Y95.888 E0.01479
+G1 X108.892 Y95.562 E0.01479
+G1 X109.133 Y95.249 E0.01479
+G1 X109.389 Y94.948 E0.01479
+G1 X109.661 Y94.661 E0.01479
+G1 X109.948 Y94.389 E0.01479
+G1 X110.249 Y94.133 E0.01479
+G1 X110.562 Y93.892 E0.01479
+G1 X110.888 Y93.668 E0.01479
+G1 X111.225 Y93.462 E0.01479
+G1 X111.572 Y93.273 E0.01479
+G1 X111.929 Y93.103 E0.01479
+G1 X112.294 Y92.951 E0.01479
+G1 X112.667 Y92.820 E0.01479
+G1 X113.046 Y92.707 E0.01479
+G1 X113.430 Y92.615 E0.01479
+G1 X113.819 Y92.543 E0.01479
+G1 X114.211 Y92.491 E0.01479
+G1 X114.605 Y92.460 E0.01479
+G1 X115.000 Y92.450 E0.01479
+G1 X115.395 Y92.460 E0.01479
+G1 X115.789 Y92.491 E0.01479
+G1 X116.181 Y92.543 E0.01479
+G1 X116.570 Y92.615 E0.01479
+G1 X116.954 Y92.707 E0.01479
+G1 X117.333 Y92.820 E0.01479
+G1 X117.706 Y92.951 E0.01479
+G1 X118.071 Y93.103 E0.01479
+G1 X118.428 Y93.273 E0.01479
+G1 X118.775 Y93.462 E0.01479
+G1 X119.112 Y93.668 E0.01479
+G1 X119.438 Y93.892 E0.01479
+G1 X119.751 Y94.133 E0.01479
+G1 X120.052 Y94.389 E0.01479
+G1 X120.339 Y94.661 E0.01479
+G1 X120.611 Y94.948 E0.01479
+G1 X120.867 Y95.249 E0.01479
+G1 X121.108 Y95.562 E0.01479
+G1 X121.332 Y95.888 E0.01479
+G1 X121.538 Y96.225 E0.01479
+G1 X121.727 Y96.572 E0.01479
+G1 X121.897 Y96.929 E0.01479
+G1 X122.049 Y97.294 E0.01479
+G1 X122.180 Y97.667 E0.01479
+G1 X122.293 Y98.046 E0.01479
+G1 X122.385 Y98.430 E0.01479
+G1 X122.457 Y98.819 E0.01479
+G1 X122.509 Y99.211 E0.01479
+G1 X122.540 Y99.605 E0.01479
+G1 X122.550 Y100.000 E0.01479
+G1 E-0.8 F2400
+G1 X123.900 Y100.000 F9000
+G1 E0.8 F2400
+G3 X106.100 Y100.000 I-8.900 J0 E1.04620 F2400
+G3 X123.900 Y100.000 I8.900 J0 E1.04620
+;LAYER:2
+G1 Z0.600 F1200
+G1 E-0.8 F2400
+G1 X80.000 Y90.000 F9000
+G1 E0.8 F2400
+G1 X100.000 Y90.000 E0.74835 F2400
+G1 X100.000 Y110.000 E0.74835
+G1 X80.000 Y110.000 E0.74835
+G1 X80.000 Y90.000 E0.74835
+G1 E-0.8 F2400
+G1 X80.450 Y90.450 F9000
+G1 E0.8 F2400
+G1 X99.550 Y90.450 E0.71468 F2400
+G1 X99.550 Y109.550 E0.71468
+G1 X80.450 Y109.550 E0.71468
+G1 X80.450 Y90.450 E0.71468
+G1 E-0.8 F2400
+G1 X80.900 Y90.900 F9000
+G1 E0.8 F2400
+G1 X99.100 Y90.900 E0.68100 F4800
+G1 X99.100 Y91.350 E0.01684
+G1 X80.900 Y91.350 E0.68100
+G1 X80.900 Y91.800 E0.01684
+G1 X99.100 Y91.800 E0.68100
+G1 X99.100 Y92.250 E0.01684
+G1 X80.900 Y92.250 E0.68100
+G1 X80.900 Y92.700 E0.01684
+G1 X99.100 Y92.700 E0.68100
+G1 X99.100 Y93.150 E0.01684
+G1 X80.900 Y93.150 E0.68100
+G1 X80.900 Y93.600 E0.01684
+G1 X99.100 Y93.600 E0.68100
+G1 X99.100 Y94.050 E0.01684
+G1 X80.900 Y94.050 E0.68100
+G1 X80.900 Y94.500 E0.01684
+G1 X99.100 Y94.500 E0.68100
+G1 X99.100 Y94.950 E0.01684
+G1 X80.900 Y94.950 E0.68100
+G1 X80.900 Y95.400 E0.01684
+G1 X99.100 Y95.400 E0.68100
+G1 X99.100 Y95.850 E0.01684
+G1 X80.900 Y95.850 E0.68100
+G1 X80.900 Y96.300 E0.01684
+G1 X99.100 Y96.300 E0.68100
+G1 X99.100 Y96.750 E0.01684
+G1 X80.900 Y96.750 E0.68100
+G1 X80.900 Y97.200 E0.01684
+G1 X99.100 Y97.200 E0.68100
+G1 X99.100 Y97.650 E0.01684
+G1 X80.900 Y97.650 E0.68100
+G1 X80.900 Y98.100 E0.01684
+G1 X99.100 Y98.100 E0.68100
+G1 X99.100 Y98.550 E0.01684
+G1 X80.900 Y98.550 E0.68100
+G1 X80.900 Y99.000 E0.01684
+G1 X99.100 Y99.000 E0.68100
+G1 X99.100 Y99.450 E0.01684
+G1 X80.900 Y99.450 E0.68100
+G1 X80.900 Y99.900 E0.01684
+G1 X99.100 Y99.900 E0.68100
+G1 X99.100 Y100.350 E0.01684
+G1 X80.900 Y100.350 E0.68100
+G1 X80.900 Y100.800 E0.01684
+G1 X99.100 Y100.800 E0.68100
+G1 X99.100 Y101.250 E0.01684
+G1 X80.900 Y101.250 E0.68100
+G1 X80.900 Y101.700 E0.01684
+G1 X99.100 Y101.700 E0.68100
+G1 X99.100 Y102.150 E0.01684
+G1 X80.900 Y102.150 E0.68100
+G1 X80.900 Y102.600 E0.01684
+G1 X99.100 Y102.600 E0.68100
+G1 X99.100 Y103.050 E0.01684
+G1 X80.900 Y103.050 E0.68100
+G1 X80.900 Y103.500 E0.01684
+G1 X99.100 Y103.500 E0.68100
+G1 X99.100 Y103.950 E0.01684
+G1 X80.900 Y103.950 E0.68100
+G1 X80.900 Y104.400 E0.01684
+G1 X99.100 Y104.400 E0.68100
+G1 X99.100 Y104.850 E0.01684
+G1 X80.900 Y104.850 E0.68100
+G1 X80.900 Y105.300 E0.01684
+G1 X99.100 Y105.300 E0.68100
+G1 X99.100 Y105.750 E0.01684
+G1 X80.900 Y105.750 E0.68100
+G1 X80.900 Y106.200 E0.01684
+G1 X99.100 Y106.200 E0.68100
+G1 X99.100 Y106.650 E0.01684
+G1 X80.900 Y106.650 E0.68100
+G1 X80.900 Y107.100 E0.01684
+G1 X99.100 Y107.100 E0.68100
+G1 X99.100 Y107.550 E0.01684
+G1 X80.900 Y107.550 E0.68100
+G1 X80.900 Y108.000 E0.01684
+G1 X99.100 Y108.000 E0.68100
+G1 X99.100 Y108.450 E0.01684
+G1 X80.900 Y108.450 E0.68100
+G1 X80.900 Y108.900 E0.01684
+G1 X99.100 Y108.900 E0.68100
+G1 E-0.8 F2400
+G1 X123.000 Y100.000 F9000
+G1 E0.8 F2400
+G1 X122.989 Y100.419 E0.01567 F2400
+G1 X122.956 Y100.836 E0.01567
+G1 X122.902 Y101.251 E0.01567
+G1 X122.825 Y101.663 E0.01567
+G1 X122.727 Y102.071 E0.01567
+G1 X122.608 Y102.472 E0.01567
+G1 X122.469 Y102.867 E0.01567
+G1 X122.308 Y103.254 E0.01567
+G1 X122.128 Y103.632 E0.01567
+G1 X121.928 Y104.000 E0.01567
+G1 X121.709 Y104.357 E0.01567
+G1 X121.472 Y104.702 E0.01567
+G1 X121.217 Y105.035 E0.01567
+G1 X120.945 Y105.353 E0.01567
+G1 X120.657 Y105.657 E0.01567
+G1 X120.353 Y105.945 E0.01567
+G1 X120.035 Y106.217 E0.01567
+G1 X119.702 Y106.472 E0.01567
+G1 X119.357 Y106.709 E0.01567
+G1 X119.000 Y106.928 E0.01567
+G1 X118.632 Y107.128 E0.01567
+G1 X118.254 Y107.308 E0.01567
+G1 X117.867 Y107.469 E0.01567
+G1 X117.472 Y107.608 E0.01567
+G1 X117.071 Y107.727 E0.01567
+G1 X116.663 Y107.825 E0.01567
+G1 X116.251 Y107.902 E0.01567
+G1 X115.836 Y107.956 E0.01567
+G1 X115.419 Y107.989 E0.01567
+G1 X115.000 Y108.000 E0.01567
+G1 X114.581 Y107.989 E0.01567
+G1 X114.164 Y107.956 E0.01567
+G1 X113.749 Y107.902 E0.01567
+G1 X113.337 Y107.825 E0.01567
+G1 X112.929 Y107.727 E0.01567
+G1 X112.528 Y107.608 E0.01567
+G1 X112.133 Y107.469 E0.01567
+G1 X111.746 Y107.308 E0.01567
+G1 X111.368 Y107.128 E0.01567
+G1 X111.000 Y106.928 E0.01567
+G1 X110.643 Y106.709 E0.01567
+G1 X110.298 Y106.472 E0.01567
+G1 X109.965 Y106.217 E0.01567
+G1 X109.647 Y105.945 E0.01567
+G1 X109.343 Y105.657 E0.01567
+G1 X109.055 Y105.353 E0.01567
+G1 X108.783 Y105.035 E0.01567
+G1 X108.528 Y104.702 E0.01567
+G1 X108.291 Y104.357 E0.01567
+G1 X108.072 Y104.000 E0.01567
+G1 X107.872 Y103.632 E0.01567
+G1 X107.692 Y103.254 E0.01567
+G1 X107.531 Y102.867 E0.01567
+G1 X107.392 Y102.472 E0.01567
+G1 X107.273 Y102.071 E0.01567
+G1 X107.175 Y101.663 E0.01567
+G1 X107.098 Y101.251 E0.01567
+G1 X107.044 Y100.836 E0.01567
+G1 X107.011 Y100.419 E0.01567
+G1 X107.000 Y100.000 E0.01567
+G1 X107.011 Y99.581 E0.01567
+G1 X107.044 Y99.164 E0.01567
+G1 X107.098 Y98.749 E0.01567
+G1 X107.175 Y98.337 E0.01567
+G1 X107.273 Y97.929 E0.01567
+G1 X107.392 Y97.528 E0.01567
+G1 X107.531 Y97.133 E0.01567
+G1 X107.692 Y96.746 E0.01567
+G1 X107.872 Y96.368 E0.01567
+G1 X108.072 Y96.000 E0.01567
+G1 X108.291 Y95.643 E0.01567
+G1 X108.528 Y95.298 E0.01567
+G1 X108.783 Y94.965 E0.01567
+G1 X109.055 Y94.647 E0.01567
+G1 X109.343 Y94.343 E0.01567
+G1 X109.647 Y94.055 E0.01567
+G1 X109.965 Y93.783 E0.01567
+G1 X110.298 Y93.528 E0.01567
+G1 X110.643 Y93.291 E0.01567
+G1 X111.000 Y93.072 E0.01567
+G1 X111.368 Y92.872 E0.01567
+G1 X111.746 Y92.692 E0.01567
+G1 X112.133 Y92.531 E0.01567
+G1 X112.528 Y92.392 E0.01567
+G1 X112.929 Y92.273 E0.01567
+G1 X113.337 Y92.175 E0.01567
+G1 X113.749 Y92.098 E0.01567
+G1 X114.164 Y92.044 E0.01567
+G1 X114.581 Y92.011 E0.01567
+G1 X115.000 Y92.000 E0.01567
+G1 X115.419 Y92.011 E0.01567
+G1 X115.836 Y92.044 E0.01567
+G1 X116.251 Y92.098 E0.01567
+G1 X116.663 Y92.175 E0.01567
+G1 X117.071 Y92.273 E0.01567
+G1 X117.472 Y92.392 E0.01567
+G1 X117.867 Y92.531 E0.01567
+G1 X118.254 Y92.692 E0.01567
+G1 X118.632 Y92.872 E0.01567
+G1 X119.000 Y93.072 E0.01567
+G1 X119.357 Y93.291 E0.01567
+G1 X119.702 Y93.528 E0.01567
+G1 X120.035 Y93.783 E0.01567
+G1 X120.353 Y94.055 E0.01567
+G1 X120.657 Y94.343 E0.01567
+G1 X120.945 Y94.647 E0.01567
+G1 X121.217 Y94.965 E0.01567
+G1 X121.472 Y95.298 E0.01567
+G1 X121.709 Y95.643 E0.01567
+G1 X121.928 Y96.000 E0.01567
+G1 X122.128 Y96.368 E0.01567
+G1 X122.308 Y96.746 E0.01567
+G1 X122.469 Y97.133 E0.01567
+G1 X122.608 Y97.528 E0.01567
+G1 X122.727 Y97.929 E0.01567
+G1 X122.825 Y98.337 E0.01567
+G1 X122.902 Y98.749 E0.01567
+G1 X122.956 Y99.164 E0.01567
+G1 X122.989 Y99.581 E0.01567
+G1 X123.000 Y100.000 E0.01567
+G1 E-0.8 F2400
+G1 X122.550 Y100.000 F9000
+G1 E0.8 F2400
+G1 X122.540 Y100.395 E0.01479 F2400
+G1 X122.509 Y100.789 E0.01479
+G1 X122.457 Y101.181 E0.01479
+G1 X122.385 Y101.570 E0.01479
+G1 X122.293 Y101.954 E0.01479
+G1 X122.180 Y102.333 E0.01479
+G1 X122.049 Y102.706 E0.01479
+G1 X121.897 Y103.071 E0.01479
+G1 X121.727 Y103.428 E0.01479
+G1 X121.538 Y103.775 E0.01479
+G1 X121.332 Y104.112 E0.01479
+G1 X121.108 Y104.438 E0.01479
+G1 X120.867 Y104.751 E0.01479
+G1 X120.611 Y105.052 E0.01479
+G1 X120.339 Y105.339 E0.01479
+G1 X120.052 Y105.611 E0.01479
+G1 X119.751 Y105.867 E0.01479
+G1 X119.438 Y106.108 E0.01479
+G1 X119.112 Y106.332 E0.01479
+G1 X118.775 Y106.538 E0.01479
+G1 X118.428 Y106.727 E0.01479
+G1 X118.071 Y106.897 E0.01479
+G1 X117.706 Y107.049 E0.01479
+G1 X117.333 Y107.180 E0.01479
+G1 X116.954 Y107.293 E0.01479
+G1 X116.570 Y107.385 E0.01479
+G1 X116.181 Y107.457 E0.01479
+G1 X115.789 Y107.509 E0.01479
+G1 X115.395 Y107.540 E0.01479
+G1 X115.000 Y107.550 E0.01479
+G1 X114.605 Y107.540 E0.01479
+G1 X114.211 Y107.509 E0.01479
+G1 X113.819 Y107.457 E0.01479
+G1 X113.430 Y107.385 E0.01479
+G1 X113.046 Y107.293 E0.01479
+G1 X112.667 Y107.180 E0.01479
+G1 X112.294 Y107.049 E0.01479
+G1 X111.929 Y106.897 E0.01479
+G1 X111.572 Y106.727 E0.01479
+G1 X111.225 Y106.538 E0.01479
+G1 X110.888 Y106.332 E0.01479
+G1 X110.562 Y106.108 E0.01479
+G1 X110.249 Y105.867 E0.01479
+G1 X109.948 Y105.611 E0.01479
+G1 X109.661 Y105.339 E0.01479
+G1 X109.389 Y105.052 E0.01479
+G1 X109.133 Y104.751 E0.01479
+G1 X108.892 Y104.438 E0.01479
+G1 X108.668 Y104.112 E0.01479
+G1 X108.462 Y103.775 E0.01479
+G1 X108.273 Y103.428 E0.01479
+G1 X108.103 Y103.071 E0.01479
+G1 X107.951 Y102.706 E0.01479
+G1 X107.820 Y102.333 E0.01479
+G1 X107.707 Y101.954 E0.01479
+G1 X107.615 Y101.570 E0.01479
+G1 X107.543 Y101.181 E0.01479
+G1 X107.491 Y100.789 E0.01479
+G1 X107.460 Y100.395 E0.01479
+G1 X107.450 Y100.000 E0.01479
+G1 X107.460 Y99.605 E0.01479
+G1 X107.491 Y99.211 E0.01479
+G1 X107.543 Y98.819 E0.01479
+G1 X107.615 Y98.430 E0.01479
+G1 X107.707 Y98.046 E0.01479
+G1 X107.820 Y97.667 E0.01479
+G1 X107.951 Y97.294 E0.01479
+G1 X108.103 Y96.929 E0.01479
+G1 X108.273 Y96.572 E0.01479
+G1 X108.462 Y96.225 E0.01479
+G1 X108.668 Y95.888 E0.01479
+G1 X108.892 Y95.562 E0.01479
+G1 X109.133 Y95.249 E0.01479
+G1 X109.389 Y94.948 E0.01479
+G1 X109.661 Y94.661 E0.01479
+G1 X109.948 Y94.389 E0.01479
+G1 X110.249 Y94.133 E0.01479
+G1 X110.562 Y93.892 E0.01479
+G1 X110.888 Y93.668 E0.01479
+G1 X111.225 Y93.462 E0.01479
+G1 X111.572 Y93.273 E0.01479
+G1 X111.929 Y93.103 E0.01479
+G1 X112.294 Y92.951 E0.01479
+G1 X112.667 Y92.820 E0.01479
+G1 X113.046 Y92.707 E0.01479
+G1 X113.430 Y92.615 E0.01479
+G1 X113.819 Y92.543 E0.01479
+G1 X114.211 Y92.491 E0.01479
+G1 X114.605 Y92.460 E0.01479
+G1 X115.000 Y92.450 E0.01479
+G1 X115.395 Y92.460 E0.01479
+G1 X115.789 Y92.491 E0.01479
+G1 X116.181 Y92.543 E0.01479
+G1 X116.570 Y92.615 E0.01479
+G1 X116.954 Y92.707 E0.01479
+G1 X117.333 Y92.820 E0.01479
+G1 X117.706 Y92.951 E0.01479
+G1 X118.071 Y93.103 E0.01479
+G1 X118.428 Y93.273 E0.01479
+G1 X118.775 Y93.462 E0.01479
+G1 X119.112 Y93.668 E0.01479
+G1 X119.438 Y93.892 E0.01479
+G1 X119.751 Y94.133 E0.01479
+G1 X120.052 Y94.389 E0.01479
+G1 X120.339 Y94.661 E0.01479
+G1 X120.611 Y94.948 E0.01479
+G1 X120.867 Y95.249 E0.01479
+G1 X121.108 Y95.562 E0.01479
+G1 X121.332 Y95.888 E0.01479
+G1 X121.538 Y96.225 E0.01479
+G1 X121.727 Y96.572 E0.01479
+G1 X121.897 Y96.929 E0.01479
+G1 X122.049 Y97.294 E0.01479
+G1 X122.180 Y97.667 E0.01479
+G1 X122.293 Y98.046 E0.01479
+G1 X122.385 Y98.430 E0.01479
+G1 X122.457 Y98.819 E0.01479
+G1 X122.509 Y99.211 E0.01479
+G1 X122.540 Y99.605 E0.01479
+G1 X122.550 Y100.000 E0.01479
+G1 E-0.8 F2400
+G1 X123.900 Y100.000 F9000
+G1 E0.8 F2400
+G3 X106.100 Y100.000 I-8.900 J0 E1.04620 F2400
+G3 X123.900 Y100.000 I8.900 J0 E1.04620
+;LAYER:3
+G1 Z0.800 F1200
+G1 E-0.8 F2400
+G1 X80.000 Y90.000 F9000
+G1 E0.8 F2400
+G1 X100.000 Y90.000 E0.74835 F2400
+G1 X100.000 Y110.000 E0.74835
+G1 X80.000 Y110.000 E0.74835
+G1 X80.000 Y90.000 E0.74835
+G1 E-0.8 F2400
+G1 X80.450 Y90.450 F9000
+G1 E0.8 F2400
+G1 X99.550 Y90.450 E0.71468 F2400
+G1 X99.550 Y109.550 E0.71468
+G1 X80.450 Y109.550 E0.71468
+G1 X80.450 Y90.450 E0.71468
+G1 E-0.8 F2400
+G1 X80.900 Y90.900 F9000
+G1 E0.8 F2400
+G1 X99.100 Y90.900 E0.68100 F4800
+G1 X99.100 Y91.350 E0.01684
+G1 X80.900 Y91.350 E0.68100
+G1 X80.900 Y91.800 E0.01684
+G1 X99.100 Y91.800 E0.68100
+G1 X99.100 Y92.250 E0.01684
+G1 X80.900 Y92.250 E0.68100
+G1 X80.900 Y92.700 E0.01684
+G1 X99.100 Y92.700 E0.68100
+G1 X99.100 Y93.150 E0.01684
+G1 X80.900 Y93.150 E0.68100
+G1 X80.900 Y93.600 E0.01684
+G1 X99.100 Y93.600 E0.68100
+G1 X99.100 Y94.050 E0.01684
+G1 X80.900 Y94.050 E0.68100
+G1 X80.900 Y94.500 E0.01684
+G1 X99.100 Y94.500 E0.68100
+G1 X99.100 Y94.950 E0.01684
+G1 X80.900 Y94.950 E0.68100
+G1 X80.900 Y95.400 E0.01684
+G1 X99.100 Y95.400 E0.68100
+G1 X99.100 Y95.850 E0.01684
+G1 X80.900 Y95.850 E0.68100
+G1 X80.900 Y96.300 E0.01684
+G1 X99.100 Y96.300 E0.68100
+G1 X99.100 Y96.750 E0.01684
+G1 X80.900 Y96.750 E0.68100
+G1 X80.900 Y97.200 E0.01684
+G1 X99.100 Y97.200 E0.68100
+G1 X99.100 Y97.650 E0.01684
+G1 X80.900 Y97.650 E0.68100
+G1 X80.900 Y98.100 E0.01684
+G1 X99.100 Y98.100 E0.68100
+G1 X99.100 Y98.550 E0.01684
+G1 X80.900 Y98.550 E0.68100
+G1 X80.900 Y99.000 E0.01684
+G1 X99.100 Y99.000 E0.68100
+G1 X99.100 Y99.450 E0.01684
+G1 X80.900 Y99.450 E0.68100
+G1 X80.900 Y99.900 E0.01684
+G1 X99.100 Y99.900 E0.68100
+G1 X99.100 Y100.350 E0.01684
+G1 X80.900 Y100.350 E0.68100
+G1 X80.900 Y100.800 E0.01684
+G1 X99.100 Y100.800 E0.68100
+G1 X99.100 Y101.250 E0.01684
+G1 X80.900 Y101.250 E0.68100
+G1 X80.900 Y101.700 E0.01684
+G1 X99.100 Y101.700 E0.68100
+G1 X99.100 Y102.150 E0.01684
+G1 X80.900 Y102.150 E0.68100
+G1 X80.900 Y102.600 E0.01684
+G1 X99.100 Y102.600 E0.68100
+G1 X99.100 Y103.050 E0.01684
+G1 X80.900 Y103.050 E0.68100
+G1 X80.900 Y103.500 E0.01684
+G1 X99.100 Y103.500 E0.68100
+G1 X99.100 Y103.950 E0.01684
+G1 X80.900 Y103.950 E0.68100
+G1 X80.900 Y104.400 E0.01684
+G1 X99.100 Y104.400 E0.68100
+G1 X99.100 Y104.850 E0.01684
+G1 X80.900 Y104.850 E0.68100
+G1 X80.900 Y105.300 E0.01684
+G1 X99.100 Y105.300 E0.68100
+G1 X99.100 Y105.750 E0.01684
+G1 X80.900 Y105.750 E0.68100
+G1 X80.900 Y106.200 E0.01684
+G1 X99.100 Y106.200 E0.68100
+G1 X99.100 Y106.650 E0.01684
+G1 X80.900 Y106.650 E0.68100
+G1 X80.900 Y107.100 E0.01684
+G1 X99.100 Y107.100 E0.68100
+G1 X99.100 Y107.550 E0.01684
+G1 X80.900 Y107.550 E0.68100
+G1 X80.900 Y108.000 E0.01684
+G1 X99.100 Y108.000 E0.68100
+G1 X99.100 Y108.450 E0.01684
+G1 X80.900 Y108.450 E0.68100
+G1 X80.900 Y108.900 E0.01684
+G1 X99.100 Y108.900 E0.68100
+G1 E-0.8 F2400
+G1 X123.000 Y100.000 F9000
+G1 E0.8 F2400
+G1 X122.989 Y100.419 E0.01567 F2400
+G1 X122.956 Y100.836 E0.01567
+G1 X122.902 Y101.251 E0.01567
+G1 X122.825 Y101.663 E0.01567
+G1 X122.727 Y102.071 E0.01567
+G1 X122.608 Y102.472 E0.01567
+G1 X122.469 Y102.867 E0.01567
+G1 X122.308 Y103.254 E0.01567
+G1 X122.128 Y103.632 E0.01567
+G1 X121.928 Y104.000 E0.01567
+G1 X121.709 Y104.357 E0.01567
+G1 X121.472 Y104.702 E0.01567
+G1 X121.217 Y105.035 E0.01567
+G1 X120.945 Y105.353 E0.01567
+G1 X120.657 Y105.657 E0.01567
+G1 X120.353 Y105.945 E0.01567
+G1 X120.035 Y106.217 E0.01567
+G1 X119.702 Y106.472 E0.01567
+G1 X119.357 Y106.709 E0.01567
+G1 X119.000 Y106.928 E0.01567
+G1 X118.632 Y107.128 E0.01567
+G1 X118.254 Y107.308 E0.01567
+G1 X117.867 Y107.469 E0.01567
+G1 X117.472 Y107.608 E0.01567
+G1 X117.071 Y107.727 E0.01567
+G1 X116.663 Y107.825 E0.01567
+G1 X116.251 Y107.902 E0.01567
+G1 X115.836 Y107.956 E0.01567
+G1 X115.419 Y107.989 E0.01567
+G1 X115.000 Y108.000 E0.01567
+G1 X114.581 Y107.989 E0.01567
+G1 X114.164 Y107.956 E0.01567
+G1 X113.749 Y107.902 E0.01567
+G1 X113.337 Y107.825 E0.01567
+G1 X112.929 Y107.727 E0.01567
+G1 X112.528 Y107.608 E0.01567
+G1 X112.133 Y107.469 E0.01567
+G1 X111.746 Y107.308 E0.01567
+G1 X111.368 Y107.128 E0.01567
+G1 X111.000 Y106.928 E0.01567
+G1 X110.643 Y106.709 E0.01567
+G1 X110.298 Y106.472 E0.01567
+G1 X109.965 Y106.217 E0.01567
+G1 X109.647 Y105.945 E0.01567
+G1 X109.343 Y105.657 E0.01567
+G1 X109.055 Y105.353 E0.01567
+G1 X108.783 Y105.035 E0.01567
+G1 X108.528 Y104.702 E0.01567
+G1 X108.291 Y104.357 E0.01567
+G1 X108.072 Y104.000 E0.01567
+G1 X107.872 Y103.632 E0.01567
+G1 X107.692 Y103.254 E0.01567
+G1 X107.531 Y102.867 E0.01567
+G1 X107.392 Y102.472 E0.01567
+G1 X107.273 Y102.071 E0.01567
+G1 X107.175 Y101.663 E0.01567
+G1 X107.098 Y101.251 E0.01567
+G1 X107.044 Y100.836 E0.01567
+G1 X107.011 Y100.419 E0.01567
+G1 X107.000 Y100.000 E0.01567
+G1 X107.011 Y99.581 E0.01567
+G1 X107.044 Y99.164 E0.01567
+G1 X107.098 Y98.749 E0.01567
+G1 X107.175 Y98.337 E0.01567
+G1 X107.273 Y97.929 E0.01567
+G1 X107.392 Y97.528 E0.01567
+G1 X107.531 Y97.133 E0.01567
+G1 X107.692 Y96.746 E0.01567
+G1 X107.872 Y96.368 E0.01567
+G1 X108.072 Y96.000 E0.01567
+G1 X108.291 Y95.643 E0.01567
+G1 X108.528 Y95.298 E0.01567
+G1 X108.783 Y94.965 E0.01567
+G1 X109.055 Y94.647 E0.01567
+G1 X109.343 Y94.343 E0.01567
+G1 X109.647 Y94.055 E0.01567
+G1 X109.965 Y93.783 E0.01567
+G1 X110.298 Y93.528 E0.01567
+G1 X110.643 Y93.291 E0.01567
+G1 X111.000 Y93.072 E0.01567
+G1 X111.368 Y92.872 E0.01567
+G1 X111.746 Y92.692 E0.01567
+G1 X112.133 Y92.531 E0.01567
+G1 X112.528 Y92.392 E0.01567
+G1 X112.929 Y92.273 E0.01567
+G1 X113.337 Y92.175 E0.01567
+G1 X113.749 Y92.098 E0.01567
+G1 X114.164 Y92.044 E0.01567
+G1 X114.581 Y92.011 E0.01567
+G1 X115.000 Y92.000 E0.01567
+G1 X115.419 Y92.011 E0.01567
+G1 X115.836 Y92.044 E0.01567
+G1 X116.251 Y92.098 E0.01567
+G1 X116.663 Y92.175 E0.01567
+G1 X117.071 Y92.273 E0.01567
+G1 X117.472 Y92.392 E0.01567
+G1 X117.867 Y92.531 E0.01567
+G1 X118.254 Y92.692 E0.01567
+G1 X118.632 Y92.872 E0.01567
+G1 X119.000 Y93.072 E0.01567
+G1 X119.357 Y93.291 E0.01567
+G1 X119.702 Y93.528 E0.01567
+G1 X120.035 Y93.783 E0.01567
+G1 X120.353 Y94.055 E0.01567
+G1 X120.657 Y94.343 E0.01567
+G1 X120.945 Y94.647 E0.01567
+G1 X121.217 Y94.965 E0.01567
+G1 X121.472 Y95.298 E0.01567
+G1 X121.709 Y95.643 E0.01567
+G1 X121.928 Y96.000 E0.01567
+G1 X122.128 Y96.368 E0.01567
+G1 X122.308 Y96.746 E0.01567
+G1 X122.469 Y97.133 E0.01567
+G1 X122.608 Y97.528 E0.01567
+G1 X122.727 Y97.929 E0.01567
+G1 X122.825 Y98.337 E0.01567
+G1 X122.902 Y98.749 E0.01567
+G1 X122.956 Y99.164 E0.01567
+G1 X122.989 Y99.581 E0.01567
+G1 X123.000 Y100.000 E0.01567
+G1 E-0.8 F2400
+G1 X122.550 Y100.000 F9000
+G1 E0.8 F2400
+G1 X122.540 Y100.395 E0.01479 F2400
+G1 X122.509 Y100.789 E0.01479
+G1 X122.457 Y101.181 E0.01479
+G1 X122.385 Y101.570 E0.01479
+G1 X122.293 Y101.954 E0.01479
+G1 X122.180 Y102.333 E0.01479
+G1 X122.049 Y102.706 E0.01479
+G1 X121.897 Y103.071 E0.01479
+G1 X121.727 Y103.428 E0.01479
+G1 X121.538 Y103.775 E0.01479
+G1 X121.332 Y104.112 E0.01479
+G1 X121.108 Y104.438 E0.01479
+G1 X120.867 Y104.751 E0.01479
+G1 X120.611 Y105.052 E0.01479
+G1 X120.339 Y105.339 E0.01479
+G1 X120.052 Y105.611 E0.01479
+G1 X119.751 Y105.867 E0.01479
+G1 X119.438 Y106.108 E0.01479
+G1 X119.112 Y106.332 E0.01479
+G1 X118.775 Y106.538 E0.01479
+G1 X118.428 Y106.727 E0.01479
+G1 X118.071 Y106.897 E0.01479
+G1 X117.706 Y107.049 E0.01479
+G1 X117.333 Y107.180 E0.01479
+G1 X116.954 Y107.293 E0.01479
+G1 X116.570 Y107.385 E0.01479
+G1 X116.181 Y107.457 E0.01479
+G1 X115.789 Y107.509 E0.01479
+G1 X115.395 Y107.540 E0.01479
+G1 X115.000 Y107.550 E0.01479
+G1 X114.605 Y107.540 E0.01479
+G1 X114.211 Y107.509 E0.01479
+G1 X113.819 Y107.457 E0.01479
+G1 X113.430 Y107.385 E0.01479
+G1 X113.046 Y107.293 E0.01479
+G1 X112.667 Y107.180 E0.01479
+G1 X112.294 Y107.049 E0.01479
+G1 X111.929 Y106.897 E0.01479
+G1 X111.572 Y106.727 E0.01479
+G1 X111.225 Y106.538 E0.01479
+G1 X110.888 Y106.332 E0.01479
+G1 X110.562 Y106.108 E0.01479
+G1 X110.249 Y105.867 E0.01479
+G1 X109.948 Y105.611 E0.01479
+G1 X109.661 Y105.339 E0.01479
+G1 X109.389 Y105.052 E0.01479
+G1 X109.133 Y104.751 E0.01479
+G1 X108.892 Y104.438 E0.01479
+G1 X108.668 Y104.112 E0.01479
+G1 X108.462 Y103.775 E0.01479
+G1 X108.273 Y103.428 E0.01479
+G1 X108.103 Y103.071 E0.01479
+G1 X107.951 Y102.706 E0.01479
+G1 X107.820 Y102.333 E0.01479
+G1 X107.707 Y101.954 E0.01479
+G1 X107.615 Y101.570 E0.01479
+G1 X107.543 Y101.181 E0.01479
+G1 X107.491 Y100.789 E0.01479
+G1 X107.460 Y100.395 E0.01479
+G1 X107.450 Y100.000 E0.01479
+G1 X107.460 Y99.605 E0.01479
+G1 X107.491 Y99.211 E0.01479
+G1 X107.543 Y98.819 E0.01479
+G1 X107.615 Y98.430 E0.01479
+G1 X107.707 Y98.046 E0.01479
+G1 X107.820 Y97.667 E0.01479
+G1 X107.951 Y97.294 E0.01479
+G1 X108.103 Y96.929 E0.01479
+G1 X108.273 Y96.572 E0.01479
+G1 X108.462 Y96.225 E0.01479
+G1 X108.668 Y95.888 E0.01479
+G1 X108.892 Y95.562 E0.01479
+G1 X109.133 Y95.249 E0.01479
+G1 X109.389 Y94.948 E0.01479
+G1 X109.661 Y94.661 E0.01479
+G1 X109.948 Y94.389 E0.01479
+G1 X110.249 Y94.133 E0.01479
+G1 X110.562 Y93.892 E0.01479
+G1 X110.888 Y93.668 E0.01479
+G1 X111.225 Y93.462 E0.01479
+G1 X111.572 Y93.273 E0.01479
+G1 X111.929 Y93.103 E0.01479
+G1 X112.294 Y92.951 E0.01479
+G1 X112.667 Y92.820 E0.01479
+G1 X113.046 Y92.707 E0.01479
+G1 X113.430 Y92.615 E0.01479
+G1 X113.819 Y92.543 E0.01479
+G1 X114.211 Y92.491 E0.01479
+G1 X114.605 Y92.460 E0.01479
+G1 X115.000 Y92.450 E0.01479
+G1 X115.395 Y92.460 E0.01479
+G1 X115.789 Y92.491 E0.01479
+G1 X116.181 Y92.543 E0.01479
+G1 X116.570 Y92.615 E0.01479
+G1 X116.954 Y92.707 E0.01479
+G1 X117.333 Y92.820 E0.01479
+G1 X117.706 Y92.951 E0.01479
+G1 X118.071 Y93.103 E0.01479
+G1 X118.428 Y93.273 E0.01479
+G1 X118.775 Y93.462 E0.01479
+G1 X119.112 Y93.668 E0.01479
+G1 X119.438 Y93.892 E0.01479
+G1 X119.751 Y94.133 E0.01479
+G1 X120.052 Y94.389 E0.01479
+G1 X120.339 Y94.661 E0.01479
+G1 X120.611 Y94.948 E0.01479
+G1 X120.867 Y95.249 E0.01479
+G1 X121.108 Y95.562 E0.01479
+G1 X121.332 Y95.888 E0.01479
+G1 X121.538 Y96.225 E0.01479
+G1 X121.727 Y96.572 E0.01479
+G1 X121.897 Y96.929 E0.01479
+G1 X122.049 Y97.294 E0.01479
+G1 X122.180 Y97.667 E0.01479
+G1 X122.293 Y98.046 E0.01479
+G1 X122.385 Y98.430 E0.01479
+G1 X122.457 Y98.819 E0.01479
+G1 X122.509 Y99.211 E0.01479
+G1 X122.540 Y99.605 E0.01479
+G1 X122.550 Y100.000 E0.01479
+G1 E-0.8 F2400
+G1 X123.900 Y100.000 F9000
+G1 E0.8 F2400
+G3 X106.100 Y100.000 I-8.900 J0 E1.04620 F2400
+G3 X123.900 Y100.000 I8.900 J0 E1.04620
+;LAYER:4
+G1 Z1.000 F1200
+G1 E-0.8 F2400
+G1 X80.000 Y90.000 F9000
+G1 E0.8 F2400
+G1 X100.000 Y90.000 E0.74835 F2400
+G1 X100.000 Y110.000 E0.74835
+G1 X80.000 Y110.000 E0.74835
+G1 X80.000 Y90.000 E0.74835
+G1 E-0.8 F2400
+G1 X80.450 Y90.450 F9000
+G1 E0.8 F2400
+G1 X99.550 Y90.450 E0.71468 F2400
+G1 X99.550 Y109.550 E0.71468
+G1 X80.450 Y109.550 E0.71468
+G1 X80.450 Y90.450 E0.71468
+G1 E-0.8 F2400
+G1 X80.900 Y90.900 F9000
+G1 E0.8 F2400
+G1 X99.100 Y90.900 E0.68100 F4800
+G1 X99.100 Y91.350 E0.01684
+G1 X80.900 Y91.350 E0.68100
+G1 X80.900 Y91.800 E0.01684
+G1 X99.100 Y91.800 E0.68100
+G1 X99.100 Y92.250 E0.01684
+G1 X80.900 Y92.250 E0.68100
+G1 X80.900 Y92.700 E0.01684
+G1 X99.100 Y92.700 E0.68100
+G1 X99.100 Y93.150 E0.01684
+G1 X80.900 Y93.150 E0.68100
+G1 X80.900 Y93.600 E0.01684
+G1 X99.100 Y93.600 E0.68100
+G1 X99.100 Y94.050 E0.01684
+G1 X80.900 Y94.050 E0.68100
+G1 X80.900 Y94.500 E0.01684
+G1 X99.100 Y94.500 E0.68100
+G1 X99.100 Y94.950 E0.01684
+G1 X80.900 Y94.950 E0.68100
+G1 X80.900 Y95.400 E0.01684
+G1 X99.100 Y95.400 E0.68100
+G1 X99.100 Y95.850 E0.01684
+G1 X80.900 Y95.850 E0.68100
+G1 X80.900 Y96.300 E0.01684
+G1 X99.100 Y96.300 E0.68100
+G1 X99.100 Y96.750 E0.01684
+G1 X80.900 Y96.750 E0.68100
+G1 X80.900 Y97.200 E0.01684
+G1 X99.100 Y97.200 E0.68100
+G1 X99.100 Y97.650 E0.01684
+G1 X80.900 Y97.650 E0.68100
+G1 X80.900 Y98.100 E0.01684
+G1 X99.100 Y98.100 E0.68100
+G1 X99.100 Y98.550 E0.01684
+G1 X80.900 Y98.550 E0.68100
+G1 X80.900 Y99.000 E0.01684
+G1 X99.100 Y99.000 E0.68100
+G1 X99.100 Y99.450 E0.01684
+G1 X80.900 Y99.450 E0.68100
+G1 X80.900 Y99.900 E0.01684
+G1 X99.100 Y99.900 E0.68100
+G1 X99.100 Y100.350 E0.01684
+G1 X80.900 Y100.350 E0.68100
+G1 X80.900 Y100.800 E0.01684
+G1 X99.100 Y100.800 E0.68100
+G1 X99.100 Y101.250 E0.01684
+G1 X80.900 Y101.250 E0.68100
+G1 X80.900 Y101.700 E0.01684
+G1 X99.100 Y101.700 E0.68100
+G1 X99.100 Y102.150 E0.01684
+G1 X80.900 Y102.150 E0.68100
+G1 X80.900 Y102.600 E0.01684
+G1 X99.100 Y102.600 E0.68100
+G1 X99.100 Y103.050 E0.01684
+G1 X80.900 Y103.050 E0.68100
+G1 X80.900 Y103.500 E0.01684
+G1 X99.100 Y103.500 E0.68100
+G1 X99.100 Y103.950 E0.01684
+G1 X80.900 Y103.950 E0.68100
+G1 X80.900 Y104.400 E0.01684
+G1 X99.100 Y104.400 E0.68100
+G1 X99.100 Y104.850 E0.01684
+G1 X80.900 Y104.850 E0.68100
+G1 X80.900 Y105.300 E0.01684
+G1 X99.100 Y105.300 E0.68100
+G1 X99.100 Y105.750 E0.01684
+G1 X80.900 Y105.750 E0.68100
+G1 X80.900 Y106.200 E0.01684
+G1 X99.100 Y106.200 E0.68100
+G1 X99.100 Y106.650 E0.01684
+G1 X80.900 Y106.650 E0.68100
+G1 X80.900 Y107.100 E0.01684
+G1 X99.100 Y107.100 E0.68100
+G1 X99.100 Y107.550 E0.01684
+G1 X80.900 Y107.550 E0.68100
+G1 X80.900 Y108.000 E0.01684
+G1 X99.100 Y108.000 E0.68100
+G1 X99.100 Y108.450 E0.01684
+G1 X80.900 Y108.450 E0.68100
+G1 X80.900 Y108.900 E0.01684
+G1 X99.100 Y108.900 E0.68100
+G1 E-0.8 F2400
+G1 X123.000 Y100.000 F9000
+G1 E0.8 F2400
+G1 X122.989 Y100.419 E0.01567 F2400
+G1 X122.956 Y100.836 E0.01567
+G1 X122.902 Y101.251 E0.01567
+G1 X122.825 Y101.663 E0.01567
+G1 X122.727 Y102.071 E0.01567
+G1 X122.608 Y102.472 E0.01567
+G1 X122.469 Y102.867 E0.01567
+G1 X122.308 Y103.254 E0.01567
+G1 X122.128 Y103.632 E0.01567
+G1 X121.928 Y104.000 E0.01567
+G1 X121.709 Y104.357 E0.01567
+G1 X121.472 Y104.702 E0.01567
+G1 X121.217 Y105.035 E0.01567
+G1 X120.945 Y105.353 E0.01567
+G1 X120.657 Y105.657 E0.01567
+G1 X120.353 Y105.945 E0.01567
+G1 X120.035 Y106.217 E0.01567
+G1 X119.702 Y106.472 E0.01567
+G1 X119.357 Y106.709 E0.01567
+G1 X119.000 Y106.928 E0.01567
+G1 X118.632 Y107.128 E0.01567
+G1 X118.254 Y107.308 E0.01567
+G1 X117.867 Y107.469 E0.01567
+G1 X117.472 Y107.608 E0.01567
+G1 X117.071 Y107.727 E0.01567
+G1 X116.663 Y107.825 E0.01567
+G1 X116.251 Y107.902 E0.01567
+G1 X115.836 Y107.956 E0.01567
+G1 X115.419 Y107.989 E0.01567
+G1 X115.000 Y108.000 E0.01567
+G1 X114.581 Y107.989 E0.01567
+G1 X114.164 Y107.956 E0.01567
+G1 X113.749 Y107.902 E0.01567
+G1 X113.337 Y107.825 E0.01567
+G1 X112.929 Y107.727 E0.01567
+G1 X112.528 Y107.608 E0.01567
+G1 X112.133 Y107.469 E0.01567
+G1 X111.746 Y107.308 E0.01567
+G1 X111.368 Y107.128 E0.01567
+G1 X111.000 Y106.928 E0.01567
+G1 X110.643 Y106.709 E0.01567
+G1 X110.298 Y106.472 E0.01567
+G1 X109.965 Y106.217 E0.01567
+G1 X109.647 Y105.945 E0.01567
+G1 X109.343 Y105.657 E0.01567
+G1 X109.055 Y105.353 E0.01567
+G1 X108.783 Y105.035 E0.01567
+G1 X108.528 Y104.702 E0.01567
+G1 X108.291 Y104.357 E0.01567
+G1 X108.072 Y104.000 E0.01567
+G1 X107.872 Y103.632 E0.01567
+G1 X107.692 Y103.254 E0.01567
+G1 X107.531 Y102.867 E0.01567
+G1 X107.392 Y102.472 E0.01567
+G1 X107.273 Y102.071 E0.01567
+G1 X107.175 Y101.663 E0.01567
+G1 X107.098 Y101.251 E0.01567
+G1 X107.044 Y100.836 E0.01567
+G1 X107.011 Y100.419 E0.01567
+G1 X107.000 Y100.000 E0.01567
+G1 X107.011 Y99.581 E0.01567
+G1 X107.044 Y99.164 E0.01567
+G1 X107.098 Y98.749 E0.01567
+G1 X107.175 Y98.337 E0.01567
+G1 X107.273 Y97.929 E0.01567
+G1 X107.392 Y97.528 E0.01567
+G1 X107.531 Y97.133 E0.01567
+G1 X107.692 Y96.746 E0.01567
+G1 X107.872 Y96.368 E0.01567
+G1 X108.072 Y96.000 E0.01567
+G1 X108.291 Y95.643 E0.01567
+G1 X108.528 Y95.298 E0.01567
+G1 X108.783 Y94.965 E0.01567
+G1 X109.055 Y94.647 E0.01567
+G1 X109.343 Y94.343 E0.01567
+G1 X109.647 Y94.055 E0.01567
+G1 X109.965 Y93.783 E0.01567
+G1 X110.298 Y93.528 E0.01567
+G1 X110.643 Y93.291 E0.01567
+G1 X111.000 Y93.072 E0.01567
+G1 X111.368 Y92.872 E0.01567
+G1 X111.746 Y92.692 E0.01567
+G1 X112.133 Y92.531 E0.01567
+G1 X112.528 Y92.392 E0.01567
+G1 X112.929 Y92.273 E0.01567
+G1 X113.337 Y92.175 E0.01567
+G1 X113.749 Y92.098 E0.01567
+G1 X114.164 Y92.044 E0.01567
+G1 X114.581 Y92.011 E0.01567
+G1 X115.000 Y92.000 E0.01567
+G1 X115.419 Y92.011 E0.01567
+G1 X115.836 Y92.044 E0.01567
+G1 X116.251 Y92.098 E0.01567
+G1 X116.663 Y92.175 E0.01567
+G1 X117.071 Y92.273 E0.01567
+G1 X117.472 Y92.392 E0.01567
+G1 X117.867 Y92.531 E0.01567
+G1 X118.254 Y92.692 E0.01567
+G1 X118.632 Y92.872 E0.01567
+G1 X119.000 Y93.072 E0.01567
+G1 X119.357 Y93.291 E0.01567
+G1 X119.702 Y93.528 E0.01567
+G1 X120.035 Y93.783 E0.01567
+G1 X120.353 Y94.055 E0.01567
+G1 X120.657 Y94.343 E0.01567
+G1 X120.945 Y94.647 E0.01567
+G1 X121.217 Y94.965 E0.01567
+G1 X121.472 Y95.298 E0.01567
+G1 X121.709 Y95.643 E0.01567
+G1 X121.928 Y96.000 E0.01567
+G1 X122.128 Y96.368 E0.01567
+G1 X122.308 Y96.746 E0.01567
+G1 X122.469 Y97.133 E0.01567
+G1 X122.608 Y97.528 E0.01567
+G1 X122.727 Y97.929 E0.01567
+G1 X122.825 Y98.337 E0.01567
+G1 X122.902 Y98.749 E0.01567
+G1 X122.956 Y99.164 E0.01567
+G1 X122.989 Y99.581 E0.01567
+G1 X123.000 Y100.000 E0.01567
+G1 E-0.8 F2400
+G1 X122.550 Y100.000 F9000
+G1 E0.8 F2400
+G1 X122.540 Y100.395 E0.01479 F2400
+G1 X122.509 Y100.789 E0.01479
+G1 X122.457 Y101.181 E0.01479
+G1 X122.385 Y101.570 E0.01479
+G1 X122.293 Y101.954 E0.01479
+G1 X122.180 Y102.333 E0.01479
+G1 X122.049 Y102.706 E0.01479
+G1 X121.897 Y103.071 E0.01479
+G1 X121.727 Y103.428 E0.01479
+G1 X121.538 Y103.775 E0.01479
+G1 X121.332 Y104.112 E0.01479
+G1 X121.108 Y104.438 E0.01479
+G1 X120.867 Y104.751 E0.01479
+G1 X120.611 Y105.052 E0.01479
+G1 X120.339 Y105.339 E0.01479
+G1 X120.052 Y105.611 E0.01479
+G1 X119.751 Y105.867 E0.01479
+G1 X119.438 Y106.108 E0.01479
+G1 X119.112 Y106.332 E0.01479
+G1 X118.775 Y106.538 E0.01479
+G1 X118.428 Y106.727 E0.01479
+G1 X118.071 Y106.897 E0.01479
+G1 X117.706 Y107.049 E0.01479
+G1 X117.333 Y107.180 E0.01479
+G1 X116.954 Y107.293 E0.01479
+G1 X116.570 Y107.385 E0.01479
+G1 X116.181 Y107.457 E0.01479
+G1 X115.789 Y107.509 E0.01479
+G1 X115.395 Y107.540 E0.01479
+G1 X115.000 Y107.550 E0.01479
+G1 X114.605 Y107.540 E0.01479
+G1 X114.211 Y107.509 E0.01479
+G1 X113.819 Y107.457 E0.01479
+G1 X113.430 Y107.385 E0.01479
+G1 X113.046 Y107.293 E0.01479
+G1 X112.667 Y107.180 E0.01479
+G1 X112.294 Y107.049 E0.01479
+G1 X111.929 Y106.897 E0.01479
+G1 X111.572 Y106.727 E0.01479
+G1 X111.225 Y106.538 E0.01479
+G1 X110.888 Y106.332 E0.01479
+G1 X110.562 Y106.108 E0.01479
+G1 X110.249 Y105.867 E0.01479
+G1 X109.948 Y105.611 E0.01479
+G1 X109.661 Y105.339 E0.01479
+G1 X109.389 Y105.052 E0.01479
+G1 X109.133 Y104.751 E0.01479
+G1 X108.892 Y104.438 E0.01479
+G1 X108.668 Y104.112 E0.01479
+G1 X108.462 Y103.775 E0.01479
+G1 X108.273 Y103.428 E0.01479
+G1 X108.103 Y103.071 E0.01479
+G1 X107.951 Y102.706 E0.01479
+G1 X107.820 Y102.333 E0.01479
+G1 X107.707 Y101.954 E0.01479
+G1 X107.615 Y101.570 E0.01479
+G1 X107.543 Y101.181 E0.01479
+G1 X107.491 Y100.789 E0.01479
+G1 X107.460 Y100.395 E0.01479
+G1 X107.450 Y100.000 E0.01479
+G1 X107.460 Y99.605 E0.01479
+G1 X107.491 Y99.211 E0.01479
+G1 X107.543 Y98.819 E0.01479
+G1 X107.615 Y98.430 E0.01479
+G1 X107.707 Y98.046 E0.01479
+G1 X107.820 Y97.667 E0.01479
+G1 X107.951 Y97.294 E0.01479
+G1 X108.103 Y96.929 E0.01479
+G1 X108.273 Y96.572 E0.01479
+G1 X108.462 Y96.225 E0.01479
+G1 X108.668 Y95.888 E0.01479
+G1 X108.892 Y95.562 E0.01479
+G1 X109.133 Y95.249 E0.01479
+G1 X109.389 Y94.948 E0.01479
+G1 X109.661 Y94.661 E0.01479
+G1 X109.948 Y94.389 E0.01479
+G1 X110.249 Y94.133 E0.01479
+G1 X110.562 Y93.892 E0.01479
+G1 X110.888 Y93.668 E0.01479
+G1 X111.225 Y93.462 E0.01479
+G1 X111.572 Y93.273 E0.01479
+G1 X111.929 Y93.103 E0.01479
+G1 X112.294 Y92.951 E0.01479
+G1 X112.667 Y92.820 E0.01479
+G1 X113.046 Y92.707 E0.01479
+G1 X113.430 Y92.615 E0.01479
+G1 X113.819 Y92.543 E0.01479
+G1 X114.211 Y92.491 E0.01479
+G1 X114.605 Y92.460 E0.01479
+G1 X115.000 Y92.450 E0.01479
+G1 X115.395 Y92.460 E0.01479
+G1 X115.789 Y92.491 E0.01479
+G1 X116.181 Y92.543 E0.01479
+G1 X116.570 Y92.615 E0.01479
+G1 X116.954 Y92.707 E0.01479
+G1 X117.333 Y92.820 E0.01479
+G1 X117.706 Y92.951 E0.01479
+G1 X118.071 Y93.103 E0.01479
+G1 X118.428 Y93.273 E0.01479
+G1 X118.775 Y93.462 E0.01479
+G1 X119.112 Y93.668 E0.01479
+G1 X119.438 Y93.892 E0.01479
+G1 X119.751 Y94.133 E0.01479
+G1 X120.052 Y94.389 E0.01479
+G1 X120.339 Y94.661 E0.01479
+G1 X120.611 Y94.948 E0.01479
+G1 X120.867 Y95.249 E0.01479
+G1 X121.108 Y95.562 E0.01479
+G1 X121.332 Y95.888 E0.01479
+G1 X121.538 Y96.225 E0.01479
+G1 X121.727 Y96.572 E0.01479
+G1 X121.897 Y96.929 E0.01479
+G1 X122.049 Y97.294 E0.01479
+G1 X122.180 Y97.667 E0.01479
+G1 X122.293 Y98.046 E0.01479
+G1 X122.385 Y98.430 E0.01479
+G1 X122.457 Y98.819 E0.01479
+G1 X122.509 Y99.211 E0.01479
+G1 X122.540 Y99.605 E0.01479
+G1 X122.550 Y100.000 E0.01479
+G1 E-0.8 F2400
+G1 X123.900 Y100.000 F9000
+G1 E0.8 F2400
+G3 X106.100 Y100.000 I-8.900 J0 E1.04620 F2400
+G3 X123.900 Y100.000 I8.900 J0 E1.04620
+;LAYER:5
+G1 Z1.200 F1200
+G1 E-0.8 F2400
+G1 X80.000 Y90.000 F9000
+G1 E0.8 F2400
+G1 X100.000 Y90.000 E0.74835 F2400
+G1 X100.000 Y110.000 E0.74835
+G1 X80.000 Y110.000 E0.74835
+G1 X80.000 Y90.000 E0.74835
+G1 E-0.8 F2400
+G1 X80.450 Y90.450 F9000
+G1 E0.8 F2400
+G1 X99.550 Y90.450 E0.71468 F2400
+G1 X99.550 Y109.550 E0.71468
+G1 X80.450 Y109.550 E0.71468
+G1 X80.450 Y90.450 E0.71468
+G1 E-0.8 F2400
+G1 X80.900 Y90.900 F9000
+G1 E0.8 F2400
+G1 X99.100 Y90.900 E0.68100 F4800
+G1 X99.100 Y91.350 E0.01684
+G1 X80.900 Y91.350 E0.68100
+G1 X80.900 Y91.800 E0.01684
+G1 X99.100 Y91.800 E0.68100
+G1 X99.100 Y92.250 E0.01684
+G1 X80.900 Y92.250 E0.68100
+G1 X80.900 Y92.700 E0.01684
+G1 X99.100 Y92.700 E0.68100
+G1 X99.100 Y93.150 E0.01684
+G1 X80.900 Y93.150 E0.68100
+G1 X80.900 Y93.600 E0.01684
+G1 X99.100 Y93.600 E0.68100
+G1 X99.100 Y94.050 E0.01684
+G1 X80.900 Y94.050 E0.68100
+G1 X80.900 Y94.500 E0.01684
+G1 X99.100 Y94.500 E0.68100
+G1 X99.100 Y94.950 E0.01684
+G1 X80.900 Y94.950 E0.68100
+G1 X80.900 Y95.400 E0.01684
+G1 X99.100 Y95.400 E0.68100
+G1 X99.100 Y95.850 E0.01684
+G1 X80.900 Y95.850 E0.68100
+G1 X80.900 Y96.300 E0.01684
+G1 X99.100 Y96.300 E0.68100
+G1 X99.100 Y96.750 E0.01684
+G1 X80.900 Y96.750 E0.68100
+G1 X80.900 Y97.200 E0.01684
+G1 X99.100 Y97.200 E0.68100
+G1 X99.100 Y97.650 E0.01684
+G1 X80.900 Y97.650 E0.68100
+G1 X80.900 Y98.100 E0.01684
+G1 X99.100 Y98.100 E0.68100
+G1 X99.100 Y98.550 E0.01684
+G1 X80.900 Y98.550 E0.68100
+G1 X80.900 Y99.000 E0.01684
+G1 X99.100 Y99.000 E0.68100
+G1 X99.100 Y99.450 E0.01684
+G1 X80.900 Y99.450 E0.68100
+G1 X80.900 Y99.900 E0.01684
+G1 X99.100 Y99.900 E0.68100
+G1 X99.100 Y100.350 E0.01684
+G1 X80.900 Y100.350 E0.68100
+G1 X80.900 Y100.800 E0.01684
+G1 X99.100 Y100.800 E0.68100
+G1 X99.100 Y101.250 E0.01684
+G1 X80.900 Y101.250 E0.68100
+G1 X80.900 Y101.700 E0.01684
+G1 X99.100 Y101.700 E0.68100
+G1 X99.100 Y102.150 E0.01684
+G1 X80.900 Y102.150 E0.68100
+G1 X80.900 Y102.600 E0.01684
+G1 X99.100 Y102.600 E0.68100
+G1 X99.100 Y103.050 E0.01684
+G1 X80.900 Y103.050 E0.68100
+G1 X80.900 Y103.500 E0.01684
+G1 X99.100 Y103.500 E0.68100
+G1 X99.100 Y103.950 E0.01684
+G1 X80.900 Y103.950 E0.68100
+G1 X80.900 Y104.400 E0.01684
+G1 X99.100 Y104.400 E0.68100
+G1 X99.100 Y104.850 E0.01684
+G1 X80.900 Y104.850 E0.68100
+G1 X80.900 Y105.300 E0.01684
+G1 X99.100 Y105.300 E0.68100
+G1 X99.100 Y105.750 E0.01684
+G1 X80.900 Y105.750 E0.68100
+G1 X80.900 Y106.200 E0.01684
+G1 X99.100 Y106.200 E0.68100
+G1 X99.100 Y106.650 E0.01684
+G1 X80.900 Y106.650 E0.68100
+G1 X80.900 Y107.100 E0.01684
+G1 X99.100 Y107.100 E0.68100
+G1 X99.100 Y107.550 E0.01684
+G1 X80.900 Y107.550 E0.68100
+G1 X80.900 Y108.000 E0.01684
+G1 X99.100 Y108.000 E0.68100
+G1 X99.100 Y108.450 E0.01684
+G1 X80.900 Y108.450 E0.68100
+G1 X80.900 Y108.900 E0.01684
+G1 X99.100 Y108.900 E0.68100
+G1 E-0.8 F2400
+G1 X123.000 Y100.000 F9000
+G1 E0.8 F2400
+G1 X122.989 Y100.419 E0.01567 F2400
+G1 X122.956 Y100.836 E0.01567
+G1 X122.902 Y101.251 E0.01567
+G1 X122.825 Y101.663 E0.01567
+G1 X122.727 Y102.071 E0.01567
+G1 X122.608 Y102.472 E0.01567
+G1 X122.469 Y102.867 E0.01567
+G1 X122.308 Y103.254 E0.01567
+G1 X122.128 Y103.632 E0.01567
+G1 X121.928 Y104.000 E0.01567
+G1 X121.709 Y104.357 E0.01567
+G1 X121.472 Y104.702 E0.01567
+G1 X121.217 Y105.035 E0.01567
+G1 X120.945 Y105.353 E0.01567
+G1 X120.657 Y105.657 E0.01567
+G1 X120.353 Y105.945 E0.01567
+G1 X120.035 Y106.217 E0.01567
+G1 X119.702 Y106.472 E0.01567
+G1 X119.357 Y106.709 E0.01567
+G1 X119.000 Y106.928 E0.01567
+G1 X118.632 Y107.128 E0.01567
+G1 X118.254 Y107.308 E0.01567
+G1 X117.867 Y107.469 E0.01567
+G1 X117.472 Y107.608 E0.01567
+G1 X117.071 Y107.727 E0.01567
+G1 X116.663 Y107.825 E0.01567
+G1 X116.251 Y107.902 E0.01567
+G1 X115.836 Y107.956 E0.01567
+G1 X115.419 Y107.989 E0.01567
+G1 X115.000 Y108.000 E0.01567
+G1 X114.581 Y107.989 E0.01567
+G1 X114.164 Y107.956 E0.01567
+G1 X113.749 Y107.902 E0.01567
+G1 X113.337 Y107.825 E0.01567
+G1 X112.929 Y107.727 E0.01567
+G1 X112.528 Y107.608 E0.01567
+G1 X112.133 Y107.469 E0.01567
+G1 X111.746 Y107.308 E0.01567
+G1 X111.368 Y107.128 E0.01567
+G1 X111.000 Y106.928 E0.01567
+G1 X110.643 Y106.709 E0.01567
+G1 X110.298 Y106.472 E0.01567
+G1 X109.965 Y106.217 E0.01567
+G1 X109.647 Y105.945 E0.01567
+G1 X109.343 Y105.657 E0.01567
+G1 X109.055 Y105.353 E0.01567
+G1 X108.783 Y105.035 E0.01567
+G1 X108.528 Y104.702 E0.01567
+G1 X108.291 Y104.357 E0.01567
+G1 X108.072 Y104.000 E0.01567
+G1 X107.872 Y103.632 E0.01567
+G1 X107.692 Y103.254 E0.01567
+G1 X107.531 Y102.867 E0.01567
+G1 X107.392 Y102.472 E0.01567
+G1 X107.273 Y102.071 E0.01567
+G1 X107.175 Y101.663 E0.01567
+G1 X107.098 Y101.251 E0.01567
+G1 X107.044 Y100.836 E0.01567
+G1 X107.011 Y100.419 E0.01567
+G1 X107.000 Y100.000 E0.01567
+G1 X107.011 Y99.581 E0.01567
+G1 X107.044 Y99.164 E0.01567
+G1 X107.098 Y98.749 E0.01567
+G1 X107.175 Y98.337 E0.01567
+G1 X107.273 Y97.929 E0.01567
+G1 X107.392 Y97.528 E0.01567
+G1 X107.531 Y97.133 E0.01567
+G1 X107.692 Y96.746 E0.01567
+G1 X107.872 Y96.368 E0.01567
+G1 X108.072 Y96.000 E0.01567
+G1 X108.291 Y95.643 E0.01567
+G1 X108.528 Y95.298 E0.01567
+G1 X108.783 Y94.965 E0.01567
+G1 X109.055 Y94.647 E0.01567
+G1 X109.343 Y94.343 E0.01567
+G1 X109.647 Y94.055 E0.01567
+G1 X109.965 Y93.783 E0.01567
+G1 X110.298 Y93.528 E0.01567
+G1 X110.643 Y93.291 E0.01567
+G1 X111.000 Y93.072 E0.01567
+G1 X111.368 Y92.872 E0.01567
+G1 X111.746 Y92.692 E0.01567
+G1 X112.133 Y92.531 E0.01567
+G1 X112.528 Y92.392 E0.01567
+G1 X112.929 Y92.273 E0.01567
+G1 X113.337 Y92.175 E0.01567
+G1 X113.749 Y92.098 E0.01567
+G1 X114.164 Y92.044 E0.01567
+G1 X114.581 Y92.011 E0.01567
+G1 X115.000 Y92.000 E0.01567
+G1 X115.419 Y92.011 E0.01567
+G1 X115.836 Y92.044 E0.01567
+G1 X116.251 Y92.098 E0.01567
+G1 X116.663 Y92.175 E0.01567
+G1 X117.071 Y92.273 E0.01567
+G1 X117.472 Y92.392 E0.01567
+G1 X117.867 Y92.531 E0.01567
+G1 X118.254 Y92.692 E0.01567
+G1 X118.632 Y92.872 E0.01567
+G1 X119.000 Y93.072 E0.01567
+G1 X119.357 Y93.291 E0.01567
+G1 X119.702 Y93.528 E0.01567
+G1 X120.035 Y93.783 E0.01567
+G1 X120.353 Y94.055 E0.01567
+G1 X120.657 Y94.343 E0.01567
+G1 X120.945 Y94.647 E0.01567
+G1 X121.217 Y94.965 E0.01567
+G1 X121.472 Y95.298 E0.01567
+G1 X121.709 Y95.643 E0.01567
+G1 X121.928 Y96.000 E0.01567
+G1 X122.128 Y96.368 E0.01567
+G1 X122.308 Y96.746 E0.01567
+G1 X122.469 Y97.133 E0.01567
+G1 X122.608 Y97.528 E0.01567
+G1 X122.727 Y97.929 E0.01567
+G1 X122.825 Y98.337 E0.01567
+G1 X122.902 Y98.749 E0.01567
+G1 X122.956 Y99.164 E0.01567
+G1 X122.989 Y99.581 E0.01567
+G1 X123.000 Y100.000 E0.01567
+G1 E-0.8 F2400
+G1 X122.550 Y100.000 F9000
+G1 E0.8 F2400
+G1 X122.540 Y100.395 E0.01479 F2400
+G1 X122.509 Y100.789 E0.01479
+G1 X122.457 Y101.181 E0.01479
+G1 X122.385 Y101.570 E0.01479
+G1 X122.293 Y101.954 E0.01479
+G1 X122.180 Y102.333 E0.01479
+G1 X122.049 Y102.706 E0.01479
+G1 X121.897 Y103.071 E0.01479
+G1 X121.727 Y103.428 E0.01479
+G1 X121.538 Y103.775 E0.01479
+G1 X121.332 Y104.112 E0.01479
+G1 X121.108 Y104.438 E0.01479
+G1 X120.867 Y104.751 E0.01479
+G1 X120.611 Y105.052 E0.01479
+G1 X120.339 Y105.339 E0.01479
+G1 X120.052 Y105.611 E0.01479
+G1 X119.751 Y105.867 E0.01479
+G1 X119.438 Y106.108 E0.01479
+G1 X119.112 Y106.332 E0.01479
+G1 X118.775 Y106.538 E0.01479
+G1 X118.428 Y106.727 E0.01479
+G1 X118.071 Y106.897 E0.01479
+G1 X117.706 Y107.049 E0.01479
+G1 X117.333 Y107.180 E0.01479
+G1 X116.954 Y107.293 E0.01479
+G1 X116.570 Y107.385 E0.01479
+G1 X116.181 Y107.457 E0.01479
+G1 X115.789 Y107.509 E0.01479
+G1 X115.395 Y107.540 E0.01479
+G1 X115.000 Y107.550 E0.01479
+G1 X114.605 Y107.540 E0.01479
+G1 X114.211 Y107.509 E0.01479
+G1 X113.819 Y107.457 E0.01479
+G1 X113.430 Y107.385 E0.01479
+G1 X113.046 Y107.293 E0.01479
+G1 X112.667 Y107.180 E0.01479
+G1 X112.294 Y107.049 E0.01479
+G1 X111.929 Y106.897 E0.01479
+G1 X111.572 Y106.727 E0.01479
+G1 X111.225 Y106.538 E0.01479
+G1 X110.888 Y106.332 E0.01479
+G1 X110.562 Y106.108 E0.01479
+G1 X110.249 Y105.867 E0.01479
+G1 X109.948 Y105.611 E0.01479
+G1 X109.661 Y105.339 E0.01479
+G1 X109.389 Y105.052 E0.01479
+G1 X109.133 Y104.751 E0.01479
+G1 X108.892 Y104.438 E0.01479
+G1 X108.668 Y104.112 E0.01479
+G1 X108.462 Y103.775 E0.01479
+G1 X108.273 Y103.428 E0.01479
+G1 X108.103 Y103.071 E0.01479
+G1 X107.951 Y102.706 E0.01479
+G1 X107.820 Y102.333 E0.01479
+G1 X107.707 Y101.954 E0.01479
+G1 X107.615 Y101.570 E0.01479
+G1 X107.543 Y101.181 E0.01479
+G1 X107.491 Y100.789 E0.01479
+G1 X107.460 Y100.395 E0.01479
+G1 X107.450 Y100.000 E0.01479
+G1 X107.460 Y99.605 E0.01479
+G1 X107.491 Y99.211 E0.01479
+G1 X107.543 Y98.819 E0.01479
+G1 X107.615 Y98.430 E0.01479
+G1 X107.707 Y98.046 E0.01479
+G1 X107.820 Y97.667 E0.01479
+G1 X107.951 Y97.294 E0.01479
+G1 X108.103 Y96.929 E0.01479
+G1 X108.273 Y96.572 E0.01479
+G1 X108.462 Y96.225 E0.01479
+G1 X108.668 Y95.888 E0.01479
+G1 X108.892 Y95.562 E0.01479
+G1 X109.133 Y95.249 E0.01479
+G1 X109.389 Y94.948 E0.01479
+G1 X109.661 Y94.661 E0.01479
+G1 X109.948 Y94.389 E0.01479
+G1 X110.249 Y94.133 E0.01479
+G1 X110.562 Y93.892 E0.01479
+G1 X110.888 Y93.668 E0.01479
+G1 X111.225 Y93.462 E0.01479
+G1 X111.572 Y93.273 E0.01479
+G1 X111.929 Y93.103 E0.01479
+G1 X112.294 Y92.951 E0.01479
+G1 X112.667 Y92.820 E0.01479
+G1 X113.046 Y92.707 E0.01479
+G1 X113.430 Y92.615 E0.01479
+G1 X113.819 Y92.543 E0.01479
+G1 X114.211 Y92.491 E0.01479
+G1 X114.605 Y92.460 E0.01479
+G1 X115.000 Y92.450 E0.01479
+G1 X115.395 Y92.460 E0.01479
+G1 X115.789 Y92.491 E0.01479
+G1 X116.181 Y92.543 E0.01479
+G1 X116.570 Y92.615 E0.01479
+G1 X116.954 Y92.707 E0.01479
+G1 X117.333 Y92.820 E0.01479
+G1 X117.706 Y92.951 E0.01479
+G1 X118.071 Y93.103 E0.01479
+G1 X118.428 Y93.273 E0.01479
+G1 X118.775 Y93.462 E0.01479
+G1 X119.112 Y93.668 E0.01479
+G1 X119.438 Y93.892 E0.01479
+G1 X119.751 Y94.133 E0.01479
+G1 X120.052 Y94.389 E0.01479
+G1 X120.339 Y94.661 E0.01479
+G1 X120.611 Y94.948 E0.01479
+G1 X120.867 Y95.249 E0.01479
+G1 X121.108 Y95.562 E0.01479
+G1 X121.332 Y95.888 E0.01479
+G1 X121.538 Y96.225 E0.01479
+G1 X121.727 Y96.572 E0.01479
+G1 X121.897 Y96.929 E0.01479
+G1 X122.049 Y97.294 E0.01479
+G1 X122.180 Y97.667 E0.01479
+G1 X122.293 Y98.046 E0.01479
+G1 X122.385 Y98.430 E0.01479
+G1 X122.457 Y98.819 E0.01479
+G1 X122.509 Y99.211 E0.01479
+G1 X122.540 Y99.605 E0.01479
+G1 X122.550 Y100.000 E0.01479
+G1 E-0.8 F2400
+G1 X123.900 Y100.000 F9000
+G1 E0.8 F2400
+G3 X106.100 Y100.000 I-8.900 J0 E1.04620 F2400
+G3 X123.900 Y100.000 I8.900 J0 E1.04620
+;LAYER:6
+G1 Z1.400 F1200
+G1 E-0.8 F2400
+G1 X80.000 Y90.000 F9000
+G1 E0.8 F2400
+G1 X100.000 Y90.000 E0.74835 F2400
+G1 X100.000 Y110.000 E0.74835
+G1 X80.000 Y110.000 E0.74835
+G1 X80.000 Y90.000 E0.74835
+G1 E-0.8 F2400
+G1 X80.450 Y90.450 F9000
+G1 E0.8 F2400
+G1 X99.550 Y90.450 E0.71468 F2400
+G1 X99.550 Y109.550 E0.71468
+G1 X80.450 Y109.550 E0.71468
+G1 X80.450 Y90.450 E0.71468
+G1 E-0.8 F2400
+G1 X80.900 Y90.900 F9000
+G1 E0.8 F2400
+G1 X99.100 Y90.900 E0.68100 F4800
+G1 X99.100 Y91.350 E0.01684
+G1 X80.900 Y91.350 E0.68100
+G1 X80.900 Y91.800 E0.01684
+G1 X99.100 Y91.800 E0.68100
+G1 X99.100 Y92.250 E0.01684
+G1 X80.900 Y92.250 E0.68100
+G1 X80.900 Y92.700 E0.01684
+G1 X99.100 Y92.700 E0.68100
+G1 X99.100 Y93.150 E0.01684
+G1 X80.900 Y93.150 E0.68100
+G1 X80.900 Y93.600 E0.01684
+G1 X99.100 Y93.600 E0.68100
+G1 X99.100 Y94.050 E0.01684
+G1 X80.900 Y94.050 E0.68100
+G1 X80.900 Y94.500 E0.01684
+G1 X99.100 Y94.500 E0.68100
+G1 X99.100 Y94.950 E0.01684
+G1 X80.900 Y94.950 E0.68100
+G1 X80.900 Y95.400 E0.01684
+G1 X99.100 Y95.400 E0.68100
+G1 X99.100 Y95.850 E0.01684
+G1 X80.900 Y95.850 E0.68100
+G1 X80.900 Y96.300 E0.01684
+G1 X99.100 Y96.300 E0.68100
+G1 X99.100 Y96.750 E0.01684
+G1 X80.900 Y96.750 E0.68100
+G1 X80.900 Y97.200 E0.01684
+G1 X99.100 Y97.200 E0.68100
+G1 X99.100 Y97.650 E0.01684
+G1 X80.900 Y97.650 E0.68100
+G1 X80.900 Y98.100 E0.01684
+G1 X99.100 Y98.100 E0.68100
+G1 X99.100 Y98.550 E0.01684
+G1 X80.900 Y98.550 E0.68100
+G1 X80.900 Y99.000 E0.01684
+G1 X99.100 Y99.000 E0.68100
+G1 X99.100 Y99.450 E0.01684
+G1 X80.900 Y99.450 E0.68100
+G1 X80.900 Y99.900 E0.01684
+G1 X99.100 Y99.900 E0.68100
+G1 X99.100 Y100.350 E0.01684
+G1 X80.900 Y100.350 E0.68100
+G1 X80.900 Y100.800 E0.01684
+G1 X99.100 Y100.800 E0.68100
+G1 X99.100 Y101.250 E0.01684
+G1 X80.900 Y101.250 E0.68100
+G1 X80.900 Y101.700 E0.01684
+G1 X99.100 Y101.700 E0.68100
+G1 X99.100 Y102.150 E0.01684
+G1 X80.900 Y102.150 E0.68100
+G1 X80.900 Y102.600 E0.01684
+G1 X99.100 Y102.600 E0.68100
+G1 X99.100 Y103.050 E0.01684
+G1 X80.900 Y103.050 E0.68100
+G1 X80.900 Y103.500 E0.01684
+G1 X99.100 Y103.500 E0.68100
+G1 X99.100 Y103.950 E0.01684
+G1 X80.900 Y103.950 E0.68100
+G1 X80.900 Y104.400 E0.01684
+G1 X99.100 Y104.400 E0.68100
+G1 X99.100 Y104.850 E0.01684
+G1 X80.900 Y104.850 E0.68100
+G1 X80.900 Y105.300 E0.01684
+G1 X99.100 Y105.300 E0.68100
+G1 X99.100 Y105.750 E0.01684
+G1 X80.900 Y105.750 E0.68100
+G1 X80.900 Y106.200 E0.01684
+G1 X99.100 Y106.200 E0.68100
+G1 X99.100 Y106.650 E0.01684
+G1 X80.900 Y106.650 E0.68100
+G1 X80.900 Y107.100 E0.01684
+G1 X99.100 Y107.100 E0.68100
+G1 X99.100 Y107.550 E0.01684
+G1 X80.900 Y107.550 E0.68100
+G1 X80.900 Y108.000 E0.01684
+G1 X99.100 Y108.000 E0.68100
+G1 X99.100 Y108.450 E0.01684
+G1 X80.900 Y108.450 E0.68100
+G1 X80.900 Y108.900 E0.01684
+G1 X99.100 Y108.900 E0.68100
+G1 E-0.8 F2400
+G1 X123.000 Y100.000 F9000
+G1 E0.8 F2400
+G1 X122.989 Y100.419 E0.01567 F2400
+G1 X122.956 Y100.836 E0.01567
+G1 X122.902 Y101.251 E0.01567
+G1 X122.825 Y101.663 E0.01567
+G1 X122.727 Y102.071 E0.01567
+G1 X122.608 Y102.472 E0.01567
+G1 X122.469 Y102.867 E0.01567
+G1 X122.308 Y103.254 E0.01567
+G1 X122.128 Y103.632 E0.01567
+G1 X121.928 Y104.000 E0.01567
+G1 X121.709 Y104.357 E0.01567
+G1 X121.472 Y104.702 E0.01567
+G1 X121.217 Y105.035 E0.01567
+G1 X120.945 Y105.353 E0.01567
+G1 X120.657 Y105.657 E0.01567
+G1 X120.353 Y105.945 E0.01567
+G1 X120.035 Y106.217 E0.01567
+G1 X119.702 Y106.472 E0.01567
+G1 X119.357 Y106.709 E0.01567
+G1 X119.000 Y106.928 E0.01567
+G1 X118.632 Y107.128 E0.01567
+G1 X118.254 Y107.308 E0.01567
+G1 X117.867 Y107.469 E0.01567
+G1 X117.472 Y107.608 E0.01567
+G1 X117.071 Y107.727 E0.01567
+G1 X116.663 Y107.825 E0.01567
+G1 X116.251 Y107.902 E0.01567
+G1 X115.836 Y107.956 E0.01567
+G1 X115.419 Y107.989 E0.01567
+G1 X115.000 Y108.000 E0.01567
+G1 X114.581 Y107.989 E0.01567
+G1 X114.164 Y107.956 E0.01567
+G1 X113.749 Y107.902 E0.01567
+G1 X113.337 Y107.825 E0.01567
+G1 X112.929 Y107.727 E0.01567
+G1 X112.528 Y107.608 E0.01567
+G1 X112.133 Y107.469 E0.01567
+G1 X111.746 Y107.308 E0.01567
+G1 X111.368 Y107.128 E0.01567
+G1 X111.000 Y106.928 E0.01567
+G1 X110.643 Y106.709 E0.01567
+G1 X110.298 Y106.472 E0.01567
+G1 X109.965 Y106.217 E0.01567
+G1 X109.647 Y105.945 E0.01567
+G1 X109.343 Y105.657 E0.01567
+G1 X109.055 Y105.353 E0.01567
+G1 X108.783 Y105.035 E0.01567
+G1 X108.528 Y104.702 E0.01567
+G1 X108.291 Y104.357 E0.01567
+G1 X108.072 Y104.000 E0.01567
+G1 X107.872 Y103.632 E0.01567
+G1 X107.692 Y103.254 E0.01567
+G1 X107.531 Y102.867 E0.01567
+G1 X107.392 Y102.472 E0.01567
+G1 X107.273 Y102.071 E0.01567
+G1 X107.175 Y101.663 E0.01567
+G1 X107.098 Y101.251 E0.01567
+G1 X107.044 Y100.836 E0.01567
+G1 X107.011 Y100.419 E0.01567
+G1 X107.000 Y100.000 E0.01567
+G1 X107.011 Y99.581 E0.01567
+G1 X107.044 Y99.164 E0.01567
+G1 X107.098 Y98.749 E0.01567
+G1 X107.175 Y98.337 E0.01567
+G1 X107.273 Y97.929 E0.01567
+G1 X107.392 Y97.528 E0.01567
+G1 X107.531 Y97.133 E0.01567
+G1 X107.692 Y96.746 E0.01567
+G1 X107.872 Y96.368 E0.01567
+G1 X108.072 Y96.000 E0.01567
+G1 X108.291 Y95.643 E0.01567
+G1 X108.528 Y95.298 E0.01567
+G1 X108.783 Y94.965 E0.01567
+G1 X109.055 Y94.647 E0.01567
+G1 X109.343 Y94.343 E0.01567
+G1 X109.647 Y94.055 E0.01567
+G1 X109.965 Y93.783 E0.01567
+G1 X110.298 Y93.528 E0.01567
+G1 X110.643 Y93.291 E0.01567
+G1 X111.000 Y93.072 E0.01567
+G1 X111.368 Y92.872 E0.01567
+G1 X111.746 Y92.692 E0.01567
+G1 X112.133 Y92.531 E0.01567
+G1 X112.528 Y92.392 E0.01567
+G1 X112.929 Y92.273 E0.01567
+G1 X113.337 Y92.175 E0.01567
+G1 X113.749 Y92.098 E0.01567
+G1 X114.164 Y92.044 E0.01567
+G1 X114.581 Y92.011 E0.01567
+G1 X115.000 Y92.000 E0.01567
+G1 X115.419 Y92.011 E0.01567
+G1 X115.836 Y92.044 E0.01567
+G1 X116.251 Y92.098 E0.01567
+G1 X116.663 Y92.175 E0.01567
+G1 X117.071 Y92.273 E0.01567
+G1 X117.472 Y92.392 E0.01567
+G1 X117.867 Y92.531 E0.01567
+G1 X118.254 Y92.692 E0.01567
+G1 X118.632 Y92.872 E0.01567
+G1 X119.000 Y93.072 E0.01567
+G1 X119.357 Y93.291 E0.01567
+G1 X119.702 Y93.528 E0.01567
+G1 X120.035 Y93.783 E0.01567
+G1 X120.353 Y94.055 E0.01567
+G1 X120.657 Y94.343 E0.01567
+G1 X120.945 Y94.647 E0.01567
+G1 X121.217 Y94.965 E0.01567
+G1 X121.472 Y95.298 E0.01567
+G1 X121.709 Y95.643 E0.01567
+G1 X121.928 Y96.000 E0.01567
+G1 X122.128 Y96.368 E0.01567
+G1 X122.308 Y96.746 E0.01567
+G1 X122.469 Y97.133 E0.01567
+G1 X122.608 Y97.528 E0.01567
+G1 X122.727 Y97.929 E0.01567
+G1 X122.825 Y98.337 E0.01567
+G1 X122.902 Y98.749 E0.01567
+G1 X122.956 Y99.164 E0.01567
+G1 X122.989 Y99.581 E0.01567
+G1 X123.000 Y100.000 E0.01567
+G1 E-0.8 F2400
+G1 X122.550 Y100.000 F9000
+G1 E0.8 F2400
+G1 X122.540 Y100.395 E0.01479 F2400
+G1 X122.509 Y100.789 E0.01479
+G1 X122.457 Y101.181 E0.01479
+G1 X122.385 Y101.570 E0.01479
+G1 X122.293 Y101.954 E0.01479
+G1 X122.180 Y102.333 E0.01479
+G1 X122.049 Y102.706 E0.01479
+G1 X121.897 Y103.071 E0.01479
+G1 X121.727 Y103.428 E0.01479
+G1 X121.538 Y103.775 E0.01479
+G1 X121.332 Y104.112 E0.01479
+G1 X121.108 Y104.438 E0.01479
+G1 X120.867 Y104.751 E0.01479
+G1 X120.611 Y105.052 E0.01479
+G1 X120.339 Y105.339 E0.01479
+G1 X120.052 Y105.611 E0.01479
+G1 X119.751 Y105.867 E0.01479
+G1 X119.438 Y106.108 E0.01479
+G1 X119.112 Y106.332 E0.01479
+G1 X118.775 Y106.538 E0.01479
+G1 X118.428 Y106.727 E0.01479
+G1 X118.071 Y106.897 E0.01479
+G1 X117.706 Y107.049 E0.01479
+G1 X117.333 Y107.180 E0.01479
+G1 X116.954 Y107.293 E0.01479
+G1 X116.570 Y107.385 E0.01479
+G1 X116.181 Y107.457 E0.01479
+G1 X115.789 Y107.509 E0.01479
+G1 X115.395 Y107.540 E0.01479
+G1 X115.000 Y107.550 E0.01479
+G1 X114.605 Y107.540 E0.01479
+G1 X114.211 Y107.509 E0.01479
+G1 X113.819 Y107.457 E0.01479
+G1 X113.430 Y107.385 E0.01479
+G1 X113.046 Y107.293 E0.01479
+G1 X112.667 Y107.180 E0.01479
+G1 X112.294 Y107.049 E0.01479
+G1 X111.929 Y106.897 E0.01479
+G1 X111.572 Y106.727 E0.01479
+G1 X111.225 Y106.538 E0.01479
+G1 X110.888 Y106.332 E0.01479
+G1 X110.562 Y106.108 E0.01479
+G1 X110.249 Y105.867 E0.01479
+G1 X109.948 Y105.611 E0.01479
+G1 X109.661 Y105.339 E0.01479
+G1 X109.389 Y105.052 E0.01479
+G1 X109.133 Y104.751 E0.01479
+G1 X108.892 Y104.438 E0.01479
+G1 X108.668 Y104.112 E0.01479
+G1 X108.462 Y103.775 E0.01479
+G1 X108.273 Y103.428 E0.01479
+G1 X108.103 Y103.071 E0.01479
+G1 X107.951 Y102.706 E0.01479
+G1 X107.820 Y102.333 E0.01479
+G1 X107.707 Y101.954 E0.01479
+G1 X107.615 Y101.570 E0.01479
+G1 X107.543 Y101.181 E0.01479
+G1 X107.491 Y100.789 E0.01479
+G1 X107.460 Y100.395 E0.01479
+G1 X107.450 Y100.000 E0.01479
+G1 X107.460 Y99.605 E0.01479
+G1 X107.491 Y99.211 E0.01479
+G1 X107.543 Y98.819 E0.01479
+G1 X107.615 Y98.430 E0.01479
+G1 X107.707 Y98.046 E0.01479
+G1 X107.820 Y97.667 E0.01479
+G1 X107.951 Y97.294 E0.01479
+G1 X108.103 Y96.929 E0.01479
+G1 X108.273 Y96.572 E0.01479
+G1 X108.462 Y96.225 E0.01479
+G1 X108.668 Y95.888 E0.01479
+G1 X108.892 Y95.562 E0.01479
+G1 X109.133 Y95.249 E0.01479
+G1 X109.389 Y94.948 E0.01479
+G1 X109.661 Y94.661 E0.01479
+G1 X109.948 Y94.389 E0.01479
+G1 X110.249 Y94.133 E0.01479
+G1 X110.562 Y93.892 E0.01479
+G1 X110.888 Y93.668 E0.01479
+G1 X111.225 Y93.462 E0.01479
+G1 X111.572 Y93.273 E0.01479
+G1 X111.929 Y93.103 E0.01479
+G1 X112.294 Y92.951 E0.01479
+G1 X112.667 Y92.820 E0.01479
+G1 X113.046 Y92.707 E0.01479
+G1 X113.430 Y92.615 E0.01479
+G1 X113.819 Y92.543 E0.01479
+G1 X114.211 Y92.491 E0.01479
+G1 X114.605 Y92.460 E0.01479
+G1 X115.000 Y92.450 E0.01479
+G1 X115.395 Y92.460 E0.01479
+G1 X115.789 Y92.491 E0.01479
+G1 X116.181 Y92.543 E0.01479
+G1 X116.570 Y92.615 E0.01479
+G1 X116.954 Y92.707 E0.01479
+G1 X117.333 Y92.820 E0.01479
+G1 X117.706 Y92.951 E0.01479
+G1 X118.071 Y93.103 E0.01479
+G1 X118.428 Y93.273 E0.01479
+G1 X118.775 Y93.462 E0.01479
+G1 X119.112 Y93.668 E0.01479
+G1 X119.438 Y93.892 E0.01479
+G1 X119.751 Y94.133 E0.01479
+G1 X120.052 Y94.389 E0.01479
+G1 X120.339 Y94.661 E0.01479
+G1 X120.611 Y94.948 E0.01479
+G1 X120.867 Y95.249 E0.01479
+G1 X121.108 Y95.562 E0.01479
+G1 X121.332 Y95.888 E0.01479
+G1 X121.538 Y96.225 E0.01479
+G1 X121.727 Y96.572 E0.01479
+G1 X121.897 Y96.929 E0.01479
+G1 X122.049 Y97.294 E0.01479
+G1 X122.180 Y97.667 E0.01479
+G1 X122.293 Y98.046 E0.01479
+G1 X122.385 Y98.430 E0.01479
+G1 X122.457 Y98.819 E0.01479
+G1 X122.509 Y99.211 E0.01479
+G1 X122.540 Y99.605 E0.01479
+G1 X122.550 Y100.000 E0.01479
+G1 E-0.8 F2400
+G1 X123.900 Y100.000 F9000
+G1 E0.8 F2400
+G3 X106.100 Y100.000 I-8.900 J0 E1.04620 F2400
+G3 X123.900 Y100.000 I8.900 J0 E1.04620
+;LAYER:7
+G1 Z1.600 F1200
+G1 E-0.8 F2400
+G1 X80.000 Y90.000 F9000
+G1 E0.8 F2400
+G1 X100.000 Y90.000 E0.74835 F2400
+G1 X100.000 Y110.000 E0.74835
+G1 X80.000 Y110.000 E0.74835
+G1 X80.000 Y90.000 E0.74835
+G1 E-0.8 F2400
+G1 X80.450 Y90.450 F9000
+G1 E0.8 F2400
+G1 X99.550 Y90.450 E0.71468 F2400
+G1 X99.550 Y109.550 E0.71468
+G1 X80.450 Y109.550 E0.71468
+G1 X80.450 Y90.450 E0.71468
+G1 E-0.8 F2400
+G1 X80.900 Y90.900 F9000
+G1 E0.8 F2400
+G1 X99.100 Y90.900 E0.68100 F4800
+G1 X99.100 Y91.350 E0.01684
+G1 X80.900 Y91.350 E0.68100
+G1 X80.900 Y91.800 E0.01684
+G1 X99.100 Y91.800 E0.68100
+G1 X99.100 Y92.250 E0.01684
+G1 X80.900 Y92.250 E0.68100
+G1 X80.900 Y92.700 E0.01684
+G1 X99.100 Y92.700 E0.68100
+G1 X99.100 Y93.150 E0.01684
+G1 X80.900 Y93.150 E0.68100
+G1 X80.900 Y93.600 E0.01684
+G1 X99.100 Y93.600 E0.68100
+G1 X99.100 Y94.050 E0.01684
+G1 X80.900 Y94.050 E0.68100
+G1 X80.900 Y94.500 E0.01684
+G1 X99.100 Y94.500 E0.68100
+G1 X99.100 Y94.950 E0.01684
+G1 X80.900 Y94.950 E0.68100
+G1 X80.900 Y95.400 E0.01684
+G1 X99.100 Y95.400 E0.68100
+G1 X99.100 Y95.850 E0.01684
+G1 X80.900 Y95.850 E0.68100
+G1 X80.900 Y96.300 E0.01684
+G1 X99.100 Y96.300 E0.68100
+G1 X99.100 Y96.750 E0.01684
+G1 X80.900 Y96.750 E0.68100
+G1 X80.900 Y97.200 E0.01684
+G1 X99.100 Y97.200 E0.68100
+G1 X99.100 Y97.650 E0.01684
+G1 X80.900 Y97.650 E0.68100
+G1 X80.900 Y98.100 E0.01684
+G1 X99.100 Y98.100 E0.68100
+G1 X99.100 Y98.550 E0.01684
+G1 X80.900 Y98.550 E0.68100
+G1 X80.900 Y99.000 E0.01684
+G1 X99.100 Y99.000 E0.68100
+G1 X99.100 Y99.450 E0.01684
+G1 X80.900 Y99.450 E0.68100
+G1 X80.900 Y99.900 E0.01684
+G1 X99.100 Y99.900 E0.68100
+G1 X99.100 Y100.350 E0.01684
+G1 X80.900 Y100.350 E0.68100
+G1 X80.900 Y100.800 E0.01684
+G1 X99.100 Y100.800 E0.68100
+G1 X99.100 Y101.250 E0.01684
+G1 X80.900 Y101.250 E0.68100
+G1 X80.900 Y101.700 E0.01684
+G1 X99.100 Y101.700 E0.68100
+G1 X99.100 Y102.150 E0.01684
+G1 X80.900 Y102.150 E0.68100
+G1 X80.900 Y102.600 E0.01684
+G1 X99.100 Y102.600 E0.68100
+G1 X99.100 Y103.050 E0.01684
+G1 X80.900 Y103.050 E0.68100
+G1 X80.900 Y103.500 E0.01684
+G1 X99.100 Y103.500 E0.68100
+G1 X99.100 Y103.950 E0.01684
+G1 X80.900 Y103.950 E0.68100
+G1 X80.900 Y104.400 E0.01684
+G1 X99.100 Y104.400 E0.68100
+G1 X99.100 Y104.850 E0.01684
+G1 X80.900 Y104.850 E0.68100
+G1 X80.900 Y105.300 E0.01684
+G1 X99.100 Y105.300 E0.68100
+G1 X99.100 Y105.750 E0.01684
+G1 X80.900 Y105.750 E0.68100
+G1 X80.900 Y106.200 E0.01684
+G1 X99.100 Y106.200 E0.68100
+G1 X99.100 Y106.650 E0.01684
+G1 X80.900 Y106.650 E0.68100
+G1 X80.900 Y107.100 E0.01684
+G1 X99.100 Y107.100 E0.68100
+G1 X99.100 Y107.550 E0.01684
+G1 X80.900 Y107.550 E0.68100
+G1 X80.900 Y108.000 E0.01684
+G1 X99.100 Y108.000 E0.68100
+G1 X99.100 Y108.450 E0.01684
+G1 X80.900 Y108.450 E0.68100
+G1 X80.900 Y108.900 E0.01684
+G1 X99.100 Y108.900 E0.68100
+G1 E-0.8 F2400
+G1 X123.000 Y100.000 F9000
+G1 E0.8 F2400
+G1 X122.989 Y100.419 E0.01567 F2400
+G1 X122.956 Y100.836 E0.01567
+G1 X122.902 Y101.251 E0.01567
+G1 X122.825 Y101.663 E0.01567
+G1 X122.727 Y102.071 E0.01567
+G1 X122.608 Y102.472 E0.01567
+G1 X122.469 Y102.867 E0.01567
+G1 X122.308 Y103.254 E0.01567
+G1 X122.128 Y103.632 E0.01567
+G1 X121.928 Y104.000 E0.01567
+G1 X121.709 Y104.357 E0.01567
+G1 X121.472 Y104.702 E0.01567
+G1 X121.217 Y105.035 E0.01567
+G1 X120.945 Y105.353 E0.01567
+G1 X120.657 Y105.657 E0.01567
+G1 X120.353 Y105.945 E0.01567
+G1 X120.035 Y106.217 E0.01567
+G1 X119.702 Y106.472 E0.01567
+G1 X119.357 Y106.709 E0.01567
+G1 X119.000 Y106.928 E0.01567
+G1 X118.632 Y107.128 E0.01567
+G1 X118.254 Y107.308 E0.01567
+G1 X117.867 Y107.469 E0.01567
+G1 X117.472 Y107.608 E0.01567
+G1 X117.071 Y107.727 E0.01567
+G1 X116.663 Y107.825 E0.01567
+G1 X116.251 Y107.902 E0.01567
+G1 X115.836 Y107.956 E0.01567
+G1 X115.419 Y107.989 E0.01567
+G1 X115.000 Y108.000 E0.01567
+G1 X114.581 Y107.989 E0.01567
+G1 X114.164 Y107.956 E0.01567
+G1 X113.749 Y107.902 E0.01567
+G1 X113.337 Y107.825 E0.01567
+G1 X112.929 Y107.727 E0.01567
+G1 X112.528 Y107.608 E0.01567
+G1 X112.133 Y107.469 E0.01567
+G1 X111.746 Y107.308 E0.01567
+G1 X111.368 Y107.128 E0.01567
+G1 X111.000 Y106.928 E0.01567
+G1 X110.643 Y106.709 E0.01567
+G1 X110.298 Y106.472 E0.01567
+G1 X109.965 Y106.217 E0.01567
+G1 X109.647 Y105.945 E0.01567
+G1 X109.343 Y105.657 E0.01567
+G1 X109.055 Y105.353 E0.01567
+G1 X108.783 Y105.035 E0.01567
+G1 X108.528 Y104.702 E0.01567
+G1 X108.291 Y104.357 E0.01567
+G1 X108.072 Y104.000 E0.01567
+G1 X107.872 Y103.632 E0.01567
+G1 X107.692 Y103.254 E0.01567
+G1 X107.531 Y102.867 E0.01567
+G1 X107.392 Y102.472 E0.01567
+G1 X107.273 Y102.071 E0.01567
+G1 X107.175 Y101.663 E0.01567
+G1 X107.098 Y101.251 E0.01567
+G1 X107.044 Y100.836 E0.01567
+G1 X107.011 Y100.419 E0.01567
+G1 X107.000 Y100.000 E0.01567
+G1 X107.011 Y99.581 E0.01567
+G1 X107.044 Y99.164 E0.01567
+G1 X107.098 Y98.749 E0.01567
+G1 X107.175 Y98.337 E0.01567
+G1 X107.273 Y97.929 E0.01567
+G1 X107.392 Y97.528 E0.01567
+G1 X107.531 Y97.133 E0.01567
+G1 X107.692 Y96.746 E0.01567
+G1 X107.872 Y96.368 E0.01567
+G1 X108.072 Y96.000 E0.01567
+G1 X108.291 Y95.643 E0.01567
+G1 X108.528 Y95.298 E0.01567
+G1 X108.783 Y94.965 E0.01567
+G1 X109.055 Y94.647 E0.01567
+G1 X109.343 Y94.343 E0.01567
+G1 X109.647 Y94.055 E0.01567
+G1 X109.965 Y93.783 E0.01567
+G1 X110.298 Y93.528 E0.01567
+G1 X110.643 Y93.291 E0.01567
+G1 X111.000 Y93.072 E0.01567
+G1 X111.368 Y92.872 E0.01567
+G1 X111.746 Y92.692 E0.01567
+G1 X112.133 Y92.531 E0.01567
+G1 X112.528 Y92.392 E0.01567
+G1 X112.929 Y92.273 E0.01567
+G1 X113.337 Y92.175 E0.01567
+G1 X113.749 Y92.098 E0.01567
+G1 X114.164 Y92.044 E0.01567
+G1 X114.581 Y92.011 E0.01567
+G1 X115.000 Y92.000 E0.01567
+G1 X115.419 Y92.011 E0.01567
+G1 X115.836 Y92.044 E0.01567
+G1 X116.251 Y92.098 E0.01567
+G1 X116.663 Y92.175 E0.01567
+G1 X117.071 Y92.273 E0.01567
+G1 X117.472 Y92.392 E0.01567
+G1 X117.867 Y92.531 E0.01567
+G1 X118.254 Y92.692 E0.01567
+G1 X118.632 Y92.872 E0.01567
+G1 X119.000 Y93.072 E0.01567
+G1 X119.357 Y93.291 E0.01567
+G1 X119.702 Y93.528 E0.01567
+G1 X120.035 Y93.783 E0.01567
+G1 X120.353 Y94.055 E0.01567
+G1 X120.657 Y94.343 E0.01567
+G1 X120.945 Y94.647 E0.01567
+G1 X121.217 Y94.965 E0.01567
+G1 X121.472 Y95.298 E0.01567
+G1 X121.709 Y95.643 E0.01567
+G1 X121.928 Y96.000 E0.01567
+G1 X122.128 Y96.368 E0.01567
+G1 X122.308 Y96.746 E0.01567
+G1 X122.469 Y97.133 E0.01567
+G1 X122.608 Y97.528 E0.01567
+G1 X122.727 Y97.929 E0.01567
+G1 X122.825 Y98.337 E0.01567
+G1 X122.902 Y98.749 E0.01567
+G1 X122.956 Y99.164 E0.01567
+G1 X122.989 Y99.581 E0.01567
+G1 X123.000 Y100.000 E0.01567
+G1 E-0.8 F2400
+G1 X122.550 Y100.000 F9000
+G1 E0.8 F2400
+G1 X122.540 Y100.395 E0.01479 F2400
+G1 X122.509 Y100.789 E0.01479
+G1 X122.457 Y101.181 E0.01479
+G1 X122.385 Y101.570 E0.01479
+G1 X122.293 Y101.954 E0.01479
+G1 X122.180 Y102.333 E0.01479
+G1 X122.049 Y102.706 E0.01479
+G1 X121.897 Y103.071 E0.01479
+G1 X121.727 Y103.428 E0.01479
+G1 X121.538 Y103.775 E0.01479
+G1 X121.332 Y104.112 E0.01479
+G1 X121.108 Y104.438 E0.01479
+G1 X120.867 Y104.751 E0.01479
+G1 X120.611 Y105.052 E0.01479
+G1 X120.339 Y105.339 E0.01479
+G1 X120.052 Y105.611 E0.01479
+G1 X119.751 Y105.867 E0.01479
+G1 X119.438 Y106.108 E0.01479
+G1 X119.112 Y106.332 E0.01479
+G1 X118.775 Y106.538 E0.01479
+G1 X118.428 Y106.727 E0.01479
+G1 X118.071 Y106.897 E0.01479
+G1 X117.706 Y107.049 E0.01479
+G1 X117.333 Y107.180 E0.01479
+G1 X116.954 Y107.293 E0.01479
+G1 X116.570 Y107.385 E0.01479
+G1 X116.181 Y107.457 E0.01479
+G1 X115.789 Y107.509 E0.01479
+G1 X115.395 Y107.540 E0.01479
+G1 X115.000 Y107.550 E0.01479
+G1 X114.605 Y107.540 E0.01479
+G1 X114.211 Y107.509 E0.01479
+G1 X113.819 Y107.457 E0.01479
+G1 X113.430 Y107.385 E0.01479
+G1 X113.046 Y107.293 E0.01479
+G1 X112.667 Y107.180 E0.01479
+G1 X112.294 Y107.049 E0.01479
+G1 X111.929 Y106.897 E0.01479
+G1 X111.572 Y106.727 E0.01479
+G1 X111.225 Y106.538 E0.01479
+G1 X110.888 Y106.332 E0.01479
+G1 X110.562 Y106.108 E0.01479
+G1 X110.249 Y105.867 E0.01479
+G1 X109.948 Y105.611 E0.01479
+G1 X109.661 Y105.339 E0.01479
+G1 X109.389 Y105.052 E0.01479
+G1 X109.133 Y104.751 E0.01479
+G1 X108.892 Y104.438 E0.01479
+G1 X108.668 Y104.112 E0.01479
+G1 X108.462 Y103.775 E0.01479
+G1 X108.273 Y103.428 E0.01479
+G1 X108.103 Y103.071 E0.01479
+G1 X107.951 Y102.706 E0.01479
+G1 X107.820 Y102.333 E0.01479
+G1 X107.707 Y101.954 E0.01479
+G1 X107.615 Y101.570 E0.01479
+G1 X107.543 Y101.181 E0.01479
+G1 X107.491 Y100.789 E0.01479
+G1 X107.460 Y100.395 E0.01479
+G1 X107.450 Y100.000 E0.01479
+G1 X107.460 Y99.605 E0.01479
+G1 X107.491 Y99.211 E0.01479
+G1 X107.543 Y98.819 E0.01479
+G1 X107.615 Y98.430 E0.01479
+G1 X107.707 Y98.046 E0.01479
+G1 X107.820 Y97.667 E0.01479
+G1 X107.951 Y97.294 E0.01479
+G1 X108.103 Y96.929 E0.01479
+G1 X108.273 Y96.572 E0.01479
+G1 X108.462 Y96.225 E0.01479
+G1 X108.668 Y95.888 E0.01479
+G1 X108.892 Y95.562 E0.01479
+G1 X109.133 Y95.249 E0.01479
+G1 X109.389 Y94.948 E0.01479
+G1 X109.661 Y94.661 E0.01479
+G1 X109.948 Y94.389 E0.01479
+G1 X110.249 Y94.133 E0.01479
+G1 X110.562 Y93.892 E0.01479
+G1 X110.888 Y93.668 E0.01479
+G1 X111.225 Y93.462 E0.01479
+G1 X111.572 Y93.273 E0.01479
+G1 X111.929 Y93.103 E0.01479
+G1 X112.294 Y92.951 E0.01479
+G1 X112.667 Y92.820 E0.01479
+G1 X113.046 Y92.707 E0.01479
+G1 X113.430 Y92.615 E0.01479
+G1 X113.819 Y92.543 E0.01479
+G1 X114.211 Y92.491 E0.01479
+G1 X114.605 Y92.460 E0.01479
+G1 X115.000 Y92.450 E0.01479
+G1 X115.395 Y92.460 E0.01479
+G1 X115.789 Y92.491 E0.01479
+G1 X116.181 Y92.543 E0.01479
+G1 X116.570 Y92.615 E0.01479
+G1 X116.954 Y92.707 E0.01479
+G1 X117.333 Y92.820 E0.01479
+G1 X117.706 Y92.951 E0.01479
+G1 X118.071 Y93.103 E0.01479
+G1 X118.428 Y93.273 E0.01479
+G1 X118.775 Y93.462 E0.01479
+G1 X119.112 Y93.668 E0.01479
+G1 X119.438 Y93.892 E0.01479
+G1 X119.751 Y94.133 E0.01479
+G1 X120.052 Y94.389 E0.01479
+G1 X120.339 Y94.661 E0.01479
+G1 X120.611 Y94.948 E0.01479
+G1 X120.867 Y95.249 E0.01479
+G1 X121.108 Y95.562 E0.01479
+G1 X121.332 Y95.888 E0.01479
+G1 X121.538 Y96.225 E0.01479
+G1 X121.727 Y96.572 E0.01479
+G1 X121.897 Y96.929 E0.01479
+G1 X122.049 Y97.294 E0.01479
+G1 X122.180 Y97.667 E0.01479
+G1 X122.293 Y98.046 E0.01479
+G1 X122.385 Y98.430 E0.01479
+G1 X122.457 Y98.819 E0.01479
+G1 X122.509 Y99.211 E0.01479
+G1 X122.540 Y99.605 E0.01479
+G1 X122.550 Y100.000 E0.01479
+G1 E-0.8 F2400
+G1 X123.900 Y100.000 F9000
+G1 E0.8 F2400
+G3 X106.100 Y100.000 I-8.900 J0 E1.04620 F2400
+G3 X123.900 Y100.000 I8.900 J0 E1.04620
+;LAYER:8
+G1 Z1.800 F1200
+G1 E-0.8 F2400
+G1 X80.000 Y90.000 F9000
+G1 E0.8 F2400
+G1 X100.000 Y90.000 E0.74835 F2400
+G1 X100.000 Y110.000 E0.74835
+G1 X80.000 Y110.000 E0.74835
+G1 X80.000 Y90.000 E0.74835
+G1 E-0.8 F2400
+G1 X80.450 Y90.450 F9000
+G1 E0.8 F2400
+G1 X99.550 Y90.450 E0.71468 F2400
+G1 X99.550 Y109.550 E0.71468
+G1 X80.450 Y109.550 E0.71468
+G1 X80.450 Y90.450 E0.71468
+G1 E-0.8 F2400
+G1 X80.900 Y90.900 F9000
+G1 E0.8 F2400
+G1 X99.100 Y90.900 E0.68100 F4800
+G1 X99.100 Y91.350 E0.01684
+G1 X80.900 Y91.350 E0.68100
+G1 X80.900 Y91.800 E0.01684
+G1 X99.100 Y91.800 E0.68100
+G1 X99.100 Y92.250 E0.01684
+G1 X80.900 Y92.250 E0.68100
+G1 X80.900 Y92.700 E0.01684
+G1 X99.100 Y92.700 E0.68100
+G1 X99.100 Y93.150 E0.01684
+G1 X80.900 Y93.150 E0.68100
+G1 X80.900 Y93.600 E0.01684
+G1 X99.100 Y93.600 E0.68100
+G1 X99.100 Y94.050 E0.01684
+G1 X80.900 Y94.050 E0.68100
+G1 X80.900 Y94.500 E0.01684
+G1 X99.100 Y94.500 E0.68100
+G1 X99.100 Y94.950 E0.01684
+G1 X80.900 Y94.950 E0.68100
+G1 X80.900 Y95.400 E0.01684
+G1 X99.100 Y95.400 E0.68100
+G1 X99.100 Y95.850 E0.01684
+G1 X80.900 Y95.850 E0.68100
+G1 X80.900 Y96.300 E0.01684
+G1 X99.100 Y96.300 E0.68100
+G1 X99.100 Y96.750 E0.01684
+G1 X80.900 Y96.750 E0.68100
+G1 X80.900 Y97.200 E0.01684
+G1 X99.100 Y97.200 E0.68100
+G1 X99.100 Y97.650 E0.01684
+G1 X80.900 Y97.650 E0.68100
+G1 X80.900 Y98.100 E0.01684
+G1 X99.100 Y98.100 E0.68100
+G1 X99.100 Y98.550 E0.01684
+G1 X80.900 Y98.550 E0.68100
+G1 X80.900 Y99.000 E0.01684
+G1 X99.100 Y99.000 E0.68100
+G1 X99.100 Y99.450 E0.01684
+G1 X80.900 Y99.450 E0.68100
+G1 X80.900 Y99.900 E0.01684
+G1 X99.100 Y99.900 E0.68100
+G1 X99.100 Y100.350 E0.01684
+G1 X80.900 Y100.350 E0.68100
+G1 X80.900 Y100.800 E0.01684
+G1 X99.100 Y100.800 E0.68100
+G1 X99.100 Y101.250 E0.01684
+G1 X80.900 Y101.250 E0.68100
+G1 X80.900 Y101.700 E0.01684
+G1 X99.100 Y101.700 E0.68100
+G1 X99.100 Y102.150 E0.01684
+G1 X80.900 Y102.150 E0.68100
+G1 X80.900 Y102.600 E0.01684
+G1 X99.100 Y102.600 E0.68100
+G1 X99.100 Y103.050 E0.01684
+G1 X80.900 Y103.050 E0.68100
+G1 X80.900 Y103.500 E0.01684
+G1 X99.100 Y103.500 E0.68100
+G1 X99.100 Y103.950 E0.01684
+G1 X80.900 Y103.950 E0.68100
+G1 X80.900 Y104.400 E0.01684
+G1 X99.100 Y104.400 E0.68100
+G1 X99.100 Y104.850 E0.01684
+G1 X80.900 Y104.850 E0.68100
+G1 X80.900 Y105.300 E0.01684
+G1 X99.100 Y105.300 E0.68100
+G1 X99.100 Y105.750 E0.01684
+G1 X80.900 Y105.750 E0.68100
+G1 X80.900 Y106.200 E0.01684
+G1 X99.100 Y106.200 E0.68100
+G1 X99.100 Y106.650 E0.01684
+G1 X80.900 Y106.650 E0.68100
+G1 X80.900 Y107.100 E0.01684
+G1 X99.100 Y107.100 E0.68100
+G1 X99.100 Y107.550 E0.01684
+G1 X80.900 Y107.550 E0.68100
+G1 X80.900 Y108.000 E0.01684
+G1 X99.100 Y108.000 E0.68100
+G1 X99.100 Y108.450 E0.01684
+G1 X80.900 Y108.450 E0.68100
+G1 X80.900 Y108.900 E0.01684
+G1 X99.100 Y108.900 E0.68100
+G1 E-0.8 F2400
+G1 X123.000 Y100.000 F9000
+G1 E0.8 F2400
+G1 X122.989 Y100.419 E0.01567 F2400
+G1 X122.956 Y100.836 E0.01567
+G1 X122.902 Y101.251 E0.01567
+G1 X122.825 Y101.663 E0.01567
+G1 X122.727 Y102.071 E0.01567
+G1 X122.608 Y102.472 E0.01567
+G1 X122.469 Y102.867 E0.01567
+G1 X122.308 Y103.254 E0.01567
+G1 X122.128 Y103.632 E0.01567
+G1 X121.928 Y104.000 E0.01567
+G1 X121.709 Y104.357 E0.01567
+G1 X121.472 Y104.702 E0.01567
+G1 X121.217 Y105.035 E0.01567
+G1 X120.945 Y105.353 E0.01567
+G1 X120.657 Y105.657 E0.01567
+G1 X120.353 Y105.945 E0.01567
+G1 X120.035 Y106.217 E0.01567
+G1 X119.702 Y106.472 E0.01567
+G1 X119.357 Y106.709 E0.01567
+G1 X119.000 Y106.928 E0.01567
+G1 X118.632 Y107.128 E0.01567
+G1 X118.254 Y107.308 E0.01567
+G1 X117.867 Y107.469 E0.01567
+G1 X117.472 Y107.608 E0.01567
+G1 X117.071 Y107.727 E0.01567
+G1 X116.663 Y107.825 E0.01567
+G1 X116.251 Y107.902 E0.01567
+G1 X115.836 Y107.956 E0.01567
+G1 X115.419 Y107.989 E0.01567
+G1 X115.000 Y108.000 E0.01567
+G1 X114.581 Y107.989 E0.01567
+G1 X114.164 Y107.956 E0.01567
+G1 X113.749 Y107.902 E0.01567
+G1 X113.337 Y107.825 E0.01567
+G1 X112.929 Y107.727 E0.01567
+G1 X112.528 Y107.608 E0.01567
+G1 X112.133 Y107.469 E0.01567
+G1 X111.746 Y107.308 E0.01567
+G1 X111.368 Y107.128 E0.01567
+G1 X111.000 Y106.928 E0.01567
+G1 X110.643 Y106.709 E0.01567
+G1 X110.298 Y106.472 E0.01567
+G1 X109.965 Y106.217 E0.01567
+G1 X109.647 Y105.945 E0.01567
+G1 X109.343 Y105.657 E0.01567
+G1 X109.055 Y105.353 E0.01567
+G1 X108.783 Y105.035 E0.01567
+G1 X108.528 Y104.702 E0.01567
+G1 X108.291 Y104.357 E0.01567
+G1 X108.072 Y104.000 E0.01567
+G1 X107.872 Y103.632 E0.01567
+G1 X107.692 Y103.254 E0.01567
+G1 X107.531 Y102.867 E0.01567
+G1 X107.392 Y102.472 E0.01567
+G1 X107.273 Y102.071 E0.01567
+G1 X107.175 Y101.663 E0.01567
+G1 X107.098 Y101.251 E0.01567
+G1 X107.044 Y100.836 E0.01567
+G1 X107.011 Y100.419 E0.01567
+G1 X107.000 Y100.000 E0.01567
+G1 X107.011 Y99.581 E0.01567
+G1 X107.044 Y99.164 E0.01567
+G1 X107.098 Y98.749 E0.01567
+G1 X107.175 Y98.337 E0.01567
+G1 X107.273 Y97.929 E0.01567
+G1 X107.392 Y97.528 E0.01567
+G1 X107.531 Y97.133 E0.01567
+G1 X107.692 Y96.746 E0.01567
+G1 X107.872 Y96.368 E0.01567
+G1 X108.072 Y96.000 E0.01567
+G1 X108.291 Y95.643 E0.01567
+G1 X108.528 Y95.298 E0.01567
+G1 X108.783 Y94.965 E0.01567
+G1 X109.055 Y94.647 E0.01567
+G1 X109.343 Y94.343 E0.01567
+G1 X109.647 Y94.055 E0.01567
+G1 X109.965 Y93.783 E0.01567
+G1 X110.298 Y93.528 E0.01567
+G1 X110.643 Y93.291 E0.01567
+G1 X111.000 Y93.072 E0.01567
+G1 X111.368 Y92.872 E0.01567
+G1 X111.746 Y92.692 E0.01567
+G1 X112.133 Y92.531 E0.01567
+G1 X112.528 Y92.392 E0.01567
+G1 X112.929 Y92.273 E0.01567
+G1 X113.337 Y92.175 E0.01567
+G1 X113.749 Y92.098 E0.01567
+G1 X114.164 Y92.044 E0.01567
+G1 X114.581 Y92.011 E0.01567
+G1 X115.000 Y92.000 E0.01567
+G1 X115.419 Y92.011 E0.01567
+G1 X115.836 Y92.044 E0.01567
+G1 X116.251 Y92.098 E0.01567
+G1 X116.663 Y92.175 E0.01567
+G1 X117.071 Y92.273 E0.01567
+G1 X117.472 Y92.392 E0.01567
+G1 X117.867 Y92.531 E0.01567
+G1 X118.254 Y92.692 E0.01567
+G1 X118.632 Y92.872 E0.01567
+G1 X119.000 Y93.072 E0.01567
+G1 X119.357 Y93.291 E0.01567
+G1 X119.702 Y93.528 E0.01567
+G1 X120.035 Y93.783 E0.01567
+G1 X120.353 Y94.055 E0.01567
+G1 X120.657 Y94.343 E0.01567
+G1 X120.945 Y94.647 E0.01567
+G1 X121.217 Y94.965 E0.01567
+G1 X121.472 Y95.298 E0.01567
+G1 X121.709 Y95.643 E0.01567
+G1 X121.928 Y96.000 E0.01567
+G1 X122.128 Y96.368 E0.01567
+G1 X122.308 Y96.746 E0.01567
+G1 X122.469 Y97.133 E0.01567
+G1 X122.608 Y97.528 E0.01567
+G1 X122.727 Y97.929 E0.01567
+G1 X122.825 Y98.337 E0.01567
+G1 X122.902 Y98.749 E0.01567
+G1 X122.956 Y99.164 E0.01567
+G1 X122.989 Y99.581 E0.01567
+G1 X123.000 Y100.000 E0.01567
+G1 E-0.8 F2400
+G1 X122.550 Y100.000 F9000
+G1 E0.8 F2400
+G1 X122.540 Y100.395 E0.01479 F2400
+G1 X122.509 Y100.789 E0.01479
+G1 X122.457 Y101.181 E0.01479
+G1 X122.385 Y101.570 E0.01479
+G1 X122.293 Y101.954 E0.01479
+G1 X122.180 Y102.333 E0.01479
+G1 X122.049 Y102.706 E0.01479
+G1 X121.897 Y103.071 E0.01479
+G1 X121.727 Y103.428 E0.01479
+G1 X121.538 Y103.775 E0.01479
+G1 X121.332 Y104.112 E0.01479
+G1 X121.108 Y104.438 E0.01479
+G1 X120.867 Y104.751 E0.01479
+G1 X120.611 Y105.052 E0.01479
+G1 X120.339 Y105.339 E0.01479
+G1 X120.052 Y105.611 E0.01479
+G1 X119.751 Y105.867 E0.01479
+G1 X119.438 Y106.108 E0.01479
+G1 X119.112 Y106.332 E0.01479
+G1 X118.775 Y106.538 E0.01479
+G1 X118.428 Y106.727 E0.01479
+G1 X118.071 Y106.897 E0.01479
+G1 X117.706 Y107.049 E0.01479
+G1 X117.333 Y107.180 E0.01479
+G1 X116.954 Y107.293 E0.01479
+G1 X116.570 Y107.385 E0.01479
+G1 X116.181 Y107.457 E0.01479
+G1 X115.789 Y107.509 E0.01479
+G1 X115.395 Y107.540 E0.01479
+G1 X115.000 Y107.550 E0.01479
+G1 X114.605 Y107.540 E0.01479
+G1 X114.211 Y107.509 E0.01479
+G1 X113.819 Y107.457 E0.01479
+G1 X113.430 Y107.385 E0.01479
+G1 X113.046 Y107.293 E0.01479
+G1 X112.667 Y107.180 E0.01479
+G1 X112.294 Y107.049 E0.01479
+G1 X111.929 Y106.897 E0.01479
+G1 X111.572 Y106.727 E0.01479
+G1 X111.225 Y106.538 E0.01479
+G1 X110.888 Y106.332 E0.01479
+G1 X110.562 Y106.108 E0.01479
+G1 X110.249 Y105.867 E0.01479
+G1 X109.948 Y105.611 E0.01479
+G1 X109.661 Y105.339 E0.01479
+G1 X109.389 Y105.052 E0.01479
+G1 X109.133 Y104.751 E0.01479
+G1 X108.892 Y104.438 E0.01479
+G1 X108.668 Y104.112 E0.01479
+G1 X108.462 Y103.775 E0.01479
+G1 X108.273 Y103.428 E0.01479
+G1 X108.103 Y103.071 E0.01479
+G1 X107.951 Y102.706 E0.01479
+G1 X107.820 Y102.333 E0.01479
+G1 X107.707 Y101.954 E0.01479
+G1 X107.615 Y101.570 E0.01479
+G1 X107.543 Y101.181 E0.01479
+G1 X107.491 Y100.789 E0.01479
+G1 X107.460 Y100.395 E0.01479
+G1 X107.450 Y100.000 E0.01479
+G1 X107.460 Y99.605 E0.01479
+G1 X107.491 Y99.211 E0.01479
+G1 X107.543 Y98.819 E0.01479
+G1 X107.615 Y98.430 E0.01479
+G1 X107.707 Y98.046 E0.01479
+G1 X107.820 Y97.667 E0.01479
+G1 X107.951 Y97.294 E0.01479
+G1 X108.103 Y96.929 E0.01479
+G1 X108.273 Y96.572 E0.01479
+G1 X108.462 Y96.225 E0.01479
+G1 X108.668 Y95.888 E0.01479
+G1 X108.892 Y95.562 E0.01479
+G1 X109.133 Y95.249 E0.01479
+G1 X109.389 Y94.948 E0.01479
+G1 X109.661 Y94.661 E0.01479
+G1 X109.948 Y94.389 E0.01479
+G1 X110.249 Y94.133 E0.01479
+G1 X110.562 Y93.892 E0.01479
+G1 X110.888 Y93.668 E0.01479
+G1 X111.225 Y93.462 E0.01479
+G1 X111.572 Y93.273 E0.01479
+G1 X111.929 Y93.103 E0.01479
+G1 X112.294 Y92.951 E0.01479
+G1 X112.667 Y92.820 E0.01479
+G1 X113.046 Y92.707 E0.01479
+G1 X113.430 Y92.615 E0.01479
+G1 X113.819 Y92.543 E0.01479
+G1 X114.211 Y92.491 E0.01479
+G1 X114.605 Y92.460 E0.01479
+G1 X115.000 Y92.450 E0.01479
+G1 X115.395 Y92.460 E0.01479
+G1 X115.789 Y92.491 E0.01479
+G1 X116.181 Y92.543 E0.01479
+G1 X116.570 Y92.615 E0.01479
+G1 X116.954 Y92.707 E0.01479
+G1 X117.333 Y92.820 E0.01479
+G1 X117.706 Y92.951 E0.01479
+G1 X118.071 Y93.103 E0.01479
+G1 X118.428 Y93.273 E0.01479
+G1 X118.775 Y93.462 E0.01479
+G1 X119.112 Y93.668 E0.01479
+G1 X119.438 Y93.892 E0.01479
+G1 X119.751 Y94.133 E0.01479
+G1 X120.052 Y94.389 E0.01479
+G1 X120.339 Y94.661 E0.01479
+G1 X120.611 Y94.948 E0.01479
+G1 X120.867 Y95.249 E0.01479
+G1 X121.108 Y95.562 E0.01479
+G1 X121.332 Y95.888 E0.01479
+G1 X121.538 Y96.225 E0.01479
+G1 X121.727 Y96.572 E0.01479
+G1 X121.897 Y96.929 E0.01479
+G1 X122.049 Y97.294 E0.01479
+G1 X122.180 Y97.667 E0.01479
+G1 X122.293 Y98.046 E0.01479
+G1 X122.385 Y98.430 E0.01479
+G1 X122.457 Y98.819 E0.01479
+G1 X122.509 Y99.211 E0.01479
+G1 X122.540 Y99.605 E0.01479
+G1 X122.550 Y100.000 E0.01479
+G1 E-0.8 F2400
+G1 X123.900 Y100.000 F9000
+G1 E0.8 F2400
+G3 X106.100 Y100.000 I-8.900 J0 E1.04620 F2400
+G3 X123.900 Y100.000 I8.900 J0 E1.04620
+;LAYER:9
+G1 Z2.000 F1200
+G1 E-0.8 F2400
+G1 X80.000 Y90.000 F9000
+G1 E0.8 F2400
+G1 X100.000 Y90.000 E0.74835 F2400
+G1 X100.000 Y110.000 E0.74835
+G1 X80.000 Y110.000 E0.74835
+G1 X80.000 Y90.000 E0.74835
+G1 E-0.8 F2400
+G1 X80.450 Y90.450 F9000
+G1 E0.8 F2400
+G1 X99.550 Y90.450 E0.71468 F2400
+G1 X99.550 Y109.550 E0.71468
+G1 X80.450 Y109.550 E0.71468
+G1 X80.450 Y90.450 E0.71468
+G1 E-0.8 F2400
+G1 X80.900 Y90.900 F9000
+G1 E0.8 F2400
+G1 X99.100 Y90.900 E0.68100 F4800
+G1 X99.100 Y91.350 E0.01684
+G1 X80.900 Y91.350 E0.68100
+G1 X80.900 Y91.800 E0.01684
+G1 X99.100 Y91.800 E0.68100
+G1 X99.100 Y92.250 E0.01684
+G1 X80.900 Y92.250 E0.68100
+G1 X80.900 Y92.700 E0.01684
+G1 X99.100 Y92.700 E0.68100
+G1 X99.100 Y93.150 E0.01684
+G1 X80.900 Y93.150 E0.68100
+G1 X80.900 Y93.600 E0.01684
+G1 X99.100 Y93.600 E0.68100
+G1 X99.100 Y94.050 E0.01684
+G1 X80.900 Y94.050 E0.68100
+G1 X80.900 Y94.500 E0.01684
+G1 X99.100 Y94.500 E0.68100
+G1 X99.100 Y94.950 E0.01684
+G1 X80.900 Y94.950 E0.68100
+G1 X80.900 Y95.400 E0.01684
+G1 X99.100 Y95.400 E0.68100
+G1 X99.100 Y95.850 E0.01684
+G1 X80.900 Y95.850 E0.68100
+G1 X80.900 Y96.300 E0.01684
+G1 X99.100 Y96.300 E0.68100
+G1 X99.100 Y96.750 E0.01684
+G1 X80.900 Y96.750 E0.68100
+G1 X80.900 Y97.200 E0.01684
+G1 X99.100 Y97.200 E0.68100
+G1 X99.100 Y97.650 E0.01684
+G1 X80.900 Y97.650 E0.68100
+G1 X80.900 Y98.100 E0.01684
+G1 X99.100 Y98.100 E0.68100
+G1 X99.100 Y98.550 E0.01684
+G1 X80.900 Y98.550 E0.68100
+G1 X80.900 Y99.000 E0.01684
+G1 X99.100 Y99.000 E0.68100
+G1 X99.100 Y99.450 E0.01684
+G1 X80.900 Y99.450 E0.68100
+G1 X80.900 Y99.900 E0.01684
+G1 X99.100 Y99.900 E0.68100
+G1 X99.100 Y100.350 E0.01684
+G1 X80.900 Y100.350 E0.68100
+G1 X80.900 Y100.800 E0.01684
+G1 X99.100 Y100.800 E0.68100
+G1 X99.100 Y101.250 E0.01684
+G1 X80.900 Y101.250 E0.68100
+G1 X80.900 Y101.700 E0.01684
+G1 X99.100 Y101.700 E0.68100
+G1 X99.100 Y102.150 E0.01684
+G1 X80.900 Y102.150 E0.68100
+G1 X80.900 Y102.600 E0.01684
+G1 X99.100 Y102.600 E0.68100
+G1 X99.100 Y103.050 E0.01684
+G1 X80.900 Y103.050 E0.68100
+G1 X80.900 Y103.500 E0.01684
+G1 X99.100 Y103.500 E0.68100
+G1 X99.100 Y103.950 E0.01684
+G1 X80.900 Y103.950 E0.68100
+G1 X80.900 Y104.400 E0.01684
+G1 X99.100 Y104.400 E0.68100
+G1 X99.100 Y104.850 E0.01684
+G1 X80.900 Y104.850 E0.68100
+G1 X80.900 Y105.300 E0.01684
+G1 X99.100 Y105.300 E0.68100
+G1 X99.100 Y105.750 E0.01684
+G1 X80.900 Y105.750 E0.68100
+G1 X80.900 Y106.200 E0.01684
+G1 X99.100 Y106.200 E0.68100
+G1 X99.100 Y106.650 E0.01684
+G1 X80.900 Y106.650 E0.68100
+G1 X80.900 Y107.100 E0.01684
+G1 X99.100 Y107.100 E0.68100
+G1 X99.100 Y107.550 E0.01684
+G1 X80.900 Y107.550 E0.68100
+G1 X80.900 Y108.000 E0.01684
+G1 X99.100 Y108.000 E0.68100
+G1 X99.100 Y108.450 E0.01684
+G1 X80.900 Y108.450 E0.68100
+G1 X80.900 Y108.900 E0.01684
+G1 X99.100 Y108.900 E0.68100
+G1 E-0.8 F2400
+G1 X123.000 Y100.000 F9000
+G1 E0.8 F2400
+G1 X122.989 Y100.419 E0.01567 F2400
+G1 X122.956 Y100.836 E0.01567
+G1 X122.902 Y101.251 E0.01567
+G1 X122.825 Y101.663 E0.01567
+G1 X122.727 Y102.071 E0.01567
+G1 X122.608 Y102.472 E0.01567
+G1 X122.469 Y102.867 E0.01567
+G1 X122.308 Y103.254 E0.01567
+G1 X122.128 Y103.632 E0.01567
+G1 X121.928 Y104.000 E0.01567
+G1 X121.709 Y104.357 E0.01567
+G1 X121.472 Y104.702 E0.01567
+G1 X121.217 Y105.035 E0.01567
+G1 X120.945 Y105.353 E0.01567
+G1 X120.657 Y105.657 E0.01567
+G1 X120.353 Y105.945 E0.01567
+G1 X120.035 Y106.217 E0.01567
+G1 X119.702 Y106.472 E0.01567
+G1 X119.357 Y106.709 E0.01567
+G1 X119.000 Y106.928 E0.01567
+G1 X118.632 Y107.128 E0.01567
+G1 X118.254 Y107.308 E0.01567
+G1 X117.867 Y107.469 E0.01567
+G1 X117.472 Y107.608 E0.01567
+G1 X117.071 Y107.727 E0.01567
+G1 X116.663 Y107.825 E0.01567
+G1 X116.251 Y107.902 E0.01567
+G1 X115.836 Y107.956 E0.01567
+G1 X115.419 Y107.989 E0.01567
+G1 X115.000 Y108.000 E0.01567
+G1 X114.581 Y107.989 E0.01567
+G1 X114.164 Y107.956 E0.01567
+G1 X113.749 Y107.902 E0.01567
+G1 X113.337 Y107.825 E0.01567
+G1 X112.929 Y107.727 E0.01567
+G1 X112.528 Y107.608 E0.01567
+G1 X112.133 Y107.469 E0.01567
+G1 X111.746 Y107.308 E0.01567
+G1 X111.368 Y107.128 E0.01567
+G1 X111.000 Y106.928 E0.01567
+G1 X110.643 Y106.709 E0.01567
+G1 X110.298 Y106.472 E0.01567
+G1 X109.965 Y106.217 E0.01567
+G1 X109.647 Y105.945 E0.01567
+G1 X109.343 Y105.657 E0.01567
+G1 X109.055 Y105.353 E0.01567
+G1 X108.783 Y105.035 E0.01567
+G1 X108.528 Y104.702 E0.01567
+G1 X108.291 Y104.357 E0.01567
+G1 X108.072 Y104.000 E0.01567
+G1 X107.872 Y103.632 E0.01567
+G1 X107.692 Y103.254 E0.01567
+G1 X107.531 Y102.867 E0.01567
+G1 X107.392 Y102.472 E0.01567
+G1 X107.273 Y102.071 E0.01567
+G1 X107.175 Y101.663 E0.01567
+G1 X107.098 Y101.251 E0.01567
+G1 X107.044 Y100.836 E0.01567
+G1 X107.011 Y100.419 E0.01567
+G1 X107.000 Y100.000 E0.01567
+G1 X107.011 Y99.581 E0.01567
+G1 X107.044 Y99.164 E0.01567
+G1 X107.098 Y98.749 E0.01567
+G1 X107.175 Y98.337 E0.01567
+G1 X107.273 Y97.929 E0.01567
+G1 X107.392 Y97.528 E0.01567
+G1 X107.531 Y97.133 E0.01567
+G1 X107.692 Y96.746 E0.01567
+G1 X107.872 Y96.368 E0.01567
+G1 X108.072 Y96.000 E0.01567
+G1 X108.291 Y95.643 E0.01567
+G1 X108.528 Y95.298 E0.01567
+G1 X108.783 Y94.965 E0.01567
+G1 X109.055 Y94.647 E0.01567
+G1 X109.343 Y94.343 E0.01567
+G1 X109.647 Y94.055 E0.01567
+G1 X109.965 Y93.783 E0.01567
+G1 X110.298 Y93.528 E0.01567
+G1 X110.643 Y93.291 E0.01567
+G1 X111.000 Y93.072 E0.01567
+G1 X111.368 Y92.872 E0.01567
+G1 X111.746 Y92.692 E0.01567
+G1 X112.133 Y92.531 E0.01567
+G1 X112.528 Y92.392 E0.01567
+G1 X112.929 Y92.273 E0.01567
+G1 X113.337 Y92.175 E0.01567
+G1 X113.749 Y92.098 E0.01567
+G1 X114.164 Y92.044 E0.01567
+G1 X114.581 Y92.011 E0.01567
+G1 X115.000 Y92.000 E0.01567
+G1 X115.419 Y92.011 E0.01567
+G1 X115.836 Y92.044 E0.01567
+G1 X116.251 Y92.098 E0.01567
+G1 X116.663 Y92.175 E0.01567
+G1 X117.071 Y92.273 E0.01567
+G1 X117.472 Y92.392 E0.01567
+G1 X117.867 Y92.531 E0.01567
+G1 X118.254 Y92.692 E0.01567
+G1 X118.632 Y92.872 E0.01567
+G1 X119.000 Y93.072 E0.01567
+G1 X119.357 Y93.291 E0.01567
+G1 X119.702 Y93.528 E0.01567
+G1 X120.035 Y93.783 E0.01567
+G1 X120.353 Y94.055 E0.01567
+G1 X120.657 Y94.343 E0.01567
+G1 X120.945 Y94.647 E0.01567
+G1 X121.217 Y94.965 E0.01567
+G1 X121.472 Y95.298 E0.01567
+G1 X121.709 Y95.643 E0.01567
+G1 X121.928 Y96.000 E0.01567
+G1 X122.128 Y96.368 E0.01567
+G1 X122.308 Y96.746 E0.01567
+G1 X122.469 Y97.133 E0.01567
+G1 X122.608 Y97.528 E0.01567
+G1 X122.727 Y97.929 E0.01567
+G1 X122.825 Y98.337 E0.01567
+G1 X122.902 Y98.749 E0.01567
+G1 X122.956 Y99.164 E0.01567
+G1 X122.989 Y99.581 E0.01567
+G1 X123.000 Y100.000 E0.01567
+G1 E-0.8 F2400
+G1 X122.550 Y100.000 F9000
+G1 E0.8 F2400
+G1 X122.540 Y100.395 E0.01479 F2400
+G1 X122.509 Y100.789 E0.01479
+G1 X122.457 Y101.181 E0.01479
+G1 X122.385 Y101.570 E0.01479
+G1 X122.293 Y101.954 E0.01479
+G1 X122.180 Y102.333 E0.01479
+G1 X122.049 Y102.706 E0.01479
+G1 X121.897 Y103.071 E0.01479
+G1 X121.727 Y103.428 E0.01479
+G1 X121.538 Y103.775 E0.01479
+G1 X121.332 Y104.112 E0.01479
+G1 X121.108 Y104.438 E0.01479
+G1 X120.867 Y104.751 E0.01479
+G1 X120.611 Y105.052 E0.01479
+G1 X120.339 Y105.339 E0.01479
+G1 X120.052 Y105.611 E0.01479
+G1 X119.751 Y105.867 E0.01479
+G1 X119.438 Y106.108 E0.01479
+G1 X119.112 Y106.332 E0.01479
+G1 X118.775 Y106.538 E0.01479
+G1 X118.428 Y106.727 E0.01479
+G1 X118.071 Y106.897 E0.01479
+G1 X117.706 Y107.049 E0.01479
+G1 X117.333 Y107.180 E0.01479
+G1 X116.954 Y107.293 E0.01479
+G1 X116.570 Y107.385 E0.01479
+G1 X116.181 Y107.457 E0.01479
+G1 X115.789 Y107.509 E0.01479
+G1 X115.395 Y107.540 E0.01479
+G1 X115.000 Y107.550 E0.01479
+G1 X114.605 Y107.540 E0.01479
+G1 X114.211 Y107.509 E0.01479
+G1 X113.819 Y107.457 E0.01479
+G1 X113.430 Y107.385 E0.01479
+G1 X113.046 Y107.293 E0.01479
+G1 X112.667 Y107.180 E0.01479
+G1 X112.294 Y107.049 E0.01479
+G1 X111.929 Y106.897 E0.01479
+G1 X111.572 Y106.727 E0.01479
+G1 X111.225 Y106.538 E0.01479
+G1 X110.888 Y106.332 E0.01479
+G1 X110.562 Y106.108 E0.01479
+G1 X110.249 Y105.867 E0.01479
+G1 X109.948 Y105.611 E0.01479
+G1 X109.661 Y105.339 E0.01479
+G1 X109.389 Y105.052 E0.01479
+G1 X109.133 Y104.751 E0.01479
+G1 X108.892 Y104.438 E0.01479
+G1 X108.668 Y104.112 E0.01479
+G1 X108.462 Y103.775 E0.01479
+G1 X108.273 Y103.428 E0.01479
+G1 X108.103 Y103.071 E0.01479
+G1 X107.951 Y102.706 E0.01479
+G1 X107.820 Y102.333 E0.01479
+G1 X107.707 Y101.954 E0.01479
+G1 X107.615 Y101.570 E0.01479
+G1 X107.543 Y101.181 E0.01479
+G1 X107.491 Y100.789 E0.01479
+G1 X107.460 Y100.395 E0.01479
+G1 X107.450 Y100.000 E0.01479
+G1 X107.460 Y99.605 E0.01479
+G1 X107.491 Y99.211 E0.01479
+G1 X107.543 Y98.819 E0.01479
+G1 X107.615 Y98.430 E0.01479
+G1 X107.707 Y98.046 E0.01479
+G1 X107.820 Y97.667 E0.01479
+G1 X107.951 Y97.294 E0.01479
+G1 X108.103 Y96.929 E0.01479
+G1 X108.273 Y96.572 E0.01479
+G1 X108.462 Y96.225 E0.01479
+G1 X108.668 Y95.888 E0.01479
+G1 X108.892 Y95.562 E0.01479
+G1 X109.133 Y95.249 E0.01479
+G1 X109.389 Y94.948 E0.01479
+G1 X109.661 Y94.661 E0.01479
+G1 X109.948 Y94.389 E0.01479
+G1 X110.249 Y94.133 E0.01479
+G1 X110.562 Y93.892 E0.01479
+G1 X110.888 Y93.668 E0.01479
+G1 X111.225 Y93.462 E0.01479
+G1 X111.572 Y93.273 E0.01479
+G1 X111.929 Y93.103 E0.01479
+G1 X112.294 Y92.951 E0.01479
+G1 X112.667 Y92.820 E0.01479
+G1 X113.046 Y92.707 E0.01479
+G1 X113.430 Y92.615 E0.01479
+G1 X113.819 Y92.543 E0.01479
+G1 X114.211 Y92.491 E0.01479
+G1 X114.605 Y92.460 E0.01479
+G1 X115.000 Y92.450 E0.01479
+G1 X115.395 Y92.460 E0.01479
+G1 X115.789 Y92.491 E0.01479
+G1 X116.181 Y92.543 E0.01479
+G1 X116.570 Y92.615 E0.01479
+G1 X116.954 Y92.707 E0.01479
+G1 X117.333 Y92.820 E0.01479
+G1 X117.706 Y92.951 E0.01479
+G1 X118.071 Y93.103 E0.01479
+G1 X118.428 Y93.273 E0.01479
+G1 X118.775 Y93.462 E0.01479
+G1 X119.112 Y93.668 E0.01479
+G1 X119.438 Y93.892 E0.01479
+G1 X119.751 Y94.133 E0.01479
+G1 X120.052 Y94.389 E0.01479
+G1 X120.339 Y94.661 E0.01479
+G1 X120.611 Y94.948 E0.01479
+G1 X120.867 Y95.249 E0.01479
+G1 X121.108 Y95.562 E0.01479
+G1 X121.332 Y95.888 E0.01479
+G1 X121.538 Y96.225 E0.01479
+G1 X121.727 Y96.572 E0.01479
+G1 X121.897 Y96.929 E0.01479
+G1 X122.049 Y97.294 E0.01479
+G1 X122.180 Y97.667 E0.01479
+G1 X122.293 Y98.046 E0.01479
+G1 X122.385 Y98.430 E0.01479
+G1 X122.457 Y98.819 E0.01479
+G1 X122.509 Y99.211 E0.01479
+G1 X122.540 Y99.605 E0.01479
+G1 X122.550 Y100.000 E0.01479
+G1 E-0.8 F2400
+G1 X123.900 Y100.000 F9000
+G1 E0.8 F2400
+G3 X106.100 Y100.000 I-8.900 J0 E1.04620 F2400
+G3 X123.900 Y100.000 I8.900 J0 E1.04620
+G1 E-0.8 F2400
+G1 Z10 F1200
+M400
@@ -0,0 +1,8988 @@
+; Benchmark print: dense grid of 3mm pillars, 0.2mm layers, printed
+; with a 0.8mm z-hop and a retraction on every travel (short
+; perimeters separated by z only and extrude only moves)
+M83
+G90
+G92 E0
+;LAYER:0
+G1 Z0.200 F1200
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X80.000 Y80.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X83.000 Y80.000 E0.11220 F1800
+G1 X83.000 Y83.000 E0.11220
+G1 X80.000 Y83.000 E0.11220
+G1 X80.000 Y80.000 E0.11220
+G1 X80.450 Y80.450 F1800
+G1 X82.550 Y80.450 E0.07854 F1800
+G1 X82.550 Y82.550 E0.07854
+G1 X80.450 Y82.550 E0.07854
+G1 X80.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X85.000 Y80.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X88.000 Y80.000 E0.11220 F1800
+G1 X88.000 Y83.000 E0.11220
+G1 X85.000 Y83.000 E0.11220
+G1 X85.000 Y80.000 E0.11220
+G1 X85.450 Y80.450 F1800
+G1 X87.550 Y80.450 E0.07854 F1800
+G1 X87.550 Y82.550 E0.07854
+G1 X85.450 Y82.550 E0.07854
+G1 X85.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X90.000 Y80.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X93.000 Y80.000 E0.11220 F1800
+G1 X93.000 Y83.000 E0.11220
+G1 X90.000 Y83.000 E0.11220
+G1 X90.000 Y80.000 E0.11220
+G1 X90.450 Y80.450 F1800
+G1 X92.550 Y80.450 E0.07854 F1800
+G1 X92.550 Y82.550 E0.07854
+G1 X90.450 Y82.550 E0.07854
+G1 X90.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X95.000 Y80.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X98.000 Y80.000 E0.11220 F1800
+G1 X98.000 Y83.000 E0.11220
+G1 X95.000 Y83.000 E0.11220
+G1 X95.000 Y80.000 E0.11220
+G1 X95.450 Y80.450 F1800
+G1 X97.550 Y80.450 E0.07854 F1800
+G1 X97.550 Y82.550 E0.07854
+G1 X95.450 Y82.550 E0.07854
+G1 X95.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X100.000 Y80.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X103.000 Y80.000 E0.11220 F1800
+G1 X103.000 Y83.000 E0.11220
+G1 X100.000 Y83.000 E0.11220
+G1 X100.000 Y80.000 E0.11220
+G1 X100.450 Y80.450 F1800
+G1 X102.550 Y80.450 E0.07854 F1800
+G1 X102.550 Y82.550 E0.07854
+G1 X100.450 Y82.550 E0.07854
+G1 X100.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X105.000 Y80.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X108.000 Y80.000 E0.11220 F1800
+G1 X108.000 Y83.000 E0.11220
+G1 X105.000 Y83.000 E0.11220
+G1 X105.000 Y80.000 E0.11220
+G1 X105.450 Y80.450 F1800
+G1 X107.550 Y80.450 E0.07854 F1800
+G1 X107.550 Y82.550 E0.07854
+G1 X105.450 Y82.550 E0.07854
+G1 X105.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X110.000 Y80.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X113.000 Y80.000 E0.11220 F1800
+G1 X113.000 Y83.000 E0.11220
+G1 X110.000 Y83.000 E0.11220
+G1 X110.000 Y80.000 E0.11220
+G1 X110.450 Y80.450 F1800
+G1 X112.550 Y80.450 E0.07854 F1800
+G1 X112.550 Y82.550 E0.07854
+G1 X110.450 Y82.550 E0.07854
+G1 X110.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X115.000 Y80.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X118.000 Y80.000 E0.11220 F1800
+G1 X118.000 Y83.000 E0.11220
+G1 X115.000 Y83.000 E0.11220
+G1 X115.000 Y80.000 E0.11220
+G1 X115.450 Y80.450 F1800
+G1 X117.550 Y80.450 E0.07854 F1800
+G1 X117.550 Y82.550 E0.07854
+G1 X115.450 Y82.550 E0.07854
+G1 X115.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X115.000 Y85.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X118.000 Y85.000 E0.11220 F1800
+G1 X118.000 Y88.000 E0.11220
+G1 X115.000 Y88.000 E0.11220
+G1 X115.000 Y85.000 E0.11220
+G1 X115.450 Y85.450 F1800
+G1 X117.550 Y85.450 E0.07854 F1800
+G1 X117.550 Y87.550 E0.07854
+G1 X115.450 Y87.550 E0.07854
+G1 X115.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X110.000 Y85.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X113.000 Y85.000 E0.11220 F1800
+G1 X113.000 Y88.000 E0.11220
+G1 X110.000 Y88.000 E0.11220
+G1 X110.000 Y85.000 E0.11220
+G1 X110.450 Y85.450 F1800
+G1 X112.550 Y85.450 E0.07854 F1800
+G1 X112.550 Y87.550 E0.07854
+G1 X110.450 Y87.550 E0.07854
+G1 X110.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X105.000 Y85.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X108.000 Y85.000 E0.11220 F1800
+G1 X108.000 Y88.000 E0.11220
+G1 X105.000 Y88.000 E0.11220
+G1 X105.000 Y85.000 E0.11220
+G1 X105.450 Y85.450 F1800
+G1 X107.550 Y85.450 E0.07854 F1800
+G1 X107.550 Y87.550 E0.07854
+G1 X105.450 Y87.550 E0.07854
+G1 X105.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X100.000 Y85.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X103.000 Y85.000 E0.11220 F1800
+G1 X103.000 Y88.000 E0.11220
+G1 X100.000 Y88.000 E0.11220
+G1 X100.000 Y85.000 E0.11220
+G1 X100.450 Y85.450 F1800
+G1 X102.550 Y85.450 E0.07854 F1800
+G1 X102.550 Y87.550 E0.07854
+G1 X100.450 Y87.550 E0.07854
+G1 X100.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X95.000 Y85.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X98.000 Y85.000 E0.11220 F1800
+G1 X98.000 Y88.000 E0.11220
+G1 X95.000 Y88.000 E0.11220
+G1 X95.000 Y85.000 E0.11220
+G1 X95.450 Y85.450 F1800
+G1 X97.550 Y85.450 E0.07854 F1800
+G1 X97.550 Y87.550 E0.07854
+G1 X95.450 Y87.550 E0.07854
+G1 X95.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X90.000 Y85.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X93.000 Y85.000 E0.11220 F1800
+G1 X93.000 Y88.000 E0.11220
+G1 X90.000 Y88.000 E0.11220
+G1 X90.000 Y85.000 E0.11220
+G1 X90.450 Y85.450 F1800
+G1 X92.550 Y85.450 E0.07854 F1800
+G1 X92.550 Y87.550 E0.07854
+G1 X90.450 Y87.550 E0.07854
+G1 X90.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X85.000 Y85.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X88.000 Y85.000 E0.11220 F1800
+G1 X88.000 Y88.000 E0.11220
+G1 X85.000 Y88.000 E0.11220
+G1 X85.000 Y85.000 E0.11220
+G1 X85.450 Y85.450 F1800
+G1 X87.550 Y85.450 E0.07854 F1800
+G1 X87.550 Y87.550 E0.07854
+G1 X85.450 Y87.550 E0.07854
+G1 X85.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X80.000 Y85.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X83.000 Y85.000 E0.11220 F1800
+G1 X83.000 Y88.000 E0.11220
+G1 X80.000 Y88.000 E0.11220
+G1 X80.000 Y85.000 E0.11220
+G1 X80.450 Y85.450 F1800
+G1 X82.550 Y85.450 E0.07854 F1800
+G1 X82.550 Y87.550 E0.07854
+G1 X80.450 Y87.550 E0.07854
+G1 X80.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X80.000 Y90.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X83.000 Y90.000 E0.11220 F1800
+G1 X83.000 Y93.000 E0.11220
+G1 X80.000 Y93.000 E0.11220
+G1 X80.000 Y90.000 E0.11220
+G1 X80.450 Y90.450 F1800
+G1 X82.550 Y90.450 E0.07854 F1800
+G1 X82.550 Y92.550 E0.07854
+G1 X80.450 Y92.550 E0.07854
+G1 X80.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X85.000 Y90.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X88.000 Y90.000 E0.11220 F1800
+G1 X88.000 Y93.000 E0.11220
+G1 X85.000 Y93.000 E0.11220
+G1 X85.000 Y90.000 E0.11220
+G1 X85.450 Y90.450 F1800
+G1 X87.550 Y90.450 E0.07854 F1800
+G1 X87.550 Y92.550 E0.07854
+G1 X85.450 Y92.550 E0.07854
+G1 X85.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X90.000 Y90.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X93.000 Y90.000 E0.11220 F1800
+G1 X93.000 Y93.000 E0.11220
+G1 X90.000 Y93.000 E0.11220
+G1 X90.000 Y90.000 E0.11220
+G1 X90.450 Y90.450 F1800
+G1 X92.550 Y90.450 E0.07854 F1800
+G1 X92.550 Y92.550 E0.07854
+G1 X90.450 Y92.550 E0.07854
+G1 X90.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X95.000 Y90.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X98.000 Y90.000 E0.11220 F1800
+G1 X98.000 Y93.000 E0.11220
+G1 X95.000 Y93.000 E0.11220
+G1 X95.000 Y90.000 E0.11220
+G1 X95.450 Y90.450 F1800
+G1 X97.550 Y90.450 E0.07854 F1800
+G1 X97.550 Y92.550 E0.07854
+G1 X95.450 Y92.550 E0.07854
+G1 X95.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X100.000 Y90.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X103.000 Y90.000 E0.11220 F1800
+G1 X103.000 Y93.000 E0.11220
+G1 X100.000 Y93.000 E0.11220
+G1 X100.000 Y90.000 E0.11220
+G1 X100.450 Y90.450 F1800
+G1 X102.550 Y90.450 E0.07854 F1800
+G1 X102.550 Y92.550 E0.07854
+G1 X100.450 Y92.550 E0.07854
+G1 X100.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X105.000 Y90.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X108.000 Y90.000 E0.11220 F1800
+G1 X108.000 Y93.000 E0.11220
+G1 X105.000 Y93.000 E0.11220
+G1 X105.000 Y90.000 E0.11220
+G1 X105.450 Y90.450 F1800
+G1 X107.550 Y90.450 E0.07854 F1800
+G1 X107.550 Y92.550 E0.07854
+G1 X105.450 Y92.550 E0.07854
+G1 X105.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X110.000 Y90.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X113.000 Y90.000 E0.11220 F1800
+G1 X113.000 Y93.000 E0.11220
+G1 X110.000 Y93.000 E0.11220
+G1 X110.000 Y90.000 E0.11220
+G1 X110.450 Y90.450 F1800
+G1 X112.550 Y90.450 E0.07854 F1800
+G1 X112.550 Y92.550 E0.07854
+G1 X110.450 Y92.550 E0.07854
+G1 X110.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X115.000 Y90.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X118.000 Y90.000 E0.11220 F1800
+G1 X118.000 Y93.000 E0.11220
+G1 X115.000 Y93.000 E0.11220
+G1 X115.000 Y90.000 E0.11220
+G1 X115.450 Y90.450 F1800
+G1 X117.550 Y90.450 E0.07854 F1800
+G1 X117.550 Y92.550 E0.07854
+G1 X115.450 Y92.550 E0.07854
+G1 X115.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X115.000 Y95.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X118.000 Y95.000 E0.11220 F1800
+G1 X118.000 Y98.000 E0.11220
+G1 X115.000 Y98.000 E0.11220
+G1 X115.000 Y95.000 E0.11220
+G1 X115.450 Y95.450 F1800
+G1 X117.550 Y95.450 E0.07854 F1800
+G1 X117.550 Y97.550 E0.07854
+G1 X115.450 Y97.550 E0.07854
+G1 X115.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X110.000 Y95.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X113.000 Y95.000 E0.11220 F1800
+G1 X113.000 Y98.000 E0.11220
+G1 X110.000 Y98.000 E0.11220
+G1 X110.000 Y95.000 E0.11220
+G1 X110.450 Y95.450 F1800
+G1 X112.550 Y95.450 E0.07854 F1800
+G1 X112.550 Y97.550 E0.07854
+G1 X110.450 Y97.550 E0.07854
+G1 X110.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X105.000 Y95.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X108.000 Y95.000 E0.11220 F1800
+G1 X108.000 Y98.000 E0.11220
+G1 X105.000 Y98.000 E0.11220
+G1 X105.000 Y95.000 E0.11220
+G1 X105.450 Y95.450 F1800
+G1 X107.550 Y95.450 E0.07854 F1800
+G1 X107.550 Y97.550 E0.07854
+G1 X105.450 Y97.550 E0.07854
+G1 X105.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X100.000 Y95.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X103.000 Y95.000 E0.11220 F1800
+G1 X103.000 Y98.000 E0.11220
+G1 X100.000 Y98.000 E0.11220
+G1 X100.000 Y95.000 E0.11220
+G1 X100.450 Y95.450 F1800
+G1 X102.550 Y95.450 E0.07854 F1800
+G1 X102.550 Y97.550 E0.07854
+G1 X100.450 Y97.550 E0.07854
+G1 X100.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X95.000 Y95.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X98.000 Y95.000 E0.11220 F1800
+G1 X98.000 Y98.000 E0.11220
+G1 X95.000 Y98.000 E0.11220
+G1 X95.000 Y95.000 E0.11220
+G1 X95.450 Y95.450 F1800
+G1 X97.550 Y95.450 E0.07854 F1800
+G1 X97.550 Y97.550 E0.07854
+G1 X95.450 Y97.550 E0.07854
+G1 X95.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X90.000 Y95.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X93.000 Y95.000 E0.11220 F1800
+G1 X93.000 Y98.000 E0.11220
+G1 X90.000 Y98.000 E0.11220
+G1 X90.000 Y95.000 E0.11220
+G1 X90.450 Y95.450 F1800
+G1 X92.550 Y95.450 E0.07854 F1800
+G1 X92.550 Y97.550 E0.07854
+G1 X90.450 Y97.550 E0.07854
+G1 X90.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X85.000 Y95.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X88.000 Y95.000 E0.11220 F1800
+G1 X88.000 Y98.000 E0.11220
+G1 X85.000 Y98.000 E0.11220
+G1 X85.000 Y95.000 E0.11220
+G1 X85.450 Y95.450 F1800
+G1 X87.550 Y95.450 E0.07854 F1800
+G1 X87.550 Y97.550 E0.07854
+G1 X85.450 Y97.550 E0.07854
+G1 X85.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X80.000 Y95.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X83.000 Y95.000 E0.11220 F1800
+G1 X83.000 Y98.000 E0.11220
+G1 X80.000 Y98.000 E0.11220
+G1 X80.000 Y95.000 E0.11220
+G1 X80.450 Y95.450 F1800
+G1 X82.550 Y95.450 E0.07854 F1800
+G1 X82.550 Y97.550 E0.07854
+G1 X80.450 Y97.550 E0.07854
+G1 X80.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X80.000 Y100.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X83.000 Y100.000 E0.11220 F1800
+G1 X83.000 Y103.000 E0.11220
+G1 X80.000 Y103.000 E0.11220
+G1 X80.000 Y100.000 E0.11220
+G1 X80.450 Y100.450 F1800
+G1 X82.550 Y100.450 E0.07854 F1800
+G1 X82.550 Y102.550 E0.07854
+G1 X80.450 Y102.550 E0.07854
+G1 X80.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X85.000 Y100.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X88.000 Y100.000 E0.11220 F1800
+G1 X88.000 Y103.000 E0.11220
+G1 X85.000 Y103.000 E0.11220
+G1 X85.000 Y100.000 E0.11220
+G1 X85.450 Y100.450 F1800
+G1 X87.550 Y100.450 E0.07854 F1800
+G1 X87.550 Y102.550 E0.07854
+G1 X85.450 Y102.550 E0.07854
+G1 X85.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X90.000 Y100.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X93.000 Y100.000 E0.11220 F1800
+G1 X93.000 Y103.000 E0.11220
+G1 X90.000 Y103.000 E0.11220
+G1 X90.000 Y100.000 E0.11220
+G1 X90.450 Y100.450 F1800
+G1 X92.550 Y100.450 E0.07854 F1800
+G1 X92.550 Y102.550 E0.07854
+G1 X90.450 Y102.550 E0.07854
+G1 X90.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X95.000 Y100.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X98.000 Y100.000 E0.11220 F1800
+G1 X98.000 Y103.000 E0.11220
+G1 X95.000 Y103.000 E0.11220
+G1 X95.000 Y100.000 E0.11220
+G1 X95.450 Y100.450 F1800
+G1 X97.550 Y100.450 E0.07854 F1800
+G1 X97.550 Y102.550 E0.07854
+G1 X95.450 Y102.550 E0.07854
+G1 X95.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X100.000 Y100.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X103.000 Y100.000 E0.11220 F1800
+G1 X103.000 Y103.000 E0.11220
+G1 X100.000 Y103.000 E0.11220
+G1 X100.000 Y100.000 E0.11220
+G1 X100.450 Y100.450 F1800
+G1 X102.550 Y100.450 E0.07854 F1800
+G1 X102.550 Y102.550 E0.07854
+G1 X100.450 Y102.550 E0.07854
+G1 X100.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X105.000 Y100.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X108.000 Y100.000 E0.11220 F1800
+G1 X108.000 Y103.000 E0.11220
+G1 X105.000 Y103.000 E0.11220
+G1 X105.000 Y100.000 E0.11220
+G1 X105.450 Y100.450 F1800
+G1 X107.550 Y100.450 E0.07854 F1800
+G1 X107.550 Y102.550 E0.07854
+G1 X105.450 Y102.550 E0.07854
+G1 X105.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X110.000 Y100.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X113.000 Y100.000 E0.11220 F1800
+G1 X113.000 Y103.000 E0.11220
+G1 X110.000 Y103.000 E0.11220
+G1 X110.000 Y100.000 E0.11220
+G1 X110.450 Y100.450 F1800
+G1 X112.550 Y100.450 E0.07854 F1800
+G1 X112.550 Y102.550 E0.07854
+G1 X110.450 Y102.550 E0.07854
+G1 X110.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X115.000 Y100.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X118.000 Y100.000 E0.11220 F1800
+G1 X118.000 Y103.000 E0.11220
+G1 X115.000 Y103.000 E0.11220
+G1 X115.000 Y100.000 E0.11220
+G1 X115.450 Y100.450 F1800
+G1 X117.550 Y100.450 E0.07854 F1800
+G1 X117.550 Y102.550 E0.07854
+G1 X115.450 Y102.550 E0.07854
+G1 X115.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X115.000 Y105.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X118.000 Y105.000 E0.11220 F1800
+G1 X118.000 Y108.000 E0.11220
+G1 X115.000 Y108.000 E0.11220
+G1 X115.000 Y105.000 E0.11220
+G1 X115.450 Y105.450 F1800
+G1 X117.550 Y105.450 E0.07854 F1800
+G1 X117.550 Y107.550 E0.07854
+G1 X115.450 Y107.550 E0.07854
+G1 X115.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X110.000 Y105.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X113.000 Y105.000 E0.11220 F1800
+G1 X113.000 Y108.000 E0.11220
+G1 X110.000 Y108.000 E0.11220
+G1 X110.000 Y105.000 E0.11220
+G1 X110.450 Y105.450 F1800
+G1 X112.550 Y105.450 E0.07854 F1800
+G1 X112.550 Y107.550 E0.07854
+G1 X110.450 Y107.550 E0.07854
+G1 X110.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X105.000 Y105.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X108.000 Y105.000 E0.11220 F1800
+G1 X108.000 Y108.000 E0.11220
+G1 X105.000 Y108.000 E0.11220
+G1 X105.000 Y105.000 E0.11220
+G1 X105.450 Y105.450 F1800
+G1 X107.550 Y105.450 E0.07854 F1800
+G1 X107.550 Y107.550 E0.07854
+G1 X105.450 Y107.550 E0.07854
+G1 X105.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X100.000 Y105.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X103.000 Y105.000 E0.11220 F1800
+G1 X103.000 Y108.000 E0.11220
+G1 X100.000 Y108.000 E0.11220
+G1 X100.000 Y105.000 E0.11220
+G1 X100.450 Y105.450 F1800
+G1 X102.550 Y105.450 E0.07854 F1800
+G1 X102.550 Y107.550 E0.07854
+G1 X100.450 Y107.550 E0.07854
+G1 X100.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X95.000 Y105.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X98.000 Y105.000 E0.11220 F1800
+G1 X98.000 Y108.000 E0.11220
+G1 X95.000 Y108.000 E0.11220
+G1 X95.000 Y105.000 E0.11220
+G1 X95.450 Y105.450 F1800
+G1 X97.550 Y105.450 E0.07854 F1800
+G1 X97.550 Y107.550 E0.07854
+G1 X95.450 Y107.550 E0.07854
+G1 X95.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X90.000 Y105.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X93.000 Y105.000 E0.11220 F1800
+G1 X93.000 Y108.000 E0.11220
+G1 X90.000 Y108.000 E0.11220
+G1 X90.000 Y105.000 E0.11220
+G1 X90.450 Y105.450 F1800
+G1 X92.550 Y105.450 E0.07854 F1800
+G1 X92.550 Y107.550 E0.07854
+G1 X90.450 Y107.550 E0.07854
+G1 X90.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X85.000 Y105.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X88.000 Y105.000 E0.11220 F1800
+G1 X88.000 Y108.000 E0.11220
+G1 X85.000 Y108.000 E0.11220
+G1 X85.000 Y105.000 E0.11220
+G1 X85.450 Y105.450 F1800
+G1 X87.550 Y105.450 E0.07854 F1800
+G1 X87.550 Y107.550 E0.07854
+G1 X85.450 Y107.550 E0.07854
+G1 X85.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X80.000 Y105.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X83.000 Y105.000 E0.11220 F1800
+G1 X83.000 Y108.000 E0.11220
+G1 X80.000 Y108.000 E0.11220
+G1 X80.000 Y105.000 E0.11220
+G1 X80.450 Y105.450 F1800
+G1 X82.550 Y105.450 E0.07854 F1800
+G1 X82.550 Y107.550 E0.07854
+G1 X80.450 Y107.550 E0.07854
+G1 X80.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X80.000 Y110.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X83.000 Y110.000 E0.11220 F1800
+G1 X83.000 Y113.000 E0.11220
+G1 X80.000 Y113.000 E0.11220
+G1 X80.000 Y110.000 E0.11220
+G1 X80.450 Y110.450 F1800
+G1 X82.550 Y110.450 E0.07854 F1800
+G1 X82.550 Y112.550 E0.07854
+G1 X80.450 Y112.550 E0.07854
+G1 X80.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X85.000 Y110.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X88.000 Y110.000 E0.11220 F1800
+G1 X88.000 Y113.000 E0.11220
+G1 X85.000 Y113.000 E0.11220
+G1 X85.000 Y110.000 E0.11220
+G1 X85.450 Y110.450 F1800
+G1 X87.550 Y110.450 E0.07854 F1800
+G1 X87.550 Y112.550 E0.07854
+G1 X85.450 Y112.550 E0.07854
+G1 X85.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X90.000 Y110.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X93.000 Y110.000 E0.11220 F1800
+G1 X93.000 Y113.000 E0.11220
+G1 X90.000 Y113.000 E0.11220
+G1 X90.000 Y110.000 E0.11220
+G1 X90.450 Y110.450 F1800
+G1 X92.550 Y110.450 E0.07854 F1800
+G1 X92.550 Y112.550 E0.07854
+G1 X90.450 Y112.550 E0.07854
+G1 X90.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X95.000 Y110.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X98.000 Y110.000 E0.11220 F1800
+G1 X98.000 Y113.000 E0.11220
+G1 X95.000 Y113.000 E0.11220
+G1 X95.000 Y110.000 E0.11220
+G1 X95.450 Y110.450 F1800
+G1 X97.550 Y110.450 E0.07854 F1800
+G1 X97.550 Y112.550 E0.07854
+G1 X95.450 Y112.550 E0.07854
+G1 X95.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X100.000 Y110.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X103.000 Y110.000 E0.11220 F1800
+G1 X103.000 Y113.000 E0.11220
+G1 X100.000 Y113.000 E0.11220
+G1 X100.000 Y110.000 E0.11220
+G1 X100.450 Y110.450 F1800
+G1 X102.550 Y110.450 E0.07854 F1800
+G1 X102.550 Y112.550 E0.07854
+G1 X100.450 Y112.550 E0.07854
+G1 X100.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X105.000 Y110.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X108.000 Y110.000 E0.11220 F1800
+G1 X108.000 Y113.000 E0.11220
+G1 X105.000 Y113.000 E0.11220
+G1 X105.000 Y110.000 E0.11220
+G1 X105.450 Y110.450 F1800
+G1 X107.550 Y110.450 E0.07854 F1800
+G1 X107.550 Y112.550 E0.07854
+G1 X105.450 Y112.550 E0.07854
+G1 X105.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X110.000 Y110.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X113.000 Y110.000 E0.11220 F1800
+G1 X113.000 Y113.000 E0.11220
+G1 X110.000 Y113.000 E0.11220
+G1 X110.000 Y110.000 E0.11220
+G1 X110.450 Y110.450 F1800
+G1 X112.550 Y110.450 E0.07854 F1800
+G1 X112.550 Y112.550 E0.07854
+G1 X110.450 Y112.550 E0.07854
+G1 X110.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X115.000 Y110.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X118.000 Y110.000 E0.11220 F1800
+G1 X118.000 Y113.000 E0.11220
+G1 X115.000 Y113.000 E0.11220
+G1 X115.000 Y110.000 E0.11220
+G1 X115.450 Y110.450 F1800
+G1 X117.550 Y110.450 E0.07854 F1800
+G1 X117.550 Y112.550 E0.07854
+G1 X115.450 Y112.550 E0.07854
+G1 X115.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X115.000 Y115.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X118.000 Y115.000 E0.11220 F1800
+G1 X118.000 Y118.000 E0.11220
+G1 X115.000 Y118.000 E0.11220
+G1 X115.000 Y115.000 E0.11220
+G1 X115.450 Y115.450 F1800
+G1 X117.550 Y115.450 E0.07854 F1800
+G1 X117.550 Y117.550 E0.07854
+G1 X115.450 Y117.550 E0.07854
+G1 X115.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X110.000 Y115.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X113.000 Y115.000 E0.11220 F1800
+G1 X113.000 Y118.000 E0.11220
+G1 X110.000 Y118.000 E0.11220
+G1 X110.000 Y115.000 E0.11220
+G1 X110.450 Y115.450 F1800
+G1 X112.550 Y115.450 E0.07854 F1800
+G1 X112.550 Y117.550 E0.07854
+G1 X110.450 Y117.550 E0.07854
+G1 X110.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X105.000 Y115.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X108.000 Y115.000 E0.11220 F1800
+G1 X108.000 Y118.000 E0.11220
+G1 X105.000 Y118.000 E0.11220
+G1 X105.000 Y115.000 E0.11220
+G1 X105.450 Y115.450 F1800
+G1 X107.550 Y115.450 E0.07854 F1800
+G1 X107.550 Y117.550 E0.07854
+G1 X105.450 Y117.550 E0.07854
+G1 X105.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X100.000 Y115.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X103.000 Y115.000 E0.11220 F1800
+G1 X103.000 Y118.000 E0.11220
+G1 X100.000 Y118.000 E0.11220
+G1 X100.000 Y115.000 E0.11220
+G1 X100.450 Y115.450 F1800
+G1 X102.550 Y115.450 E0.07854 F1800
+G1 X102.550 Y117.550 E0.07854
+G1 X100.450 Y117.550 E0.07854
+G1 X100.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X95.000 Y115.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X98.000 Y115.000 E0.11220 F1800
+G1 X98.000 Y118.000 E0.11220
+G1 X95.000 Y118.000 E0.11220
+G1 X95.000 Y115.000 E0.11220
+G1 X95.450 Y115.450 F1800
+G1 X97.550 Y115.450 E0.07854 F1800
+G1 X97.550 Y117.550 E0.07854
+G1 X95.450 Y117.550 E0.07854
+G1 X95.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X90.000 Y115.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X93.000 Y115.000 E0.11220 F1800
+G1 X93.000 Y118.000 E0.11220
+G1 X90.000 Y118.000 E0.11220
+G1 X90.000 Y115.000 E0.11220
+G1 X90.450 Y115.450 F1800
+G1 X92.550 Y115.450 E0.07854 F1800
+G1 X92.550 Y117.550 E0.07854
+G1 X90.450 Y117.550 E0.07854
+G1 X90.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X85.000 Y115.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X88.000 Y115.000 E0.11220 F1800
+G1 X88.000 Y118.000 E0.11220
+G1 X85.000 Y118.000 E0.11220
+G1 X85.000 Y115.000 E0.11220
+G1 X85.450 Y115.450 F1800
+G1 X87.550 Y115.450 E0.07854 F1800
+G1 X87.550 Y117.550 E0.07854
+G1 X85.450 Y117.550 E0.07854
+G1 X85.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.000 F1200
+G1 X80.000 Y115.000 F9000
+G1 Z0.200 F1200
+G1 E0.8 F2400
+G1 X83.000 Y115.000 E0.11220 F1800
+G1 X83.000 Y118.000 E0.11220
+G1 X80.000 Y118.000 E0.11220
+G1 X80.000 Y115.000 E0.11220
+G1 X80.450 Y115.450 F1800
+G1 X82.550 Y115.450 E0.07854 F1800
+G1 X82.550 Y117.550 E0.07854
+G1 X80.450 Y117.550 E0.07854
+G1 X80.450 Y115.450 E0.07854
+;LAYER:1
+G1 Z0.400 F1200
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X80.000 Y80.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X83.000 Y80.000 E0.11220 F1800
+G1 X83.000 Y83.000 E0.11220
+G1 X80.000 Y83.000 E0.11220
+G1 X80.000 Y80.000 E0.11220
+G1 X80.450 Y80.450 F1800
+G1 X82.550 Y80.450 E0.07854 F1800
+G1 X82.550 Y82.550 E0.07854
+G1 X80.450 Y82.550 E0.07854
+G1 X80.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X85.000 Y80.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X88.000 Y80.000 E0.11220 F1800
+G1 X88.000 Y83.000 E0.11220
+G1 X85.000 Y83.000 E0.11220
+G1 X85.000 Y80.000 E0.11220
+G1 X85.450 Y80.450 F1800
+G1 X87.550 Y80.450 E0.07854 F1800
+G1 X87.550 Y82.550 E0.07854
+G1 X85.450 Y82.550 E0.07854
+G1 X85.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X90.000 Y80.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X93.000 Y80.000 E0.11220 F1800
+G1 X93.000 Y83.000 E0.11220
+G1 X90.000 Y83.000 E0.11220
+G1 X90.000 Y80.000 E0.11220
+G1 X90.450 Y80.450 F1800
+G1 X92.550 Y80.450 E0.07854 F1800
+G1 X92.550 Y82.550 E0.07854
+G1 X90.450 Y82.550 E0.07854
+G1 X90.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X95.000 Y80.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X98.000 Y80.000 E0.11220 F1800
+G1 X98.000 Y83.000 E0.11220
+G1 X95.000 Y83.000 E0.11220
+G1 X95.000 Y80.000 E0.11220
+G1 X95.450 Y80.450 F1800
+G1 X97.550 Y80.450 E0.07854 F1800
+G1 X97.550 Y82.550 E0.07854
+G1 X95.450 Y82.550 E0.07854
+G1 X95.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X100.000 Y80.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X103.000 Y80.000 E0.11220 F1800
+G1 X103.000 Y83.000 E0.11220
+G1 X100.000 Y83.000 E0.11220
+G1 X100.000 Y80.000 E0.11220
+G1 X100.450 Y80.450 F1800
+G1 X102.550 Y80.450 E0.07854 F1800
+G1 X102.550 Y82.550 E0.07854
+G1 X100.450 Y82.550 E0.07854
+G1 X100.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X105.000 Y80.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X108.000 Y80.000 E0.11220 F1800
+G1 X108.000 Y83.000 E0.11220
+G1 X105.000 Y83.000 E0.11220
+G1 X105.000 Y80.000 E0.11220
+G1 X105.450 Y80.450 F1800
+G1 X107.550 Y80.450 E0.07854 F1800
+G1 X107.550 Y82.550 E0.07854
+G1 X105.450 Y82.550 E0.07854
+G1 X105.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X110.000 Y80.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X113.000 Y80.000 E0.11220 F1800
+G1 X113.000 Y83.000 E0.11220
+G1 X110.000 Y83.000 E0.11220
+G1 X110.000 Y80.000 E0.11220
+G1 X110.450 Y80.450 F1800
+G1 X112.550 Y80.450 E0.07854 F1800
+G1 X112.550 Y82.550 E0.07854
+G1 X110.450 Y82.550 E0.07854
+G1 X110.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X115.000 Y80.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X118.000 Y80.000 E0.11220 F1800
+G1 X118.000 Y83.000 E0.11220
+G1 X115.000 Y83.000 E0.11220
+G1 X115.000 Y80.000 E0.11220
+G1 X115.450 Y80.450 F1800
+G1 X117.550 Y80.450 E0.07854 F1800
+G1 X117.550 Y82.550 E0.07854
+G1 X115.450 Y82.550 E0.07854
+G1 X115.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X115.000 Y85.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X118.000 Y85.000 E0.11220 F1800
+G1 X118.000 Y88.000 E0.11220
+G1 X115.000 Y88.000 E0.11220
+G1 X115.000 Y85.000 E0.11220
+G1 X115.450 Y85.450 F1800
+G1 X117.550 Y85.450 E0.07854 F1800
+G1 X117.550 Y87.550 E0.07854
+G1 X115.450 Y87.550 E0.07854
+G1 X115.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X110.000 Y85.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X113.000 Y85.000 E0.11220 F1800
+G1 X113.000 Y88.000 E0.11220
+G1 X110.000 Y88.000 E0.11220
+G1 X110.000 Y85.000 E0.11220
+G1 X110.450 Y85.450 F1800
+G1 X112.550 Y85.450 E0.07854 F1800
+G1 X112.550 Y87.550 E0.07854
+G1 X110.450 Y87.550 E0.07854
+G1 X110.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X105.000 Y85.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X108.000 Y85.000 E0.11220 F1800
+G1 X108.000 Y88.000 E0.11220
+G1 X105.000 Y88.000 E0.11220
+G1 X105.000 Y85.000 E0.11220
+G1 X105.450 Y85.450 F1800
+G1 X107.550 Y85.450 E0.07854 F1800
+G1 X107.550 Y87.550 E0.07854
+G1 X105.450 Y87.550 E0.07854
+G1 X105.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X100.000 Y85.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X103.000 Y85.000 E0.11220 F1800
+G1 X103.000 Y88.000 E0.11220
+G1 X100.000 Y88.000 E0.11220
+G1 X100.000 Y85.000 E0.11220
+G1 X100.450 Y85.450 F1800
+G1 X102.550 Y85.450 E0.07854 F1800
+G1 X102.550 Y87.550 E0.07854
+G1 X100.450 Y87.550 E0.07854
+G1 X100.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X95.000 Y85.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X98.000 Y85.000 E0.11220 F1800
+G1 X98.000 Y88.000 E0.11220
+G1 X95.000 Y88.000 E0.11220
+G1 X95.000 Y85.000 E0.11220
+G1 X95.450 Y85.450 F1800
+G1 X97.550 Y85.450 E0.07854 F1800
+G1 X97.550 Y87.550 E0.07854
+G1 X95.450 Y87.550 E0.07854
+G1 X95.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X90.000 Y85.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X93.000 Y85.000 E0.11220 F1800
+G1 X93.000 Y88.000 E0.11220
+G1 X90.000 Y88.000 E0.11220
+G1 X90.000 Y85.000 E0.11220
+G1 X90.450 Y85.450 F1800
+G1 X92.550 Y85.450 E0.07854 F1800
+G1 X92.550 Y87.550 E0.07854
+G1 X90.450 Y87.550 E0.07854
+G1 X90.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X85.000 Y85.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X88.000 Y85.000 E0.11220 F1800
+G1 X88.000 Y88.000 E0.11220
+G1 X85.000 Y88.000 E0.11220
+G1 X85.000 Y85.000 E0.11220
+G1 X85.450 Y85.450 F1800
+G1 X87.550 Y85.450 E0.07854 F1800
+G1 X87.550 Y87.550 E0.07854
+G1 X85.450 Y87.550 E0.07854
+G1 X85.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X80.000 Y85.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X83.000 Y85.000 E0.11220 F1800
+G1 X83.000 Y88.000 E0.11220
+G1 X80.000 Y88.000 E0.11220
+G1 X80.000 Y85.000 E0.11220
+G1 X80.450 Y85.450 F1800
+G1 X82.550 Y85.450 E0.07854 F1800
+G1 X82.550 Y87.550 E0.07854
+G1 X80.450 Y87.550 E0.07854
+G1 X80.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X80.000 Y90.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X83.000 Y90.000 E0.11220 F1800
+G1 X83.000 Y93.000 E0.11220
+G1 X80.000 Y93.000 E0.11220
+G1 X80.000 Y90.000 E0.11220
+G1 X80.450 Y90.450 F1800
+G1 X82.550 Y90.450 E0.07854 F1800
+G1 X82.550 Y92.550 E0.07854
+G1 X80.450 Y92.550 E0.07854
+G1 X80.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X85.000 Y90.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X88.000 Y90.000 E0.11220 F1800
+G1 X88.000 Y93.000 E0.11220
+G1 X85.000 Y93.000 E0.11220
+G1 X85.000 Y90.000 E0.11220
+G1 X85.450 Y90.450 F1800
+G1 X87.550 Y90.450 E0.07854 F1800
+G1 X87.550 Y92.550 E0.07854
+G1 X85.450 Y92.550 E0.07854
+G1 X85.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X90.000 Y90.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X93.000 Y90.000 E0.11220 F1800
+G1 X93.000 Y93.000 E0.11220
+G1 X90.000 Y93.000 E0.11220
+G1 X90.000 Y90.000 E0.11220
+G1 X90.450 Y90.450 F1800
+G1 X92.550 Y90.450 E0.07854 F1800
+G1 X92.550 Y92.550 E0.07854
+G1 X90.450 Y92.550 E0.07854
+G1 X90.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X95.000 Y90.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X98.000 Y90.000 E0.11220 F1800
+G1 X98.000 Y93.000 E0.11220
+G1 X95.000 Y93.000 E0.11220
+G1 X95.000 Y90.000 E0.11220
+G1 X95.450 Y90.450 F1800
+G1 X97.550 Y90.450 E0.07854 F1800
+G1 X97.550 Y92.550 E0.07854
+G1 X95.450 Y92.550 E0.07854
+G1 X95.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X100.000 Y90.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X103.000 Y90.000 E0.11220 F1800
+G1 X103.000 Y93.000 E0.11220
+G1 X100.000 Y93.000 E0.11220
+G1 X100.000 Y90.000 E0.11220
+G1 X100.450 Y90.450 F1800
+G1 X102.550 Y90.450 E0.07854 F1800
+G1 X102.550 Y92.550 E0.07854
+G1 X100.450 Y92.550 E0.07854
+G1 X100.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X105.000 Y90.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X108.000 Y90.000 E0.11220 F1800
+G1 X108.000 Y93.000 E0.11220
+G1 X105.000 Y93.000 E0.11220
+G1 X105.000 Y90.000 E0.11220
+G1 X105.450 Y90.450 F1800
+G1 X107.550 Y90.450 E0.07854 F1800
+G1 X107.550 Y92.550 E0.07854
+G1 X105.450 Y92.550 E0.07854
+G1 X105.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X110.000 Y90.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X113.000 Y90.000 E0.11220 F1800
+G1 X113.000 Y93.000 E0.11220
+G1 X110.000 Y93.000 E0.11220
+G1 X110.000 Y90.000 E0.11220
+G1 X110.450 Y90.450 F1800
+G1 X112.550 Y90.450 E0.07854 F1800
+G1 X112.550 Y92.550 E0.07854
+G1 X110.450 Y92.550 E0.07854
+G1 X110.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X115.000 Y90.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X118.000 Y90.000 E0.11220 F1800
+G1 X118.000 Y93.000 E0.11220
+G1 X115.000 Y93.000 E0.11220
+G1 X115.000 Y90.000 E0.11220
+G1 X115.450 Y90.450 F1800
+G1 X117.550 Y90.450 E0.07854 F1800
+G1 X117.550 Y92.550 E0.07854
+G1 X115.450 Y92.550 E0.07854
+G1 X115.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X115.000 Y95.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X118.000 Y95.000 E0.11220 F1800
+G1 X118.000 Y98.000 E0.11220
+G1 X115.000 Y98.000 E0.11220
+G1 X115.000 Y95.000 E0.11220
+G1 X115.450 Y95.450 F1800
+G1 X117.550 Y95.450 E0.07854 F1800
+G1 X117.550 Y97.550 E0.07854
+G1 X115.450 Y97.550 E0.07854
+G1 X115.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X110.000 Y95.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X113.000 Y95.000 E0.11220 F1800
+G1 X113.000 Y98.000 E0.11220
+G1 X110.000 Y98.000 E0.11220
+G1 X110.000 Y95.000 E0.11220
+G1 X110.450 Y95.450 F1800
+G1 X112.550 Y95.450 E0.07854 F1800
+G1 X112.550 Y97.550 E0.07854
+G1 X110.450 Y97.550 E0.07854
+G1 X110.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X105.000 Y95.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X108.000 Y95.000 E0.11220 F1800
+G1 X108.000 Y98.000 E0.11220
+G1 X105.000 Y98.000 E0.11220
+G1 X105.000 Y95.000 E0.11220
+G1 X105.450 Y95.450 F1800
+G1 X107.550 Y95.450 E0.07854 F1800
+G1 X107.550 Y97.550 E0.07854
+G1 X105.450 Y97.550 E0.07854
+G1 X105.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X100.000 Y95.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X103.000 Y95.000 E0.11220 F1800
+G1 X103.000 Y98.000 E0.11220
+G1 X100.000 Y98.000 E0.11220
+G1 X100.000 Y95.000 E0.11220
+G1 X100.450 Y95.450 F1800
+G1 X102.550 Y95.450 E0.07854 F1800
+G1 X102.550 Y97.550 E0.07854
+G1 X100.450 Y97.550 E0.07854
+G1 X100.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X95.000 Y95.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X98.000 Y95.000 E0.11220 F1800
+G1 X98.000 Y98.000 E0.11220
+G1 X95.000 Y98.000 E0.11220
+G1 X95.000 Y95.000 E0.11220
+G1 X95.450 Y95.450 F1800
+G1 X97.550 Y95.450 E0.07854 F1800
+G1 X97.550 Y97.550 E0.07854
+G1 X95.450 Y97.550 E0.07854
+G1 X95.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X90.000 Y95.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X93.000 Y95.000 E0.11220 F1800
+G1 X93.000 Y98.000 E0.11220
+G1 X90.000 Y98.000 E0.11220
+G1 X90.000 Y95.000 E0.11220
+G1 X90.450 Y95.450 F1800
+G1 X92.550 Y95.450 E0.07854 F1800
+G1 X92.550 Y97.550 E0.07854
+G1 X90.450 Y97.550 E0.07854
+G1 X90.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X85.000 Y95.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X88.000 Y95.000 E0.11220 F1800
+G1 X88.000 Y98.000 E0.11220
+G1 X85.000 Y98.000 E0.11220
+G1 X85.000 Y95.000 E0.11220
+G1 X85.450 Y95.450 F1800
+G1 X87.550 Y95.450 E0.07854 F1800
+G1 X87.550 Y97.550 E0.07854
+G1 X85.450 Y97.550 E0.07854
+G1 X85.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X80.000 Y95.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X83.000 Y95.000 E0.11220 F1800
+G1 X83.000 Y98.000 E0.11220
+G1 X80.000 Y98.000 E0.11220
+G1 X80.000 Y95.000 E0.11220
+G1 X80.450 Y95.450 F1800
+G1 X82.550 Y95.450 E0.07854 F1800
+G1 X82.550 Y97.550 E0.07854
+G1 X80.450 Y97.550 E0.07854
+G1 X80.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X80.000 Y100.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X83.000 Y100.000 E0.11220 F1800
+G1 X83.000 Y103.000 E0.11220
+G1 X80.000 Y103.000 E0.11220
+G1 X80.000 Y100.000 E0.11220
+G1 X80.450 Y100.450 F1800
+G1 X82.550 Y100.450 E0.07854 F1800
+G1 X82.550 Y102.550 E0.07854
+G1 X80.450 Y102.550 E0.07854
+G1 X80.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X85.000 Y100.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X88.000 Y100.000 E0.11220 F1800
+G1 X88.000 Y103.000 E0.11220
+G1 X85.000 Y103.000 E0.11220
+G1 X85.000 Y100.000 E0.11220
+G1 X85.450 Y100.450 F1800
+G1 X87.550 Y100.450 E0.07854 F1800
+G1 X87.550 Y102.550 E0.07854
+G1 X85.450 Y102.550 E0.07854
+G1 X85.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X90.000 Y100.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X93.000 Y100.000 E0.11220 F1800
+G1 X93.000 Y103.000 E0.11220
+G1 X90.000 Y103.000 E0.11220
+G1 X90.000 Y100.000 E0.11220
+G1 X90.450 Y100.450 F1800
+G1 X92.550 Y100.450 E0.07854 F1800
+G1 X92.550 Y102.550 E0.07854
+G1 X90.450 Y102.550 E0.07854
+G1 X90.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X95.000 Y100.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X98.000 Y100.000 E0.11220 F1800
+G1 X98.000 Y103.000 E0.11220
+G1 X95.000 Y103.000 E0.11220
+G1 X95.000 Y100.000 E0.11220
+G1 X95.450 Y100.450 F1800
+G1 X97.550 Y100.450 E0.07854 F1800
+G1 X97.550 Y102.550 E0.07854
+G1 X95.450 Y102.550 E0.07854
+G1 X95.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X100.000 Y100.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X103.000 Y100.000 E0.11220 F1800
+G1 X103.000 Y103.000 E0.11220
+G1 X100.000 Y103.000 E0.11220
+G1 X100.000 Y100.000 E0.11220
+G1 X100.450 Y100.450 F1800
+G1 X102.550 Y100.450 E0.07854 F1800
+G1 X102.550 Y102.550 E0.07854
+G1 X100.450 Y102.550 E0.07854
+G1 X100.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X105.000 Y100.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X108.000 Y100.000 E0.11220 F1800
+G1 X108.000 Y103.000 E0.11220
+G1 X105.000 Y103.000 E0.11220
+G1 X105.000 Y100.000 E0.11220
+G1 X105.450 Y100.450 F1800
+G1 X107.550 Y100.450 E0.07854 F1800
+G1 X107.550 Y102.550 E0.07854
+G1 X105.450 Y102.550 E0.07854
+G1 X105.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X110.000 Y100.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X113.000 Y100.000 E0.11220 F1800
+G1 X113.000 Y103.000 E0.11220
+G1 X110.000 Y103.000 E0.11220
+G1 X110.000 Y100.000 E0.11220
+G1 X110.450 Y100.450 F1800
+G1 X112.550 Y100.450 E0.07854 F1800
+G1 X112.550 Y102.550 E0.07854
+G1 X110.450 Y102.550 E0.07854
+G1 X110.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X115.000 Y100.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X118.000 Y100.000 E0.11220 F1800
+G1 X118.000 Y103.000 E0.11220
+G1 X115.000 Y103.000 E0.11220
+G1 X115.000 Y100.000 E0.11220
+G1 X115.450 Y100.450 F1800
+G1 X117.550 Y100.450 E0.07854 F1800
+G1 X117.550 Y102.550 E0.07854
+G1 X115.450 Y102.550 E0.07854
+G1 X115.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X115.000 Y105.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X118.000 Y105.000 E0.11220 F1800
+G1 X118.000 Y108.000 E0.11220
+G1 X115.000 Y108.000 E0.11220
+G1 X115.000 Y105.000 E0.11220
+G1 X115.450 Y105.450 F1800
+G1 X117.550 Y105.450 E0.07854 F1800
+G1 X117.550 Y107.550 E0.07854
+G1 X115.450 Y107.550 E0.07854
+G1 X115.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X110.000 Y105.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X113.000 Y105.000 E0.11220 F1800
+G1 X113.000 Y108.000 E0.11220
+G1 X110.000 Y108.000 E0.11220
+G1 X110.000 Y105.000 E0.11220
+G1 X110.450 Y105.450 F1800
+G1 X112.550 Y105.450 E0.07854 F1800
+G1 X112.550 Y107.550 E0.07854
+G1 X110.450 Y107.550 E0.07854
+G1 X110.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X105.000 Y105.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X108.000 Y105.000 E0.11220 F1800
+G1 X108.000 Y108.000 E0.11220
+G1 X105.000 Y108.000 E0.11220
+G1 X105.000 Y105.000 E0.11220
+G1 X105.450 Y105.450 F1800
+G1 X107.550 Y105.450 E0.07854 F1800
+G1 X107.550 Y107.550 E0.07854
+G1 X105.450 Y107.550 E0.07854
+G1 X105.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X100.000 Y105.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X103.000 Y105.000 E0.11220 F1800
+G1 X103.000 Y108.000 E0.11220
+G1 X100.000 Y108.000 E0.11220
+G1 X100.000 Y105.000 E0.11220
+G1 X100.450 Y105.450 F1800
+G1 X102.550 Y105.450 E0.07854 F1800
+G1 X102.550 Y107.550 E0.07854
+G1 X100.450 Y107.550 E0.07854
+G1 X100.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X95.000 Y105.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X98.000 Y105.000 E0.11220 F1800
+G1 X98.000 Y108.000 E0.11220
+G1 X95.000 Y108.000 E0.11220
+G1 X95.000 Y105.000 E0.11220
+G1 X95.450 Y105.450 F1800
+G1 X97.550 Y105.450 E0.07854 F1800
+G1 X97.550 Y107.550 E0.07854
+G1 X95.450 Y107.550 E0.07854
+G1 X95.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X90.000 Y105.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X93.000 Y105.000 E0.11220 F1800
+G1 X93.000 Y108.000 E0.11220
+G1 X90.000 Y108.000 E0.11220
+G1 X90.000 Y105.000 E0.11220
+G1 X90.450 Y105.450 F1800
+G1 X92.550 Y105.450 E0.07854 F1800
+G1 X92.550 Y107.550 E0.07854
+G1 X90.450 Y107.550 E0.07854
+G1 X90.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X85.000 Y105.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X88.000 Y105.000 E0.11220 F1800
+G1 X88.000 Y108.000 E0.11220
+G1 X85.000 Y108.000 E0.11220
+G1 X85.000 Y105.000 E0.11220
+G1 X85.450 Y105.450 F1800
+G1 X87.550 Y105.450 E0.07854 F1800
+G1 X87.550 Y107.550 E0.07854
+G1 X85.450 Y107.550 E0.07854
+G1 X85.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X80.000 Y105.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X83.000 Y105.000 E0.11220 F1800
+G1 X83.000 Y108.000 E0.11220
+G1 X80.000 Y108.000 E0.11220
+G1 X80.000 Y105.000 E0.11220
+G1 X80.450 Y105.450 F1800
+G1 X82.550 Y105.450 E0.07854 F1800
+G1 X82.550 Y107.550 E0.07854
+G1 X80.450 Y107.550 E0.07854
+G1 X80.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X80.000 Y110.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X83.000 Y110.000 E0.11220 F1800
+G1 X83.000 Y113.000 E0.11220
+G1 X80.000 Y113.000 E0.11220
+G1 X80.000 Y110.000 E0.11220
+G1 X80.450 Y110.450 F1800
+G1 X82.550 Y110.450 E0.07854 F1800
+G1 X82.550 Y112.550 E0.07854
+G1 X80.450 Y112.550 E0.07854
+G1 X80.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X85.000 Y110.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X88.000 Y110.000 E0.11220 F1800
+G1 X88.000 Y113.000 E0.11220
+G1 X85.000 Y113.000 E0.11220
+G1 X85.000 Y110.000 E0.11220
+G1 X85.450 Y110.450 F1800
+G1 X87.550 Y110.450 E0.07854 F1800
+G1 X87.550 Y112.550 E0.07854
+G1 X85.450 Y112.550 E0.07854
+G1 X85.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X90.000 Y110.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X93.000 Y110.000 E0.11220 F1800
+G1 X93.000 Y113.000 E0.11220
+G1 X90.000 Y113.000 E0.11220
+G1 X90.000 Y110.000 E0.11220
+G1 X90.450 Y110.450 F1800
+G1 X92.550 Y110.450 E0.07854 F1800
+G1 X92.550 Y112.550 E0.07854
+G1 X90.450 Y112.550 E0.07854
+G1 X90.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X95.000 Y110.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X98.000 Y110.000 E0.11220 F1800
+G1 X98.000 Y113.000 E0.11220
+G1 X95.000 Y113.000 E0.11220
+G1 X95.000 Y110.000 E0.11220
+G1 X95.450 Y110.450 F1800
+G1 X97.550 Y110.450 E0.07854 F1800
+G1 X97.550 Y112.550 E0.07854
+G1 X95.450 Y112.550 E0.07854
+G1 X95.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X100.000 Y110.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X103.000 Y110.000 E0.11220 F1800
+G1 X103.000 Y113.000 E0.11220
+G1 X100.000 Y113.000 E0.11220
+G1 X100.000 Y110.000 E0.11220
+G1 X100.450 Y110.450 F1800
+G1 X102.550 Y110.450 E0.07854 F1800
+G1 X102.550 Y112.550 E0.07854
+G1 X100.450 Y112.550 E0.07854
+G1 X100.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X105.000 Y110.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X108.000 Y110.000 E0.11220 F1800
+G1 X108.000 Y113.000 E0.11220
+G1 X105.000 Y113.000 E0.11220
+G1 X105.000 Y110.000 E0.11220
+G1 X105.450 Y110.450 F1800
+G1 X107.550 Y110.450 E0.07854 F1800
+G1 X107.550 Y112.550 E0.07854
+G1 X105.450 Y112.550 E0.07854
+G1 X105.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X110.000 Y110.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X113.000 Y110.000 E0.11220 F1800
+G1 X113.000 Y113.000 E0.11220
+G1 X110.000 Y113.000 E0.11220
+G1 X110.000 Y110.000 E0.11220
+G1 X110.450 Y110.450 F1800
+G1 X112.550 Y110.450 E0.07854 F1800
+G1 X112.550 Y112.550 E0.07854
+G1 X110.450 Y112.550 E0.07854
+G1 X110.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X115.000 Y110.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X118.000 Y110.000 E0.11220 F1800
+G1 X118.000 Y113.000 E0.11220
+G1 X115.000 Y113.000 E0.11220
+G1 X115.000 Y110.000 E0.11220
+G1 X115.450 Y110.450 F1800
+G1 X117.550 Y110.450 E0.07854 F1800
+G1 X117.550 Y112.550 E0.07854
+G1 X115.450 Y112.550 E0.07854
+G1 X115.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X115.000 Y115.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X118.000 Y115.000 E0.11220 F1800
+G1 X118.000 Y118.000 E0.11220
+G1 X115.000 Y118.000 E0.11220
+G1 X115.000 Y115.000 E0.11220
+G1 X115.450 Y115.450 F1800
+G1 X117.550 Y115.450 E0.07854 F1800
+G1 X117.550 Y117.550 E0.07854
+G1 X115.450 Y117.550 E0.07854
+G1 X115.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X110.000 Y115.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X113.000 Y115.000 E0.11220 F1800
+G1 X113.000 Y118.000 E0.11220
+G1 X110.000 Y118.000 E0.11220
+G1 X110.000 Y115.000 E0.11220
+G1 X110.450 Y115.450 F1800
+G1 X112.550 Y115.450 E0.07854 F1800
+G1 X112.550 Y117.550 E0.07854
+G1 X110.450 Y117.550 E0.07854
+G1 X110.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X105.000 Y115.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X108.000 Y115.000 E0.11220 F1800
+G1 X108.000 Y118.000 E0.11220
+G1 X105.000 Y118.000 E0.11220
+G1 X105.000 Y115.000 E0.11220
+G1 X105.450 Y115.450 F1800
+G1 X107.550 Y115.450 E0.07854 F1800
+G1 X107.550 Y117.550 E0.07854
+G1 X105.450 Y117.550 E0.07854
+G1 X105.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X100.000 Y115.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X103.000 Y115.000 E0.11220 F1800
+G1 X103.000 Y118.000 E0.11220
+G1 X100.000 Y118.000 E0.11220
+G1 X100.000 Y115.000 E0.11220
+G1 X100.450 Y115.450 F1800
+G1 X102.550 Y115.450 E0.07854 F1800
+G1 X102.550 Y117.550 E0.07854
+G1 X100.450 Y117.550 E0.07854
+G1 X100.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X95.000 Y115.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X98.000 Y115.000 E0.11220 F1800
+G1 X98.000 Y118.000 E0.11220
+G1 X95.000 Y118.000 E0.11220
+G1 X95.000 Y115.000 E0.11220
+G1 X95.450 Y115.450 F1800
+G1 X97.550 Y115.450 E0.07854 F1800
+G1 X97.550 Y117.550 E0.07854
+G1 X95.450 Y117.550 E0.07854
+G1 X95.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X90.000 Y115.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X93.000 Y115.000 E0.11220 F1800
+G1 X93.000 Y118.000 E0.11220
+G1 X90.000 Y118.000 E0.11220
+G1 X90.000 Y115.000 E0.11220
+G1 X90.450 Y115.450 F1800
+G1 X92.550 Y115.450 E0.07854 F1800
+G1 X92.550 Y117.550 E0.07854
+G1 X90.450 Y117.550 E0.07854
+G1 X90.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X85.000 Y115.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X88.000 Y115.000 E0.11220 F1800
+G1 X88.000 Y118.000 E0.11220
+G1 X85.000 Y118.000 E0.11220
+G1 X85.000 Y115.000 E0.11220
+G1 X85.450 Y115.450 F1800
+G1 X87.550 Y115.450 E0.07854 F1800
+G1 X87.550 Y117.550 E0.07854
+G1 X85.450 Y117.550 E0.07854
+G1 X85.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.200 F1200
+G1 X80.000 Y115.000 F9000
+G1 Z0.400 F1200
+G1 E0.8 F2400
+G1 X83.000 Y115.000 E0.11220 F1800
+G1 X83.000 Y118.000 E0.11220
+G1 X80.000 Y118.000 E0.11220
+G1 X80.000 Y115.000 E0.11220
+G1 X80.450 Y115.450 F1800
+G1 X82.550 Y115.450 E0.07854 F1800
+G1 X82.550 Y117.550 E0.07854
+G1 X80.450 Y117.550 E0.07854
+G1 X80.450 Y115.450 E0.07854
+;LAYER:2
+G1 Z0.600 F1200
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X80.000 Y80.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X83.000 Y80.000 E0.11220 F1800
+G1 X83.000 Y83.000 E0.11220
+G1 X80.000 Y83.000 E0.11220
+G1 X80.000 Y80.000 E0.11220
+G1 X80.450 Y80.450 F1800
+G1 X82.550 Y80.450 E0.07854 F1800
+G1 X82.550 Y82.550 E0.07854
+G1 X80.450 Y82.550 E0.07854
+G1 X80.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X85.000 Y80.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X88.000 Y80.000 E0.11220 F1800
+G1 X88.000 Y83.000 E0.11220
+G1 X85.000 Y83.000 E0.11220
+G1 X85.000 Y80.000 E0.11220
+G1 X85.450 Y80.450 F1800
+G1 X87.550 Y80.450 E0.07854 F1800
+G1 X87.550 Y82.550 E0.07854
+G1 X85.450 Y82.550 E0.07854
+G1 X85.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X90.000 Y80.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X93.000 Y80.000 E0.11220 F1800
+G1 X93.000 Y83.000 E0.11220
+G1 X90.000 Y83.000 E0.11220
+G1 X90.000 Y80.000 E0.11220
+G1 X90.450 Y80.450 F1800
+G1 X92.550 Y80.450 E0.07854 F1800
+G1 X92.550 Y82.550 E0.07854
+G1 X90.450 Y82.550 E0.07854
+G1 X90.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X95.000 Y80.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X98.000 Y80.000 E0.11220 F1800
+G1 X98.000 Y83.000 E0.11220
+G1 X95.000 Y83.000 E0.11220
+G1 X95.000 Y80.000 E0.11220
+G1 X95.450 Y80.450 F1800
+G1 X97.550 Y80.450 E0.07854 F1800
+G1 X97.550 Y82.550 E0.07854
+G1 X95.450 Y82.550 E0.07854
+G1 X95.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X100.000 Y80.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X103.000 Y80.000 E0.11220 F1800
+G1 X103.000 Y83.000 E0.11220
+G1 X100.000 Y83.000 E0.11220
+G1 X100.000 Y80.000 E0.11220
+G1 X100.450 Y80.450 F1800
+G1 X102.550 Y80.450 E0.07854 F1800
+G1 X102.550 Y82.550 E0.07854
+G1 X100.450 Y82.550 E0.07854
+G1 X100.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X105.000 Y80.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X108.000 Y80.000 E0.11220 F1800
+G1 X108.000 Y83.000 E0.11220
+G1 X105.000 Y83.000 E0.11220
+G1 X105.000 Y80.000 E0.11220
+G1 X105.450 Y80.450 F1800
+G1 X107.550 Y80.450 E0.07854 F1800
+G1 X107.550 Y82.550 E0.07854
+G1 X105.450 Y82.550 E0.07854
+G1 X105.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X110.000 Y80.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X113.000 Y80.000 E0.11220 F1800
+G1 X113.000 Y83.000 E0.11220
+G1 X110.000 Y83.000 E0.11220
+G1 X110.000 Y80.000 E0.11220
+G1 X110.450 Y80.450 F1800
+G1 X112.550 Y80.450 E0.07854 F1800
+G1 X112.550 Y82.550 E0.07854
+G1 X110.450 Y82.550 E0.07854
+G1 X110.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X115.000 Y80.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X118.000 Y80.000 E0.11220 F1800
+G1 X118.000 Y83.000 E0.11220
+G1 X115.000 Y83.000 E0.11220
+G1 X115.000 Y80.000 E0.11220
+G1 X115.450 Y80.450 F1800
+G1 X117.550 Y80.450 E0.07854 F1800
+G1 X117.550 Y82.550 E0.07854
+G1 X115.450 Y82.550 E0.07854
+G1 X115.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X115.000 Y85.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X118.000 Y85.000 E0.11220 F1800
+G1 X118.000 Y88.000 E0.11220
+G1 X115.000 Y88.000 E0.11220
+G1 X115.000 Y85.000 E0.11220
+G1 X115.450 Y85.450 F1800
+G1 X117.550 Y85.450 E0.07854 F1800
+G1 X117.550 Y87.550 E0.07854
+G1 X115.450 Y87.550 E0.07854
+G1 X115.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X110.000 Y85.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X113.000 Y85.000 E0.11220 F1800
+G1 X113.000 Y88.000 E0.11220
+G1 X110.000 Y88.000 E0.11220
+G1 X110.000 Y85.000 E0.11220
+G1 X110.450 Y85.450 F1800
+G1 X112.550 Y85.450 E0.07854 F1800
+G1 X112.550 Y87.550 E0.07854
+G1 X110.450 Y87.550 E0.07854
+G1 X110.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X105.000 Y85.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X108.000 Y85.000 E0.11220 F1800
+G1 X108.000 Y88.000 E0.11220
+G1 X105.000 Y88.000 E0.11220
+G1 X105.000 Y85.000 E0.11220
+G1 X105.450 Y85.450 F1800
+G1 X107.550 Y85.450 E0.07854 F1800
+G1 X107.550 Y87.550 E0.07854
+G1 X105.450 Y87.550 E0.07854
+G1 X105.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X100.000 Y85.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X103.000 Y85.000 E0.11220 F1800
+G1 X103.000 Y88.000 E0.11220
+G1 X100.000 Y88.000 E0.11220
+G1 X100.000 Y85.000 E0.11220
+G1 X100.450 Y85.450 F1800
+G1 X102.550 Y85.450 E0.07854 F1800
+G1 X102.550 Y87.550 E0.07854
+G1 X100.450 Y87.550 E0.07854
+G1 X100.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X95.000 Y85.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X98.000 Y85.000 E0.11220 F1800
+G1 X98.000 Y88.000 E0.11220
+G1 X95.000 Y88.000 E0.11220
+G1 X95.000 Y85.000 E0.11220
+G1 X95.450 Y85.450 F1800
+G1 X97.550 Y85.450 E0.07854 F1800
+G1 X97.550 Y87.550 E0.07854
+G1 X95.450 Y87.550 E0.07854
+G1 X95.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X90.000 Y85.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X93.000 Y85.000 E0.11220 F1800
+G1 X93.000 Y88.000 E0.11220
+G1 X90.000 Y88.000 E0.11220
+G1 X90.000 Y85.000 E0.11220
+G1 X90.450 Y85.450 F1800
+G1 X92.550 Y85.450 E0.07854 F1800
+G1 X92.550 Y87.550 E0.07854
+G1 X90.450 Y87.550 E0.07854
+G1 X90.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X85.000 Y85.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X88.000 Y85.000 E0.11220 F1800
+G1 X88.000 Y88.000 E0.11220
+G1 X85.000 Y88.000 E0.11220
+G1 X85.000 Y85.000 E0.11220
+G1 X85.450 Y85.450 F1800
+G1 X87.550 Y85.450 E0.07854 F1800
+G1 X87.550 Y87.550 E0.07854
+G1 X85.450 Y87.550 E0.07854
+G1 X85.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X80.000 Y85.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X83.000 Y85.000 E0.11220 F1800
+G1 X83.000 Y88.000 E0.11220
+G1 X80.000 Y88.000 E0.11220
+G1 X80.000 Y85.000 E0.11220
+G1 X80.450 Y85.450 F1800
+G1 X82.550 Y85.450 E0.07854 F1800
+G1 X82.550 Y87.550 E0.07854
+G1 X80.450 Y87.550 E0.07854
+G1 X80.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X80.000 Y90.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X83.000 Y90.000 E0.11220 F1800
+G1 X83.000 Y93.000 E0.11220
+G1 X80.000 Y93.000 E0.11220
+G1 X80.000 Y90.000 E0.11220
+G1 X80.450 Y90.450 F1800
+G1 X82.550 Y90.450 E0.07854 F1800
+G1 X82.550 Y92.550 E0.07854
+G1 X80.450 Y92.550 E0.07854
+G1 X80.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X85.000 Y90.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X88.000 Y90.000 E0.11220 F1800
+G1 X88.000 Y93.000 E0.11220
+G1 X85.000 Y93.000 E0.11220
+G1 X85.000 Y90.000 E0.11220
+G1 X85.450 Y90.450 F1800
+G1 X87.550 Y90.450 E0.07854 F1800
+G1 X87.550 Y92.550 E0.07854
+G1 X85.450 Y92.550 E0.07854
+G1 X85.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X90.000 Y90.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X93.000 Y90.000 E0.11220 F1800
+G1 X93.000 Y93.000 E0.11220
+G1 X90.000 Y93.000 E0.11220
+G1 X90.000 Y90.000 E0.11220
+G1 X90.450 Y90.450 F1800
+G1 X92.550 Y90.450 E0.07854 F1800
+G1 X92.550 Y92.550 E0.07854
+G1 X90.450 Y92.550 E0.07854
+G1 X90.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X95.000 Y90.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X98.000 Y90.000 E0.11220 F1800
+G1 X98.000 Y93.000 E0.11220
+G1 X95.000 Y93.000 E0.11220
+G1 X95.000 Y90.000 E0.11220
+G1 X95.450 Y90.450 F1800
+G1 X97.550 Y90.450 E0.07854 F1800
+G1 X97.550 Y92.550 E0.07854
+G1 X95.450 Y92.550 E0.07854
+G1 X95.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X100.000 Y90.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X103.000 Y90.000 E0.11220 F1800
+G1 X103.000 Y93.000 E0.11220
+G1 X100.000 Y93.000 E0.11220
+G1 X100.000 Y90.000 E0.11220
+G1 X100.450 Y90.450 F1800
+G1 X102.550 Y90.450 E0.07854 F1800
+G1 X102.550 Y92.550 E0.07854
+G1 X100.450 Y92.550 E0.07854
+G1 X100.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X105.000 Y90.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X108.000 Y90.000 E0.11220 F1800
+G1 X108.000 Y93.000 E0.11220
+G1 X105.000 Y93.000 E0.11220
+G1 X105.000 Y90.000 E0.11220
+G1 X105.450 Y90.450 F1800
+G1 X107.550 Y90.450 E0.07854 F1800
+G1 X107.550 Y92.550 E0.07854
+G1 X105.450 Y92.550 E0.07854
+G1 X105.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X110.000 Y90.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X113.000 Y90.000 E0.11220 F1800
+G1 X113.000 Y93.000 E0.11220
+G1 X110.000 Y93.000 E0.11220
+G1 X110.000 Y90.000 E0.11220
+G1 X110.450 Y90.450 F1800
+G1 X112.550 Y90.450 E0.07854 F1800
+G1 X112.550 Y92.550 E0.07854
+G1 X110.450 Y92.550 E0.07854
+G1 X110.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X115.000 Y90.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X118.000 Y90.000 E0.11220 F1800
+G1 X118.000 Y93.000 E0.11220
+G1 X115.000 Y93.000 E0.11220
+G1 X115.000 Y90.000 E0.11220
+G1 X115.450 Y90.450 F1800
+G1 X117.550 Y90.450 E0.07854 F1800
+G1 X117.550 Y92.550 E0.07854
+G1 X115.450 Y92.550 E0.07854
+G1 X115.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X115.000 Y95.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X118.000 Y95.000 E0.11220 F1800
+G1 X118.000 Y98.000 E0.11220
+G1 X115.000 Y98.000 E0.11220
+G1 X115.000 Y95.000 E0.11220
+G1 X115.450 Y95.450 F1800
+G1 X117.550 Y95.450 E0.07854 F1800
+G1 X117.550 Y97.550 E0.07854
+G1 X115.450 Y97.550 E0.07854
+G1 X115.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X110.000 Y95.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X113.000 Y95.000 E0.11220 F1800
+G1 X113.000 Y98.000 E0.11220
+G1 X110.000 Y98.000 E0.11220
+G1 X110.000 Y95.000 E0.11220
+G1 X110.450 Y95.450 F1800
+G1 X112.550 Y95.450 E0.07854 F1800
+G1 X112.550 Y97.550 E0.07854
+G1 X110.450 Y97.550 E0.07854
+G1 X110.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X105.000 Y95.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X108.000 Y95.000 E0.11220 F1800
+G1 X108.000 Y98.000 E0.11220
+G1 X105.000 Y98.000 E0.11220
+G1 X105.000 Y95.000 E0.11220
+G1 X105.450 Y95.450 F1800
+G1 X107.550 Y95.450 E0.07854 F1800
+G1 X107.550 Y97.550 E0.07854
+G1 X105.450 Y97.550 E0.07854
+G1 X105.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X100.000 Y95.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X103.000 Y95.000 E0.11220 F1800
+G1 X103.000 Y98.000 E0.11220
+G1 X100.000 Y98.000 E0.11220
+G1 X100.000 Y95.000 E0.11220
+G1 X100.450 Y95.450 F1800
+G1 X102.550 Y95.450 E0.07854 F1800
+G1 X102.550 Y97.550 E0.07854
+G1 X100.450 Y97.550 E0.07854
+G1 X100.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X95.000 Y95.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X98.000 Y95.000 E0.11220 F1800
+G1 X98.000 Y98.000 E0.11220
+G1 X95.000 Y98.000 E0.11220
+G1 X95.000 Y95.000 E0.11220
+G1 X95.450 Y95.450 F1800
+G1 X97.550 Y95.450 E0.07854 F1800
+G1 X97.550 Y97.550 E0.07854
+G1 X95.450 Y97.550 E0.07854
+G1 X95.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X90.000 Y95.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X93.000 Y95.000 E0.11220 F1800
+G1 X93.000 Y98.000 E0.11220
+G1 X90.000 Y98.000 E0.11220
+G1 X90.000 Y95.000 E0.11220
+G1 X90.450 Y95.450 F1800
+G1 X92.550 Y95.450 E0.07854 F1800
+G1 X92.550 Y97.550 E0.07854
+G1 X90.450 Y97.550 E0.07854
+G1 X90.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X85.000 Y95.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X88.000 Y95.000 E0.11220 F1800
+G1 X88.000 Y98.000 E0.11220
+G1 X85.000 Y98.000 E0.11220
+G1 X85.000 Y95.000 E0.11220
+G1 X85.450 Y95.450 F1800
+G1 X87.550 Y95.450 E0.07854 F1800
+G1 X87.550 Y97.550 E0.07854
+G1 X85.450 Y97.550 E0.07854
+G1 X85.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X80.000 Y95.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X83.000 Y95.000 E0.11220 F1800
+G1 X83.000 Y98.000 E0.11220
+G1 X80.000 Y98.000 E0.11220
+G1 X80.000 Y95.000 E0.11220
+G1 X80.450 Y95.450 F1800
+G1 X82.550 Y95.450 E0.07854 F1800
+G1 X82.550 Y97.550 E0.07854
+G1 X80.450 Y97.550 E0.07854
+G1 X80.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X80.000 Y100.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X83.000 Y100.000 E0.11220 F1800
+G1 X83.000 Y103.000 E0.11220
+G1 X80.000 Y103.000 E0.11220
+G1 X80.000 Y100.000 E0.11220
+G1 X80.450 Y100.450 F1800
+G1 X82.550 Y100.450 E0.07854 F1800
+G1 X82.550 Y102.550 E0.07854
+G1 X80.450 Y102.550 E0.07854
+G1 X80.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X85.000 Y100.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X88.000 Y100.000 E0.11220 F1800
+G1 X88.000 Y103.000 E0.11220
+G1 X85.000 Y103.000 E0.11220
+G1 X85.000 Y100.000 E0.11220
+G1 X85.450 Y100.450 F1800
+G1 X87.550 Y100.450 E0.07854 F1800
+G1 X87.550 Y102.550 E0.07854
+G1 X85.450 Y102.550 E0.07854
+G1 X85.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X90.000 Y100.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X93.000 Y100.000 E0.11220 F1800
+G1 X93.000 Y103.000 E0.11220
+G1 X90.000 Y103.000 E0.11220
+G1 X90.000 Y100.000 E0.11220
+G1 X90.450 Y100.450 F1800
+G1 X92.550 Y100.450 E0.07854 F1800
+G1 X92.550 Y102.550 E0.07854
+G1 X90.450 Y102.550 E0.07854
+G1 X90.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X95.000 Y100.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X98.000 Y100.000 E0.11220 F1800
+G1 X98.000 Y103.000 E0.11220
+G1 X95.000 Y103.000 E0.11220
+G1 X95.000 Y100.000 E0.11220
+G1 X95.450 Y100.450 F1800
+G1 X97.550 Y100.450 E0.07854 F1800
+G1 X97.550 Y102.550 E0.07854
+G1 X95.450 Y102.550 E0.07854
+G1 X95.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X100.000 Y100.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X103.000 Y100.000 E0.11220 F1800
+G1 X103.000 Y103.000 E0.11220
+G1 X100.000 Y103.000 E0.11220
+G1 X100.000 Y100.000 E0.11220
+G1 X100.450 Y100.450 F1800
+G1 X102.550 Y100.450 E0.07854 F1800
+G1 X102.550 Y102.550 E0.07854
+G1 X100.450 Y102.550 E0.07854
+G1 X100.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X105.000 Y100.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X108.000 Y100.000 E0.11220 F1800
+G1 X108.000 Y103.000 E0.11220
+G1 X105.000 Y103.000 E0.11220
+G1 X105.000 Y100.000 E0.11220
+G1 X105.450 Y100.450 F1800
+G1 X107.550 Y100.450 E0.07854 F1800
+G1 X107.550 Y102.550 E0.07854
+G1 X105.450 Y102.550 E0.07854
+G1 X105.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X110.000 Y100.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X113.000 Y100.000 E0.11220 F1800
+G1 X113.000 Y103.000 E0.11220
+G1 X110.000 Y103.000 E0.11220
+G1 X110.000 Y100.000 E0.11220
+G1 X110.450 Y100.450 F1800
+G1 X112.550 Y100.450 E0.07854 F1800
+G1 X112.550 Y102.550 E0.07854
+G1 X110.450 Y102.550 E0.07854
+G1 X110.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X115.000 Y100.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X118.000 Y100.000 E0.11220 F1800
+G1 X118.000 Y103.000 E0.11220
+G1 X115.000 Y103.000 E0.11220
+G1 X115.000 Y100.000 E0.11220
+G1 X115.450 Y100.450 F1800
+G1 X117.550 Y100.450 E0.07854 F1800
+G1 X117.550 Y102.550 E0.07854
+G1 X115.450 Y102.550 E0.07854
+G1 X115.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X115.000 Y105.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X118.000 Y105.000 E0.11220 F1800
+G1 X118.000 Y108.000 E0.11220
+G1 X115.000 Y108.000 E0.11220
+G1 X115.000 Y105.000 E0.11220
+G1 X115.450 Y105.450 F1800
+G1 X117.550 Y105.450 E0.07854 F1800
+G1 X117.550 Y107.550 E0.07854
+G1 X115.450 Y107.550 E0.07854
+G1 X115.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X110.000 Y105.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X113.000 Y105.000 E0.11220 F1800
+G1 X113.000 Y108.000 E0.11220
+G1 X110.000 Y108.000 E0.11220
+G1 X110.000 Y105.000 E0.11220
+G1 X110.450 Y105.450 F1800
+G1 X112.550 Y105.450 E0.07854 F1800
+G1 X112.550 Y107.550 E0.07854
+G1 X110.450 Y107.550 E0.07854
+G1 X110.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X105.000 Y105.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X108.000 Y105.000 E0.11220 F1800
+G1 X108.000 Y108.000 E0.11220
+G1 X105.000 Y108.000 E0.11220
+G1 X105.000 Y105.000 E0.11220
+G1 X105.450 Y105.450 F1800
+G1 X107.550 Y105.450 E0.07854 F1800
+G1 X107.550 Y107.550 E0.07854
+G1 X105.450 Y107.550 E0.07854
+G1 X105.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X100.000 Y105.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X103.000 Y105.000 E0.11220 F1800
+G1 X103.000 Y108.000 E0.11220
+G1 X100.000 Y108.000 E0.11220
+G1 X100.000 Y105.000 E0.11220
+G1 X100.450 Y105.450 F1800
+G1 X102.550 Y105.450 E0.07854 F1800
+G1 X102.550 Y107.550 E0.07854
+G1 X100.450 Y107.550 E0.07854
+G1 X100.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X95.000 Y105.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X98.000 Y105.000 E0.11220 F1800
+G1 X98.000 Y108.000 E0.11220
+G1 X95.000 Y108.000 E0.11220
+G1 X95.000 Y105.000 E0.11220
+G1 X95.450 Y105.450 F1800
+G1 X97.550 Y105.450 E0.07854 F1800
+G1 X97.550 Y107.550 E0.07854
+G1 X95.450 Y107.550 E0.07854
+G1 X95.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X90.000 Y105.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X93.000 Y105.000 E0.11220 F1800
+G1 X93.000 Y108.000 E0.11220
+G1 X90.000 Y108.000 E0.11220
+G1 X90.000 Y105.000 E0.11220
+G1 X90.450 Y105.450 F1800
+G1 X92.550 Y105.450 E0.07854 F1800
+G1 X92.550 Y107.550 E0.07854
+G1 X90.450 Y107.550 E0.07854
+G1 X90.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X85.000 Y105.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X88.000 Y105.000 E0.11220 F1800
+G1 X88.000 Y108.000 E0.11220
+G1 X85.000 Y108.000 E0.11220
+G1 X85.000 Y105.000 E0.11220
+G1 X85.450 Y105.450 F1800
+G1 X87.550 Y105.450 E0.07854 F1800
+G1 X87.550 Y107.550 E0.07854
+G1 X85.450 Y107.550 E0.07854
+G1 X85.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X80.000 Y105.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X83.000 Y105.000 E0.11220 F1800
+G1 X83.000 Y108.000 E0.11220
+G1 X80.000 Y108.000 E0.11220
+G1 X80.000 Y105.000 E0.11220
+G1 X80.450 Y105.450 F1800
+G1 X82.550 Y105.450 E0.07854 F1800
+G1 X82.550 Y107.550 E0.07854
+G1 X80.450 Y107.550 E0.07854
+G1 X80.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X80.000 Y110.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X83.000 Y110.000 E0.11220 F1800
+G1 X83.000 Y113.000 E0.11220
+G1 X80.000 Y113.000 E0.11220
+G1 X80.000 Y110.000 E0.11220
+G1 X80.450 Y110.450 F1800
+G1 X82.550 Y110.450 E0.07854 F1800
+G1 X82.550 Y112.550 E0.07854
+G1 X80.450 Y112.550 E0.07854
+G1 X80.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X85.000 Y110.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X88.000 Y110.000 E0.11220 F1800
+G1 X88.000 Y113.000 E0.11220
+G1 X85.000 Y113.000 E0.11220
+G1 X85.000 Y110.000 E0.11220
+G1 X85.450 Y110.450 F1800
+G1 X87.550 Y110.450 E0.07854 F1800
+G1 X87.550 Y112.550 E0.07854
+G1 X85.450 Y112.550 E0.07854
+G1 X85.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X90.000 Y110.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X93.000 Y110.000 E0.11220 F1800
+G1 X93.000 Y113.000 E0.11220
+G1 X90.000 Y113.000 E0.11220
+G1 X90.000 Y110.000 E0.11220
+G1 X90.450 Y110.450 F1800
+G1 X92.550 Y110.450 E0.07854 F1800
+G1 X92.550 Y112.550 E0.07854
+G1 X90.450 Y112.550 E0.07854
+G1 X90.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X95.000 Y110.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X98.000 Y110.000 E0.11220 F1800
+G1 X98.000 Y113.000 E0.11220
+G1 X95.000 Y113.000 E0.11220
+G1 X95.000 Y110.000 E0.11220
+G1 X95.450 Y110.450 F1800
+G1 X97.550 Y110.450 E0.07854 F1800
+G1 X97.550 Y112.550 E0.07854
+G1 X95.450 Y112.550 E0.07854
+G1 X95.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X100.000 Y110.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X103.000 Y110.000 E0.11220 F1800
+G1 X103.000 Y113.000 E0.11220
+G1 X100.000 Y113.000 E0.11220
+G1 X100.000 Y110.000 E0.11220
+G1 X100.450 Y110.450 F1800
+G1 X102.550 Y110.450 E0.07854 F1800
+G1 X102.550 Y112.550 E0.07854
+G1 X100.450 Y112.550 E0.07854
+G1 X100.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X105.000 Y110.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X108.000 Y110.000 E0.11220 F1800
+G1 X108.000 Y113.000 E0.11220
+G1 X105.000 Y113.000 E0.11220
+G1 X105.000 Y110.000 E0.11220
+G1 X105.450 Y110.450 F1800
+G1 X107.550 Y110.450 E0.07854 F1800
+G1 X107.550 Y112.550 E0.07854
+G1 X105.450 Y112.550 E0.07854
+G1 X105.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X110.000 Y110.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X113.000 Y110.000 E0.11220 F1800
+G1 X113.000 Y113.000 E0.11220
+G1 X110.000 Y113.000 E0.11220
+G1 X110.000 Y110.000 E0.11220
+G1 X110.450 Y110.450 F1800
+G1 X112.550 Y110.450 E0.07854 F1800
+G1 X112.550 Y112.550 E0.07854
+G1 X110.450 Y112.550 E0.07854
+G1 X110.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X115.000 Y110.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X118.000 Y110.000 E0.11220 F1800
+G1 X118.000 Y113.000 E0.11220
+G1 X115.000 Y113.000 E0.11220
+G1 X115.000 Y110.000 E0.11220
+G1 X115.450 Y110.450 F1800
+G1 X117.550 Y110.450 E0.07854 F1800
+G1 X117.550 Y112.550 E0.07854
+G1 X115.450 Y112.550 E0.07854
+G1 X115.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X115.000 Y115.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X118.000 Y115.000 E0.11220 F1800
+G1 X118.000 Y118.000 E0.11220
+G1 X115.000 Y118.000 E0.11220
+G1 X115.000 Y115.000 E0.11220
+G1 X115.450 Y115.450 F1800
+G1 X117.550 Y115.450 E0.07854 F1800
+G1 X117.550 Y117.550 E0.07854
+G1 X115.450 Y117.550 E0.07854
+G1 X115.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X110.000 Y115.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X113.000 Y115.000 E0.11220 F1800
+G1 X113.000 Y118.000 E0.11220
+G1 X110.000 Y118.000 E0.11220
+G1 X110.000 Y115.000 E0.11220
+G1 X110.450 Y115.450 F1800
+G1 X112.550 Y115.450 E0.07854 F1800
+G1 X112.550 Y117.550 E0.07854
+G1 X110.450 Y117.550 E0.07854
+G1 X110.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X105.000 Y115.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X108.000 Y115.000 E0.11220 F1800
+G1 X108.000 Y118.000 E0.11220
+G1 X105.000 Y118.000 E0.11220
+G1 X105.000 Y115.000 E0.11220
+G1 X105.450 Y115.450 F1800
+G1 X107.550 Y115.450 E0.07854 F1800
+G1 X107.550 Y117.550 E0.07854
+G1 X105.450 Y117.550 E0.07854
+G1 X105.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X100.000 Y115.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X103.000 Y115.000 E0.11220 F1800
+G1 X103.000 Y118.000 E0.11220
+G1 X100.000 Y118.000 E0.11220
+G1 X100.000 Y115.000 E0.11220
+G1 X100.450 Y115.450 F1800
+G1 X102.550 Y115.450 E0.07854 F1800
+G1 X102.550 Y117.550 E0.07854
+G1 X100.450 Y117.550 E0.07854
+G1 X100.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X95.000 Y115.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X98.000 Y115.000 E0.11220 F1800
+G1 X98.000 Y118.000 E0.11220
+G1 X95.000 Y118.000 E0.11220
+G1 X95.000 Y115.000 E0.11220
+G1 X95.450 Y115.450 F1800
+G1 X97.550 Y115.450 E0.07854 F1800
+G1 X97.550 Y117.550 E0.07854
+G1 X95.450 Y117.550 E0.07854
+G1 X95.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X90.000 Y115.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X93.000 Y115.000 E0.11220 F1800
+G1 X93.000 Y118.000 E0.11220
+G1 X90.000 Y118.000 E0.11220
+G1 X90.000 Y115.000 E0.11220
+G1 X90.450 Y115.450 F1800
+G1 X92.550 Y115.450 E0.07854 F1800
+G1 X92.550 Y117.550 E0.07854
+G1 X90.450 Y117.550 E0.07854
+G1 X90.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X85.000 Y115.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X88.000 Y115.000 E0.11220 F1800
+G1 X88.000 Y118.000 E0.11220
+G1 X85.000 Y118.000 E0.11220
+G1 X85.000 Y115.000 E0.11220
+G1 X85.450 Y115.450 F1800
+G1 X87.550 Y115.450 E0.07854 F1800
+G1 X87.550 Y117.550 E0.07854
+G1 X85.450 Y117.550 E0.07854
+G1 X85.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.400 F1200
+G1 X80.000 Y115.000 F9000
+G1 Z0.600 F1200
+G1 E0.8 F2400
+G1 X83.000 Y115.000 E0.11220 F1800
+G1 X83.000 Y118.000 E0.11220
+G1 X80.000 Y118.000 E0.11220
+G1 X80.000 Y115.000 E0.11220
+G1 X80.450 Y115.450 F1800
+G1 X82.550 Y115.450 E0.07854 F1800
+G1 X82.550 Y117.550 E0.07854
+G1 X80.450 Y117.550 E0.07854
+G1 X80.450 Y115.450 E0.07854
+;LAYER:3
+G1 Z0.800 F1200
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X80.000 Y80.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X83.000 Y80.000 E0.11220 F1800
+G1 X83.000 Y83.000 E0.11220
+G1 X80.000 Y83.000 E0.11220
+G1 X80.000 Y80.000 E0.11220
+G1 X80.450 Y80.450 F1800
+G1 X82.550 Y80.450 E0.07854 F1800
+G1 X82.550 Y82.550 E0.07854
+G1 X80.450 Y82.550 E0.07854
+G1 X80.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X85.000 Y80.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X88.000 Y80.000 E0.11220 F1800
+G1 X88.000 Y83.000 E0.11220
+G1 X85.000 Y83.000 E0.11220
+G1 X85.000 Y80.000 E0.11220
+G1 X85.450 Y80.450 F1800
+G1 X87.550 Y80.450 E0.07854 F1800
+G1 X87.550 Y82.550 E0.07854
+G1 X85.450 Y82.550 E0.07854
+G1 X85.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X90.000 Y80.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X93.000 Y80.000 E0.11220 F1800
+G1 X93.000 Y83.000 E0.11220
+G1 X90.000 Y83.000 E0.11220
+G1 X90.000 Y80.000 E0.11220
+G1 X90.450 Y80.450 F1800
+G1 X92.550 Y80.450 E0.07854 F1800
+G1 X92.550 Y82.550 E0.07854
+G1 X90.450 Y82.550 E0.07854
+G1 X90.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X95.000 Y80.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X98.000 Y80.000 E0.11220 F1800
+G1 X98.000 Y83.000 E0.11220
+G1 X95.000 Y83.000 E0.11220
+G1 X95.000 Y80.000 E0.11220
+G1 X95.450 Y80.450 F1800
+G1 X97.550 Y80.450 E0.07854 F1800
+G1 X97.550 Y82.550 E0.07854
+G1 X95.450 Y82.550 E0.07854
+G1 X95.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X100.000 Y80.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X103.000 Y80.000 E0.11220 F1800
+G1 X103.000 Y83.000 E0.11220
+G1 X100.000 Y83.000 E0.11220
+G1 X100.000 Y80.000 E0.11220
+G1 X100.450 Y80.450 F1800
+G1 X102.550 Y80.450 E0.07854 F1800
+G1 X102.550 Y82.550 E0.07854
+G1 X100.450 Y82.550 E0.07854
+G1 X100.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X105.000 Y80.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X108.000 Y80.000 E0.11220 F1800
+G1 X108.000 Y83.000 E0.11220
+G1 X105.000 Y83.000 E0.11220
+G1 X105.000 Y80.000 E0.11220
+G1 X105.450 Y80.450 F1800
+G1 X107.550 Y80.450 E0.07854 F1800
+G1 X107.550 Y82.550 E0.07854
+G1 X105.450 Y82.550 E0.07854
+G1 X105.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X110.000 Y80.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X113.000 Y80.000 E0.11220 F1800
+G1 X113.000 Y83.000 E0.11220
+G1 X110.000 Y83.000 E0.11220
+G1 X110.000 Y80.000 E0.11220
+G1 X110.450 Y80.450 F1800
+G1 X112.550 Y80.450 E0.07854 F1800
+G1 X112.550 Y82.550 E0.07854
+G1 X110.450 Y82.550 E0.07854
+G1 X110.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X115.000 Y80.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X118.000 Y80.000 E0.11220 F1800
+G1 X118.000 Y83.000 E0.11220
+G1 X115.000 Y83.000 E0.11220
+G1 X115.000 Y80.000 E0.11220
+G1 X115.450 Y80.450 F1800
+G1 X117.550 Y80.450 E0.07854 F1800
+G1 X117.550 Y82.550 E0.07854
+G1 X115.450 Y82.550 E0.07854
+G1 X115.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X115.000 Y85.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X118.000 Y85.000 E0.11220 F1800
+G1 X118.000 Y88.000 E0.11220
+G1 X115.000 Y88.000 E0.11220
+G1 X115.000 Y85.000 E0.11220
+G1 X115.450 Y85.450 F1800
+G1 X117.550 Y85.450 E0.07854 F1800
+G1 X117.550 Y87.550 E0.07854
+G1 X115.450 Y87.550 E0.07854
+G1 X115.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X110.000 Y85.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X113.000 Y85.000 E0.11220 F1800
+G1 X113.000 Y88.000 E0.11220
+G1 X110.000 Y88.000 E0.11220
+G1 X110.000 Y85.000 E0.11220
+G1 X110.450 Y85.450 F1800
+G1 X112.550 Y85.450 E0.07854 F1800
+G1 X112.550 Y87.550 E0.07854
+G1 X110.450 Y87.550 E0.07854
+G1 X110.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X105.000 Y85.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X108.000 Y85.000 E0.11220 F1800
+G1 X108.000 Y88.000 E0.11220
+G1 X105.000 Y88.000 E0.11220
+G1 X105.000 Y85.000 E0.11220
+G1 X105.450 Y85.450 F1800
+G1 X107.550 Y85.450 E0.07854 F1800
+G1 X107.550 Y87.550 E0.07854
+G1 X105.450 Y87.550 E0.07854
+G1 X105.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X100.000 Y85.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X103.000 Y85.000 E0.11220 F1800
+G1 X103.000 Y88.000 E0.11220
+G1 X100.000 Y88.000 E0.11220
+G1 X100.000 Y85.000 E0.11220
+G1 X100.450 Y85.450 F1800
+G1 X102.550 Y85.450 E0.07854 F1800
+G1 X102.550 Y87.550 E0.07854
+G1 X100.450 Y87.550 E0.07854
+G1 X100.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X95.000 Y85.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X98.000 Y85.000 E0.11220 F1800
+G1 X98.000 Y88.000 E0.11220
+G1 X95.000 Y88.000 E0.11220
+G1 X95.000 Y85.000 E0.11220
+G1 X95.450 Y85.450 F1800
+G1 X97.550 Y85.450 E0.07854 F1800
+G1 X97.550 Y87.550 E0.07854
+G1 X95.450 Y87.550 E0.07854
+G1 X95.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X90.000 Y85.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X93.000 Y85.000 E0.11220 F1800
+G1 X93.000 Y88.000 E0.11220
+G1 X90.000 Y88.000 E0.11220
+G1 X90.000 Y85.000 E0.11220
+G1 X90.450 Y85.450 F1800
+G1 X92.550 Y85.450 E0.07854 F1800
+G1 X92.550 Y87.550 E0.07854
+G1 X90.450 Y87.550 E0.07854
+G1 X90.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X85.000 Y85.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X88.000 Y85.000 E0.11220 F1800
+G1 X88.000 Y88.000 E0.11220
+G1 X85.000 Y88.000 E0.11220
+G1 X85.000 Y85.000 E0.11220
+G1 X85.450 Y85.450 F1800
+G1 X87.550 Y85.450 E0.07854 F1800
+G1 X87.550 Y87.550 E0.07854
+G1 X85.450 Y87.550 E0.07854
+G1 X85.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X80.000 Y85.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X83.000 Y85.000 E0.11220 F1800
+G1 X83.000 Y88.000 E0.11220
+G1 X80.000 Y88.000 E0.11220
+G1 X80.000 Y85.000 E0.11220
+G1 X80.450 Y85.450 F1800
+G1 X82.550 Y85.450 E0.07854 F1800
+G1 X82.550 Y87.550 E0.07854
+G1 X80.450 Y87.550 E0.07854
+G1 X80.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X80.000 Y90.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X83.000 Y90.000 E0.11220 F1800
+G1 X83.000 Y93.000 E0.11220
+G1 X80.000 Y93.000 E0.11220
+G1 X80.000 Y90.000 E0.11220
+G1 X80.450 Y90.450 F1800
+G1 X82.550 Y90.450 E0.07854 F1800
+G1 X82.550 Y92.550 E0.07854
+G1 X80.450 Y92.550 E0.07854
+G1 X80.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X85.000 Y90.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X88.000 Y90.000 E0.11220 F1800
+G1 X88.000 Y93.000 E0.11220
+G1 X85.000 Y93.000 E0.11220
+G1 X85.000 Y90.000 E0.11220
+G1 X85.450 Y90.450 F1800
+G1 X87.550 Y90.450 E0.07854 F1800
+G1 X87.550 Y92.550 E0.07854
+G1 X85.450 Y92.550 E0.07854
+G1 X85.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X90.000 Y90.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X93.000 Y90.000 E0.11220 F1800
+G1 X93.000 Y93.000 E0.11220
+G1 X90.000 Y93.000 E0.11220
+G1 X90.000 Y90.000 E0.11220
+G1 X90.450 Y90.450 F1800
+G1 X92.550 Y90.450 E0.07854 F1800
+G1 X92.550 Y92.550 E0.07854
+G1 X90.450 Y92.550 E0.07854
+G1 X90.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X95.000 Y90.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X98.000 Y90.000 E0.11220 F1800
+G1 X98.000 Y93.000 E0.11220
+G1 X95.000 Y93.000 E0.11220
+G1 X95.000 Y90.000 E0.11220
+G1 X95.450 Y90.450 F1800
+G1 X97.550 Y90.450 E0.07854 F1800
+G1 X97.550 Y92.550 E0.07854
+G1 X95.450 Y92.550 E0.07854
+G1 X95.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X100.000 Y90.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X103.000 Y90.000 E0.11220 F1800
+G1 X103.000 Y93.000 E0.11220
+G1 X100.000 Y93.000 E0.11220
+G1 X100.000 Y90.000 E0.11220
+G1 X100.450 Y90.450 F1800
+G1 X102.550 Y90.450 E0.07854 F1800
+G1 X102.550 Y92.550 E0.07854
+G1 X100.450 Y92.550 E0.07854
+G1 X100.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X105.000 Y90.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X108.000 Y90.000 E0.11220 F1800
+G1 X108.000 Y93.000 E0.11220
+G1 X105.000 Y93.000 E0.11220
+G1 X105.000 Y90.000 E0.11220
+G1 X105.450 Y90.450 F1800
+G1 X107.550 Y90.450 E0.07854 F1800
+G1 X107.550 Y92.550 E0.07854
+G1 X105.450 Y92.550 E0.07854
+G1 X105.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X110.000 Y90.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X113.000 Y90.000 E0.11220 F1800
+G1 X113.000 Y93.000 E0.11220
+G1 X110.000 Y93.000 E0.11220
+G1 X110.000 Y90.000 E0.11220
+G1 X110.450 Y90.450 F1800
+G1 X112.550 Y90.450 E0.07854 F1800
+G1 X112.550 Y92.550 E0.07854
+G1 X110.450 Y92.550 E0.07854
+G1 X110.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X115.000 Y90.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X118.000 Y90.000 E0.11220 F1800
+G1 X118.000 Y93.000 E0.11220
+G1 X115.000 Y93.000 E0.11220
+G1 X115.000 Y90.000 E0.11220
+G1 X115.450 Y90.450 F1800
+G1 X117.550 Y90.450 E0.07854 F1800
+G1 X117.550 Y92.550 E0.07854
+G1 X115.450 Y92.550 E0.07854
+G1 X115.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X115.000 Y95.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X118.000 Y95.000 E0.11220 F1800
+G1 X118.000 Y98.000 E0.11220
+G1 X115.000 Y98.000 E0.11220
+G1 X115.000 Y95.000 E0.11220
+G1 X115.450 Y95.450 F1800
+G1 X117.550 Y95.450 E0.07854 F1800
+G1 X117.550 Y97.550 E0.07854
+G1 X115.450 Y97.550 E0.07854
+G1 X115.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X110.000 Y95.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X113.000 Y95.000 E0.11220 F1800
+G1 X113.000 Y98.000 E0.11220
+G1 X110.000 Y98.000 E0.11220
+G1 X110.000 Y95.000 E0.11220
+G1 X110.450 Y95.450 F1800
+G1 X112.550 Y95.450 E0.07854 F1800
+G1 X112.550 Y97.550 E0.07854
+G1 X110.450 Y97.550 E0.07854
+G1 X110.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X105.000 Y95.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X108.000 Y95.000 E0.11220 F1800
+G1 X108.000 Y98.000 E0.11220
+G1 X105.000 Y98.000 E0.11220
+G1 X105.000 Y95.000 E0.11220
+G1 X105.450 Y95.450 F1800
+G1 X107.550 Y95.450 E0.07854 F1800
+G1 X107.550 Y97.550 E0.07854
+G1 X105.450 Y97.550 E0.07854
+G1 X105.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X100.000 Y95.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X103.000 Y95.000 E0.11220 F1800
+G1 X103.000 Y98.000 E0.11220
+G1 X100.000 Y98.000 E0.11220
+G1 X100.000 Y95.000 E0.11220
+G1 X100.450 Y95.450 F1800
+G1 X102.550 Y95.450 E0.07854 F1800
+G1 X102.550 Y97.550 E0.07854
+G1 X100.450 Y97.550 E0.07854
+G1 X100.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X95.000 Y95.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X98.000 Y95.000 E0.11220 F1800
+G1 X98.000 Y98.000 E0.11220
+G1 X95.000 Y98.000 E0.11220
+G1 X95.000 Y95.000 E0.11220
+G1 X95.450 Y95.450 F1800
+G1 X97.550 Y95.450 E0.07854 F1800
+G1 X97.550 Y97.550 E0.07854
+G1 X95.450 Y97.550 E0.07854
+G1 X95.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X90.000 Y95.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X93.000 Y95.000 E0.11220 F1800
+G1 X93.000 Y98.000 E0.11220
+G1 X90.000 Y98.000 E0.11220
+G1 X90.000 Y95.000 E0.11220
+G1 X90.450 Y95.450 F1800
+G1 X92.550 Y95.450 E0.07854 F1800
+G1 X92.550 Y97.550 E0.07854
+G1 X90.450 Y97.550 E0.07854
+G1 X90.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X85.000 Y95.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X88.000 Y95.000 E0.11220 F1800
+G1 X88.000 Y98.000 E0.11220
+G1 X85.000 Y98.000 E0.11220
+G1 X85.000 Y95.000 E0.11220
+G1 X85.450 Y95.450 F1800
+G1 X87.550 Y95.450 E0.07854 F1800
+G1 X87.550 Y97.550 E0.07854
+G1 X85.450 Y97.550 E0.07854
+G1 X85.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X80.000 Y95.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X83.000 Y95.000 E0.11220 F1800
+G1 X83.000 Y98.000 E0.11220
+G1 X80.000 Y98.000 E0.11220
+G1 X80.000 Y95.000 E0.11220
+G1 X80.450 Y95.450 F1800
+G1 X82.550 Y95.450 E0.07854 F1800
+G1 X82.550 Y97.550 E0.07854
+G1 X80.450 Y97.550 E0.07854
+G1 X80.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X80.000 Y100.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X83.000 Y100.000 E0.11220 F1800
+G1 X83.000 Y103.000 E0.11220
+G1 X80.000 Y103.000 E0.11220
+G1 X80.000 Y100.000 E0.11220
+G1 X80.450 Y100.450 F1800
+G1 X82.550 Y100.450 E0.07854 F1800
+G1 X82.550 Y102.550 E0.07854
+G1 X80.450 Y102.550 E0.07854
+G1 X80.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X85.000 Y100.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X88.000 Y100.000 E0.11220 F1800
+G1 X88.000 Y103.000 E0.11220
+G1 X85.000 Y103.000 E0.11220
+G1 X85.000 Y100.000 E0.11220
+G1 X85.450 Y100.450 F1800
+G1 X87.550 Y100.450 E0.07854 F1800
+G1 X87.550 Y102.550 E0.07854
+G1 X85.450 Y102.550 E0.07854
+G1 X85.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X90.000 Y100.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X93.000 Y100.000 E0.11220 F1800
+G1 X93.000 Y103.000 E0.11220
+G1 X90.000 Y103.000 E0.11220
+G1 X90.000 Y100.000 E0.11220
+G1 X90.450 Y100.450 F1800
+G1 X92.550 Y100.450 E0.07854 F1800
+G1 X92.550 Y102.550 E0.07854
+G1 X90.450 Y102.550 E0.07854
+G1 X90.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X95.000 Y100.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X98.000 Y100.000 E0.11220 F1800
+G1 X98.000 Y103.000 E0.11220
+G1 X95.000 Y103.000 E0.11220
+G1 X95.000 Y100.000 E0.11220
+G1 X95.450 Y100.450 F1800
+G1 X97.550 Y100.450 E0.07854 F1800
+G1 X97.550 Y102.550 E0.07854
+G1 X95.450 Y102.550 E0.07854
+G1 X95.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X100.000 Y100.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X103.000 Y100.000 E0.11220 F1800
+G1 X103.000 Y103.000 E0.11220
+G1 X100.000 Y103.000 E0.11220
+G1 X100.000 Y100.000 E0.11220
+G1 X100.450 Y100.450 F1800
+G1 X102.550 Y100.450 E0.07854 F1800
+G1 X102.550 Y102.550 E0.07854
+G1 X100.450 Y102.550 E0.07854
+G1 X100.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X105.000 Y100.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X108.000 Y100.000 E0.11220 F1800
+G1 X108.000 Y103.000 E0.11220
+G1 X105.000 Y103.000 E0.11220
+G1 X105.000 Y100.000 E0.11220
+G1 X105.450 Y100.450 F1800
+G1 X107.550 Y100.450 E0.07854 F1800
+G1 X107.550 Y102.550 E0.07854
+G1 X105.450 Y102.550 E0.07854
+G1 X105.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X110.000 Y100.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X113.000 Y100.000 E0.11220 F1800
+G1 X113.000 Y103.000 E0.11220
+G1 X110.000 Y103.000 E0.11220
+G1 X110.000 Y100.000 E0.11220
+G1 X110.450 Y100.450 F1800
+G1 X112.550 Y100.450 E0.07854 F1800
+G1 X112.550 Y102.550 E0.07854
+G1 X110.450 Y102.550 E0.07854
+G1 X110.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X115.000 Y100.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X118.000 Y100.000 E0.11220 F1800
+G1 X118.000 Y103.000 E0.11220
+G1 X115.000 Y103.000 E0.11220
+G1 X115.000 Y100.000 E0.11220
+G1 X115.450 Y100.450 F1800
+G1 X117.550 Y100.450 E0.07854 F1800
+G1 X117.550 Y102.550 E0.07854
+G1 X115.450 Y102.550 E0.07854
+G1 X115.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X115.000 Y105.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X118.000 Y105.000 E0.11220 F1800
+G1 X118.000 Y108.000 E0.11220
+G1 X115.000 Y108.000 E0.11220
+G1 X115.000 Y105.000 E0.11220
+G1 X115.450 Y105.450 F1800
+G1 X117.550 Y105.450 E0.07854 F1800
+G1 X117.550 Y107.550 E0.07854
+G1 X115.450 Y107.550 E0.07854
+G1 X115.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X110.000 Y105.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X113.000 Y105.000 E0.11220 F1800
+G1 X113.000 Y108.000 E0.11220
+G1 X110.000 Y108.000 E0.11220
+G1 X110.000 Y105.000 E0.11220
+G1 X110.450 Y105.450 F1800
+G1 X112.550 Y105.450 E0.07854 F1800
+G1 X112.550 Y107.550 E0.07854
+G1 X110.450 Y107.550 E0.07854
+G1 X110.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X105.000 Y105.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X108.000 Y105.000 E0.11220 F1800
+G1 X108.000 Y108.000 E0.11220
+G1 X105.000 Y108.000 E0.11220
+G1 X105.000 Y105.000 E0.11220
+G1 X105.450 Y105.450 F1800
+G1 X107.550 Y105.450 E0.07854 F1800
+G1 X107.550 Y107.550 E0.07854
+G1 X105.450 Y107.550 E0.07854
+G1 X105.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X100.000 Y105.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X103.000 Y105.000 E0.11220 F1800
+G1 X103.000 Y108.000 E0.11220
+G1 X100.000 Y108.000 E0.11220
+G1 X100.000 Y105.000 E0.11220
+G1 X100.450 Y105.450 F1800
+G1 X102.550 Y105.450 E0.07854 F1800
+G1 X102.550 Y107.550 E0.07854
+G1 X100.450 Y107.550 E0.07854
+G1 X100.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X95.000 Y105.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X98.000 Y105.000 E0.11220 F1800
+G1 X98.000 Y108.000 E0.11220
+G1 X95.000 Y108.000 E0.11220
+G1 X95.000 Y105.000 E0.11220
+G1 X95.450 Y105.450 F1800
+G1 X97.550 Y105.450 E0.07854 F1800
+G1 X97.550 Y107.550 E0.07854
+G1 X95.450 Y107.550 E0.07854
+G1 X95.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X90.000 Y105.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X93.000 Y105.000 E0.11220 F1800
+G1 X93.000 Y108.000 E0.11220
+G1 X90.000 Y108.000 E0.11220
+G1 X90.000 Y105.000 E0.11220
+G1 X90.450 Y105.450 F1800
+G1 X92.550 Y105.450 E0.07854 F1800
+G1 X92.550 Y107.550 E0.07854
+G1 X90.450 Y107.550 E0.07854
+G1 X90.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X85.000 Y105.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X88.000 Y105.000 E0.11220 F1800
+G1 X88.000 Y108.000 E0.11220
+G1 X85.000 Y108.000 E0.11220
+G1 X85.000 Y105.000 E0.11220
+G1 X85.450 Y105.450 F1800
+G1 X87.550 Y105.450 E0.07854 F1800
+G1 X87.550 Y107.550 E0.07854
+G1 X85.450 Y107.550 E0.07854
+G1 X85.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X80.000 Y105.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X83.000 Y105.000 E0.11220 F1800
+G1 X83.000 Y108.000 E0.11220
+G1 X80.000 Y108.000 E0.11220
+G1 X80.000 Y105.000 E0.11220
+G1 X80.450 Y105.450 F1800
+G1 X82.550 Y105.450 E0.07854 F1800
+G1 X82.550 Y107.550 E0.07854
+G1 X80.450 Y107.550 E0.07854
+G1 X80.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X80.000 Y110.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X83.000 Y110.000 E0.11220 F1800
+G1 X83.000 Y113.000 E0.11220
+G1 X80.000 Y113.000 E0.11220
+G1 X80.000 Y110.000 E0.11220
+G1 X80.450 Y110.450 F1800
+G1 X82.550 Y110.450 E0.07854 F1800
+G1 X82.550 Y112.550 E0.07854
+G1 X80.450 Y112.550 E0.07854
+G1 X80.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X85.000 Y110.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X88.000 Y110.000 E0.11220 F1800
+G1 X88.000 Y113.000 E0.11220
+G1 X85.000 Y113.000 E0.11220
+G1 X85.000 Y110.000 E0.11220
+G1 X85.450 Y110.450 F1800
+G1 X87.550 Y110.450 E0.07854 F1800
+G1 X87.550 Y112.550 E0.07854
+G1 X85.450 Y112.550 E0.07854
+G1 X85.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X90.000 Y110.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X93.000 Y110.000 E0.11220 F1800
+G1 X93.000 Y113.000 E0.11220
+G1 X90.000 Y113.000 E0.11220
+G1 X90.000 Y110.000 E0.11220
+G1 X90.450 Y110.450 F1800
+G1 X92.550 Y110.450 E0.07854 F1800
+G1 X92.550 Y112.550 E0.07854
+G1 X90.450 Y112.550 E0.07854
+G1 X90.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X95.000 Y110.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X98.000 Y110.000 E0.11220 F1800
+G1 X98.000 Y113.000 E0.11220
+G1 X95.000 Y113.000 E0.11220
+G1 X95.000 Y110.000 E0.11220
+G1 X95.450 Y110.450 F1800
+G1 X97.550 Y110.450 E0.07854 F1800
+G1 X97.550 Y112.550 E0.07854
+G1 X95.450 Y112.550 E0.07854
+G1 X95.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X100.000 Y110.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X103.000 Y110.000 E0.11220 F1800
+G1 X103.000 Y113.000 E0.11220
+G1 X100.000 Y113.000 E0.11220
+G1 X100.000 Y110.000 E0.11220
+G1 X100.450 Y110.450 F1800
+G1 X102.550 Y110.450 E0.07854 F1800
+G1 X102.550 Y112.550 E0.07854
+G1 X100.450 Y112.550 E0.07854
+G1 X100.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X105.000 Y110.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X108.000 Y110.000 E0.11220 F1800
+G1 X108.000 Y113.000 E0.11220
+G1 X105.000 Y113.000 E0.11220
+G1 X105.000 Y110.000 E0.11220
+G1 X105.450 Y110.450 F1800
+G1 X107.550 Y110.450 E0.07854 F1800
+G1 X107.550 Y112.550 E0.07854
+G1 X105.450 Y112.550 E0.07854
+G1 X105.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X110.000 Y110.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X113.000 Y110.000 E0.11220 F1800
+G1 X113.000 Y113.000 E0.11220
+G1 X110.000 Y113.000 E0.11220
+G1 X110.000 Y110.000 E0.11220
+G1 X110.450 Y110.450 F1800
+G1 X112.550 Y110.450 E0.07854 F1800
+G1 X112.550 Y112.550 E0.07854
+G1 X110.450 Y112.550 E0.07854
+G1 X110.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X115.000 Y110.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X118.000 Y110.000 E0.11220 F1800
+G1 X118.000 Y113.000 E0.11220
+G1 X115.000 Y113.000 E0.11220
+G1 X115.000 Y110.000 E0.11220
+G1 X115.450 Y110.450 F1800
+G1 X117.550 Y110.450 E0.07854 F1800
+G1 X117.550 Y112.550 E0.07854
+G1 X115.450 Y112.550 E0.07854
+G1 X115.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X115.000 Y115.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X118.000 Y115.000 E0.11220 F1800
+G1 X118.000 Y118.000 E0.11220
+G1 X115.000 Y118.000 E0.11220
+G1 X115.000 Y115.000 E0.11220
+G1 X115.450 Y115.450 F1800
+G1 X117.550 Y115.450 E0.07854 F1800
+G1 X117.550 Y117.550 E0.07854
+G1 X115.450 Y117.550 E0.07854
+G1 X115.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X110.000 Y115.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X113.000 Y115.000 E0.11220 F1800
+G1 X113.000 Y118.000 E0.11220
+G1 X110.000 Y118.000 E0.11220
+G1 X110.000 Y115.000 E0.11220
+G1 X110.450 Y115.450 F1800
+G1 X112.550 Y115.450 E0.07854 F1800
+G1 X112.550 Y117.550 E0.07854
+G1 X110.450 Y117.550 E0.07854
+G1 X110.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X105.000 Y115.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X108.000 Y115.000 E0.11220 F1800
+G1 X108.000 Y118.000 E0.11220
+G1 X105.000 Y118.000 E0.11220
+G1 X105.000 Y115.000 E0.11220
+G1 X105.450 Y115.450 F1800
+G1 X107.550 Y115.450 E0.07854 F1800
+G1 X107.550 Y117.550 E0.07854
+G1 X105.450 Y117.550 E0.07854
+G1 X105.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X100.000 Y115.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X103.000 Y115.000 E0.11220 F1800
+G1 X103.000 Y118.000 E0.11220
+G1 X100.000 Y118.000 E0.11220
+G1 X100.000 Y115.000 E0.11220
+G1 X100.450 Y115.450 F1800
+G1 X102.550 Y115.450 E0.07854 F1800
+G1 X102.550 Y117.550 E0.07854
+G1 X100.450 Y117.550 E0.07854
+G1 X100.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X95.000 Y115.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X98.000 Y115.000 E0.11220 F1800
+G1 X98.000 Y118.000 E0.11220
+G1 X95.000 Y118.000 E0.11220
+G1 X95.000 Y115.000 E0.11220
+G1 X95.450 Y115.450 F1800
+G1 X97.550 Y115.450 E0.07854 F1800
+G1 X97.550 Y117.550 E0.07854
+G1 X95.450 Y117.550 E0.07854
+G1 X95.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X90.000 Y115.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X93.000 Y115.000 E0.11220 F1800
+G1 X93.000 Y118.000 E0.11220
+G1 X90.000 Y118.000 E0.11220
+G1 X90.000 Y115.000 E0.11220
+G1 X90.450 Y115.450 F1800
+G1 X92.550 Y115.450 E0.07854 F1800
+G1 X92.550 Y117.550 E0.07854
+G1 X90.450 Y117.550 E0.07854
+G1 X90.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X85.000 Y115.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X88.000 Y115.000 E0.11220 F1800
+G1 X88.000 Y118.000 E0.11220
+G1 X85.000 Y118.000 E0.11220
+G1 X85.000 Y115.000 E0.11220
+G1 X85.450 Y115.450 F1800
+G1 X87.550 Y115.450 E0.07854 F1800
+G1 X87.550 Y117.550 E0.07854
+G1 X85.450 Y117.550 E0.07854
+G1 X85.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.600 F1200
+G1 X80.000 Y115.000 F9000
+G1 Z0.800 F1200
+G1 E0.8 F2400
+G1 X83.000 Y115.000 E0.11220 F1800
+G1 X83.000 Y118.000 E0.11220
+G1 X80.000 Y118.000 E0.11220
+G1 X80.000 Y115.000 E0.11220
+G1 X80.450 Y115.450 F1800
+G1 X82.550 Y115.450 E0.07854 F1800
+G1 X82.550 Y117.550 E0.07854
+G1 X80.450 Y117.550 E0.07854
+G1 X80.450 Y115.450 E0.07854
+;LAYER:4
+G1 Z1.000 F1200
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X80.000 Y80.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X83.000 Y80.000 E0.11220 F1800
+G1 X83.000 Y83.000 E0.11220
+G1 X80.000 Y83.000 E0.11220
+G1 X80.000 Y80.000 E0.11220
+G1 X80.450 Y80.450 F1800
+G1 X82.550 Y80.450 E0.07854 F1800
+G1 X82.550 Y82.550 E0.07854
+G1 X80.450 Y82.550 E0.07854
+G1 X80.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X85.000 Y80.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X88.000 Y80.000 E0.11220 F1800
+G1 X88.000 Y83.000 E0.11220
+G1 X85.000 Y83.000 E0.11220
+G1 X85.000 Y80.000 E0.11220
+G1 X85.450 Y80.450 F1800
+G1 X87.550 Y80.450 E0.07854 F1800
+G1 X87.550 Y82.550 E0.07854
+G1 X85.450 Y82.550 E0.07854
+G1 X85.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X90.000 Y80.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X93.000 Y80.000 E0.11220 F1800
+G1 X93.000 Y83.000 E0.11220
+G1 X90.000 Y83.000 E0.11220
+G1 X90.000 Y80.000 E0.11220
+G1 X90.450 Y80.450 F1800
+G1 X92.550 Y80.450 E0.07854 F1800
+G1 X92.550 Y82.550 E0.07854
+G1 X90.450 Y82.550 E0.07854
+G1 X90.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X95.000 Y80.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X98.000 Y80.000 E0.11220 F1800
+G1 X98.000 Y83.000 E0.11220
+G1 X95.000 Y83.000 E0.11220
+G1 X95.000 Y80.000 E0.11220
+G1 X95.450 Y80.450 F1800
+G1 X97.550 Y80.450 E0.07854 F1800
+G1 X97.550 Y82.550 E0.07854
+G1 X95.450 Y82.550 E0.07854
+G1 X95.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X100.000 Y80.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X103.000 Y80.000 E0.11220 F1800
+G1 X103.000 Y83.000 E0.11220
+G1 X100.000 Y83.000 E0.11220
+G1 X100.000 Y80.000 E0.11220
+G1 X100.450 Y80.450 F1800
+G1 X102.550 Y80.450 E0.07854 F1800
+G1 X102.550 Y82.550 E0.07854
+G1 X100.450 Y82.550 E0.07854
+G1 X100.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X105.000 Y80.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X108.000 Y80.000 E0.11220 F1800
+G1 X108.000 Y83.000 E0.11220
+G1 X105.000 Y83.000 E0.11220
+G1 X105.000 Y80.000 E0.11220
+G1 X105.450 Y80.450 F1800
+G1 X107.550 Y80.450 E0.07854 F1800
+G1 X107.550 Y82.550 E0.07854
+G1 X105.450 Y82.550 E0.07854
+G1 X105.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X110.000 Y80.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X113.000 Y80.000 E0.11220 F1800
+G1 X113.000 Y83.000 E0.11220
+G1 X110.000 Y83.000 E0.11220
+G1 X110.000 Y80.000 E0.11220
+G1 X110.450 Y80.450 F1800
+G1 X112.550 Y80.450 E0.07854 F1800
+G1 X112.550 Y82.550 E0.07854
+G1 X110.450 Y82.550 E0.07854
+G1 X110.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X115.000 Y80.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X118.000 Y80.000 E0.11220 F1800
+G1 X118.000 Y83.000 E0.11220
+G1 X115.000 Y83.000 E0.11220
+G1 X115.000 Y80.000 E0.11220
+G1 X115.450 Y80.450 F1800
+G1 X117.550 Y80.450 E0.07854 F1800
+G1 X117.550 Y82.550 E0.07854
+G1 X115.450 Y82.550 E0.07854
+G1 X115.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X115.000 Y85.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X118.000 Y85.000 E0.11220 F1800
+G1 X118.000 Y88.000 E0.11220
+G1 X115.000 Y88.000 E0.11220
+G1 X115.000 Y85.000 E0.11220
+G1 X115.450 Y85.450 F1800
+G1 X117.550 Y85.450 E0.07854 F1800
+G1 X117.550 Y87.550 E0.07854
+G1 X115.450 Y87.550 E0.07854
+G1 X115.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X110.000 Y85.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X113.000 Y85.000 E0.11220 F1800
+G1 X113.000 Y88.000 E0.11220
+G1 X110.000 Y88.000 E0.11220
+G1 X110.000 Y85.000 E0.11220
+G1 X110.450 Y85.450 F1800
+G1 X112.550 Y85.450 E0.07854 F1800
+G1 X112.550 Y87.550 E0.07854
+G1 X110.450 Y87.550 E0.07854
+G1 X110.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X105.000 Y85.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X108.000 Y85.000 E0.11220 F1800
+G1 X108.000 Y88.000 E0.11220
+G1 X105.000 Y88.000 E0.11220
+G1 X105.000 Y85.000 E0.11220
+G1 X105.450 Y85.450 F1800
+G1 X107.550 Y85.450 E0.07854 F1800
+G1 X107.550 Y87.550 E0.07854
+G1 X105.450 Y87.550 E0.07854
+G1 X105.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X100.000 Y85.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X103.000 Y85.000 E0.11220 F1800
+G1 X103.000 Y88.000 E0.11220
+G1 X100.000 Y88.000 E0.11220
+G1 X100.000 Y85.000 E0.11220
+G1 X100.450 Y85.450 F1800
+G1 X102.550 Y85.450 E0.07854 F1800
+G1 X102.550 Y87.550 E0.07854
+G1 X100.450 Y87.550 E0.07854
+G1 X100.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X95.000 Y85.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X98.000 Y85.000 E0.11220 F1800
+G1 X98.000 Y88.000 E0.11220
+G1 X95.000 Y88.000 E0.11220
+G1 X95.000 Y85.000 E0.11220
+G1 X95.450 Y85.450 F1800
+G1 X97.550 Y85.450 E0.07854 F1800
+G1 X97.550 Y87.550 E0.07854
+G1 X95.450 Y87.550 E0.07854
+G1 X95.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X90.000 Y85.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X93.000 Y85.000 E0.11220 F1800
+G1 X93.000 Y88.000 E0.11220
+G1 X90.000 Y88.000 E0.11220
+G1 X90.000 Y85.000 E0.11220
+G1 X90.450 Y85.450 F1800
+G1 X92.550 Y85.450 E0.07854 F1800
+G1 X92.550 Y87.550 E0.07854
+G1 X90.450 Y87.550 E0.07854
+G1 X90.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X85.000 Y85.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X88.000 Y85.000 E0.11220 F1800
+G1 X88.000 Y88.000 E0.11220
+G1 X85.000 Y88.000 E0.11220
+G1 X85.000 Y85.000 E0.11220
+G1 X85.450 Y85.450 F1800
+G1 X87.550 Y85.450 E0.07854 F1800
+G1 X87.550 Y87.550 E0.07854
+G1 X85.450 Y87.550 E0.07854
+G1 X85.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X80.000 Y85.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X83.000 Y85.000 E0.11220 F1800
+G1 X83.000 Y88.000 E0.11220
+G1 X80.000 Y88.000 E0.11220
+G1 X80.000 Y85.000 E0.11220
+G1 X80.450 Y85.450 F1800
+G1 X82.550 Y85.450 E0.07854 F1800
+G1 X82.550 Y87.550 E0.07854
+G1 X80.450 Y87.550 E0.07854
+G1 X80.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X80.000 Y90.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X83.000 Y90.000 E0.11220 F1800
+G1 X83.000 Y93.000 E0.11220
+G1 X80.000 Y93.000 E0.11220
+G1 X80.000 Y90.000 E0.11220
+G1 X80.450 Y90.450 F1800
+G1 X82.550 Y90.450 E0.07854 F1800
+G1 X82.550 Y92.550 E0.07854
+G1 X80.450 Y92.550 E0.07854
+G1 X80.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X85.000 Y90.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X88.000 Y90.000 E0.11220 F1800
+G1 X88.000 Y93.000 E0.11220
+G1 X85.000 Y93.000 E0.11220
+G1 X85.000 Y90.000 E0.11220
+G1 X85.450 Y90.450 F1800
+G1 X87.550 Y90.450 E0.07854 F1800
+G1 X87.550 Y92.550 E0.07854
+G1 X85.450 Y92.550 E0.07854
+G1 X85.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X90.000 Y90.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X93.000 Y90.000 E0.11220 F1800
+G1 X93.000 Y93.000 E0.11220
+G1 X90.000 Y93.000 E0.11220
+G1 X90.000 Y90.000 E0.11220
+G1 X90.450 Y90.450 F1800
+G1 X92.550 Y90.450 E0.07854 F1800
+G1 X92.550 Y92.550 E0.07854
+G1 X90.450 Y92.550 E0.07854
+G1 X90.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X95.000 Y90.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X98.000 Y90.000 E0.11220 F1800
+G1 X98.000 Y93.000 E0.11220
+G1 X95.000 Y93.000 E0.11220
+G1 X95.000 Y90.000 E0.11220
+G1 X95.450 Y90.450 F1800
+G1 X97.550 Y90.450 E0.07854 F1800
+G1 X97.550 Y92.550 E0.07854
+G1 X95.450 Y92.550 E0.07854
+G1 X95.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X100.000 Y90.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X103.000 Y90.000 E0.11220 F1800
+G1 X103.000 Y93.000 E0.11220
+G1 X100.000 Y93.000 E0.11220
+G1 X100.000 Y90.000 E0.11220
+G1 X100.450 Y90.450 F1800
+G1 X102.550 Y90.450 E0.07854 F1800
+G1 X102.550 Y92.550 E0.07854
+G1 X100.450 Y92.550 E0.07854
+G1 X100.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X105.000 Y90.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X108.000 Y90.000 E0.11220 F1800
+G1 X108.000 Y93.000 E0.11220
+G1 X105.000 Y93.000 E0.11220
+G1 X105.000 Y90.000 E0.11220
+G1 X105.450 Y90.450 F1800
+G1 X107.550 Y90.450 E0.07854 F1800
+G1 X107.550 Y92.550 E0.07854
+G1 X105.450 Y92.550 E0.07854
+G1 X105.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X110.000 Y90.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X113.000 Y90.000 E0.11220 F1800
+G1 X113.000 Y93.000 E0.11220
+G1 X110.000 Y93.000 E0.11220
+G1 X110.000 Y90.000 E0.11220
+G1 X110.450 Y90.450 F1800
+G1 X112.550 Y90.450 E0.07854 F1800
+G1 X112.550 Y92.550 E0.07854
+G1 X110.450 Y92.550 E0.07854
+G1 X110.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X115.000 Y90.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X118.000 Y90.000 E0.11220 F1800
+G1 X118.000 Y93.000 E0.11220
+G1 X115.000 Y93.000 E0.11220
+G1 X115.000 Y90.000 E0.11220
+G1 X115.450 Y90.450 F1800
+G1 X117.550 Y90.450 E0.07854 F1800
+G1 X117.550 Y92.550 E0.07854
+G1 X115.450 Y92.550 E0.07854
+G1 X115.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X115.000 Y95.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X118.000 Y95.000 E0.11220 F1800
+G1 X118.000 Y98.000 E0.11220
+G1 X115.000 Y98.000 E0.11220
+G1 X115.000 Y95.000 E0.11220
+G1 X115.450 Y95.450 F1800
+G1 X117.550 Y95.450 E0.07854 F1800
+G1 X117.550 Y97.550 E0.07854
+G1 X115.450 Y97.550 E0.07854
+G1 X115.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X110.000 Y95.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X113.000 Y95.000 E0.11220 F1800
+G1 X113.000 Y98.000 E0.11220
+G1 X110.000 Y98.000 E0.11220
+G1 X110.000 Y95.000 E0.11220
+G1 X110.450 Y95.450 F1800
+G1 X112.550 Y95.450 E0.07854 F1800
+G1 X112.550 Y97.550 E0.07854
+G1 X110.450 Y97.550 E0.07854
+G1 X110.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X105.000 Y95.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X108.000 Y95.000 E0.11220 F1800
+G1 X108.000 Y98.000 E0.11220
+G1 X105.000 Y98.000 E0.11220
+G1 X105.000 Y95.000 E0.11220
+G1 X105.450 Y95.450 F1800
+G1 X107.550 Y95.450 E0.07854 F1800
+G1 X107.550 Y97.550 E0.07854
+G1 X105.450 Y97.550 E0.07854
+G1 X105.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X100.000 Y95.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X103.000 Y95.000 E0.11220 F1800
+G1 X103.000 Y98.000 E0.11220
+G1 X100.000 Y98.000 E0.11220
+G1 X100.000 Y95.000 E0.11220
+G1 X100.450 Y95.450 F1800
+G1 X102.550 Y95.450 E0.07854 F1800
+G1 X102.550 Y97.550 E0.07854
+G1 X100.450 Y97.550 E0.07854
+G1 X100.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X95.000 Y95.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X98.000 Y95.000 E0.11220 F1800
+G1 X98.000 Y98.000 E0.11220
+G1 X95.000 Y98.000 E0.11220
+G1 X95.000 Y95.000 E0.11220
+G1 X95.450 Y95.450 F1800
+G1 X97.550 Y95.450 E0.07854 F1800
+G1 X97.550 Y97.550 E0.07854
+G1 X95.450 Y97.550 E0.07854
+G1 X95.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X90.000 Y95.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X93.000 Y95.000 E0.11220 F1800
+G1 X93.000 Y98.000 E0.11220
+G1 X90.000 Y98.000 E0.11220
+G1 X90.000 Y95.000 E0.11220
+G1 X90.450 Y95.450 F1800
+G1 X92.550 Y95.450 E0.07854 F1800
+G1 X92.550 Y97.550 E0.07854
+G1 X90.450 Y97.550 E0.07854
+G1 X90.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X85.000 Y95.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X88.000 Y95.000 E0.11220 F1800
+G1 X88.000 Y98.000 E0.11220
+G1 X85.000 Y98.000 E0.11220
+G1 X85.000 Y95.000 E0.11220
+G1 X85.450 Y95.450 F1800
+G1 X87.550 Y95.450 E0.07854 F1800
+G1 X87.550 Y97.550 E0.07854
+G1 X85.450 Y97.550 E0.07854
+G1 X85.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X80.000 Y95.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X83.000 Y95.000 E0.11220 F1800
+G1 X83.000 Y98.000 E0.11220
+G1 X80.000 Y98.000 E0.11220
+G1 X80.000 Y95.000 E0.11220
+G1 X80.450 Y95.450 F1800
+G1 X82.550 Y95.450 E0.07854 F1800
+G1 X82.550 Y97.550 E0.07854
+G1 X80.450 Y97.550 E0.07854
+G1 X80.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X80.000 Y100.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X83.000 Y100.000 E0.11220 F1800
+G1 X83.000 Y103.000 E0.11220
+G1 X80.000 Y103.000 E0.11220
+G1 X80.000 Y100.000 E0.11220
+G1 X80.450 Y100.450 F1800
+G1 X82.550 Y100.450 E0.07854 F1800
+G1 X82.550 Y102.550 E0.07854
+G1 X80.450 Y102.550 E0.07854
+G1 X80.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X85.000 Y100.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X88.000 Y100.000 E0.11220 F1800
+G1 X88.000 Y103.000 E0.11220
+G1 X85.000 Y103.000 E0.11220
+G1 X85.000 Y100.000 E0.11220
+G1 X85.450 Y100.450 F1800
+G1 X87.550 Y100.450 E0.07854 F1800
+G1 X87.550 Y102.550 E0.07854
+G1 X85.450 Y102.550 E0.07854
+G1 X85.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X90.000 Y100.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X93.000 Y100.000 E0.11220 F1800
+G1 X93.000 Y103.000 E0.11220
+G1 X90.000 Y103.000 E0.11220
+G1 X90.000 Y100.000 E0.11220
+G1 X90.450 Y100.450 F1800
+G1 X92.550 Y100.450 E0.07854 F1800
+G1 X92.550 Y102.550 E0.07854
+G1 X90.450 Y102.550 E0.07854
+G1 X90.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X95.000 Y100.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X98.000 Y100.000 E0.11220 F1800
+G1 X98.000 Y103.000 E0.11220
+G1 X95.000 Y103.000 E0.11220
+G1 X95.000 Y100.000 E0.11220
+G1 X95.450 Y100.450 F1800
+G1 X97.550 Y100.450 E0.07854 F1800
+G1 X97.550 Y102.550 E0.07854
+G1 X95.450 Y102.550 E0.07854
+G1 X95.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X100.000 Y100.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X103.000 Y100.000 E0.11220 F1800
+G1 X103.000 Y103.000 E0.11220
+G1 X100.000 Y103.000 E0.11220
+G1 X100.000 Y100.000 E0.11220
+G1 X100.450 Y100.450 F1800
+G1 X102.550 Y100.450 E0.07854 F1800
+G1 X102.550 Y102.550 E0.07854
+G1 X100.450 Y102.550 E0.07854
+G1 X100.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X105.000 Y100.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X108.000 Y100.000 E0.11220 F1800
+G1 X108.000 Y103.000 E0.11220
+G1 X105.000 Y103.000 E0.11220
+G1 X105.000 Y100.000 E0.11220
+G1 X105.450 Y100.450 F1800
+G1 X107.550 Y100.450 E0.07854 F1800
+G1 X107.550 Y102.550 E0.07854
+G1 X105.450 Y102.550 E0.07854
+G1 X105.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X110.000 Y100.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X113.000 Y100.000 E0.11220 F1800
+G1 X113.000 Y103.000 E0.11220
+G1 X110.000 Y103.000 E0.11220
+G1 X110.000 Y100.000 E0.11220
+G1 X110.450 Y100.450 F1800
+G1 X112.550 Y100.450 E0.07854 F1800
+G1 X112.550 Y102.550 E0.07854
+G1 X110.450 Y102.550 E0.07854
+G1 X110.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X115.000 Y100.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X118.000 Y100.000 E0.11220 F1800
+G1 X118.000 Y103.000 E0.11220
+G1 X115.000 Y103.000 E0.11220
+G1 X115.000 Y100.000 E0.11220
+G1 X115.450 Y100.450 F1800
+G1 X117.550 Y100.450 E0.07854 F1800
+G1 X117.550 Y102.550 E0.07854
+G1 X115.450 Y102.550 E0.07854
+G1 X115.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X115.000 Y105.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X118.000 Y105.000 E0.11220 F1800
+G1 X118.000 Y108.000 E0.11220
+G1 X115.000 Y108.000 E0.11220
+G1 X115.000 Y105.000 E0.11220
+G1 X115.450 Y105.450 F1800
+G1 X117.550 Y105.450 E0.07854 F1800
+G1 X117.550 Y107.550 E0.07854
+G1 X115.450 Y107.550 E0.07854
+G1 X115.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X110.000 Y105.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X113.000 Y105.000 E0.11220 F1800
+G1 X113.000 Y108.000 E0.11220
+G1 X110.000 Y108.000 E0.11220
+G1 X110.000 Y105.000 E0.11220
+G1 X110.450 Y105.450 F1800
+G1 X112.550 Y105.450 E0.07854 F1800
+G1 X112.550 Y107.550 E0.07854
+G1 X110.450 Y107.550 E0.07854
+G1 X110.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X105.000 Y105.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X108.000 Y105.000 E0.11220 F1800
+G1 X108.000 Y108.000 E0.11220
+G1 X105.000 Y108.000 E0.11220
+G1 X105.000 Y105.000 E0.11220
+G1 X105.450 Y105.450 F1800
+G1 X107.550 Y105.450 E0.07854 F1800
+G1 X107.550 Y107.550 E0.07854
+G1 X105.450 Y107.550 E0.07854
+G1 X105.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X100.000 Y105.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X103.000 Y105.000 E0.11220 F1800
+G1 X103.000 Y108.000 E0.11220
+G1 X100.000 Y108.000 E0.11220
+G1 X100.000 Y105.000 E0.11220
+G1 X100.450 Y105.450 F1800
+G1 X102.550 Y105.450 E0.07854 F1800
+G1 X102.550 Y107.550 E0.07854
+G1 X100.450 Y107.550 E0.07854
+G1 X100.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X95.000 Y105.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X98.000 Y105.000 E0.11220 F1800
+G1 X98.000 Y108.000 E0.11220
+G1 X95.000 Y108.000 E0.11220
+G1 X95.000 Y105.000 E0.11220
+G1 X95.450 Y105.450 F1800
+G1 X97.550 Y105.450 E0.07854 F1800
+G1 X97.550 Y107.550 E0.07854
+G1 X95.450 Y107.550 E0.07854
+G1 X95.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X90.000 Y105.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X93.000 Y105.000 E0.11220 F1800
+G1 X93.000 Y108.000 E0.11220
+G1 X90.000 Y108.000 E0.11220
+G1 X90.000 Y105.000 E0.11220
+G1 X90.450 Y105.450 F1800
+G1 X92.550 Y105.450 E0.07854 F1800
+G1 X92.550 Y107.550 E0.07854
+G1 X90.450 Y107.550 E0.07854
+G1 X90.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X85.000 Y105.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X88.000 Y105.000 E0.11220 F1800
+G1 X88.000 Y108.000 E0.11220
+G1 X85.000 Y108.000 E0.11220
+G1 X85.000 Y105.000 E0.11220
+G1 X85.450 Y105.450 F1800
+G1 X87.550 Y105.450 E0.07854 F1800
+G1 X87.550 Y107.550 E0.07854
+G1 X85.450 Y107.550 E0.07854
+G1 X85.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X80.000 Y105.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X83.000 Y105.000 E0.11220 F1800
+G1 X83.000 Y108.000 E0.11220
+G1 X80.000 Y108.000 E0.11220
+G1 X80.000 Y105.000 E0.11220
+G1 X80.450 Y105.450 F1800
+G1 X82.550 Y105.450 E0.07854 F1800
+G1 X82.550 Y107.550 E0.07854
+G1 X80.450 Y107.550 E0.07854
+G1 X80.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X80.000 Y110.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X83.000 Y110.000 E0.11220 F1800
+G1 X83.000 Y113.000 E0.11220
+G1 X80.000 Y113.000 E0.11220
+G1 X80.000 Y110.000 E0.11220
+G1 X80.450 Y110.450 F1800
+G1 X82.550 Y110.450 E0.07854 F1800
+G1 X82.550 Y112.550 E0.07854
+G1 X80.450 Y112.550 E0.07854
+G1 X80.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X85.000 Y110.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X88.000 Y110.000 E0.11220 F1800
+G1 X88.000 Y113.000 E0.11220
+G1 X85.000 Y113.000 E0.11220
+G1 X85.000 Y110.000 E0.11220
+G1 X85.450 Y110.450 F1800
+G1 X87.550 Y110.450 E0.07854 F1800
+G1 X87.550 Y112.550 E0.07854
+G1 X85.450 Y112.550 E0.07854
+G1 X85.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X90.000 Y110.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X93.000 Y110.000 E0.11220 F1800
+G1 X93.000 Y113.000 E0.11220
+G1 X90.000 Y113.000 E0.11220
+G1 X90.000 Y110.000 E0.11220
+G1 X90.450 Y110.450 F1800
+G1 X92.550 Y110.450 E0.07854 F1800
+G1 X92.550 Y112.550 E0.07854
+G1 X90.450 Y112.550 E0.07854
+G1 X90.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X95.000 Y110.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X98.000 Y110.000 E0.11220 F1800
+G1 X98.000 Y113.000 E0.11220
+G1 X95.000 Y113.000 E0.11220
+G1 X95.000 Y110.000 E0.11220
+G1 X95.450 Y110.450 F1800
+G1 X97.550 Y110.450 E0.07854 F1800
+G1 X97.550 Y112.550 E0.07854
+G1 X95.450 Y112.550 E0.07854
+G1 X95.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X100.000 Y110.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X103.000 Y110.000 E0.11220 F1800
+G1 X103.000 Y113.000 E0.11220
+G1 X100.000 Y113.000 E0.11220
+G1 X100.000 Y110.000 E0.11220
+G1 X100.450 Y110.450 F1800
+G1 X102.550 Y110.450 E0.07854 F1800
+G1 X102.550 Y112.550 E0.07854
+G1 X100.450 Y112.550 E0.07854
+G1 X100.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X105.000 Y110.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X108.000 Y110.000 E0.11220 F1800
+G1 X108.000 Y113.000 E0.11220
+G1 X105.000 Y113.000 E0.11220
+G1 X105.000 Y110.000 E0.11220
+G1 X105.450 Y110.450 F1800
+G1 X107.550 Y110.450 E0.07854 F1800
+G1 X107.550 Y112.550 E0.07854
+G1 X105.450 Y112.550 E0.07854
+G1 X105.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X110.000 Y110.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X113.000 Y110.000 E0.11220 F1800
+G1 X113.000 Y113.000 E0.11220
+G1 X110.000 Y113.000 E0.11220
+G1 X110.000 Y110.000 E0.11220
+G1 X110.450 Y110.450 F1800
+G1 X112.550 Y110.450 E0.07854 F1800
+G1 X112.550 Y112.550 E0.07854
+G1 X110.450 Y112.550 E0.07854
+G1 X110.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X115.000 Y110.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X118.000 Y110.000 E0.11220 F1800
+G1 X118.000 Y113.000 E0.11220
+G1 X115.000 Y113.000 E0.11220
+G1 X115.000 Y110.000 E0.11220
+G1 X115.450 Y110.450 F1800
+G1 X117.550 Y110.450 E0.07854 F1800
+G1 X117.550 Y112.550 E0.07854
+G1 X115.450 Y112.550 E0.07854
+G1 X115.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X115.000 Y115.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X118.000 Y115.000 E0.11220 F1800
+G1 X118.000 Y118.000 E0.11220
+G1 X115.000 Y118.000 E0.11220
+G1 X115.000 Y115.000 E0.11220
+G1 X115.450 Y115.450 F1800
+G1 X117.550 Y115.450 E0.07854 F1800
+G1 X117.550 Y117.550 E0.07854
+G1 X115.450 Y117.550 E0.07854
+G1 X115.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X110.000 Y115.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X113.000 Y115.000 E0.11220 F1800
+G1 X113.000 Y118.000 E0.11220
+G1 X110.000 Y118.000 E0.11220
+G1 X110.000 Y115.000 E0.11220
+G1 X110.450 Y115.450 F1800
+G1 X112.550 Y115.450 E0.07854 F1800
+G1 X112.550 Y117.550 E0.07854
+G1 X110.450 Y117.550 E0.07854
+G1 X110.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X105.000 Y115.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X108.000 Y115.000 E0.11220 F1800
+G1 X108.000 Y118.000 E0.11220
+G1 X105.000 Y118.000 E0.11220
+G1 X105.000 Y115.000 E0.11220
+G1 X105.450 Y115.450 F1800
+G1 X107.550 Y115.450 E0.07854 F1800
+G1 X107.550 Y117.550 E0.07854
+G1 X105.450 Y117.550 E0.07854
+G1 X105.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X100.000 Y115.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X103.000 Y115.000 E0.11220 F1800
+G1 X103.000 Y118.000 E0.11220
+G1 X100.000 Y118.000 E0.11220
+G1 X100.000 Y115.000 E0.11220
+G1 X100.450 Y115.450 F1800
+G1 X102.550 Y115.450 E0.07854 F1800
+G1 X102.550 Y117.550 E0.07854
+G1 X100.450 Y117.550 E0.07854
+G1 X100.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X95.000 Y115.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X98.000 Y115.000 E0.11220 F1800
+G1 X98.000 Y118.000 E0.11220
+G1 X95.000 Y118.000 E0.11220
+G1 X95.000 Y115.000 E0.11220
+G1 X95.450 Y115.450 F1800
+G1 X97.550 Y115.450 E0.07854 F1800
+G1 X97.550 Y117.550 E0.07854
+G1 X95.450 Y117.550 E0.07854
+G1 X95.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X90.000 Y115.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X93.000 Y115.000 E0.11220 F1800
+G1 X93.000 Y118.000 E0.11220
+G1 X90.000 Y118.000 E0.11220
+G1 X90.000 Y115.000 E0.11220
+G1 X90.450 Y115.450 F1800
+G1 X92.550 Y115.450 E0.07854 F1800
+G1 X92.550 Y117.550 E0.07854
+G1 X90.450 Y117.550 E0.07854
+G1 X90.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X85.000 Y115.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X88.000 Y115.000 E0.11220 F1800
+G1 X88.000 Y118.000 E0.11220
+G1 X85.000 Y118.000 E0.11220
+G1 X85.000 Y115.000 E0.11220
+G1 X85.450 Y115.450 F1800
+G1 X87.550 Y115.450 E0.07854 F1800
+G1 X87.550 Y117.550 E0.07854
+G1 X85.450 Y117.550 E0.07854
+G1 X85.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z1.800 F1200
+G1 X80.000 Y115.000 F9000
+G1 Z1.000 F1200
+G1 E0.8 F2400
+G1 X83.000 Y115.000 E0.11220 F1800
+G1 X83.000 Y118.000 E0.11220
+G1 X80.000 Y118.000 E0.11220
+G1 X80.000 Y115.000 E0.11220
+G1 X80.450 Y115.450 F1800
+G1 X82.550 Y115.450 E0.07854 F1800
+G1 X82.550 Y117.550 E0.07854
+G1 X80.450 Y117.550 E0.07854
+G1 X80.450 Y115.450 E0.07854
+;LAYER:5
+G1 Z1.200 F1200
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X80.000 Y80.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X83.000 Y80.000 E0.11220 F1800
+G1 X83.000 Y83.000 E0.11220
+G1 X80.000 Y83.000 E0.11220
+G1 X80.000 Y80.000 E0.11220
+G1 X80.450 Y80.450 F1800
+G1 X82.550 Y80.450 E0.07854 F1800
+G1 X82.550 Y82.550 E0.07854
+G1 X80.450 Y82.550 E0.07854
+G1 X80.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X85.000 Y80.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X88.000 Y80.000 E0.11220 F1800
+G1 X88.000 Y83.000 E0.11220
+G1 X85.000 Y83.000 E0.11220
+G1 X85.000 Y80.000 E0.11220
+G1 X85.450 Y80.450 F1800
+G1 X87.550 Y80.450 E0.07854 F1800
+G1 X87.550 Y82.550 E0.07854
+G1 X85.450 Y82.550 E0.07854
+G1 X85.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X90.000 Y80.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X93.000 Y80.000 E0.11220 F1800
+G1 X93.000 Y83.000 E0.11220
+G1 X90.000 Y83.000 E0.11220
+G1 X90.000 Y80.000 E0.11220
+G1 X90.450 Y80.450 F1800
+G1 X92.550 Y80.450 E0.07854 F1800
+G1 X92.550 Y82.550 E0.07854
+G1 X90.450 Y82.550 E0.07854
+G1 X90.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X95.000 Y80.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X98.000 Y80.000 E0.11220 F1800
+G1 X98.000 Y83.000 E0.11220
+G1 X95.000 Y83.000 E0.11220
+G1 X95.000 Y80.000 E0.11220
+G1 X95.450 Y80.450 F1800
+G1 X97.550 Y80.450 E0.07854 F1800
+G1 X97.550 Y82.550 E0.07854
+G1 X95.450 Y82.550 E0.07854
+G1 X95.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X100.000 Y80.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X103.000 Y80.000 E0.11220 F1800
+G1 X103.000 Y83.000 E0.11220
+G1 X100.000 Y83.000 E0.11220
+G1 X100.000 Y80.000 E0.11220
+G1 X100.450 Y80.450 F1800
+G1 X102.550 Y80.450 E0.07854 F1800
+G1 X102.550 Y82.550 E0.07854
+G1 X100.450 Y82.550 E0.07854
+G1 X100.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X105.000 Y80.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X108.000 Y80.000 E0.11220 F1800
+G1 X108.000 Y83.000 E0.11220
+G1 X105.000 Y83.000 E0.11220
+G1 X105.000 Y80.000 E0.11220
+G1 X105.450 Y80.450 F1800
+G1 X107.550 Y80.450 E0.07854 F1800
+G1 X107.550 Y82.550 E0.07854
+G1 X105.450 Y82.550 E0.07854
+G1 X105.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X110.000 Y80.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X113.000 Y80.000 E0.11220 F1800
+G1 X113.000 Y83.000 E0.11220
+G1 X110.000 Y83.000 E0.11220
+G1 X110.000 Y80.000 E0.11220
+G1 X110.450 Y80.450 F1800
+G1 X112.550 Y80.450 E0.07854 F1800
+G1 X112.550 Y82.550 E0.07854
+G1 X110.450 Y82.550 E0.07854
+G1 X110.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X115.000 Y80.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X118.000 Y80.000 E0.11220 F1800
+G1 X118.000 Y83.000 E0.11220
+G1 X115.000 Y83.000 E0.11220
+G1 X115.000 Y80.000 E0.11220
+G1 X115.450 Y80.450 F1800
+G1 X117.550 Y80.450 E0.07854 F1800
+G1 X117.550 Y82.550 E0.07854
+G1 X115.450 Y82.550 E0.07854
+G1 X115.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X115.000 Y85.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X118.000 Y85.000 E0.11220 F1800
+G1 X118.000 Y88.000 E0.11220
+G1 X115.000 Y88.000 E0.11220
+G1 X115.000 Y85.000 E0.11220
+G1 X115.450 Y85.450 F1800
+G1 X117.550 Y85.450 E0.07854 F1800
+G1 X117.550 Y87.550 E0.07854
+G1 X115.450 Y87.550 E0.07854
+G1 X115.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X110.000 Y85.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X113.000 Y85.000 E0.11220 F1800
+G1 X113.000 Y88.000 E0.11220
+G1 X110.000 Y88.000 E0.11220
+G1 X110.000 Y85.000 E0.11220
+G1 X110.450 Y85.450 F1800
+G1 X112.550 Y85.450 E0.07854 F1800
+G1 X112.550 Y87.550 E0.07854
+G1 X110.450 Y87.550 E0.07854
+G1 X110.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X105.000 Y85.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X108.000 Y85.000 E0.11220 F1800
+G1 X108.000 Y88.000 E0.11220
+G1 X105.000 Y88.000 E0.11220
+G1 X105.000 Y85.000 E0.11220
+G1 X105.450 Y85.450 F1800
+G1 X107.550 Y85.450 E0.07854 F1800
+G1 X107.550 Y87.550 E0.07854
+G1 X105.450 Y87.550 E0.07854
+G1 X105.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X100.000 Y85.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X103.000 Y85.000 E0.11220 F1800
+G1 X103.000 Y88.000 E0.11220
+G1 X100.000 Y88.000 E0.11220
+G1 X100.000 Y85.000 E0.11220
+G1 X100.450 Y85.450 F1800
+G1 X102.550 Y85.450 E0.07854 F1800
+G1 X102.550 Y87.550 E0.07854
+G1 X100.450 Y87.550 E0.07854
+G1 X100.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X95.000 Y85.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X98.000 Y85.000 E0.11220 F1800
+G1 X98.000 Y88.000 E0.11220
+G1 X95.000 Y88.000 E0.11220
+G1 X95.000 Y85.000 E0.11220
+G1 X95.450 Y85.450 F1800
+G1 X97.550 Y85.450 E0.07854 F1800
+G1 X97.550 Y87.550 E0.07854
+G1 X95.450 Y87.550 E0.07854
+G1 X95.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X90.000 Y85.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X93.000 Y85.000 E0.11220 F1800
+G1 X93.000 Y88.000 E0.11220
+G1 X90.000 Y88.000 E0.11220
+G1 X90.000 Y85.000 E0.11220
+G1 X90.450 Y85.450 F1800
+G1 X92.550 Y85.450 E0.07854 F1800
+G1 X92.550 Y87.550 E0.07854
+G1 X90.450 Y87.550 E0.07854
+G1 X90.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X85.000 Y85.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X88.000 Y85.000 E0.11220 F1800
+G1 X88.000 Y88.000 E0.11220
+G1 X85.000 Y88.000 E0.11220
+G1 X85.000 Y85.000 E0.11220
+G1 X85.450 Y85.450 F1800
+G1 X87.550 Y85.450 E0.07854 F1800
+G1 X87.550 Y87.550 E0.07854
+G1 X85.450 Y87.550 E0.07854
+G1 X85.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X80.000 Y85.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X83.000 Y85.000 E0.11220 F1800
+G1 X83.000 Y88.000 E0.11220
+G1 X80.000 Y88.000 E0.11220
+G1 X80.000 Y85.000 E0.11220
+G1 X80.450 Y85.450 F1800
+G1 X82.550 Y85.450 E0.07854 F1800
+G1 X82.550 Y87.550 E0.07854
+G1 X80.450 Y87.550 E0.07854
+G1 X80.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X80.000 Y90.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X83.000 Y90.000 E0.11220 F1800
+G1 X83.000 Y93.000 E0.11220
+G1 X80.000 Y93.000 E0.11220
+G1 X80.000 Y90.000 E0.11220
+G1 X80.450 Y90.450 F1800
+G1 X82.550 Y90.450 E0.07854 F1800
+G1 X82.550 Y92.550 E0.07854
+G1 X80.450 Y92.550 E0.07854
+G1 X80.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X85.000 Y90.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X88.000 Y90.000 E0.11220 F1800
+G1 X88.000 Y93.000 E0.11220
+G1 X85.000 Y93.000 E0.11220
+G1 X85.000 Y90.000 E0.11220
+G1 X85.450 Y90.450 F1800
+G1 X87.550 Y90.450 E0.07854 F1800
+G1 X87.550 Y92.550 E0.07854
+G1 X85.450 Y92.550 E0.07854
+G1 X85.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X90.000 Y90.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X93.000 Y90.000 E0.11220 F1800
+G1 X93.000 Y93.000 E0.11220
+G1 X90.000 Y93.000 E0.11220
+G1 X90.000 Y90.000 E0.11220
+G1 X90.450 Y90.450 F1800
+G1 X92.550 Y90.450 E0.07854 F1800
+G1 X92.550 Y92.550 E0.07854
+G1 X90.450 Y92.550 E0.07854
+G1 X90.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X95.000 Y90.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X98.000 Y90.000 E0.11220 F1800
+G1 X98.000 Y93.000 E0.11220
+G1 X95.000 Y93.000 E0.11220
+G1 X95.000 Y90.000 E0.11220
+G1 X95.450 Y90.450 F1800
+G1 X97.550 Y90.450 E0.07854 F1800
+G1 X97.550 Y92.550 E0.07854
+G1 X95.450 Y92.550 E0.07854
+G1 X95.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X100.000 Y90.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X103.000 Y90.000 E0.11220 F1800
+G1 X103.000 Y93.000 E0.11220
+G1 X100.000 Y93.000 E0.11220
+G1 X100.000 Y90.000 E0.11220
+G1 X100.450 Y90.450 F1800
+G1 X102.550 Y90.450 E0.07854 F1800
+G1 X102.550 Y92.550 E0.07854
+G1 X100.450 Y92.550 E0.07854
+G1 X100.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X105.000 Y90.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X108.000 Y90.000 E0.11220 F1800
+G1 X108.000 Y93.000 E0.11220
+G1 X105.000 Y93.000 E0.11220
+G1 X105.000 Y90.000 E0.11220
+G1 X105.450 Y90.450 F1800
+G1 X107.550 Y90.450 E0.07854 F1800
+G1 X107.550 Y92.550 E0.07854
+G1 X105.450 Y92.550 E0.07854
+G1 X105.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X110.000 Y90.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X113.000 Y90.000 E0.11220 F1800
+G1 X113.000 Y93.000 E0.11220
+G1 X110.000 Y93.000 E0.11220
+G1 X110.000 Y90.000 E0.11220
+G1 X110.450 Y90.450 F1800
+G1 X112.550 Y90.450 E0.07854 F1800
+G1 X112.550 Y92.550 E0.07854
+G1 X110.450 Y92.550 E0.07854
+G1 X110.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X115.000 Y90.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X118.000 Y90.000 E0.11220 F1800
+G1 X118.000 Y93.000 E0.11220
+G1 X115.000 Y93.000 E0.11220
+G1 X115.000 Y90.000 E0.11220
+G1 X115.450 Y90.450 F1800
+G1 X117.550 Y90.450 E0.07854 F1800
+G1 X117.550 Y92.550 E0.07854
+G1 X115.450 Y92.550 E0.07854
+G1 X115.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X115.000 Y95.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X118.000 Y95.000 E0.11220 F1800
+G1 X118.000 Y98.000 E0.11220
+G1 X115.000 Y98.000 E0.11220
+G1 X115.000 Y95.000 E0.11220
+G1 X115.450 Y95.450 F1800
+G1 X117.550 Y95.450 E0.07854 F1800
+G1 X117.550 Y97.550 E0.07854
+G1 X115.450 Y97.550 E0.07854
+G1 X115.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X110.000 Y95.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X113.000 Y95.000 E0.11220 F1800
+G1 X113.000 Y98.000 E0.11220
+G1 X110.000 Y98.000 E0.11220
+G1 X110.000 Y95.000 E0.11220
+G1 X110.450 Y95.450 F1800
+G1 X112.550 Y95.450 E0.07854 F1800
+G1 X112.550 Y97.550 E0.07854
+G1 X110.450 Y97.550 E0.07854
+G1 X110.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X105.000 Y95.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X108.000 Y95.000 E0.11220 F1800
+G1 X108.000 Y98.000 E0.11220
+G1 X105.000 Y98.000 E0.11220
+G1 X105.000 Y95.000 E0.11220
+G1 X105.450 Y95.450 F1800
+G1 X107.550 Y95.450 E0.07854 F1800
+G1 X107.550 Y97.550 E0.07854
+G1 X105.450 Y97.550 E0.07854
+G1 X105.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X100.000 Y95.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X103.000 Y95.000 E0.11220 F1800
+G1 X103.000 Y98.000 E0.11220
+G1 X100.000 Y98.000 E0.11220
+G1 X100.000 Y95.000 E0.11220
+G1 X100.450 Y95.450 F1800
+G1 X102.550 Y95.450 E0.07854 F1800
+G1 X102.550 Y97.550 E0.07854
+G1 X100.450 Y97.550 E0.07854
+G1 X100.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X95.000 Y95.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X98.000 Y95.000 E0.11220 F1800
+G1 X98.000 Y98.000 E0.11220
+G1 X95.000 Y98.000 E0.11220
+G1 X95.000 Y95.000 E0.11220
+G1 X95.450 Y95.450 F1800
+G1 X97.550 Y95.450 E0.07854 F1800
+G1 X97.550 Y97.550 E0.07854
+G1 X95.450 Y97.550 E0.07854
+G1 X95.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X90.000 Y95.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X93.000 Y95.000 E0.11220 F1800
+G1 X93.000 Y98.000 E0.11220
+G1 X90.000 Y98.000 E0.11220
+G1 X90.000 Y95.000 E0.11220
+G1 X90.450 Y95.450 F1800
+G1 X92.550 Y95.450 E0.07854 F1800
+G1 X92.550 Y97.550 E0.07854
+G1 X90.450 Y97.550 E0.07854
+G1 X90.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X85.000 Y95.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X88.000 Y95.000 E0.11220 F1800
+G1 X88.000 Y98.000 E0.11220
+G1 X85.000 Y98.000 E0.11220
+G1 X85.000 Y95.000 E0.11220
+G1 X85.450 Y95.450 F1800
+G1 X87.550 Y95.450 E0.07854 F1800
+G1 X87.550 Y97.550 E0.07854
+G1 X85.450 Y97.550 E0.07854
+G1 X85.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X80.000 Y95.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X83.000 Y95.000 E0.11220 F1800
+G1 X83.000 Y98.000 E0.11220
+G1 X80.000 Y98.000 E0.11220
+G1 X80.000 Y95.000 E0.11220
+G1 X80.450 Y95.450 F1800
+G1 X82.550 Y95.450 E0.07854 F1800
+G1 X82.550 Y97.550 E0.07854
+G1 X80.450 Y97.550 E0.07854
+G1 X80.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X80.000 Y100.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X83.000 Y100.000 E0.11220 F1800
+G1 X83.000 Y103.000 E0.11220
+G1 X80.000 Y103.000 E0.11220
+G1 X80.000 Y100.000 E0.11220
+G1 X80.450 Y100.450 F1800
+G1 X82.550 Y100.450 E0.07854 F1800
+G1 X82.550 Y102.550 E0.07854
+G1 X80.450 Y102.550 E0.07854
+G1 X80.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X85.000 Y100.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X88.000 Y100.000 E0.11220 F1800
+G1 X88.000 Y103.000 E0.11220
+G1 X85.000 Y103.000 E0.11220
+G1 X85.000 Y100.000 E0.11220
+G1 X85.450 Y100.450 F1800
+G1 X87.550 Y100.450 E0.07854 F1800
+G1 X87.550 Y102.550 E0.07854
+G1 X85.450 Y102.550 E0.07854
+G1 X85.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X90.000 Y100.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X93.000 Y100.000 E0.11220 F1800
+G1 X93.000 Y103.000 E0.11220
+G1 X90.000 Y103.000 E0.11220
+G1 X90.000 Y100.000 E0.11220
+G1 X90.450 Y100.450 F1800
+G1 X92.550 Y100.450 E0.07854 F1800
+G1 X92.550 Y102.550 E0.07854
+G1 X90.450 Y102.550 E0.07854
+G1 X90.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X95.000 Y100.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X98.000 Y100.000 E0.11220 F1800
+G1 X98.000 Y103.000 E0.11220
+G1 X95.000 Y103.000 E0.11220
+G1 X95.000 Y100.000 E0.11220
+G1 X95.450 Y100.450 F1800
+G1 X97.550 Y100.450 E0.07854 F1800
+G1 X97.550 Y102.550 E0.07854
+G1 X95.450 Y102.550 E0.07854
+G1 X95.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X100.000 Y100.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X103.000 Y100.000 E0.11220 F1800
+G1 X103.000 Y103.000 E0.11220
+G1 X100.000 Y103.000 E0.11220
+G1 X100.000 Y100.000 E0.11220
+G1 X100.450 Y100.450 F1800
+G1 X102.550 Y100.450 E0.07854 F1800
+G1 X102.550 Y102.550 E0.07854
+G1 X100.450 Y102.550 E0.07854
+G1 X100.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X105.000 Y100.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X108.000 Y100.000 E0.11220 F1800
+G1 X108.000 Y103.000 E0.11220
+G1 X105.000 Y103.000 E0.11220
+G1 X105.000 Y100.000 E0.11220
+G1 X105.450 Y100.450 F1800
+G1 X107.550 Y100.450 E0.07854 F1800
+G1 X107.550 Y102.550 E0.07854
+G1 X105.450 Y102.550 E0.07854
+G1 X105.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X110.000 Y100.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X113.000 Y100.000 E0.11220 F1800
+G1 X113.000 Y103.000 E0.11220
+G1 X110.000 Y103.000 E0.11220
+G1 X110.000 Y100.000 E0.11220
+G1 X110.450 Y100.450 F1800
+G1 X112.550 Y100.450 E0.07854 F1800
+G1 X112.550 Y102.550 E0.07854
+G1 X110.450 Y102.550 E0.07854
+G1 X110.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X115.000 Y100.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X118.000 Y100.000 E0.11220 F1800
+G1 X118.000 Y103.000 E0.11220
+G1 X115.000 Y103.000 E0.11220
+G1 X115.000 Y100.000 E0.11220
+G1 X115.450 Y100.450 F1800
+G1 X117.550 Y100.450 E0.07854 F1800
+G1 X117.550 Y102.550 E0.07854
+G1 X115.450 Y102.550 E0.07854
+G1 X115.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X115.000 Y105.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X118.000 Y105.000 E0.11220 F1800
+G1 X118.000 Y108.000 E0.11220
+G1 X115.000 Y108.000 E0.11220
+G1 X115.000 Y105.000 E0.11220
+G1 X115.450 Y105.450 F1800
+G1 X117.550 Y105.450 E0.07854 F1800
+G1 X117.550 Y107.550 E0.07854
+G1 X115.450 Y107.550 E0.07854
+G1 X115.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X110.000 Y105.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X113.000 Y105.000 E0.11220 F1800
+G1 X113.000 Y108.000 E0.11220
+G1 X110.000 Y108.000 E0.11220
+G1 X110.000 Y105.000 E0.11220
+G1 X110.450 Y105.450 F1800
+G1 X112.550 Y105.450 E0.07854 F1800
+G1 X112.550 Y107.550 E0.07854
+G1 X110.450 Y107.550 E0.07854
+G1 X110.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X105.000 Y105.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X108.000 Y105.000 E0.11220 F1800
+G1 X108.000 Y108.000 E0.11220
+G1 X105.000 Y108.000 E0.11220
+G1 X105.000 Y105.000 E0.11220
+G1 X105.450 Y105.450 F1800
+G1 X107.550 Y105.450 E0.07854 F1800
+G1 X107.550 Y107.550 E0.07854
+G1 X105.450 Y107.550 E0.07854
+G1 X105.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X100.000 Y105.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X103.000 Y105.000 E0.11220 F1800
+G1 X103.000 Y108.000 E0.11220
+G1 X100.000 Y108.000 E0.11220
+G1 X100.000 Y105.000 E0.11220
+G1 X100.450 Y105.450 F1800
+G1 X102.550 Y105.450 E0.07854 F1800
+G1 X102.550 Y107.550 E0.07854
+G1 X100.450 Y107.550 E0.07854
+G1 X100.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X95.000 Y105.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X98.000 Y105.000 E0.11220 F1800
+G1 X98.000 Y108.000 E0.11220
+G1 X95.000 Y108.000 E0.11220
+G1 X95.000 Y105.000 E0.11220
+G1 X95.450 Y105.450 F1800
+G1 X97.550 Y105.450 E0.07854 F1800
+G1 X97.550 Y107.550 E0.07854
+G1 X95.450 Y107.550 E0.07854
+G1 X95.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X90.000 Y105.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X93.000 Y105.000 E0.11220 F1800
+G1 X93.000 Y108.000 E0.11220
+G1 X90.000 Y108.000 E0.11220
+G1 X90.000 Y105.000 E0.11220
+G1 X90.450 Y105.450 F1800
+G1 X92.550 Y105.450 E0.07854 F1800
+G1 X92.550 Y107.550 E0.07854
+G1 X90.450 Y107.550 E0.07854
+G1 X90.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X85.000 Y105.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X88.000 Y105.000 E0.11220 F1800
+G1 X88.000 Y108.000 E0.11220
+G1 X85.000 Y108.000 E0.11220
+G1 X85.000 Y105.000 E0.11220
+G1 X85.450 Y105.450 F1800
+G1 X87.550 Y105.450 E0.07854 F1800
+G1 X87.550 Y107.550 E0.07854
+G1 X85.450 Y107.550 E0.07854
+G1 X85.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X80.000 Y105.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X83.000 Y105.000 E0.11220 F1800
+G1 X83.000 Y108.000 E0.11220
+G1 X80.000 Y108.000 E0.11220
+G1 X80.000 Y105.000 E0.11220
+G1 X80.450 Y105.450 F1800
+G1 X82.550 Y105.450 E0.07854 F1800
+G1 X82.550 Y107.550 E0.07854
+G1 X80.450 Y107.550 E0.07854
+G1 X80.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X80.000 Y110.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X83.000 Y110.000 E0.11220 F1800
+G1 X83.000 Y113.000 E0.11220
+G1 X80.000 Y113.000 E0.11220
+G1 X80.000 Y110.000 E0.11220
+G1 X80.450 Y110.450 F1800
+G1 X82.550 Y110.450 E0.07854 F1800
+G1 X82.550 Y112.550 E0.07854
+G1 X80.450 Y112.550 E0.07854
+G1 X80.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X85.000 Y110.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X88.000 Y110.000 E0.11220 F1800
+G1 X88.000 Y113.000 E0.11220
+G1 X85.000 Y113.000 E0.11220
+G1 X85.000 Y110.000 E0.11220
+G1 X85.450 Y110.450 F1800
+G1 X87.550 Y110.450 E0.07854 F1800
+G1 X87.550 Y112.550 E0.07854
+G1 X85.450 Y112.550 E0.07854
+G1 X85.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X90.000 Y110.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X93.000 Y110.000 E0.11220 F1800
+G1 X93.000 Y113.000 E0.11220
+G1 X90.000 Y113.000 E0.11220
+G1 X90.000 Y110.000 E0.11220
+G1 X90.450 Y110.450 F1800
+G1 X92.550 Y110.450 E0.07854 F1800
+G1 X92.550 Y112.550 E0.07854
+G1 X90.450 Y112.550 E0.07854
+G1 X90.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X95.000 Y110.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X98.000 Y110.000 E0.11220 F1800
+G1 X98.000 Y113.000 E0.11220
+G1 X95.000 Y113.000 E0.11220
+G1 X95.000 Y110.000 E0.11220
+G1 X95.450 Y110.450 F1800
+G1 X97.550 Y110.450 E0.07854 F1800
+G1 X97.550 Y112.550 E0.07854
+G1 X95.450 Y112.550 E0.07854
+G1 X95.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X100.000 Y110.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X103.000 Y110.000 E0.11220 F1800
+G1 X103.000 Y113.000 E0.11220
+G1 X100.000 Y113.000 E0.11220
+G1 X100.000 Y110.000 E0.11220
+G1 X100.450 Y110.450 F1800
+G1 X102.550 Y110.450 E0.07854 F1800
+G1 X102.550 Y112.550 E0.07854
+G1 X100.450 Y112.550 E0.07854
+G1 X100.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X105.000 Y110.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X108.000 Y110.000 E0.11220 F1800
+G1 X108.000 Y113.000 E0.11220
+G1 X105.000 Y113.000 E0.11220
+G1 X105.000 Y110.000 E0.11220
+G1 X105.450 Y110.450 F1800
+G1 X107.550 Y110.450 E0.07854 F1800
+G1 X107.550 Y112.550 E0.07854
+G1 X105.450 Y112.550 E0.07854
+G1 X105.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X110.000 Y110.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X113.000 Y110.000 E0.11220 F1800
+G1 X113.000 Y113.000 E0.11220
+G1 X110.000 Y113.000 E0.11220
+G1 X110.000 Y110.000 E0.11220
+G1 X110.450 Y110.450 F1800
+G1 X112.550 Y110.450 E0.07854 F1800
+G1 X112.550 Y112.550 E0.07854
+G1 X110.450 Y112.550 E0.07854
+G1 X110.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X115.000 Y110.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X118.000 Y110.000 E0.11220 F1800
+G1 X118.000 Y113.000 E0.11220
+G1 X115.000 Y113.000 E0.11220
+G1 X115.000 Y110.000 E0.11220
+G1 X115.450 Y110.450 F1800
+G1 X117.550 Y110.450 E0.07854 F1800
+G1 X117.550 Y112.550 E0.07854
+G1 X115.450 Y112.550 E0.07854
+G1 X115.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X115.000 Y115.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X118.000 Y115.000 E0.11220 F1800
+G1 X118.000 Y118.000 E0.11220
+G1 X115.000 Y118.000 E0.11220
+G1 X115.000 Y115.000 E0.11220
+G1 X115.450 Y115.450 F1800
+G1 X117.550 Y115.450 E0.07854 F1800
+G1 X117.550 Y117.550 E0.07854
+G1 X115.450 Y117.550 E0.07854
+G1 X115.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X110.000 Y115.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X113.000 Y115.000 E0.11220 F1800
+G1 X113.000 Y118.000 E0.11220
+G1 X110.000 Y118.000 E0.11220
+G1 X110.000 Y115.000 E0.11220
+G1 X110.450 Y115.450 F1800
+G1 X112.550 Y115.450 E0.07854 F1800
+G1 X112.550 Y117.550 E0.07854
+G1 X110.450 Y117.550 E0.07854
+G1 X110.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X105.000 Y115.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X108.000 Y115.000 E0.11220 F1800
+G1 X108.000 Y118.000 E0.11220
+G1 X105.000 Y118.000 E0.11220
+G1 X105.000 Y115.000 E0.11220
+G1 X105.450 Y115.450 F1800
+G1 X107.550 Y115.450 E0.07854 F1800
+G1 X107.550 Y117.550 E0.07854
+G1 X105.450 Y117.550 E0.07854
+G1 X105.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X100.000 Y115.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X103.000 Y115.000 E0.11220 F1800
+G1 X103.000 Y118.000 E0.11220
+G1 X100.000 Y118.000 E0.11220
+G1 X100.000 Y115.000 E0.11220
+G1 X100.450 Y115.450 F1800
+G1 X102.550 Y115.450 E0.07854 F1800
+G1 X102.550 Y117.550 E0.07854
+G1 X100.450 Y117.550 E0.07854
+G1 X100.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X95.000 Y115.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X98.000 Y115.000 E0.11220 F1800
+G1 X98.000 Y118.000 E0.11220
+G1 X95.000 Y118.000 E0.11220
+G1 X95.000 Y115.000 E0.11220
+G1 X95.450 Y115.450 F1800
+G1 X97.550 Y115.450 E0.07854 F1800
+G1 X97.550 Y117.550 E0.07854
+G1 X95.450 Y117.550 E0.07854
+G1 X95.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X90.000 Y115.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X93.000 Y115.000 E0.11220 F1800
+G1 X93.000 Y118.000 E0.11220
+G1 X90.000 Y118.000 E0.11220
+G1 X90.000 Y115.000 E0.11220
+G1 X90.450 Y115.450 F1800
+G1 X92.550 Y115.450 E0.07854 F1800
+G1 X92.550 Y117.550 E0.07854
+G1 X90.450 Y117.550 E0.07854
+G1 X90.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X85.000 Y115.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X88.000 Y115.000 E0.11220 F1800
+G1 X88.000 Y118.000 E0.11220
+G1 X85.000 Y118.000 E0.11220
+G1 X85.000 Y115.000 E0.11220
+G1 X85.450 Y115.450 F1800
+G1 X87.550 Y115.450 E0.07854 F1800
+G1 X87.550 Y117.550 E0.07854
+G1 X85.450 Y117.550 E0.07854
+G1 X85.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.000 F1200
+G1 X80.000 Y115.000 F9000
+G1 Z1.200 F1200
+G1 E0.8 F2400
+G1 X83.000 Y115.000 E0.11220 F1800
+G1 X83.000 Y118.000 E0.11220
+G1 X80.000 Y118.000 E0.11220
+G1 X80.000 Y115.000 E0.11220
+G1 X80.450 Y115.450 F1800
+G1 X82.550 Y115.450 E0.07854 F1800
+G1 X82.550 Y117.550 E0.07854
+G1 X80.450 Y117.550 E0.07854
+G1 X80.450 Y115.450 E0.07854
+;LAYER:6
+G1 Z1.400 F1200
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X80.000 Y80.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X83.000 Y80.000 E0.11220 F1800
+G1 X83.000 Y83.000 E0.11220
+G1 X80.000 Y83.000 E0.11220
+G1 X80.000 Y80.000 E0.11220
+G1 X80.450 Y80.450 F1800
+G1 X82.550 Y80.450 E0.07854 F1800
+G1 X82.550 Y82.550 E0.07854
+G1 X80.450 Y82.550 E0.07854
+G1 X80.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X85.000 Y80.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X88.000 Y80.000 E0.11220 F1800
+G1 X88.000 Y83.000 E0.11220
+G1 X85.000 Y83.000 E0.11220
+G1 X85.000 Y80.000 E0.11220
+G1 X85.450 Y80.450 F1800
+G1 X87.550 Y80.450 E0.07854 F1800
+G1 X87.550 Y82.550 E0.07854
+G1 X85.450 Y82.550 E0.07854
+G1 X85.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X90.000 Y80.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X93.000 Y80.000 E0.11220 F1800
+G1 X93.000 Y83.000 E0.11220
+G1 X90.000 Y83.000 E0.11220
+G1 X90.000 Y80.000 E0.11220
+G1 X90.450 Y80.450 F1800
+G1 X92.550 Y80.450 E0.07854 F1800
+G1 X92.550 Y82.550 E0.07854
+G1 X90.450 Y82.550 E0.07854
+G1 X90.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X95.000 Y80.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X98.000 Y80.000 E0.11220 F1800
+G1 X98.000 Y83.000 E0.11220
+G1 X95.000 Y83.000 E0.11220
+G1 X95.000 Y80.000 E0.11220
+G1 X95.450 Y80.450 F1800
+G1 X97.550 Y80.450 E0.07854 F1800
+G1 X97.550 Y82.550 E0.07854
+G1 X95.450 Y82.550 E0.07854
+G1 X95.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X100.000 Y80.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X103.000 Y80.000 E0.11220 F1800
+G1 X103.000 Y83.000 E0.11220
+G1 X100.000 Y83.000 E0.11220
+G1 X100.000 Y80.000 E0.11220
+G1 X100.450 Y80.450 F1800
+G1 X102.550 Y80.450 E0.07854 F1800
+G1 X102.550 Y82.550 E0.07854
+G1 X100.450 Y82.550 E0.07854
+G1 X100.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X105.000 Y80.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X108.000 Y80.000 E0.11220 F1800
+G1 X108.000 Y83.000 E0.11220
+G1 X105.000 Y83.000 E0.11220
+G1 X105.000 Y80.000 E0.11220
+G1 X105.450 Y80.450 F1800
+G1 X107.550 Y80.450 E0.07854 F1800
+G1 X107.550 Y82.550 E0.07854
+G1 X105.450 Y82.550 E0.07854
+G1 X105.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X110.000 Y80.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X113.000 Y80.000 E0.11220 F1800
+G1 X113.000 Y83.000 E0.11220
+G1 X110.000 Y83.000 E0.11220
+G1 X110.000 Y80.000 E0.11220
+G1 X110.450 Y80.450 F1800
+G1 X112.550 Y80.450 E0.07854 F1800
+G1 X112.550 Y82.550 E0.07854
+G1 X110.450 Y82.550 E0.07854
+G1 X110.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X115.000 Y80.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X118.000 Y80.000 E0.11220 F1800
+G1 X118.000 Y83.000 E0.11220
+G1 X115.000 Y83.000 E0.11220
+G1 X115.000 Y80.000 E0.11220
+G1 X115.450 Y80.450 F1800
+G1 X117.550 Y80.450 E0.07854 F1800
+G1 X117.550 Y82.550 E0.07854
+G1 X115.450 Y82.550 E0.07854
+G1 X115.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X115.000 Y85.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X118.000 Y85.000 E0.11220 F1800
+G1 X118.000 Y88.000 E0.11220
+G1 X115.000 Y88.000 E0.11220
+G1 X115.000 Y85.000 E0.11220
+G1 X115.450 Y85.450 F1800
+G1 X117.550 Y85.450 E0.07854 F1800
+G1 X117.550 Y87.550 E0.07854
+G1 X115.450 Y87.550 E0.07854
+G1 X115.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X110.000 Y85.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X113.000 Y85.000 E0.11220 F1800
+G1 X113.000 Y88.000 E0.11220
+G1 X110.000 Y88.000 E0.11220
+G1 X110.000 Y85.000 E0.11220
+G1 X110.450 Y85.450 F1800
+G1 X112.550 Y85.450 E0.07854 F1800
+G1 X112.550 Y87.550 E0.07854
+G1 X110.450 Y87.550 E0.07854
+G1 X110.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X105.000 Y85.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X108.000 Y85.000 E0.11220 F1800
+G1 X108.000 Y88.000 E0.11220
+G1 X105.000 Y88.000 E0.11220
+G1 X105.000 Y85.000 E0.11220
+G1 X105.450 Y85.450 F1800
+G1 X107.550 Y85.450 E0.07854 F1800
+G1 X107.550 Y87.550 E0.07854
+G1 X105.450 Y87.550 E0.07854
+G1 X105.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X100.000 Y85.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X103.000 Y85.000 E0.11220 F1800
+G1 X103.000 Y88.000 E0.11220
+G1 X100.000 Y88.000 E0.11220
+G1 X100.000 Y85.000 E0.11220
+G1 X100.450 Y85.450 F1800
+G1 X102.550 Y85.450 E0.07854 F1800
+G1 X102.550 Y87.550 E0.07854
+G1 X100.450 Y87.550 E0.07854
+G1 X100.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X95.000 Y85.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X98.000 Y85.000 E0.11220 F1800
+G1 X98.000 Y88.000 E0.11220
+G1 X95.000 Y88.000 E0.11220
+G1 X95.000 Y85.000 E0.11220
+G1 X95.450 Y85.450 F1800
+G1 X97.550 Y85.450 E0.07854 F1800
+G1 X97.550 Y87.550 E0.07854
+G1 X95.450 Y87.550 E0.07854
+G1 X95.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X90.000 Y85.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X93.000 Y85.000 E0.11220 F1800
+G1 X93.000 Y88.000 E0.11220
+G1 X90.000 Y88.000 E0.11220
+G1 X90.000 Y85.000 E0.11220
+G1 X90.450 Y85.450 F1800
+G1 X92.550 Y85.450 E0.07854 F1800
+G1 X92.550 Y87.550 E0.07854
+G1 X90.450 Y87.550 E0.07854
+G1 X90.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X85.000 Y85.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X88.000 Y85.000 E0.11220 F1800
+G1 X88.000 Y88.000 E0.11220
+G1 X85.000 Y88.000 E0.11220
+G1 X85.000 Y85.000 E0.11220
+G1 X85.450 Y85.450 F1800
+G1 X87.550 Y85.450 E0.07854 F1800
+G1 X87.550 Y87.550 E0.07854
+G1 X85.450 Y87.550 E0.07854
+G1 X85.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X80.000 Y85.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X83.000 Y85.000 E0.11220 F1800
+G1 X83.000 Y88.000 E0.11220
+G1 X80.000 Y88.000 E0.11220
+G1 X80.000 Y85.000 E0.11220
+G1 X80.450 Y85.450 F1800
+G1 X82.550 Y85.450 E0.07854 F1800
+G1 X82.550 Y87.550 E0.07854
+G1 X80.450 Y87.550 E0.07854
+G1 X80.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X80.000 Y90.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X83.000 Y90.000 E0.11220 F1800
+G1 X83.000 Y93.000 E0.11220
+G1 X80.000 Y93.000 E0.11220
+G1 X80.000 Y90.000 E0.11220
+G1 X80.450 Y90.450 F1800
+G1 X82.550 Y90.450 E0.07854 F1800
+G1 X82.550 Y92.550 E0.07854
+G1 X80.450 Y92.550 E0.07854
+G1 X80.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X85.000 Y90.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X88.000 Y90.000 E0.11220 F1800
+G1 X88.000 Y93.000 E0.11220
+G1 X85.000 Y93.000 E0.11220
+G1 X85.000 Y90.000 E0.11220
+G1 X85.450 Y90.450 F1800
+G1 X87.550 Y90.450 E0.07854 F1800
+G1 X87.550 Y92.550 E0.07854
+G1 X85.450 Y92.550 E0.07854
+G1 X85.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X90.000 Y90.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X93.000 Y90.000 E0.11220 F1800
+G1 X93.000 Y93.000 E0.11220
+G1 X90.000 Y93.000 E0.11220
+G1 X90.000 Y90.000 E0.11220
+G1 X90.450 Y90.450 F1800
+G1 X92.550 Y90.450 E0.07854 F1800
+G1 X92.550 Y92.550 E0.07854
+G1 X90.450 Y92.550 E0.07854
+G1 X90.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X95.000 Y90.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X98.000 Y90.000 E0.11220 F1800
+G1 X98.000 Y93.000 E0.11220
+G1 X95.000 Y93.000 E0.11220
+G1 X95.000 Y90.000 E0.11220
+G1 X95.450 Y90.450 F1800
+G1 X97.550 Y90.450 E0.07854 F1800
+G1 X97.550 Y92.550 E0.07854
+G1 X95.450 Y92.550 E0.07854
+G1 X95.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X100.000 Y90.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X103.000 Y90.000 E0.11220 F1800
+G1 X103.000 Y93.000 E0.11220
+G1 X100.000 Y93.000 E0.11220
+G1 X100.000 Y90.000 E0.11220
+G1 X100.450 Y90.450 F1800
+G1 X102.550 Y90.450 E0.07854 F1800
+G1 X102.550 Y92.550 E0.07854
+G1 X100.450 Y92.550 E0.07854
+G1 X100.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X105.000 Y90.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X108.000 Y90.000 E0.11220 F1800
+G1 X108.000 Y93.000 E0.11220
+G1 X105.000 Y93.000 E0.11220
+G1 X105.000 Y90.000 E0.11220
+G1 X105.450 Y90.450 F1800
+G1 X107.550 Y90.450 E0.07854 F1800
+G1 X107.550 Y92.550 E0.07854
+G1 X105.450 Y92.550 E0.07854
+G1 X105.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X110.000 Y90.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X113.000 Y90.000 E0.11220 F1800
+G1 X113.000 Y93.000 E0.11220
+G1 X110.000 Y93.000 E0.11220
+G1 X110.000 Y90.000 E0.11220
+G1 X110.450 Y90.450 F1800
+G1 X112.550 Y90.450 E0.07854 F1800
+G1 X112.550 Y92.550 E0.07854
+G1 X110.450 Y92.550 E0.07854
+G1 X110.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X115.000 Y90.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X118.000 Y90.000 E0.11220 F1800
+G1 X118.000 Y93.000 E0.11220
+G1 X115.000 Y93.000 E0.11220
+G1 X115.000 Y90.000 E0.11220
+G1 X115.450 Y90.450 F1800
+G1 X117.550 Y90.450 E0.07854 F1800
+G1 X117.550 Y92.550 E0.07854
+G1 X115.450 Y92.550 E0.07854
+G1 X115.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X115.000 Y95.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X118.000 Y95.000 E0.11220 F1800
+G1 X118.000 Y98.000 E0.11220
+G1 X115.000 Y98.000 E0.11220
+G1 X115.000 Y95.000 E0.11220
+G1 X115.450 Y95.450 F1800
+G1 X117.550 Y95.450 E0.07854 F1800
+G1 X117.550 Y97.550 E0.07854
+G1 X115.450 Y97.550 E0.07854
+G1 X115.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X110.000 Y95.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X113.000 Y95.000 E0.11220 F1800
+G1 X113.000 Y98.000 E0.11220
+G1 X110.000 Y98.000 E0.11220
+G1 X110.000 Y95.000 E0.11220
+G1 X110.450 Y95.450 F1800
+G1 X112.550 Y95.450 E0.07854 F1800
+G1 X112.550 Y97.550 E0.07854
+G1 X110.450 Y97.550 E0.07854
+G1 X110.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X105.000 Y95.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X108.000 Y95.000 E0.11220 F1800
+G1 X108.000 Y98.000 E0.11220
+G1 X105.000 Y98.000 E0.11220
+G1 X105.000 Y95.000 E0.11220
+G1 X105.450 Y95.450 F1800
+G1 X107.550 Y95.450 E0.07854 F1800
+G1 X107.550 Y97.550 E0.07854
+G1 X105.450 Y97.550 E0.07854
+G1 X105.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X100.000 Y95.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X103.000 Y95.000 E0.11220 F1800
+G1 X103.000 Y98.000 E0.11220
+G1 X100.000 Y98.000 E0.11220
+G1 X100.000 Y95.000 E0.11220
+G1 X100.450 Y95.450 F1800
+G1 X102.550 Y95.450 E0.07854 F1800
+G1 X102.550 Y97.550 E0.07854
+G1 X100.450 Y97.550 E0.07854
+G1 X100.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X95.000 Y95.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X98.000 Y95.000 E0.11220 F1800
+G1 X98.000 Y98.000 E0.11220
+G1 X95.000 Y98.000 E0.11220
+G1 X95.000 Y95.000 E0.11220
+G1 X95.450 Y95.450 F1800
+G1 X97.550 Y95.450 E0.07854 F1800
+G1 X97.550 Y97.550 E0.07854
+G1 X95.450 Y97.550 E0.07854
+G1 X95.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X90.000 Y95.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X93.000 Y95.000 E0.11220 F1800
+G1 X93.000 Y98.000 E0.11220
+G1 X90.000 Y98.000 E0.11220
+G1 X90.000 Y95.000 E0.11220
+G1 X90.450 Y95.450 F1800
+G1 X92.550 Y95.450 E0.07854 F1800
+G1 X92.550 Y97.550 E0.07854
+G1 X90.450 Y97.550 E0.07854
+G1 X90.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X85.000 Y95.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X88.000 Y95.000 E0.11220 F1800
+G1 X88.000 Y98.000 E0.11220
+G1 X85.000 Y98.000 E0.11220
+G1 X85.000 Y95.000 E0.11220
+G1 X85.450 Y95.450 F1800
+G1 X87.550 Y95.450 E0.07854 F1800
+G1 X87.550 Y97.550 E0.07854
+G1 X85.450 Y97.550 E0.07854
+G1 X85.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X80.000 Y95.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X83.000 Y95.000 E0.11220 F1800
+G1 X83.000 Y98.000 E0.11220
+G1 X80.000 Y98.000 E0.11220
+G1 X80.000 Y95.000 E0.11220
+G1 X80.450 Y95.450 F1800
+G1 X82.550 Y95.450 E0.07854 F1800
+G1 X82.550 Y97.550 E0.07854
+G1 X80.450 Y97.550 E0.07854
+G1 X80.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X80.000 Y100.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X83.000 Y100.000 E0.11220 F1800
+G1 X83.000 Y103.000 E0.11220
+G1 X80.000 Y103.000 E0.11220
+G1 X80.000 Y100.000 E0.11220
+G1 X80.450 Y100.450 F1800
+G1 X82.550 Y100.450 E0.07854 F1800
+G1 X82.550 Y102.550 E0.07854
+G1 X80.450 Y102.550 E0.07854
+G1 X80.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X85.000 Y100.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X88.000 Y100.000 E0.11220 F1800
+G1 X88.000 Y103.000 E0.11220
+G1 X85.000 Y103.000 E0.11220
+G1 X85.000 Y100.000 E0.11220
+G1 X85.450 Y100.450 F1800
+G1 X87.550 Y100.450 E0.07854 F1800
+G1 X87.550 Y102.550 E0.07854
+G1 X85.450 Y102.550 E0.07854
+G1 X85.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X90.000 Y100.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X93.000 Y100.000 E0.11220 F1800
+G1 X93.000 Y103.000 E0.11220
+G1 X90.000 Y103.000 E0.11220
+G1 X90.000 Y100.000 E0.11220
+G1 X90.450 Y100.450 F1800
+G1 X92.550 Y100.450 E0.07854 F1800
+G1 X92.550 Y102.550 E0.07854
+G1 X90.450 Y102.550 E0.07854
+G1 X90.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X95.000 Y100.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X98.000 Y100.000 E0.11220 F1800
+G1 X98.000 Y103.000 E0.11220
+G1 X95.000 Y103.000 E0.11220
+G1 X95.000 Y100.000 E0.11220
+G1 X95.450 Y100.450 F1800
+G1 X97.550 Y100.450 E0.07854 F1800
+G1 X97.550 Y102.550 E0.07854
+G1 X95.450 Y102.550 E0.07854
+G1 X95.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X100.000 Y100.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X103.000 Y100.000 E0.11220 F1800
+G1 X103.000 Y103.000 E0.11220
+G1 X100.000 Y103.000 E0.11220
+G1 X100.000 Y100.000 E0.11220
+G1 X100.450 Y100.450 F1800
+G1 X102.550 Y100.450 E0.07854 F1800
+G1 X102.550 Y102.550 E0.07854
+G1 X100.450 Y102.550 E0.07854
+G1 X100.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X105.000 Y100.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X108.000 Y100.000 E0.11220 F1800
+G1 X108.000 Y103.000 E0.11220
+G1 X105.000 Y103.000 E0.11220
+G1 X105.000 Y100.000 E0.11220
+G1 X105.450 Y100.450 F1800
+G1 X107.550 Y100.450 E0.07854 F1800
+G1 X107.550 Y102.550 E0.07854
+G1 X105.450 Y102.550 E0.07854
+G1 X105.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X110.000 Y100.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X113.000 Y100.000 E0.11220 F1800
+G1 X113.000 Y103.000 E0.11220
+G1 X110.000 Y103.000 E0.11220
+G1 X110.000 Y100.000 E0.11220
+G1 X110.450 Y100.450 F1800
+G1 X112.550 Y100.450 E0.07854 F1800
+G1 X112.550 Y102.550 E0.07854
+G1 X110.450 Y102.550 E0.07854
+G1 X110.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X115.000 Y100.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X118.000 Y100.000 E0.11220 F1800
+G1 X118.000 Y103.000 E0.11220
+G1 X115.000 Y103.000 E0.11220
+G1 X115.000 Y100.000 E0.11220
+G1 X115.450 Y100.450 F1800
+G1 X117.550 Y100.450 E0.07854 F1800
+G1 X117.550 Y102.550 E0.07854
+G1 X115.450 Y102.550 E0.07854
+G1 X115.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X115.000 Y105.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X118.000 Y105.000 E0.11220 F1800
+G1 X118.000 Y108.000 E0.11220
+G1 X115.000 Y108.000 E0.11220
+G1 X115.000 Y105.000 E0.11220
+G1 X115.450 Y105.450 F1800
+G1 X117.550 Y105.450 E0.07854 F1800
+G1 X117.550 Y107.550 E0.07854
+G1 X115.450 Y107.550 E0.07854
+G1 X115.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X110.000 Y105.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X113.000 Y105.000 E0.11220 F1800
+G1 X113.000 Y108.000 E0.11220
+G1 X110.000 Y108.000 E0.11220
+G1 X110.000 Y105.000 E0.11220
+G1 X110.450 Y105.450 F1800
+G1 X112.550 Y105.450 E0.07854 F1800
+G1 X112.550 Y107.550 E0.07854
+G1 X110.450 Y107.550 E0.07854
+G1 X110.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X105.000 Y105.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X108.000 Y105.000 E0.11220 F1800
+G1 X108.000 Y108.000 E0.11220
+G1 X105.000 Y108.000 E0.11220
+G1 X105.000 Y105.000 E0.11220
+G1 X105.450 Y105.450 F1800
+G1 X107.550 Y105.450 E0.07854 F1800
+G1 X107.550 Y107.550 E0.07854
+G1 X105.450 Y107.550 E0.07854
+G1 X105.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X100.000 Y105.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X103.000 Y105.000 E0.11220 F1800
+G1 X103.000 Y108.000 E0.11220
+G1 X100.000 Y108.000 E0.11220
+G1 X100.000 Y105.000 E0.11220
+G1 X100.450 Y105.450 F1800
+G1 X102.550 Y105.450 E0.07854 F1800
+G1 X102.550 Y107.550 E0.07854
+G1 X100.450 Y107.550 E0.07854
+G1 X100.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X95.000 Y105.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X98.000 Y105.000 E0.11220 F1800
+G1 X98.000 Y108.000 E0.11220
+G1 X95.000 Y108.000 E0.11220
+G1 X95.000 Y105.000 E0.11220
+G1 X95.450 Y105.450 F1800
+G1 X97.550 Y105.450 E0.07854 F1800
+G1 X97.550 Y107.550 E0.07854
+G1 X95.450 Y107.550 E0.07854
+G1 X95.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X90.000 Y105.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X93.000 Y105.000 E0.11220 F1800
+G1 X93.000 Y108.000 E0.11220
+G1 X90.000 Y108.000 E0.11220
+G1 X90.000 Y105.000 E0.11220
+G1 X90.450 Y105.450 F1800
+G1 X92.550 Y105.450 E0.07854 F1800
+G1 X92.550 Y107.550 E0.07854
+G1 X90.450 Y107.550 E0.07854
+G1 X90.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X85.000 Y105.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X88.000 Y105.000 E0.11220 F1800
+G1 X88.000 Y108.000 E0.11220
+G1 X85.000 Y108.000 E0.11220
+G1 X85.000 Y105.000 E0.11220
+G1 X85.450 Y105.450 F1800
+G1 X87.550 Y105.450 E0.07854 F1800
+G1 X87.550 Y107.550 E0.07854
+G1 X85.450 Y107.550 E0.07854
+G1 X85.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X80.000 Y105.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X83.000 Y105.000 E0.11220 F1800
+G1 X83.000 Y108.000 E0.11220
+G1 X80.000 Y108.000 E0.11220
+G1 X80.000 Y105.000 E0.11220
+G1 X80.450 Y105.450 F1800
+G1 X82.550 Y105.450 E0.07854 F1800
+G1 X82.550 Y107.550 E0.07854
+G1 X80.450 Y107.550 E0.07854
+G1 X80.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X80.000 Y110.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X83.000 Y110.000 E0.11220 F1800
+G1 X83.000 Y113.000 E0.11220
+G1 X80.000 Y113.000 E0.11220
+G1 X80.000 Y110.000 E0.11220
+G1 X80.450 Y110.450 F1800
+G1 X82.550 Y110.450 E0.07854 F1800
+G1 X82.550 Y112.550 E0.07854
+G1 X80.450 Y112.550 E0.07854
+G1 X80.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X85.000 Y110.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X88.000 Y110.000 E0.11220 F1800
+G1 X88.000 Y113.000 E0.11220
+G1 X85.000 Y113.000 E0.11220
+G1 X85.000 Y110.000 E0.11220
+G1 X85.450 Y110.450 F1800
+G1 X87.550 Y110.450 E0.07854 F1800
+G1 X87.550 Y112.550 E0.07854
+G1 X85.450 Y112.550 E0.07854
+G1 X85.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X90.000 Y110.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X93.000 Y110.000 E0.11220 F1800
+G1 X93.000 Y113.000 E0.11220
+G1 X90.000 Y113.000 E0.11220
+G1 X90.000 Y110.000 E0.11220
+G1 X90.450 Y110.450 F1800
+G1 X92.550 Y110.450 E0.07854 F1800
+G1 X92.550 Y112.550 E0.07854
+G1 X90.450 Y112.550 E0.07854
+G1 X90.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X95.000 Y110.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X98.000 Y110.000 E0.11220 F1800
+G1 X98.000 Y113.000 E0.11220
+G1 X95.000 Y113.000 E0.11220
+G1 X95.000 Y110.000 E0.11220
+G1 X95.450 Y110.450 F1800
+G1 X97.550 Y110.450 E0.07854 F1800
+G1 X97.550 Y112.550 E0.07854
+G1 X95.450 Y112.550 E0.07854
+G1 X95.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X100.000 Y110.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X103.000 Y110.000 E0.11220 F1800
+G1 X103.000 Y113.000 E0.11220
+G1 X100.000 Y113.000 E0.11220
+G1 X100.000 Y110.000 E0.11220
+G1 X100.450 Y110.450 F1800
+G1 X102.550 Y110.450 E0.07854 F1800
+G1 X102.550 Y112.550 E0.07854
+G1 X100.450 Y112.550 E0.07854
+G1 X100.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X105.000 Y110.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X108.000 Y110.000 E0.11220 F1800
+G1 X108.000 Y113.000 E0.11220
+G1 X105.000 Y113.000 E0.11220
+G1 X105.000 Y110.000 E0.11220
+G1 X105.450 Y110.450 F1800
+G1 X107.550 Y110.450 E0.07854 F1800
+G1 X107.550 Y112.550 E0.07854
+G1 X105.450 Y112.550 E0.07854
+G1 X105.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X110.000 Y110.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X113.000 Y110.000 E0.11220 F1800
+G1 X113.000 Y113.000 E0.11220
+G1 X110.000 Y113.000 E0.11220
+G1 X110.000 Y110.000 E0.11220
+G1 X110.450 Y110.450 F1800
+G1 X112.550 Y110.450 E0.07854 F1800
+G1 X112.550 Y112.550 E0.07854
+G1 X110.450 Y112.550 E0.07854
+G1 X110.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X115.000 Y110.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X118.000 Y110.000 E0.11220 F1800
+G1 X118.000 Y113.000 E0.11220
+G1 X115.000 Y113.000 E0.11220
+G1 X115.000 Y110.000 E0.11220
+G1 X115.450 Y110.450 F1800
+G1 X117.550 Y110.450 E0.07854 F1800
+G1 X117.550 Y112.550 E0.07854
+G1 X115.450 Y112.550 E0.07854
+G1 X115.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X115.000 Y115.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X118.000 Y115.000 E0.11220 F1800
+G1 X118.000 Y118.000 E0.11220
+G1 X115.000 Y118.000 E0.11220
+G1 X115.000 Y115.000 E0.11220
+G1 X115.450 Y115.450 F1800
+G1 X117.550 Y115.450 E0.07854 F1800
+G1 X117.550 Y117.550 E0.07854
+G1 X115.450 Y117.550 E0.07854
+G1 X115.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X110.000 Y115.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X113.000 Y115.000 E0.11220 F1800
+G1 X113.000 Y118.000 E0.11220
+G1 X110.000 Y118.000 E0.11220
+G1 X110.000 Y115.000 E0.11220
+G1 X110.450 Y115.450 F1800
+G1 X112.550 Y115.450 E0.07854 F1800
+G1 X112.550 Y117.550 E0.07854
+G1 X110.450 Y117.550 E0.07854
+G1 X110.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X105.000 Y115.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X108.000 Y115.000 E0.11220 F1800
+G1 X108.000 Y118.000 E0.11220
+G1 X105.000 Y118.000 E0.11220
+G1 X105.000 Y115.000 E0.11220
+G1 X105.450 Y115.450 F1800
+G1 X107.550 Y115.450 E0.07854 F1800
+G1 X107.550 Y117.550 E0.07854
+G1 X105.450 Y117.550 E0.07854
+G1 X105.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X100.000 Y115.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X103.000 Y115.000 E0.11220 F1800
+G1 X103.000 Y118.000 E0.11220
+G1 X100.000 Y118.000 E0.11220
+G1 X100.000 Y115.000 E0.11220
+G1 X100.450 Y115.450 F1800
+G1 X102.550 Y115.450 E0.07854 F1800
+G1 X102.550 Y117.550 E0.07854
+G1 X100.450 Y117.550 E0.07854
+G1 X100.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X95.000 Y115.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X98.000 Y115.000 E0.11220 F1800
+G1 X98.000 Y118.000 E0.11220
+G1 X95.000 Y118.000 E0.11220
+G1 X95.000 Y115.000 E0.11220
+G1 X95.450 Y115.450 F1800
+G1 X97.550 Y115.450 E0.07854 F1800
+G1 X97.550 Y117.550 E0.07854
+G1 X95.450 Y117.550 E0.07854
+G1 X95.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X90.000 Y115.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X93.000 Y115.000 E0.11220 F1800
+G1 X93.000 Y118.000 E0.11220
+G1 X90.000 Y118.000 E0.11220
+G1 X90.000 Y115.000 E0.11220
+G1 X90.450 Y115.450 F1800
+G1 X92.550 Y115.450 E0.07854 F1800
+G1 X92.550 Y117.550 E0.07854
+G1 X90.450 Y117.550 E0.07854
+G1 X90.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X85.000 Y115.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X88.000 Y115.000 E0.11220 F1800
+G1 X88.000 Y118.000 E0.11220
+G1 X85.000 Y118.000 E0.11220
+G1 X85.000 Y115.000 E0.11220
+G1 X85.450 Y115.450 F1800
+G1 X87.550 Y115.450 E0.07854 F1800
+G1 X87.550 Y117.550 E0.07854
+G1 X85.450 Y117.550 E0.07854
+G1 X85.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.200 F1200
+G1 X80.000 Y115.000 F9000
+G1 Z1.400 F1200
+G1 E0.8 F2400
+G1 X83.000 Y115.000 E0.11220 F1800
+G1 X83.000 Y118.000 E0.11220
+G1 X80.000 Y118.000 E0.11220
+G1 X80.000 Y115.000 E0.11220
+G1 X80.450 Y115.450 F1800
+G1 X82.550 Y115.450 E0.07854 F1800
+G1 X82.550 Y117.550 E0.07854
+G1 X80.450 Y117.550 E0.07854
+G1 X80.450 Y115.450 E0.07854
+;LAYER:7
+G1 Z1.600 F1200
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X80.000 Y80.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X83.000 Y80.000 E0.11220 F1800
+G1 X83.000 Y83.000 E0.11220
+G1 X80.000 Y83.000 E0.11220
+G1 X80.000 Y80.000 E0.11220
+G1 X80.450 Y80.450 F1800
+G1 X82.550 Y80.450 E0.07854 F1800
+G1 X82.550 Y82.550 E0.07854
+G1 X80.450 Y82.550 E0.07854
+G1 X80.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X85.000 Y80.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X88.000 Y80.000 E0.11220 F1800
+G1 X88.000 Y83.000 E0.11220
+G1 X85.000 Y83.000 E0.11220
+G1 X85.000 Y80.000 E0.11220
+G1 X85.450 Y80.450 F1800
+G1 X87.550 Y80.450 E0.07854 F1800
+G1 X87.550 Y82.550 E0.07854
+G1 X85.450 Y82.550 E0.07854
+G1 X85.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X90.000 Y80.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X93.000 Y80.000 E0.11220 F1800
+G1 X93.000 Y83.000 E0.11220
+G1 X90.000 Y83.000 E0.11220
+G1 X90.000 Y80.000 E0.11220
+G1 X90.450 Y80.450 F1800
+G1 X92.550 Y80.450 E0.07854 F1800
+G1 X92.550 Y82.550 E0.07854
+G1 X90.450 Y82.550 E0.07854
+G1 X90.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X95.000 Y80.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X98.000 Y80.000 E0.11220 F1800
+G1 X98.000 Y83.000 E0.11220
+G1 X95.000 Y83.000 E0.11220
+G1 X95.000 Y80.000 E0.11220
+G1 X95.450 Y80.450 F1800
+G1 X97.550 Y80.450 E0.07854 F1800
+G1 X97.550 Y82.550 E0.07854
+G1 X95.450 Y82.550 E0.07854
+G1 X95.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X100.000 Y80.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X103.000 Y80.000 E0.11220 F1800
+G1 X103.000 Y83.000 E0.11220
+G1 X100.000 Y83.000 E0.11220
+G1 X100.000 Y80.000 E0.11220
+G1 X100.450 Y80.450 F1800
+G1 X102.550 Y80.450 E0.07854 F1800
+G1 X102.550 Y82.550 E0.07854
+G1 X100.450 Y82.550 E0.07854
+G1 X100.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X105.000 Y80.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X108.000 Y80.000 E0.11220 F1800
+G1 X108.000 Y83.000 E0.11220
+G1 X105.000 Y83.000 E0.11220
+G1 X105.000 Y80.000 E0.11220
+G1 X105.450 Y80.450 F1800
+G1 X107.550 Y80.450 E0.07854 F1800
+G1 X107.550 Y82.550 E0.07854
+G1 X105.450 Y82.550 E0.07854
+G1 X105.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X110.000 Y80.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X113.000 Y80.000 E0.11220 F1800
+G1 X113.000 Y83.000 E0.11220
+G1 X110.000 Y83.000 E0.11220
+G1 X110.000 Y80.000 E0.11220
+G1 X110.450 Y80.450 F1800
+G1 X112.550 Y80.450 E0.07854 F1800
+G1 X112.550 Y82.550 E0.07854
+G1 X110.450 Y82.550 E0.07854
+G1 X110.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X115.000 Y80.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X118.000 Y80.000 E0.11220 F1800
+G1 X118.000 Y83.000 E0.11220
+G1 X115.000 Y83.000 E0.11220
+G1 X115.000 Y80.000 E0.11220
+G1 X115.450 Y80.450 F1800
+G1 X117.550 Y80.450 E0.07854 F1800
+G1 X117.550 Y82.550 E0.07854
+G1 X115.450 Y82.550 E0.07854
+G1 X115.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X115.000 Y85.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X118.000 Y85.000 E0.11220 F1800
+G1 X118.000 Y88.000 E0.11220
+G1 X115.000 Y88.000 E0.11220
+G1 X115.000 Y85.000 E0.11220
+G1 X115.450 Y85.450 F1800
+G1 X117.550 Y85.450 E0.07854 F1800
+G1 X117.550 Y87.550 E0.07854
+G1 X115.450 Y87.550 E0.07854
+G1 X115.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X110.000 Y85.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X113.000 Y85.000 E0.11220 F1800
+G1 X113.000 Y88.000 E0.11220
+G1 X110.000 Y88.000 E0.11220
+G1 X110.000 Y85.000 E0.11220
+G1 X110.450 Y85.450 F1800
+G1 X112.550 Y85.450 E0.07854 F1800
+G1 X112.550 Y87.550 E0.07854
+G1 X110.450 Y87.550 E0.07854
+G1 X110.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X105.000 Y85.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X108.000 Y85.000 E0.11220 F1800
+G1 X108.000 Y88.000 E0.11220
+G1 X105.000 Y88.000 E0.11220
+G1 X105.000 Y85.000 E0.11220
+G1 X105.450 Y85.450 F1800
+G1 X107.550 Y85.450 E0.07854 F1800
+G1 X107.550 Y87.550 E0.07854
+G1 X105.450 Y87.550 E0.07854
+G1 X105.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X100.000 Y85.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X103.000 Y85.000 E0.11220 F1800
+G1 X103.000 Y88.000 E0.11220
+G1 X100.000 Y88.000 E0.11220
+G1 X100.000 Y85.000 E0.11220
+G1 X100.450 Y85.450 F1800
+G1 X102.550 Y85.450 E0.07854 F1800
+G1 X102.550 Y87.550 E0.07854
+G1 X100.450 Y87.550 E0.07854
+G1 X100.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X95.000 Y85.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X98.000 Y85.000 E0.11220 F1800
+G1 X98.000 Y88.000 E0.11220
+G1 X95.000 Y88.000 E0.11220
+G1 X95.000 Y85.000 E0.11220
+G1 X95.450 Y85.450 F1800
+G1 X97.550 Y85.450 E0.07854 F1800
+G1 X97.550 Y87.550 E0.07854
+G1 X95.450 Y87.550 E0.07854
+G1 X95.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X90.000 Y85.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X93.000 Y85.000 E0.11220 F1800
+G1 X93.000 Y88.000 E0.11220
+G1 X90.000 Y88.000 E0.11220
+G1 X90.000 Y85.000 E0.11220
+G1 X90.450 Y85.450 F1800
+G1 X92.550 Y85.450 E0.07854 F1800
+G1 X92.550 Y87.550 E0.07854
+G1 X90.450 Y87.550 E0.07854
+G1 X90.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X85.000 Y85.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X88.000 Y85.000 E0.11220 F1800
+G1 X88.000 Y88.000 E0.11220
+G1 X85.000 Y88.000 E0.11220
+G1 X85.000 Y85.000 E0.11220
+G1 X85.450 Y85.450 F1800
+G1 X87.550 Y85.450 E0.07854 F1800
+G1 X87.550 Y87.550 E0.07854
+G1 X85.450 Y87.550 E0.07854
+G1 X85.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X80.000 Y85.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X83.000 Y85.000 E0.11220 F1800
+G1 X83.000 Y88.000 E0.11220
+G1 X80.000 Y88.000 E0.11220
+G1 X80.000 Y85.000 E0.11220
+G1 X80.450 Y85.450 F1800
+G1 X82.550 Y85.450 E0.07854 F1800
+G1 X82.550 Y87.550 E0.07854
+G1 X80.450 Y87.550 E0.07854
+G1 X80.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X80.000 Y90.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X83.000 Y90.000 E0.11220 F1800
+G1 X83.000 Y93.000 E0.11220
+G1 X80.000 Y93.000 E0.11220
+G1 X80.000 Y90.000 E0.11220
+G1 X80.450 Y90.450 F1800
+G1 X82.550 Y90.450 E0.07854 F1800
+G1 X82.550 Y92.550 E0.07854
+G1 X80.450 Y92.550 E0.07854
+G1 X80.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X85.000 Y90.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X88.000 Y90.000 E0.11220 F1800
+G1 X88.000 Y93.000 E0.11220
+G1 X85.000 Y93.000 E0.11220
+G1 X85.000 Y90.000 E0.11220
+G1 X85.450 Y90.450 F1800
+G1 X87.550 Y90.450 E0.07854 F1800
+G1 X87.550 Y92.550 E0.07854
+G1 X85.450 Y92.550 E0.07854
+G1 X85.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X90.000 Y90.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X93.000 Y90.000 E0.11220 F1800
+G1 X93.000 Y93.000 E0.11220
+G1 X90.000 Y93.000 E0.11220
+G1 X90.000 Y90.000 E0.11220
+G1 X90.450 Y90.450 F1800
+G1 X92.550 Y90.450 E0.07854 F1800
+G1 X92.550 Y92.550 E0.07854
+G1 X90.450 Y92.550 E0.07854
+G1 X90.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X95.000 Y90.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X98.000 Y90.000 E0.11220 F1800
+G1 X98.000 Y93.000 E0.11220
+G1 X95.000 Y93.000 E0.11220
+G1 X95.000 Y90.000 E0.11220
+G1 X95.450 Y90.450 F1800
+G1 X97.550 Y90.450 E0.07854 F1800
+G1 X97.550 Y92.550 E0.07854
+G1 X95.450 Y92.550 E0.07854
+G1 X95.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X100.000 Y90.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X103.000 Y90.000 E0.11220 F1800
+G1 X103.000 Y93.000 E0.11220
+G1 X100.000 Y93.000 E0.11220
+G1 X100.000 Y90.000 E0.11220
+G1 X100.450 Y90.450 F1800
+G1 X102.550 Y90.450 E0.07854 F1800
+G1 X102.550 Y92.550 E0.07854
+G1 X100.450 Y92.550 E0.07854
+G1 X100.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X105.000 Y90.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X108.000 Y90.000 E0.11220 F1800
+G1 X108.000 Y93.000 E0.11220
+G1 X105.000 Y93.000 E0.11220
+G1 X105.000 Y90.000 E0.11220
+G1 X105.450 Y90.450 F1800
+G1 X107.550 Y90.450 E0.07854 F1800
+G1 X107.550 Y92.550 E0.07854
+G1 X105.450 Y92.550 E0.07854
+G1 X105.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X110.000 Y90.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X113.000 Y90.000 E0.11220 F1800
+G1 X113.000 Y93.000 E0.11220
+G1 X110.000 Y93.000 E0.11220
+G1 X110.000 Y90.000 E0.11220
+G1 X110.450 Y90.450 F1800
+G1 X112.550 Y90.450 E0.07854 F1800
+G1 X112.550 Y92.550 E0.07854
+G1 X110.450 Y92.550 E0.07854
+G1 X110.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X115.000 Y90.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X118.000 Y90.000 E0.11220 F1800
+G1 X118.000 Y93.000 E0.11220
+G1 X115.000 Y93.000 E0.11220
+G1 X115.000 Y90.000 E0.11220
+G1 X115.450 Y90.450 F1800
+G1 X117.550 Y90.450 E0.07854 F1800
+G1 X117.550 Y92.550 E0.07854
+G1 X115.450 Y92.550 E0.07854
+G1 X115.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X115.000 Y95.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X118.000 Y95.000 E0.11220 F1800
+G1 X118.000 Y98.000 E0.11220
+G1 X115.000 Y98.000 E0.11220
+G1 X115.000 Y95.000 E0.11220
+G1 X115.450 Y95.450 F1800
+G1 X117.550 Y95.450 E0.07854 F1800
+G1 X117.550 Y97.550 E0.07854
+G1 X115.450 Y97.550 E0.07854
+G1 X115.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X110.000 Y95.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X113.000 Y95.000 E0.11220 F1800
+G1 X113.000 Y98.000 E0.11220
+G1 X110.000 Y98.000 E0.11220
+G1 X110.000 Y95.000 E0.11220
+G1 X110.450 Y95.450 F1800
+G1 X112.550 Y95.450 E0.07854 F1800
+G1 X112.550 Y97.550 E0.07854
+G1 X110.450 Y97.550 E0.07854
+G1 X110.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X105.000 Y95.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X108.000 Y95.000 E0.11220 F1800
+G1 X108.000 Y98.000 E0.11220
+G1 X105.000 Y98.000 E0.11220
+G1 X105.000 Y95.000 E0.11220
+G1 X105.450 Y95.450 F1800
+G1 X107.550 Y95.450 E0.07854 F1800
+G1 X107.550 Y97.550 E0.07854
+G1 X105.450 Y97.550 E0.07854
+G1 X105.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X100.000 Y95.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X103.000 Y95.000 E0.11220 F1800
+G1 X103.000 Y98.000 E0.11220
+G1 X100.000 Y98.000 E0.11220
+G1 X100.000 Y95.000 E0.11220
+G1 X100.450 Y95.450 F1800
+G1 X102.550 Y95.450 E0.07854 F1800
+G1 X102.550 Y97.550 E0.07854
+G1 X100.450 Y97.550 E0.07854
+G1 X100.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X95.000 Y95.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X98.000 Y95.000 E0.11220 F1800
+G1 X98.000 Y98.000 E0.11220
+G1 X95.000 Y98.000 E0.11220
+G1 X95.000 Y95.000 E0.11220
+G1 X95.450 Y95.450 F1800
+G1 X97.550 Y95.450 E0.07854 F1800
+G1 X97.550 Y97.550 E0.07854
+G1 X95.450 Y97.550 E0.07854
+G1 X95.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X90.000 Y95.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X93.000 Y95.000 E0.11220 F1800
+G1 X93.000 Y98.000 E0.11220
+G1 X90.000 Y98.000 E0.11220
+G1 X90.000 Y95.000 E0.11220
+G1 X90.450 Y95.450 F1800
+G1 X92.550 Y95.450 E0.07854 F1800
+G1 X92.550 Y97.550 E0.07854
+G1 X90.450 Y97.550 E0.07854
+G1 X90.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X85.000 Y95.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X88.000 Y95.000 E0.11220 F1800
+G1 X88.000 Y98.000 E0.11220
+G1 X85.000 Y98.000 E0.11220
+G1 X85.000 Y95.000 E0.11220
+G1 X85.450 Y95.450 F1800
+G1 X87.550 Y95.450 E0.07854 F1800
+G1 X87.550 Y97.550 E0.07854
+G1 X85.450 Y97.550 E0.07854
+G1 X85.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X80.000 Y95.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X83.000 Y95.000 E0.11220 F1800
+G1 X83.000 Y98.000 E0.11220
+G1 X80.000 Y98.000 E0.11220
+G1 X80.000 Y95.000 E0.11220
+G1 X80.450 Y95.450 F1800
+G1 X82.550 Y95.450 E0.07854 F1800
+G1 X82.550 Y97.550 E0.07854
+G1 X80.450 Y97.550 E0.07854
+G1 X80.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X80.000 Y100.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X83.000 Y100.000 E0.11220 F1800
+G1 X83.000 Y103.000 E0.11220
+G1 X80.000 Y103.000 E0.11220
+G1 X80.000 Y100.000 E0.11220
+G1 X80.450 Y100.450 F1800
+G1 X82.550 Y100.450 E0.07854 F1800
+G1 X82.550 Y102.550 E0.07854
+G1 X80.450 Y102.550 E0.07854
+G1 X80.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X85.000 Y100.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X88.000 Y100.000 E0.11220 F1800
+G1 X88.000 Y103.000 E0.11220
+G1 X85.000 Y103.000 E0.11220
+G1 X85.000 Y100.000 E0.11220
+G1 X85.450 Y100.450 F1800
+G1 X87.550 Y100.450 E0.07854 F1800
+G1 X87.550 Y102.550 E0.07854
+G1 X85.450 Y102.550 E0.07854
+G1 X85.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X90.000 Y100.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X93.000 Y100.000 E0.11220 F1800
+G1 X93.000 Y103.000 E0.11220
+G1 X90.000 Y103.000 E0.11220
+G1 X90.000 Y100.000 E0.11220
+G1 X90.450 Y100.450 F1800
+G1 X92.550 Y100.450 E0.07854 F1800
+G1 X92.550 Y102.550 E0.07854
+G1 X90.450 Y102.550 E0.07854
+G1 X90.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X95.000 Y100.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X98.000 Y100.000 E0.11220 F1800
+G1 X98.000 Y103.000 E0.11220
+G1 X95.000 Y103.000 E0.11220
+G1 X95.000 Y100.000 E0.11220
+G1 X95.450 Y100.450 F1800
+G1 X97.550 Y100.450 E0.07854 F1800
+G1 X97.550 Y102.550 E0.07854
+G1 X95.450 Y102.550 E0.07854
+G1 X95.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X100.000 Y100.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X103.000 Y100.000 E0.11220 F1800
+G1 X103.000 Y103.000 E0.11220
+G1 X100.000 Y103.000 E0.11220
+G1 X100.000 Y100.000 E0.11220
+G1 X100.450 Y100.450 F1800
+G1 X102.550 Y100.450 E0.07854 F1800
+G1 X102.550 Y102.550 E0.07854
+G1 X100.450 Y102.550 E0.07854
+G1 X100.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X105.000 Y100.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X108.000 Y100.000 E0.11220 F1800
+G1 X108.000 Y103.000 E0.11220
+G1 X105.000 Y103.000 E0.11220
+G1 X105.000 Y100.000 E0.11220
+G1 X105.450 Y100.450 F1800
+G1 X107.550 Y100.450 E0.07854 F1800
+G1 X107.550 Y102.550 E0.07854
+G1 X105.450 Y102.550 E0.07854
+G1 X105.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X110.000 Y100.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X113.000 Y100.000 E0.11220 F1800
+G1 X113.000 Y103.000 E0.11220
+G1 X110.000 Y103.000 E0.11220
+G1 X110.000 Y100.000 E0.11220
+G1 X110.450 Y100.450 F1800
+G1 X112.550 Y100.450 E0.07854 F1800
+G1 X112.550 Y102.550 E0.07854
+G1 X110.450 Y102.550 E0.07854
+G1 X110.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X115.000 Y100.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X118.000 Y100.000 E0.11220 F1800
+G1 X118.000 Y103.000 E0.11220
+G1 X115.000 Y103.000 E0.11220
+G1 X115.000 Y100.000 E0.11220
+G1 X115.450 Y100.450 F1800
+G1 X117.550 Y100.450 E0.07854 F1800
+G1 X117.550 Y102.550 E0.07854
+G1 X115.450 Y102.550 E0.07854
+G1 X115.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X115.000 Y105.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X118.000 Y105.000 E0.11220 F1800
+G1 X118.000 Y108.000 E0.11220
+G1 X115.000 Y108.000 E0.11220
+G1 X115.000 Y105.000 E0.11220
+G1 X115.450 Y105.450 F1800
+G1 X117.550 Y105.450 E0.07854 F1800
+G1 X117.550 Y107.550 E0.07854
+G1 X115.450 Y107.550 E0.07854
+G1 X115.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X110.000 Y105.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X113.000 Y105.000 E0.11220 F1800
+G1 X113.000 Y108.000 E0.11220
+G1 X110.000 Y108.000 E0.11220
+G1 X110.000 Y105.000 E0.11220
+G1 X110.450 Y105.450 F1800
+G1 X112.550 Y105.450 E0.07854 F1800
+G1 X112.550 Y107.550 E0.07854
+G1 X110.450 Y107.550 E0.07854
+G1 X110.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X105.000 Y105.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X108.000 Y105.000 E0.11220 F1800
+G1 X108.000 Y108.000 E0.11220
+G1 X105.000 Y108.000 E0.11220
+G1 X105.000 Y105.000 E0.11220
+G1 X105.450 Y105.450 F1800
+G1 X107.550 Y105.450 E0.07854 F1800
+G1 X107.550 Y107.550 E0.07854
+G1 X105.450 Y107.550 E0.07854
+G1 X105.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X100.000 Y105.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X103.000 Y105.000 E0.11220 F1800
+G1 X103.000 Y108.000 E0.11220
+G1 X100.000 Y108.000 E0.11220
+G1 X100.000 Y105.000 E0.11220
+G1 X100.450 Y105.450 F1800
+G1 X102.550 Y105.450 E0.07854 F1800
+G1 X102.550 Y107.550 E0.07854
+G1 X100.450 Y107.550 E0.07854
+G1 X100.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X95.000 Y105.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X98.000 Y105.000 E0.11220 F1800
+G1 X98.000 Y108.000 E0.11220
+G1 X95.000 Y108.000 E0.11220
+G1 X95.000 Y105.000 E0.11220
+G1 X95.450 Y105.450 F1800
+G1 X97.550 Y105.450 E0.07854 F1800
+G1 X97.550 Y107.550 E0.07854
+G1 X95.450 Y107.550 E0.07854
+G1 X95.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X90.000 Y105.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X93.000 Y105.000 E0.11220 F1800
+G1 X93.000 Y108.000 E0.11220
+G1 X90.000 Y108.000 E0.11220
+G1 X90.000 Y105.000 E0.11220
+G1 X90.450 Y105.450 F1800
+G1 X92.550 Y105.450 E0.07854 F1800
+G1 X92.550 Y107.550 E0.07854
+G1 X90.450 Y107.550 E0.07854
+G1 X90.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X85.000 Y105.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X88.000 Y105.000 E0.11220 F1800
+G1 X88.000 Y108.000 E0.11220
+G1 X85.000 Y108.000 E0.11220
+G1 X85.000 Y105.000 E0.11220
+G1 X85.450 Y105.450 F1800
+G1 X87.550 Y105.450 E0.07854 F1800
+G1 X87.550 Y107.550 E0.07854
+G1 X85.450 Y107.550 E0.07854
+G1 X85.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X80.000 Y105.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X83.000 Y105.000 E0.11220 F1800
+G1 X83.000 Y108.000 E0.11220
+G1 X80.000 Y108.000 E0.11220
+G1 X80.000 Y105.000 E0.11220
+G1 X80.450 Y105.450 F1800
+G1 X82.550 Y105.450 E0.07854 F1800
+G1 X82.550 Y107.550 E0.07854
+G1 X80.450 Y107.550 E0.07854
+G1 X80.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X80.000 Y110.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X83.000 Y110.000 E0.11220 F1800
+G1 X83.000 Y113.000 E0.11220
+G1 X80.000 Y113.000 E0.11220
+G1 X80.000 Y110.000 E0.11220
+G1 X80.450 Y110.450 F1800
+G1 X82.550 Y110.450 E0.07854 F1800
+G1 X82.550 Y112.550 E0.07854
+G1 X80.450 Y112.550 E0.07854
+G1 X80.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X85.000 Y110.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X88.000 Y110.000 E0.11220 F1800
+G1 X88.000 Y113.000 E0.11220
+G1 X85.000 Y113.000 E0.11220
+G1 X85.000 Y110.000 E0.11220
+G1 X85.450 Y110.450 F1800
+G1 X87.550 Y110.450 E0.07854 F1800
+G1 X87.550 Y112.550 E0.07854
+G1 X85.450 Y112.550 E0.07854
+G1 X85.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X90.000 Y110.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X93.000 Y110.000 E0.11220 F1800
+G1 X93.000 Y113.000 E0.11220
+G1 X90.000 Y113.000 E0.11220
+G1 X90.000 Y110.000 E0.11220
+G1 X90.450 Y110.450 F1800
+G1 X92.550 Y110.450 E0.07854 F1800
+G1 X92.550 Y112.550 E0.07854
+G1 X90.450 Y112.550 E0.07854
+G1 X90.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X95.000 Y110.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X98.000 Y110.000 E0.11220 F1800
+G1 X98.000 Y113.000 E0.11220
+G1 X95.000 Y113.000 E0.11220
+G1 X95.000 Y110.000 E0.11220
+G1 X95.450 Y110.450 F1800
+G1 X97.550 Y110.450 E0.07854 F1800
+G1 X97.550 Y112.550 E0.07854
+G1 X95.450 Y112.550 E0.07854
+G1 X95.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X100.000 Y110.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X103.000 Y110.000 E0.11220 F1800
+G1 X103.000 Y113.000 E0.11220
+G1 X100.000 Y113.000 E0.11220
+G1 X100.000 Y110.000 E0.11220
+G1 X100.450 Y110.450 F1800
+G1 X102.550 Y110.450 E0.07854 F1800
+G1 X102.550 Y112.550 E0.07854
+G1 X100.450 Y112.550 E0.07854
+G1 X100.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X105.000 Y110.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X108.000 Y110.000 E0.11220 F1800
+G1 X108.000 Y113.000 E0.11220
+G1 X105.000 Y113.000 E0.11220
+G1 X105.000 Y110.000 E0.11220
+G1 X105.450 Y110.450 F1800
+G1 X107.550 Y110.450 E0.07854 F1800
+G1 X107.550 Y112.550 E0.07854
+G1 X105.450 Y112.550 E0.07854
+G1 X105.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X110.000 Y110.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X113.000 Y110.000 E0.11220 F1800
+G1 X113.000 Y113.000 E0.11220
+G1 X110.000 Y113.000 E0.11220
+G1 X110.000 Y110.000 E0.11220
+G1 X110.450 Y110.450 F1800
+G1 X112.550 Y110.450 E0.07854 F1800
+G1 X112.550 Y112.550 E0.07854
+G1 X110.450 Y112.550 E0.07854
+G1 X110.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X115.000 Y110.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X118.000 Y110.000 E0.11220 F1800
+G1 X118.000 Y113.000 E0.11220
+G1 X115.000 Y113.000 E0.11220
+G1 X115.000 Y110.000 E0.11220
+G1 X115.450 Y110.450 F1800
+G1 X117.550 Y110.450 E0.07854 F1800
+G1 X117.550 Y112.550 E0.07854
+G1 X115.450 Y112.550 E0.07854
+G1 X115.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X115.000 Y115.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X118.000 Y115.000 E0.11220 F1800
+G1 X118.000 Y118.000 E0.11220
+G1 X115.000 Y118.000 E0.11220
+G1 X115.000 Y115.000 E0.11220
+G1 X115.450 Y115.450 F1800
+G1 X117.550 Y115.450 E0.07854 F1800
+G1 X117.550 Y117.550 E0.07854
+G1 X115.450 Y117.550 E0.07854
+G1 X115.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X110.000 Y115.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X113.000 Y115.000 E0.11220 F1800
+G1 X113.000 Y118.000 E0.11220
+G1 X110.000 Y118.000 E0.11220
+G1 X110.000 Y115.000 E0.11220
+G1 X110.450 Y115.450 F1800
+G1 X112.550 Y115.450 E0.07854 F1800
+G1 X112.550 Y117.550 E0.07854
+G1 X110.450 Y117.550 E0.07854
+G1 X110.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X105.000 Y115.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X108.000 Y115.000 E0.11220 F1800
+G1 X108.000 Y118.000 E0.11220
+G1 X105.000 Y118.000 E0.11220
+G1 X105.000 Y115.000 E0.11220
+G1 X105.450 Y115.450 F1800
+G1 X107.550 Y115.450 E0.07854 F1800
+G1 X107.550 Y117.550 E0.07854
+G1 X105.450 Y117.550 E0.07854
+G1 X105.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X100.000 Y115.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X103.000 Y115.000 E0.11220 F1800
+G1 X103.000 Y118.000 E0.11220
+G1 X100.000 Y118.000 E0.11220
+G1 X100.000 Y115.000 E0.11220
+G1 X100.450 Y115.450 F1800
+G1 X102.550 Y115.450 E0.07854 F1800
+G1 X102.550 Y117.550 E0.07854
+G1 X100.450 Y117.550 E0.07854
+G1 X100.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X95.000 Y115.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X98.000 Y115.000 E0.11220 F1800
+G1 X98.000 Y118.000 E0.11220
+G1 X95.000 Y118.000 E0.11220
+G1 X95.000 Y115.000 E0.11220
+G1 X95.450 Y115.450 F1800
+G1 X97.550 Y115.450 E0.07854 F1800
+G1 X97.550 Y117.550 E0.07854
+G1 X95.450 Y117.550 E0.07854
+G1 X95.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X90.000 Y115.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X93.000 Y115.000 E0.11220 F1800
+G1 X93.000 Y118.000 E0.11220
+G1 X90.000 Y118.000 E0.11220
+G1 X90.000 Y115.000 E0.11220
+G1 X90.450 Y115.450 F1800
+G1 X92.550 Y115.450 E0.07854 F1800
+G1 X92.550 Y117.550 E0.07854
+G1 X90.450 Y117.550 E0.07854
+G1 X90.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X85.000 Y115.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X88.000 Y115.000 E0.11220 F1800
+G1 X88.000 Y118.000 E0.11220
+G1 X85.000 Y118.000 E0.11220
+G1 X85.000 Y115.000 E0.11220
+G1 X85.450 Y115.450 F1800
+G1 X87.550 Y115.450 E0.07854 F1800
+G1 X87.550 Y117.550 E0.07854
+G1 X85.450 Y117.550 E0.07854
+G1 X85.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.400 F1200
+G1 X80.000 Y115.000 F9000
+G1 Z1.600 F1200
+G1 E0.8 F2400
+G1 X83.000 Y115.000 E0.11220 F1800
+G1 X83.000 Y118.000 E0.11220
+G1 X80.000 Y118.000 E0.11220
+G1 X80.000 Y115.000 E0.11220
+G1 X80.450 Y115.450 F1800
+G1 X82.550 Y115.450 E0.07854 F1800
+G1 X82.550 Y117.550 E0.07854
+G1 X80.450 Y117.550 E0.07854
+G1 X80.450 Y115.450 E0.07854
+;LAYER:8
+G1 Z1.800 F1200
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X80.000 Y80.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X83.000 Y80.000 E0.11220 F1800
+G1 X83.000 Y83.000 E0.11220
+G1 X80.000 Y83.000 E0.11220
+G1 X80.000 Y80.000 E0.11220
+G1 X80.450 Y80.450 F1800
+G1 X82.550 Y80.450 E0.07854 F1800
+G1 X82.550 Y82.550 E0.07854
+G1 X80.450 Y82.550 E0.07854
+G1 X80.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X85.000 Y80.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X88.000 Y80.000 E0.11220 F1800
+G1 X88.000 Y83.000 E0.11220
+G1 X85.000 Y83.000 E0.11220
+G1 X85.000 Y80.000 E0.11220
+G1 X85.450 Y80.450 F1800
+G1 X87.550 Y80.450 E0.07854 F1800
+G1 X87.550 Y82.550 E0.07854
+G1 X85.450 Y82.550 E0.07854
+G1 X85.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X90.000 Y80.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X93.000 Y80.000 E0.11220 F1800
+G1 X93.000 Y83.000 E0.11220
+G1 X90.000 Y83.000 E0.11220
+G1 X90.000 Y80.000 E0.11220
+G1 X90.450 Y80.450 F1800
+G1 X92.550 Y80.450 E0.07854 F1800
+G1 X92.550 Y82.550 E0.07854
+G1 X90.450 Y82.550 E0.07854
+G1 X90.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X95.000 Y80.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X98.000 Y80.000 E0.11220 F1800
+G1 X98.000 Y83.000 E0.11220
+G1 X95.000 Y83.000 E0.11220
+G1 X95.000 Y80.000 E0.11220
+G1 X95.450 Y80.450 F1800
+G1 X97.550 Y80.450 E0.07854 F1800
+G1 X97.550 Y82.550 E0.07854
+G1 X95.450 Y82.550 E0.07854
+G1 X95.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X100.000 Y80.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X103.000 Y80.000 E0.11220 F1800
+G1 X103.000 Y83.000 E0.11220
+G1 X100.000 Y83.000 E0.11220
+G1 X100.000 Y80.000 E0.11220
+G1 X100.450 Y80.450 F1800
+G1 X102.550 Y80.450 E0.07854 F1800
+G1 X102.550 Y82.550 E0.07854
+G1 X100.450 Y82.550 E0.07854
+G1 X100.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X105.000 Y80.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X108.000 Y80.000 E0.11220 F1800
+G1 X108.000 Y83.000 E0.11220
+G1 X105.000 Y83.000 E0.11220
+G1 X105.000 Y80.000 E0.11220
+G1 X105.450 Y80.450 F1800
+G1 X107.550 Y80.450 E0.07854 F1800
+G1 X107.550 Y82.550 E0.07854
+G1 X105.450 Y82.550 E0.07854
+G1 X105.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X110.000 Y80.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X113.000 Y80.000 E0.11220 F1800
+G1 X113.000 Y83.000 E0.11220
+G1 X110.000 Y83.000 E0.11220
+G1 X110.000 Y80.000 E0.11220
+G1 X110.450 Y80.450 F1800
+G1 X112.550 Y80.450 E0.07854 F1800
+G1 X112.550 Y82.550 E0.07854
+G1 X110.450 Y82.550 E0.07854
+G1 X110.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X115.000 Y80.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X118.000 Y80.000 E0.11220 F1800
+G1 X118.000 Y83.000 E0.11220
+G1 X115.000 Y83.000 E0.11220
+G1 X115.000 Y80.000 E0.11220
+G1 X115.450 Y80.450 F1800
+G1 X117.550 Y80.450 E0.07854 F1800
+G1 X117.550 Y82.550 E0.07854
+G1 X115.450 Y82.550 E0.07854
+G1 X115.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X115.000 Y85.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X118.000 Y85.000 E0.11220 F1800
+G1 X118.000 Y88.000 E0.11220
+G1 X115.000 Y88.000 E0.11220
+G1 X115.000 Y85.000 E0.11220
+G1 X115.450 Y85.450 F1800
+G1 X117.550 Y85.450 E0.07854 F1800
+G1 X117.550 Y87.550 E0.07854
+G1 X115.450 Y87.550 E0.07854
+G1 X115.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X110.000 Y85.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X113.000 Y85.000 E0.11220 F1800
+G1 X113.000 Y88.000 E0.11220
+G1 X110.000 Y88.000 E0.11220
+G1 X110.000 Y85.000 E0.11220
+G1 X110.450 Y85.450 F1800
+G1 X112.550 Y85.450 E0.07854 F1800
+G1 X112.550 Y87.550 E0.07854
+G1 X110.450 Y87.550 E0.07854
+G1 X110.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X105.000 Y85.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X108.000 Y85.000 E0.11220 F1800
+G1 X108.000 Y88.000 E0.11220
+G1 X105.000 Y88.000 E0.11220
+G1 X105.000 Y85.000 E0.11220
+G1 X105.450 Y85.450 F1800
+G1 X107.550 Y85.450 E0.07854 F1800
+G1 X107.550 Y87.550 E0.07854
+G1 X105.450 Y87.550 E0.07854
+G1 X105.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X100.000 Y85.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X103.000 Y85.000 E0.11220 F1800
+G1 X103.000 Y88.000 E0.11220
+G1 X100.000 Y88.000 E0.11220
+G1 X100.000 Y85.000 E0.11220
+G1 X100.450 Y85.450 F1800
+G1 X102.550 Y85.450 E0.07854 F1800
+G1 X102.550 Y87.550 E0.07854
+G1 X100.450 Y87.550 E0.07854
+G1 X100.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X95.000 Y85.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X98.000 Y85.000 E0.11220 F1800
+G1 X98.000 Y88.000 E0.11220
+G1 X95.000 Y88.000 E0.11220
+G1 X95.000 Y85.000 E0.11220
+G1 X95.450 Y85.450 F1800
+G1 X97.550 Y85.450 E0.07854 F1800
+G1 X97.550 Y87.550 E0.07854
+G1 X95.450 Y87.550 E0.07854
+G1 X95.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X90.000 Y85.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X93.000 Y85.000 E0.11220 F1800
+G1 X93.000 Y88.000 E0.11220
+G1 X90.000 Y88.000 E0.11220
+G1 X90.000 Y85.000 E0.11220
+G1 X90.450 Y85.450 F1800
+G1 X92.550 Y85.450 E0.07854 F1800
+G1 X92.550 Y87.550 E0.07854
+G1 X90.450 Y87.550 E0.07854
+G1 X90.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X85.000 Y85.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X88.000 Y85.000 E0.11220 F1800
+G1 X88.000 Y88.000 E0.11220
+G1 X85.000 Y88.000 E0.11220
+G1 X85.000 Y85.000 E0.11220
+G1 X85.450 Y85.450 F1800
+G1 X87.550 Y85.450 E0.07854 F1800
+G1 X87.550 Y87.550 E0.07854
+G1 X85.450 Y87.550 E0.07854
+G1 X85.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X80.000 Y85.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X83.000 Y85.000 E0.11220 F1800
+G1 X83.000 Y88.000 E0.11220
+G1 X80.000 Y88.000 E0.11220
+G1 X80.000 Y85.000 E0.11220
+G1 X80.450 Y85.450 F1800
+G1 X82.550 Y85.450 E0.07854 F1800
+G1 X82.550 Y87.550 E0.07854
+G1 X80.450 Y87.550 E0.07854
+G1 X80.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X80.000 Y90.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X83.000 Y90.000 E0.11220 F1800
+G1 X83.000 Y93.000 E0.11220
+G1 X80.000 Y93.000 E0.11220
+G1 X80.000 Y90.000 E0.11220
+G1 X80.450 Y90.450 F1800
+G1 X82.550 Y90.450 E0.07854 F1800
+G1 X82.550 Y92.550 E0.07854
+G1 X80.450 Y92.550 E0.07854
+G1 X80.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X85.000 Y90.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X88.000 Y90.000 E0.11220 F1800
+G1 X88.000 Y93.000 E0.11220
+G1 X85.000 Y93.000 E0.11220
+G1 X85.000 Y90.000 E0.11220
+G1 X85.450 Y90.450 F1800
+G1 X87.550 Y90.450 E0.07854 F1800
+G1 X87.550 Y92.550 E0.07854
+G1 X85.450 Y92.550 E0.07854
+G1 X85.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X90.000 Y90.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X93.000 Y90.000 E0.11220 F1800
+G1 X93.000 Y93.000 E0.11220
+G1 X90.000 Y93.000 E0.11220
+G1 X90.000 Y90.000 E0.11220
+G1 X90.450 Y90.450 F1800
+G1 X92.550 Y90.450 E0.07854 F1800
+G1 X92.550 Y92.550 E0.07854
+G1 X90.450 Y92.550 E0.07854
+G1 X90.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X95.000 Y90.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X98.000 Y90.000 E0.11220 F1800
+G1 X98.000 Y93.000 E0.11220
+G1 X95.000 Y93.000 E0.11220
+G1 X95.000 Y90.000 E0.11220
+G1 X95.450 Y90.450 F1800
+G1 X97.550 Y90.450 E0.07854 F1800
+G1 X97.550 Y92.550 E0.07854
+G1 X95.450 Y92.550 E0.07854
+G1 X95.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X100.000 Y90.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X103.000 Y90.000 E0.11220 F1800
+G1 X103.000 Y93.000 E0.11220
+G1 X100.000 Y93.000 E0.11220
+G1 X100.000 Y90.000 E0.11220
+G1 X100.450 Y90.450 F1800
+G1 X102.550 Y90.450 E0.07854 F1800
+G1 X102.550 Y92.550 E0.07854
+G1 X100.450 Y92.550 E0.07854
+G1 X100.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X105.000 Y90.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X108.000 Y90.000 E0.11220 F1800
+G1 X108.000 Y93.000 E0.11220
+G1 X105.000 Y93.000 E0.11220
+G1 X105.000 Y90.000 E0.11220
+G1 X105.450 Y90.450 F1800
+G1 X107.550 Y90.450 E0.07854 F1800
+G1 X107.550 Y92.550 E0.07854
+G1 X105.450 Y92.550 E0.07854
+G1 X105.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X110.000 Y90.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X113.000 Y90.000 E0.11220 F1800
+G1 X113.000 Y93.000 E0.11220
+G1 X110.000 Y93.000 E0.11220
+G1 X110.000 Y90.000 E0.11220
+G1 X110.450 Y90.450 F1800
+G1 X112.550 Y90.450 E0.07854 F1800
+G1 X112.550 Y92.550 E0.07854
+G1 X110.450 Y92.550 E0.07854
+G1 X110.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X115.000 Y90.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X118.000 Y90.000 E0.11220 F1800
+G1 X118.000 Y93.000 E0.11220
+G1 X115.000 Y93.000 E0.11220
+G1 X115.000 Y90.000 E0.11220
+G1 X115.450 Y90.450 F1800
+G1 X117.550 Y90.450 E0.07854 F1800
+G1 X117.550 Y92.550 E0.07854
+G1 X115.450 Y92.550 E0.07854
+G1 X115.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X115.000 Y95.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X118.000 Y95.000 E0.11220 F1800
+G1 X118.000 Y98.000 E0.11220
+G1 X115.000 Y98.000 E0.11220
+G1 X115.000 Y95.000 E0.11220
+G1 X115.450 Y95.450 F1800
+G1 X117.550 Y95.450 E0.07854 F1800
+G1 X117.550 Y97.550 E0.07854
+G1 X115.450 Y97.550 E0.07854
+G1 X115.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X110.000 Y95.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X113.000 Y95.000 E0.11220 F1800
+G1 X113.000 Y98.000 E0.11220
+G1 X110.000 Y98.000 E0.11220
+G1 X110.000 Y95.000 E0.11220
+G1 X110.450 Y95.450 F1800
+G1 X112.550 Y95.450 E0.07854 F1800
+G1 X112.550 Y97.550 E0.07854
+G1 X110.450 Y97.550 E0.07854
+G1 X110.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X105.000 Y95.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X108.000 Y95.000 E0.11220 F1800
+G1 X108.000 Y98.000 E0.11220
+G1 X105.000 Y98.000 E0.11220
+G1 X105.000 Y95.000 E0.11220
+G1 X105.450 Y95.450 F1800
+G1 X107.550 Y95.450 E0.07854 F1800
+G1 X107.550 Y97.550 E0.07854
+G1 X105.450 Y97.550 E0.07854
+G1 X105.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X100.000 Y95.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X103.000 Y95.000 E0.11220 F1800
+G1 X103.000 Y98.000 E0.11220
+G1 X100.000 Y98.000 E0.11220
+G1 X100.000 Y95.000 E0.11220
+G1 X100.450 Y95.450 F1800
+G1 X102.550 Y95.450 E0.07854 F1800
+G1 X102.550 Y97.550 E0.07854
+G1 X100.450 Y97.550 E0.07854
+G1 X100.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X95.000 Y95.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X98.000 Y95.000 E0.11220 F1800
+G1 X98.000 Y98.000 E0.11220
+G1 X95.000 Y98.000 E0.11220
+G1 X95.000 Y95.000 E0.11220
+G1 X95.450 Y95.450 F1800
+G1 X97.550 Y95.450 E0.07854 F1800
+G1 X97.550 Y97.550 E0.07854
+G1 X95.450 Y97.550 E0.07854
+G1 X95.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X90.000 Y95.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X93.000 Y95.000 E0.11220 F1800
+G1 X93.000 Y98.000 E0.11220
+G1 X90.000 Y98.000 E0.11220
+G1 X90.000 Y95.000 E0.11220
+G1 X90.450 Y95.450 F1800
+G1 X92.550 Y95.450 E0.07854 F1800
+G1 X92.550 Y97.550 E0.07854
+G1 X90.450 Y97.550 E0.07854
+G1 X90.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X85.000 Y95.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X88.000 Y95.000 E0.11220 F1800
+G1 X88.000 Y98.000 E0.11220
+G1 X85.000 Y98.000 E0.11220
+G1 X85.000 Y95.000 E0.11220
+G1 X85.450 Y95.450 F1800
+G1 X87.550 Y95.450 E0.07854 F1800
+G1 X87.550 Y97.550 E0.07854
+G1 X85.450 Y97.550 E0.07854
+G1 X85.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X80.000 Y95.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X83.000 Y95.000 E0.11220 F1800
+G1 X83.000 Y98.000 E0.11220
+G1 X80.000 Y98.000 E0.11220
+G1 X80.000 Y95.000 E0.11220
+G1 X80.450 Y95.450 F1800
+G1 X82.550 Y95.450 E0.07854 F1800
+G1 X82.550 Y97.550 E0.07854
+G1 X80.450 Y97.550 E0.07854
+G1 X80.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X80.000 Y100.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X83.000 Y100.000 E0.11220 F1800
+G1 X83.000 Y103.000 E0.11220
+G1 X80.000 Y103.000 E0.11220
+G1 X80.000 Y100.000 E0.11220
+G1 X80.450 Y100.450 F1800
+G1 X82.550 Y100.450 E0.07854 F1800
+G1 X82.550 Y102.550 E0.07854
+G1 X80.450 Y102.550 E0.07854
+G1 X80.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X85.000 Y100.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X88.000 Y100.000 E0.11220 F1800
+G1 X88.000 Y103.000 E0.11220
+G1 X85.000 Y103.000 E0.11220
+G1 X85.000 Y100.000 E0.11220
+G1 X85.450 Y100.450 F1800
+G1 X87.550 Y100.450 E0.07854 F1800
+G1 X87.550 Y102.550 E0.07854
+G1 X85.450 Y102.550 E0.07854
+G1 X85.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X90.000 Y100.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X93.000 Y100.000 E0.11220 F1800
+G1 X93.000 Y103.000 E0.11220
+G1 X90.000 Y103.000 E0.11220
+G1 X90.000 Y100.000 E0.11220
+G1 X90.450 Y100.450 F1800
+G1 X92.550 Y100.450 E0.07854 F1800
+G1 X92.550 Y102.550 E0.07854
+G1 X90.450 Y102.550 E0.07854
+G1 X90.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X95.000 Y100.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X98.000 Y100.000 E0.11220 F1800
+G1 X98.000 Y103.000 E0.11220
+G1 X95.000 Y103.000 E0.11220
+G1 X95.000 Y100.000 E0.11220
+G1 X95.450 Y100.450 F1800
+G1 X97.550 Y100.450 E0.07854 F1800
+G1 X97.550 Y102.550 E0.07854
+G1 X95.450 Y102.550 E0.07854
+G1 X95.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X100.000 Y100.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X103.000 Y100.000 E0.11220 F1800
+G1 X103.000 Y103.000 E0.11220
+G1 X100.000 Y103.000 E0.11220
+G1 X100.000 Y100.000 E0.11220
+G1 X100.450 Y100.450 F1800
+G1 X102.550 Y100.450 E0.07854 F1800
+G1 X102.550 Y102.550 E0.07854
+G1 X100.450 Y102.550 E0.07854
+G1 X100.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X105.000 Y100.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X108.000 Y100.000 E0.11220 F1800
+G1 X108.000 Y103.000 E0.11220
+G1 X105.000 Y103.000 E0.11220
+G1 X105.000 Y100.000 E0.11220
+G1 X105.450 Y100.450 F1800
+G1 X107.550 Y100.450 E0.07854 F1800
+G1 X107.550 Y102.550 E0.07854
+G1 X105.450 Y102.550 E0.07854
+G1 X105.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X110.000 Y100.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X113.000 Y100.000 E0.11220 F1800
+G1 X113.000 Y103.000 E0.11220
+G1 X110.000 Y103.000 E0.11220
+G1 X110.000 Y100.000 E0.11220
+G1 X110.450 Y100.450 F1800
+G1 X112.550 Y100.450 E0.07854 F1800
+G1 X112.550 Y102.550 E0.07854
+G1 X110.450 Y102.550 E0.07854
+G1 X110.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X115.000 Y100.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X118.000 Y100.000 E0.11220 F1800
+G1 X118.000 Y103.000 E0.11220
+G1 X115.000 Y103.000 E0.11220
+G1 X115.000 Y100.000 E0.11220
+G1 X115.450 Y100.450 F1800
+G1 X117.550 Y100.450 E0.07854 F1800
+G1 X117.550 Y102.550 E0.07854
+G1 X115.450 Y102.550 E0.07854
+G1 X115.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X115.000 Y105.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X118.000 Y105.000 E0.11220 F1800
+G1 X118.000 Y108.000 E0.11220
+G1 X115.000 Y108.000 E0.11220
+G1 X115.000 Y105.000 E0.11220
+G1 X115.450 Y105.450 F1800
+G1 X117.550 Y105.450 E0.07854 F1800
+G1 X117.550 Y107.550 E0.07854
+G1 X115.450 Y107.550 E0.07854
+G1 X115.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X110.000 Y105.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X113.000 Y105.000 E0.11220 F1800
+G1 X113.000 Y108.000 E0.11220
+G1 X110.000 Y108.000 E0.11220
+G1 X110.000 Y105.000 E0.11220
+G1 X110.450 Y105.450 F1800
+G1 X112.550 Y105.450 E0.07854 F1800
+G1 X112.550 Y107.550 E0.07854
+G1 X110.450 Y107.550 E0.07854
+G1 X110.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X105.000 Y105.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X108.000 Y105.000 E0.11220 F1800
+G1 X108.000 Y108.000 E0.11220
+G1 X105.000 Y108.000 E0.11220
+G1 X105.000 Y105.000 E0.11220
+G1 X105.450 Y105.450 F1800
+G1 X107.550 Y105.450 E0.07854 F1800
+G1 X107.550 Y107.550 E0.07854
+G1 X105.450 Y107.550 E0.07854
+G1 X105.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X100.000 Y105.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X103.000 Y105.000 E0.11220 F1800
+G1 X103.000 Y108.000 E0.11220
+G1 X100.000 Y108.000 E0.11220
+G1 X100.000 Y105.000 E0.11220
+G1 X100.450 Y105.450 F1800
+G1 X102.550 Y105.450 E0.07854 F1800
+G1 X102.550 Y107.550 E0.07854
+G1 X100.450 Y107.550 E0.07854
+G1 X100.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X95.000 Y105.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X98.000 Y105.000 E0.11220 F1800
+G1 X98.000 Y108.000 E0.11220
+G1 X95.000 Y108.000 E0.11220
+G1 X95.000 Y105.000 E0.11220
+G1 X95.450 Y105.450 F1800
+G1 X97.550 Y105.450 E0.07854 F1800
+G1 X97.550 Y107.550 E0.07854
+G1 X95.450 Y107.550 E0.07854
+G1 X95.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X90.000 Y105.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X93.000 Y105.000 E0.11220 F1800
+G1 X93.000 Y108.000 E0.11220
+G1 X90.000 Y108.000 E0.11220
+G1 X90.000 Y105.000 E0.11220
+G1 X90.450 Y105.450 F1800
+G1 X92.550 Y105.450 E0.07854 F1800
+G1 X92.550 Y107.550 E0.07854
+G1 X90.450 Y107.550 E0.07854
+G1 X90.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X85.000 Y105.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X88.000 Y105.000 E0.11220 F1800
+G1 X88.000 Y108.000 E0.11220
+G1 X85.000 Y108.000 E0.11220
+G1 X85.000 Y105.000 E0.11220
+G1 X85.450 Y105.450 F1800
+G1 X87.550 Y105.450 E0.07854 F1800
+G1 X87.550 Y107.550 E0.07854
+G1 X85.450 Y107.550 E0.07854
+G1 X85.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X80.000 Y105.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X83.000 Y105.000 E0.11220 F1800
+G1 X83.000 Y108.000 E0.11220
+G1 X80.000 Y108.000 E0.11220
+G1 X80.000 Y105.000 E0.11220
+G1 X80.450 Y105.450 F1800
+G1 X82.550 Y105.450 E0.07854 F1800
+G1 X82.550 Y107.550 E0.07854
+G1 X80.450 Y107.550 E0.07854
+G1 X80.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X80.000 Y110.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X83.000 Y110.000 E0.11220 F1800
+G1 X83.000 Y113.000 E0.11220
+G1 X80.000 Y113.000 E0.11220
+G1 X80.000 Y110.000 E0.11220
+G1 X80.450 Y110.450 F1800
+G1 X82.550 Y110.450 E0.07854 F1800
+G1 X82.550 Y112.550 E0.07854
+G1 X80.450 Y112.550 E0.07854
+G1 X80.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X85.000 Y110.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X88.000 Y110.000 E0.11220 F1800
+G1 X88.000 Y113.000 E0.11220
+G1 X85.000 Y113.000 E0.11220
+G1 X85.000 Y110.000 E0.11220
+G1 X85.450 Y110.450 F1800
+G1 X87.550 Y110.450 E0.07854 F1800
+G1 X87.550 Y112.550 E0.07854
+G1 X85.450 Y112.550 E0.07854
+G1 X85.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X90.000 Y110.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X93.000 Y110.000 E0.11220 F1800
+G1 X93.000 Y113.000 E0.11220
+G1 X90.000 Y113.000 E0.11220
+G1 X90.000 Y110.000 E0.11220
+G1 X90.450 Y110.450 F1800
+G1 X92.550 Y110.450 E0.07854 F1800
+G1 X92.550 Y112.550 E0.07854
+G1 X90.450 Y112.550 E0.07854
+G1 X90.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X95.000 Y110.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X98.000 Y110.000 E0.11220 F1800
+G1 X98.000 Y113.000 E0.11220
+G1 X95.000 Y113.000 E0.11220
+G1 X95.000 Y110.000 E0.11220
+G1 X95.450 Y110.450 F1800
+G1 X97.550 Y110.450 E0.07854 F1800
+G1 X97.550 Y112.550 E0.07854
+G1 X95.450 Y112.550 E0.07854
+G1 X95.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X100.000 Y110.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X103.000 Y110.000 E0.11220 F1800
+G1 X103.000 Y113.000 E0.11220
+G1 X100.000 Y113.000 E0.11220
+G1 X100.000 Y110.000 E0.11220
+G1 X100.450 Y110.450 F1800
+G1 X102.550 Y110.450 E0.07854 F1800
+G1 X102.550 Y112.550 E0.07854
+G1 X100.450 Y112.550 E0.07854
+G1 X100.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X105.000 Y110.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X108.000 Y110.000 E0.11220 F1800
+G1 X108.000 Y113.000 E0.11220
+G1 X105.000 Y113.000 E0.11220
+G1 X105.000 Y110.000 E0.11220
+G1 X105.450 Y110.450 F1800
+G1 X107.550 Y110.450 E0.07854 F1800
+G1 X107.550 Y112.550 E0.07854
+G1 X105.450 Y112.550 E0.07854
+G1 X105.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X110.000 Y110.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X113.000 Y110.000 E0.11220 F1800
+G1 X113.000 Y113.000 E0.11220
+G1 X110.000 Y113.000 E0.11220
+G1 X110.000 Y110.000 E0.11220
+G1 X110.450 Y110.450 F1800
+G1 X112.550 Y110.450 E0.07854 F1800
+G1 X112.550 Y112.550 E0.07854
+G1 X110.450 Y112.550 E0.07854
+G1 X110.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X115.000 Y110.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X118.000 Y110.000 E0.11220 F1800
+G1 X118.000 Y113.000 E0.11220
+G1 X115.000 Y113.000 E0.11220
+G1 X115.000 Y110.000 E0.11220
+G1 X115.450 Y110.450 F1800
+G1 X117.550 Y110.450 E0.07854 F1800
+G1 X117.550 Y112.550 E0.07854
+G1 X115.450 Y112.550 E0.07854
+G1 X115.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X115.000 Y115.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X118.000 Y115.000 E0.11220 F1800
+G1 X118.000 Y118.000 E0.11220
+G1 X115.000 Y118.000 E0.11220
+G1 X115.000 Y115.000 E0.11220
+G1 X115.450 Y115.450 F1800
+G1 X117.550 Y115.450 E0.07854 F1800
+G1 X117.550 Y117.550 E0.07854
+G1 X115.450 Y117.550 E0.07854
+G1 X115.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X110.000 Y115.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X113.000 Y115.000 E0.11220 F1800
+G1 X113.000 Y118.000 E0.11220
+G1 X110.000 Y118.000 E0.11220
+G1 X110.000 Y115.000 E0.11220
+G1 X110.450 Y115.450 F1800
+G1 X112.550 Y115.450 E0.07854 F1800
+G1 X112.550 Y117.550 E0.07854
+G1 X110.450 Y117.550 E0.07854
+G1 X110.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X105.000 Y115.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X108.000 Y115.000 E0.11220 F1800
+G1 X108.000 Y118.000 E0.11220
+G1 X105.000 Y118.000 E0.11220
+G1 X105.000 Y115.000 E0.11220
+G1 X105.450 Y115.450 F1800
+G1 X107.550 Y115.450 E0.07854 F1800
+G1 X107.550 Y117.550 E0.07854
+G1 X105.450 Y117.550 E0.07854
+G1 X105.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X100.000 Y115.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X103.000 Y115.000 E0.11220 F1800
+G1 X103.000 Y118.000 E0.11220
+G1 X100.000 Y118.000 E0.11220
+G1 X100.000 Y115.000 E0.11220
+G1 X100.450 Y115.450 F1800
+G1 X102.550 Y115.450 E0.07854 F1800
+G1 X102.550 Y117.550 E0.07854
+G1 X100.450 Y117.550 E0.07854
+G1 X100.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X95.000 Y115.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X98.000 Y115.000 E0.11220 F1800
+G1 X98.000 Y118.000 E0.11220
+G1 X95.000 Y118.000 E0.11220
+G1 X95.000 Y115.000 E0.11220
+G1 X95.450 Y115.450 F1800
+G1 X97.550 Y115.450 E0.07854 F1800
+G1 X97.550 Y117.550 E0.07854
+G1 X95.450 Y117.550 E0.07854
+G1 X95.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X90.000 Y115.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X93.000 Y115.000 E0.11220 F1800
+G1 X93.000 Y118.000 E0.11220
+G1 X90.000 Y118.000 E0.11220
+G1 X90.000 Y115.000 E0.11220
+G1 X90.450 Y115.450 F1800
+G1 X92.550 Y115.450 E0.07854 F1800
+G1 X92.550 Y117.550 E0.07854
+G1 X90.450 Y117.550 E0.07854
+G1 X90.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X85.000 Y115.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X88.000 Y115.000 E0.11220 F1800
+G1 X88.000 Y118.000 E0.11220
+G1 X85.000 Y118.000 E0.11220
+G1 X85.000 Y115.000 E0.11220
+G1 X85.450 Y115.450 F1800
+G1 X87.550 Y115.450 E0.07854 F1800
+G1 X87.550 Y117.550 E0.07854
+G1 X85.450 Y117.550 E0.07854
+G1 X85.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.600 F1200
+G1 X80.000 Y115.000 F9000
+G1 Z1.800 F1200
+G1 E0.8 F2400
+G1 X83.000 Y115.000 E0.11220 F1800
+G1 X83.000 Y118.000 E0.11220
+G1 X80.000 Y118.000 E0.11220
+G1 X80.000 Y115.000 E0.11220
+G1 X80.450 Y115.450 F1800
+G1 X82.550 Y115.450 E0.07854 F1800
+G1 X82.550 Y117.550 E0.07854
+G1 X80.450 Y117.550 E0.07854
+G1 X80.450 Y115.450 E0.07854
+;LAYER:9
+G1 Z2.000 F1200
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X80.000 Y80.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X83.000 Y80.000 E0.11220 F1800
+G1 X83.000 Y83.000 E0.11220
+G1 X80.000 Y83.000 E0.11220
+G1 X80.000 Y80.000 E0.11220
+G1 X80.450 Y80.450 F1800
+G1 X82.550 Y80.450 E0.07854 F1800
+G1 X82.550 Y82.550 E0.07854
+G1 X80.450 Y82.550 E0.07854
+G1 X80.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X85.000 Y80.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X88.000 Y80.000 E0.11220 F1800
+G1 X88.000 Y83.000 E0.11220
+G1 X85.000 Y83.000 E0.11220
+G1 X85.000 Y80.000 E0.11220
+G1 X85.450 Y80.450 F1800
+G1 X87.550 Y80.450 E0.07854 F1800
+G1 X87.550 Y82.550 E0.07854
+G1 X85.450 Y82.550 E0.07854
+G1 X85.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X90.000 Y80.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X93.000 Y80.000 E0.11220 F1800
+G1 X93.000 Y83.000 E0.11220
+G1 X90.000 Y83.000 E0.11220
+G1 X90.000 Y80.000 E0.11220
+G1 X90.450 Y80.450 F1800
+G1 X92.550 Y80.450 E0.07854 F1800
+G1 X92.550 Y82.550 E0.07854
+G1 X90.450 Y82.550 E0.07854
+G1 X90.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X95.000 Y80.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X98.000 Y80.000 E0.11220 F1800
+G1 X98.000 Y83.000 E0.11220
+G1 X95.000 Y83.000 E0.11220
+G1 X95.000 Y80.000 E0.11220
+G1 X95.450 Y80.450 F1800
+G1 X97.550 Y80.450 E0.07854 F1800
+G1 X97.550 Y82.550 E0.07854
+G1 X95.450 Y82.550 E0.07854
+G1 X95.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X100.000 Y80.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X103.000 Y80.000 E0.11220 F1800
+G1 X103.000 Y83.000 E0.11220
+G1 X100.000 Y83.000 E0.11220
+G1 X100.000 Y80.000 E0.11220
+G1 X100.450 Y80.450 F1800
+G1 X102.550 Y80.450 E0.07854 F1800
+G1 X102.550 Y82.550 E0.07854
+G1 X100.450 Y82.550 E0.07854
+G1 X100.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X105.000 Y80.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X108.000 Y80.000 E0.11220 F1800
+G1 X108.000 Y83.000 E0.11220
+G1 X105.000 Y83.000 E0.11220
+G1 X105.000 Y80.000 E0.11220
+G1 X105.450 Y80.450 F1800
+G1 X107.550 Y80.450 E0.07854 F1800
+G1 X107.550 Y82.550 E0.07854
+G1 X105.450 Y82.550 E0.07854
+G1 X105.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X110.000 Y80.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X113.000 Y80.000 E0.11220 F1800
+G1 X113.000 Y83.000 E0.11220
+G1 X110.000 Y83.000 E0.11220
+G1 X110.000 Y80.000 E0.11220
+G1 X110.450 Y80.450 F1800
+G1 X112.550 Y80.450 E0.07854 F1800
+G1 X112.550 Y82.550 E0.07854
+G1 X110.450 Y82.550 E0.07854
+G1 X110.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X115.000 Y80.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X118.000 Y80.000 E0.11220 F1800
+G1 X118.000 Y83.000 E0.11220
+G1 X115.000 Y83.000 E0.11220
+G1 X115.000 Y80.000 E0.11220
+G1 X115.450 Y80.450 F1800
+G1 X117.550 Y80.450 E0.07854 F1800
+G1 X117.550 Y82.550 E0.07854
+G1 X115.450 Y82.550 E0.07854
+G1 X115.450 Y80.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X115.000 Y85.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X118.000 Y85.000 E0.11220 F1800
+G1 X118.000 Y88.000 E0.11220
+G1 X115.000 Y88.000 E0.11220
+G1 X115.000 Y85.000 E0.11220
+G1 X115.450 Y85.450 F1800
+G1 X117.550 Y85.450 E0.07854 F1800
+G1 X117.550 Y87.550 E0.07854
+G1 X115.450 Y87.550 E0.07854
+G1 X115.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X110.000 Y85.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X113.000 Y85.000 E0.11220 F1800
+G1 X113.000 Y88.000 E0.11220
+G1 X110.000 Y88.000 E0.11220
+G1 X110.000 Y85.000 E0.11220
+G1 X110.450 Y85.450 F1800
+G1 X112.550 Y85.450 E0.07854 F1800
+G1 X112.550 Y87.550 E0.07854
+G1 X110.450 Y87.550 E0.07854
+G1 X110.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X105.000 Y85.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X108.000 Y85.000 E0.11220 F1800
+G1 X108.000 Y88.000 E0.11220
+G1 X105.000 Y88.000 E0.11220
+G1 X105.000 Y85.000 E0.11220
+G1 X105.450 Y85.450 F1800
+G1 X107.550 Y85.450 E0.07854 F1800
+G1 X107.550 Y87.550 E0.07854
+G1 X105.450 Y87.550 E0.07854
+G1 X105.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X100.000 Y85.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X103.000 Y85.000 E0.11220 F1800
+G1 X103.000 Y88.000 E0.11220
+G1 X100.000 Y88.000 E0.11220
+G1 X100.000 Y85.000 E0.11220
+G1 X100.450 Y85.450 F1800
+G1 X102.550 Y85.450 E0.07854 F1800
+G1 X102.550 Y87.550 E0.07854
+G1 X100.450 Y87.550 E0.07854
+G1 X100.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X95.000 Y85.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X98.000 Y85.000 E0.11220 F1800
+G1 X98.000 Y88.000 E0.11220
+G1 X95.000 Y88.000 E0.11220
+G1 X95.000 Y85.000 E0.11220
+G1 X95.450 Y85.450 F1800
+G1 X97.550 Y85.450 E0.07854 F1800
+G1 X97.550 Y87.550 E0.07854
+G1 X95.450 Y87.550 E0.07854
+G1 X95.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X90.000 Y85.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X93.000 Y85.000 E0.11220 F1800
+G1 X93.000 Y88.000 E0.11220
+G1 X90.000 Y88.000 E0.11220
+G1 X90.000 Y85.000 E0.11220
+G1 X90.450 Y85.450 F1800
+G1 X92.550 Y85.450 E0.07854 F1800
+G1 X92.550 Y87.550 E0.07854
+G1 X90.450 Y87.550 E0.07854
+G1 X90.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X85.000 Y85.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X88.000 Y85.000 E0.11220 F1800
+G1 X88.000 Y88.000 E0.11220
+G1 X85.000 Y88.000 E0.11220
+G1 X85.000 Y85.000 E0.11220
+G1 X85.450 Y85.450 F1800
+G1 X87.550 Y85.450 E0.07854 F1800
+G1 X87.550 Y87.550 E0.07854
+G1 X85.450 Y87.550 E0.07854
+G1 X85.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X80.000 Y85.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X83.000 Y85.000 E0.11220 F1800
+G1 X83.000 Y88.000 E0.11220
+G1 X80.000 Y88.000 E0.11220
+G1 X80.000 Y85.000 E0.11220
+G1 X80.450 Y85.450 F1800
+G1 X82.550 Y85.450 E0.07854 F1800
+G1 X82.550 Y87.550 E0.07854
+G1 X80.450 Y87.550 E0.07854
+G1 X80.450 Y85.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X80.000 Y90.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X83.000 Y90.000 E0.11220 F1800
+G1 X83.000 Y93.000 E0.11220
+G1 X80.000 Y93.000 E0.11220
+G1 X80.000 Y90.000 E0.11220
+G1 X80.450 Y90.450 F1800
+G1 X82.550 Y90.450 E0.07854 F1800
+G1 X82.550 Y92.550 E0.07854
+G1 X80.450 Y92.550 E0.07854
+G1 X80.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X85.000 Y90.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X88.000 Y90.000 E0.11220 F1800
+G1 X88.000 Y93.000 E0.11220
+G1 X85.000 Y93.000 E0.11220
+G1 X85.000 Y90.000 E0.11220
+G1 X85.450 Y90.450 F1800
+G1 X87.550 Y90.450 E0.07854 F1800
+G1 X87.550 Y92.550 E0.07854
+G1 X85.450 Y92.550 E0.07854
+G1 X85.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X90.000 Y90.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X93.000 Y90.000 E0.11220 F1800
+G1 X93.000 Y93.000 E0.11220
+G1 X90.000 Y93.000 E0.11220
+G1 X90.000 Y90.000 E0.11220
+G1 X90.450 Y90.450 F1800
+G1 X92.550 Y90.450 E0.07854 F1800
+G1 X92.550 Y92.550 E0.07854
+G1 X90.450 Y92.550 E0.07854
+G1 X90.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X95.000 Y90.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X98.000 Y90.000 E0.11220 F1800
+G1 X98.000 Y93.000 E0.11220
+G1 X95.000 Y93.000 E0.11220
+G1 X95.000 Y90.000 E0.11220
+G1 X95.450 Y90.450 F1800
+G1 X97.550 Y90.450 E0.07854 F1800
+G1 X97.550 Y92.550 E0.07854
+G1 X95.450 Y92.550 E0.07854
+G1 X95.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X100.000 Y90.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X103.000 Y90.000 E0.11220 F1800
+G1 X103.000 Y93.000 E0.11220
+G1 X100.000 Y93.000 E0.11220
+G1 X100.000 Y90.000 E0.11220
+G1 X100.450 Y90.450 F1800
+G1 X102.550 Y90.450 E0.07854 F1800
+G1 X102.550 Y92.550 E0.07854
+G1 X100.450 Y92.550 E0.07854
+G1 X100.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X105.000 Y90.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X108.000 Y90.000 E0.11220 F1800
+G1 X108.000 Y93.000 E0.11220
+G1 X105.000 Y93.000 E0.11220
+G1 X105.000 Y90.000 E0.11220
+G1 X105.450 Y90.450 F1800
+G1 X107.550 Y90.450 E0.07854 F1800
+G1 X107.550 Y92.550 E0.07854
+G1 X105.450 Y92.550 E0.07854
+G1 X105.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X110.000 Y90.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X113.000 Y90.000 E0.11220 F1800
+G1 X113.000 Y93.000 E0.11220
+G1 X110.000 Y93.000 E0.11220
+G1 X110.000 Y90.000 E0.11220
+G1 X110.450 Y90.450 F1800
+G1 X112.550 Y90.450 E0.07854 F1800
+G1 X112.550 Y92.550 E0.07854
+G1 X110.450 Y92.550 E0.07854
+G1 X110.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X115.000 Y90.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X118.000 Y90.000 E0.11220 F1800
+G1 X118.000 Y93.000 E0.11220
+G1 X115.000 Y93.000 E0.11220
+G1 X115.000 Y90.000 E0.11220
+G1 X115.450 Y90.450 F1800
+G1 X117.550 Y90.450 E0.07854 F1800
+G1 X117.550 Y92.550 E0.07854
+G1 X115.450 Y92.550 E0.07854
+G1 X115.450 Y90.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X115.000 Y95.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X118.000 Y95.000 E0.11220 F1800
+G1 X118.000 Y98.000 E0.11220
+G1 X115.000 Y98.000 E0.11220
+G1 X115.000 Y95.000 E0.11220
+G1 X115.450 Y95.450 F1800
+G1 X117.550 Y95.450 E0.07854 F1800
+G1 X117.550 Y97.550 E0.07854
+G1 X115.450 Y97.550 E0.07854
+G1 X115.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X110.000 Y95.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X113.000 Y95.000 E0.11220 F1800
+G1 X113.000 Y98.000 E0.11220
+G1 X110.000 Y98.000 E0.11220
+G1 X110.000 Y95.000 E0.11220
+G1 X110.450 Y95.450 F1800
+G1 X112.550 Y95.450 E0.07854 F1800
+G1 X112.550 Y97.550 E0.07854
+G1 X110.450 Y97.550 E0.07854
+G1 X110.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X105.000 Y95.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X108.000 Y95.000 E0.11220 F1800
+G1 X108.000 Y98.000 E0.11220
+G1 X105.000 Y98.000 E0.11220
+G1 X105.000 Y95.000 E0.11220
+G1 X105.450 Y95.450 F1800
+G1 X107.550 Y95.450 E0.07854 F1800
+G1 X107.550 Y97.550 E0.07854
+G1 X105.450 Y97.550 E0.07854
+G1 X105.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X100.000 Y95.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X103.000 Y95.000 E0.11220 F1800
+G1 X103.000 Y98.000 E0.11220
+G1 X100.000 Y98.000 E0.11220
+G1 X100.000 Y95.000 E0.11220
+G1 X100.450 Y95.450 F1800
+G1 X102.550 Y95.450 E0.07854 F1800
+G1 X102.550 Y97.550 E0.07854
+G1 X100.450 Y97.550 E0.07854
+G1 X100.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X95.000 Y95.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X98.000 Y95.000 E0.11220 F1800
+G1 X98.000 Y98.000 E0.11220
+G1 X95.000 Y98.000 E0.11220
+G1 X95.000 Y95.000 E0.11220
+G1 X95.450 Y95.450 F1800
+G1 X97.550 Y95.450 E0.07854 F1800
+G1 X97.550 Y97.550 E0.07854
+G1 X95.450 Y97.550 E0.07854
+G1 X95.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X90.000 Y95.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X93.000 Y95.000 E0.11220 F1800
+G1 X93.000 Y98.000 E0.11220
+G1 X90.000 Y98.000 E0.11220
+G1 X90.000 Y95.000 E0.11220
+G1 X90.450 Y95.450 F1800
+G1 X92.550 Y95.450 E0.07854 F1800
+G1 X92.550 Y97.550 E0.07854
+G1 X90.450 Y97.550 E0.07854
+G1 X90.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X85.000 Y95.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X88.000 Y95.000 E0.11220 F1800
+G1 X88.000 Y98.000 E0.11220
+G1 X85.000 Y98.000 E0.11220
+G1 X85.000 Y95.000 E0.11220
+G1 X85.450 Y95.450 F1800
+G1 X87.550 Y95.450 E0.07854 F1800
+G1 X87.550 Y97.550 E0.07854
+G1 X85.450 Y97.550 E0.07854
+G1 X85.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X80.000 Y95.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X83.000 Y95.000 E0.11220 F1800
+G1 X83.000 Y98.000 E0.11220
+G1 X80.000 Y98.000 E0.11220
+G1 X80.000 Y95.000 E0.11220
+G1 X80.450 Y95.450 F1800
+G1 X82.550 Y95.450 E0.07854 F1800
+G1 X82.550 Y97.550 E0.07854
+G1 X80.450 Y97.550 E0.07854
+G1 X80.450 Y95.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X80.000 Y100.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X83.000 Y100.000 E0.11220 F1800
+G1 X83.000 Y103.000 E0.11220
+G1 X80.000 Y103.000 E0.11220
+G1 X80.000 Y100.000 E0.11220
+G1 X80.450 Y100.450 F1800
+G1 X82.550 Y100.450 E0.07854 F1800
+G1 X82.550 Y102.550 E0.07854
+G1 X80.450 Y102.550 E0.07854
+G1 X80.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X85.000 Y100.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X88.000 Y100.000 E0.11220 F1800
+G1 X88.000 Y103.000 E0.11220
+G1 X85.000 Y103.000 E0.11220
+G1 X85.000 Y100.000 E0.11220
+G1 X85.450 Y100.450 F1800
+G1 X87.550 Y100.450 E0.07854 F1800
+G1 X87.550 Y102.550 E0.07854
+G1 X85.450 Y102.550 E0.07854
+G1 X85.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X90.000 Y100.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X93.000 Y100.000 E0.11220 F1800
+G1 X93.000 Y103.000 E0.11220
+G1 X90.000 Y103.000 E0.11220
+G1 X90.000 Y100.000 E0.11220
+G1 X90.450 Y100.450 F1800
+G1 X92.550 Y100.450 E0.07854 F1800
+G1 X92.550 Y102.550 E0.07854
+G1 X90.450 Y102.550 E0.07854
+G1 X90.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X95.000 Y100.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X98.000 Y100.000 E0.11220 F1800
+G1 X98.000 Y103.000 E0.11220
+G1 X95.000 Y103.000 E0.11220
+G1 X95.000 Y100.000 E0.11220
+G1 X95.450 Y100.450 F1800
+G1 X97.550 Y100.450 E0.07854 F1800
+G1 X97.550 Y102.550 E0.07854
+G1 X95.450 Y102.550 E0.07854
+G1 X95.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X100.000 Y100.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X103.000 Y100.000 E0.11220 F1800
+G1 X103.000 Y103.000 E0.11220
+G1 X100.000 Y103.000 E0.11220
+G1 X100.000 Y100.000 E0.11220
+G1 X100.450 Y100.450 F1800
+G1 X102.550 Y100.450 E0.07854 F1800
+G1 X102.550 Y102.550 E0.07854
+G1 X100.450 Y102.550 E0.07854
+G1 X100.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X105.000 Y100.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X108.000 Y100.000 E0.11220 F1800
+G1 X108.000 Y103.000 E0.11220
+G1 X105.000 Y103.000 E0.11220
+G1 X105.000 Y100.000 E0.11220
+G1 X105.450 Y100.450 F1800
+G1 X107.550 Y100.450 E0.07854 F1800
+G1 X107.550 Y102.550 E0.07854
+G1 X105.450 Y102.550 E0.07854
+G1 X105.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X110.000 Y100.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X113.000 Y100.000 E0.11220 F1800
+G1 X113.000 Y103.000 E0.11220
+G1 X110.000 Y103.000 E0.11220
+G1 X110.000 Y100.000 E0.11220
+G1 X110.450 Y100.450 F1800
+G1 X112.550 Y100.450 E0.07854 F1800
+G1 X112.550 Y102.550 E0.07854
+G1 X110.450 Y102.550 E0.07854
+G1 X110.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X115.000 Y100.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X118.000 Y100.000 E0.11220 F1800
+G1 X118.000 Y103.000 E0.11220
+G1 X115.000 Y103.000 E0.11220
+G1 X115.000 Y100.000 E0.11220
+G1 X115.450 Y100.450 F1800
+G1 X117.550 Y100.450 E0.07854 F1800
+G1 X117.550 Y102.550 E0.07854
+G1 X115.450 Y102.550 E0.07854
+G1 X115.450 Y100.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X115.000 Y105.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X118.000 Y105.000 E0.11220 F1800
+G1 X118.000 Y108.000 E0.11220
+G1 X115.000 Y108.000 E0.11220
+G1 X115.000 Y105.000 E0.11220
+G1 X115.450 Y105.450 F1800
+G1 X117.550 Y105.450 E0.07854 F1800
+G1 X117.550 Y107.550 E0.07854
+G1 X115.450 Y107.550 E0.07854
+G1 X115.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X110.000 Y105.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X113.000 Y105.000 E0.11220 F1800
+G1 X113.000 Y108.000 E0.11220
+G1 X110.000 Y108.000 E0.11220
+G1 X110.000 Y105.000 E0.11220
+G1 X110.450 Y105.450 F1800
+G1 X112.550 Y105.450 E0.07854 F1800
+G1 X112.550 Y107.550 E0.07854
+G1 X110.450 Y107.550 E0.07854
+G1 X110.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X105.000 Y105.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X108.000 Y105.000 E0.11220 F1800
+G1 X108.000 Y108.000 E0.11220
+G1 X105.000 Y108.000 E0.11220
+G1 X105.000 Y105.000 E0.11220
+G1 X105.450 Y105.450 F1800
+G1 X107.550 Y105.450 E0.07854 F1800
+G1 X107.550 Y107.550 E0.07854
+G1 X105.450 Y107.550 E0.07854
+G1 X105.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X100.000 Y105.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X103.000 Y105.000 E0.11220 F1800
+G1 X103.000 Y108.000 E0.11220
+G1 X100.000 Y108.000 E0.11220
+G1 X100.000 Y105.000 E0.11220
+G1 X100.450 Y105.450 F1800
+G1 X102.550 Y105.450 E0.07854 F1800
+G1 X102.550 Y107.550 E0.07854
+G1 X100.450 Y107.550 E0.07854
+G1 X100.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X95.000 Y105.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X98.000 Y105.000 E0.11220 F1800
+G1 X98.000 Y108.000 E0.11220
+G1 X95.000 Y108.000 E0.11220
+G1 X95.000 Y105.000 E0.11220
+G1 X95.450 Y105.450 F1800
+G1 X97.550 Y105.450 E0.07854 F1800
+G1 X97.550 Y107.550 E0.07854
+G1 X95.450 Y107.550 E0.07854
+G1 X95.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X90.000 Y105.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X93.000 Y105.000 E0.11220 F1800
+G1 X93.000 Y108.000 E0.11220
+G1 X90.000 Y108.000 E0.11220
+G1 X90.000 Y105.000 E0.11220
+G1 X90.450 Y105.450 F1800
+G1 X92.550 Y105.450 E0.07854 F1800
+G1 X92.550 Y107.550 E0.07854
+G1 X90.450 Y107.550 E0.07854
+G1 X90.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X85.000 Y105.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X88.000 Y105.000 E0.11220 F1800
+G1 X88.000 Y108.000 E0.11220
+G1 X85.000 Y108.000 E0.11220
+G1 X85.000 Y105.000 E0.11220
+G1 X85.450 Y105.450 F1800
+G1 X87.550 Y105.450 E0.07854 F1800
+G1 X87.550 Y107.550 E0.07854
+G1 X85.450 Y107.550 E0.07854
+G1 X85.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X80.000 Y105.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X83.000 Y105.000 E0.11220 F1800
+G1 X83.000 Y108.000 E0.11220
+G1 X80.000 Y108.000 E0.11220
+G1 X80.000 Y105.000 E0.11220
+G1 X80.450 Y105.450 F1800
+G1 X82.550 Y105.450 E0.07854 F1800
+G1 X82.550 Y107.550 E0.07854
+G1 X80.450 Y107.550 E0.07854
+G1 X80.450 Y105.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X80.000 Y110.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X83.000 Y110.000 E0.11220 F1800
+G1 X83.000 Y113.000 E0.11220
+G1 X80.000 Y113.000 E0.11220
+G1 X80.000 Y110.000 E0.11220
+G1 X80.450 Y110.450 F1800
+G1 X82.550 Y110.450 E0.07854 F1800
+G1 X82.550 Y112.550 E0.07854
+G1 X80.450 Y112.550 E0.07854
+G1 X80.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X85.000 Y110.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X88.000 Y110.000 E0.11220 F1800
+G1 X88.000 Y113.000 E0.11220
+G1 X85.000 Y113.000 E0.11220
+G1 X85.000 Y110.000 E0.11220
+G1 X85.450 Y110.450 F1800
+G1 X87.550 Y110.450 E0.07854 F1800
+G1 X87.550 Y112.550 E0.07854
+G1 X85.450 Y112.550 E0.07854
+G1 X85.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X90.000 Y110.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X93.000 Y110.000 E0.11220 F1800
+G1 X93.000 Y113.000 E0.11220
+G1 X90.000 Y113.000 E0.11220
+G1 X90.000 Y110.000 E0.11220
+G1 X90.450 Y110.450 F1800
+G1 X92.550 Y110.450 E0.07854 F1800
+G1 X92.550 Y112.550 E0.07854
+G1 X90.450 Y112.550 E0.07854
+G1 X90.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X95.000 Y110.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X98.000 Y110.000 E0.11220 F1800
+G1 X98.000 Y113.000 E0.11220
+G1 X95.000 Y113.000 E0.11220
+G1 X95.000 Y110.000 E0.11220
+G1 X95.450 Y110.450 F1800
+G1 X97.550 Y110.450 E0.07854 F1800
+G1 X97.550 Y112.550 E0.07854
+G1 X95.450 Y112.550 E0.07854
+G1 X95.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X100.000 Y110.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X103.000 Y110.000 E0.11220 F1800
+G1 X103.000 Y113.000 E0.11220
+G1 X100.000 Y113.000 E0.11220
+G1 X100.000 Y110.000 E0.11220
+G1 X100.450 Y110.450 F1800
+G1 X102.550 Y110.450 E0.07854 F1800
+G1 X102.550 Y112.550 E0.07854
+G1 X100.450 Y112.550 E0.07854
+G1 X100.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X105.000 Y110.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X108.000 Y110.000 E0.11220 F1800
+G1 X108.000 Y113.000 E0.11220
+G1 X105.000 Y113.000 E0.11220
+G1 X105.000 Y110.000 E0.11220
+G1 X105.450 Y110.450 F1800
+G1 X107.550 Y110.450 E0.07854 F1800
+G1 X107.550 Y112.550 E0.07854
+G1 X105.450 Y112.550 E0.07854
+G1 X105.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X110.000 Y110.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X113.000 Y110.000 E0.11220 F1800
+G1 X113.000 Y113.000 E0.11220
+G1 X110.000 Y113.000 E0.11220
+G1 X110.000 Y110.000 E0.11220
+G1 X110.450 Y110.450 F1800
+G1 X112.550 Y110.450 E0.07854 F1800
+G1 X112.550 Y112.550 E0.07854
+G1 X110.450 Y112.550 E0.07854
+G1 X110.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X115.000 Y110.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X118.000 Y110.000 E0.11220 F1800
+G1 X118.000 Y113.000 E0.11220
+G1 X115.000 Y113.000 E0.11220
+G1 X115.000 Y110.000 E0.11220
+G1 X115.450 Y110.450 F1800
+G1 X117.550 Y110.450 E0.07854 F1800
+G1 X117.550 Y112.550 E0.07854
+G1 X115.450 Y112.550 E0.07854
+G1 X115.450 Y110.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X115.000 Y115.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X118.000 Y115.000 E0.11220 F1800
+G1 X118.000 Y118.000 E0.11220
+G1 X115.000 Y118.000 E0.11220
+G1 X115.000 Y115.000 E0.11220
+G1 X115.450 Y115.450 F1800
+G1 X117.550 Y115.450 E0.07854 F1800
+G1 X117.550 Y117.550 E0.07854
+G1 X115.450 Y117.550 E0.07854
+G1 X115.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X110.000 Y115.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X113.000 Y115.000 E0.11220 F1800
+G1 X113.000 Y118.000 E0.11220
+G1 X110.000 Y118.000 E0.11220
+G1 X110.000 Y115.000 E0.11220
+G1 X110.450 Y115.450 F1800
+G1 X112.550 Y115.450 E0.07854 F1800
+G1 X112.550 Y117.550 E0.07854
+G1 X110.450 Y117.550 E0.07854
+G1 X110.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X105.000 Y115.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X108.000 Y115.000 E0.11220 F1800
+G1 X108.000 Y118.000 E0.11220
+G1 X105.000 Y118.000 E0.11220
+G1 X105.000 Y115.000 E0.11220
+G1 X105.450 Y115.450 F1800
+G1 X107.550 Y115.450 E0.07854 F1800
+G1 X107.550 Y117.550 E0.07854
+G1 X105.450 Y117.550 E0.07854
+G1 X105.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X100.000 Y115.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X103.000 Y115.000 E0.11220 F1800
+G1 X103.000 Y118.000 E0.11220
+G1 X100.000 Y118.000 E0.11220
+G1 X100.000 Y115.000 E0.11220
+G1 X100.450 Y115.450 F1800
+G1 X102.550 Y115.450 E0.07854 F1800
+G1 X102.550 Y117.550 E0.07854
+G1 X100.450 Y117.550 E0.07854
+G1 X100.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X95.000 Y115.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X98.000 Y115.000 E0.11220 F1800
+G1 X98.000 Y118.000 E0.11220
+G1 X95.000 Y118.000 E0.11220
+G1 X95.000 Y115.000 E0.11220
+G1 X95.450 Y115.450 F1800
+G1 X97.550 Y115.450 E0.07854 F1800
+G1 X97.550 Y117.550 E0.07854
+G1 X95.450 Y117.550 E0.07854
+G1 X95.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X90.000 Y115.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X93.000 Y115.000 E0.11220 F1800
+G1 X93.000 Y118.000 E0.11220
+G1 X90.000 Y118.000 E0.11220
+G1 X90.000 Y115.000 E0.11220
+G1 X90.450 Y115.450 F1800
+G1 X92.550 Y115.450 E0.07854 F1800
+G1 X92.550 Y117.550 E0.07854
+G1 X90.450 Y117.550 E0.07854
+G1 X90.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X85.000 Y115.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X88.000 Y115.000 E0.11220 F1800
+G1 X88.000 Y118.000 E0.11220
+G1 X85.000 Y118.000 E0.11220
+G1 X85.000 Y115.000 E0.11220
+G1 X85.450 Y115.450 F1800
+G1 X87.550 Y115.450 E0.07854 F1800
+G1 X87.550 Y117.550 E0.07854
+G1 X85.450 Y117.550 E0.07854
+G1 X85.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z2.800 F1200
+G1 X80.000 Y115.000 F9000
+G1 Z2.000 F1200
+G1 E0.8 F2400
+G1 X83.000 Y115.000 E0.11220 F1800
+G1 X83.000 Y118.000 E0.11220
+G1 X80.000 Y118.000 E0.11220
+G1 X80.000 Y115.000 E0.11220
+G1 X80.450 Y115.450 F1800
+G1 X82.550 Y115.450 E0.07854 F1800
+G1 X82.550 Y117.550 E0.07854
+G1 X80.450 Y117.550 E0.07854
+G1 X80.450 Y115.450 E0.07854
+G1 E-0.8 F2400
+G1 Z12.000 F1200